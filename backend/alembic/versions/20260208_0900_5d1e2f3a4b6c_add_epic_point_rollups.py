@@ -0,0 +1,78 @@
+"""Add epic_point_rollups table for materialized per-initiative point totals
+
+Revision ID: 5d1e2f3a4b6c
+Revises: 4ca08f133008
+Create Date: 2026-02-08 09:00:00.000000
+
+The rollup rows are kept current by triggers on user_stories and features,
+which are (re)created idempotently in db.database.init_db().
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1e2f3a4b6c'
+down_revision: Union[str, Sequence[str], None] = '4ca08f133008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create epic_point_rollups and backfill it from existing stories."""
+    op.create_table(
+        'epic_point_rollups',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('epic_id', sa.String(50), nullable=False),
+        sa.Column('user_id', sa.String(50), nullable=False),
+        sa.Column('total_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('must_have_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('should_have_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('nice_to_have_points', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('stories_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('scored_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['epic_id'], ['epics.epic_id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('epic_id')
+    )
+    op.create_index('idx_epic_point_rollups_user_id', 'epic_point_rollups', ['user_id'])
+    
+    # Backfill one row per existing initiative
+    op.execute("""
+        INSERT INTO epic_point_rollups (
+            epic_id, user_id, total_points, must_have_points, should_have_points,
+            nice_to_have_points, stories_count, scored_count, updated_at
+        )
+        SELECT
+            e.epic_id,
+            e.user_id,
+            COALESCE(SUM(COALESCE(s.story_points, 0)), 0),
+            COALESCE(SUM(CASE WHEN s.story_priority = 'must-have' THEN COALESCE(s.story_points, 0) ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN s.story_id IS NOT NULL
+                               AND s.story_priority IS DISTINCT FROM 'must-have'
+                               AND s.story_priority IS DISTINCT FROM 'nice-to-have'
+                              THEN COALESCE(s.story_points, 0) ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN s.story_priority = 'nice-to-have' THEN COALESCE(s.story_points, 0) ELSE 0 END), 0),
+            COUNT(s.story_id),
+            COUNT(s.story_points),
+            NOW()
+        FROM epics e
+        LEFT JOIN features f ON f.epic_id = e.epic_id
+        LEFT JOIN user_stories s ON s.feature_id = f.feature_id
+        GROUP BY e.epic_id, e.user_id
+    """)
+
+
+def downgrade() -> None:
+    """Drop epic_point_rollups and its maintenance triggers."""
+    op.execute("DROP TRIGGER IF EXISTS maintain_epic_point_rollup_story ON user_stories")
+    op.execute("DROP TRIGGER IF EXISTS maintain_epic_point_rollup_feature ON features")
+    op.execute("DROP FUNCTION IF EXISTS maintain_epic_point_rollup_story()")
+    op.execute("DROP FUNCTION IF EXISTS maintain_epic_point_rollup_feature()")
+    op.execute("DROP FUNCTION IF EXISTS apply_story_point_rollup_delta(VARCHAR, BOOLEAN, INTEGER, VARCHAR, BOOLEAN, INTEGER, VARCHAR)")
+    op.execute("DROP FUNCTION IF EXISTS refresh_epic_point_rollup(VARCHAR)")
+    op.drop_index('idx_epic_point_rollups_user_id', table_name='epic_point_rollups')
+    op.drop_table('epic_point_rollups')
@@ -0,0 +1,28 @@
+"""Add epics indexes for keyset pagination of the initiatives list
+
+Revision ID: 6e2f3a4b5c7d
+Revises: 5d1e2f3a4b6c
+Create Date: 2026-02-08 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '6e2f3a4b5c7d'
+down_revision: Union[str, Sequence[str], None] = '5d1e2f3a4b6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add (user_id, updated_at, id) and (user_id, created_at, id) indexes on epics."""
+    op.create_index('idx_epics_user_updated', 'epics', ['user_id', 'updated_at', 'id'])
+    op.create_index('idx_epics_user_created', 'epics', ['user_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Drop keyset pagination indexes."""
+    op.drop_index('idx_epics_user_created', table_name='epics')
+    op.drop_index('idx_epics_user_updated', table_name='epics')
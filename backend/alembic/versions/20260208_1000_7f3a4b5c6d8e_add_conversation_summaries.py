@@ -0,0 +1,40 @@
+"""Add conversation_summaries table for rolling chat history summaries
+
+Revision ID: 7f3a4b5c6d8e
+Revises: 6e2f3a4b5c7d
+Create Date: 2026-02-08 10:00:00.000000
+
+One row per epic/feature/story conversation, summarizing every
+user/assistant event up to covers_through_id.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a4b5c6d8e'
+down_revision: Union[str, Sequence[str], None] = '6e2f3a4b5c7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create conversation_summaries."""
+    op.create_table(
+        'conversation_summaries',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('parent_type', sa.String(20), nullable=False),
+        sa.Column('parent_id', sa.String(50), nullable=False),
+        sa.Column('summary', sa.Text(), nullable=False),
+        sa.Column('covers_through_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('parent_type', 'parent_id', name='uq_conversation_summary_parent')
+    )
+
+
+def downgrade() -> None:
+    """Drop conversation_summaries."""
+    op.drop_table('conversation_summaries')
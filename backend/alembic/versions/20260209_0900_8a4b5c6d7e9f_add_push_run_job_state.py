@@ -0,0 +1,42 @@
+"""Add background job state to external_push_runs
+
+Revision ID: 8a4b5c6d7e9f
+Revises: 7f3a4b5c6d8e
+Create Date: 2026-02-09 09:00:00.000000
+
+Push runs are executed by the push job queue; these columns hold the queued
+request, per-item progress for resuming, the final result and the claim
+bookkeeping (attempts, heartbeat, next attempt after a rate-limit pause).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4b5c6d7e9f'
+down_revision: Union[str, Sequence[str], None] = '7f3a4b5c6d8e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add job columns and the queue index."""
+    op.add_column('external_push_runs', sa.Column('request_json', sa.JSON(), nullable=True))
+    op.add_column('external_push_runs', sa.Column('progress_json', sa.JSON(), nullable=True))
+    op.add_column('external_push_runs', sa.Column('result_json', sa.JSON(), nullable=True))
+    op.add_column('external_push_runs', sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('external_push_runs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('external_push_runs', sa.Column('next_attempt_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('idx_push_run_queue', 'external_push_runs', ['status', 'next_attempt_at'])
+
+
+def downgrade() -> None:
+    """Drop job columns."""
+    op.drop_index('idx_push_run_queue', table_name='external_push_runs')
+    op.drop_column('external_push_runs', 'next_attempt_at')
+    op.drop_column('external_push_runs', 'heartbeat_at')
+    op.drop_column('external_push_runs', 'attempts')
+    op.drop_column('external_push_runs', 'result_json')
+    op.drop_column('external_push_runs', 'progress_json')
+    op.drop_column('external_push_runs', 'request_json')
@@ -0,0 +1,32 @@
+"""Cover bug_id in the bug_links entity index
+
+Revision ID: 9b5c6d7e8f0a
+Revises: 8a4b5c6d7e9f
+Create Date: 2026-02-10 09:00:00.000000
+
+Epic-scoped bug loading looks links up by (entity_type, entity_id) for the
+epic, its features and their stories and only needs bug_id back; including
+it makes those lookups index-only. The old two-column index is a prefix of
+the new one and is dropped.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9b5c6d7e8f0a'
+down_revision: Union[str, Sequence[str], None] = '8a4b5c6d7e9f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace idx_bug_links_entity with (entity_type, entity_id, bug_id)."""
+    op.create_index('idx_bug_links_entity_bug', 'bug_links', ['entity_type', 'entity_id', 'bug_id'])
+    op.drop_index('idx_bug_links_entity', table_name='bug_links', if_exists=True)
+
+
+def downgrade() -> None:
+    """Restore the two-column entity index."""
+    op.create_index('idx_bug_links_entity', 'bug_links', ['entity_type', 'entity_id'])
+    op.drop_index('idx_bug_links_entity_bug', table_name='bug_links')
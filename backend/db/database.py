@@ -12,10 +12,13 @@ Environment Variables:
 """
 import os
 import ssl
+import time
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy import event, text
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue
 import logging
 
 logger = logging.getLogger(__name__)
@@ -72,10 +75,41 @@ ssl_context = ssl.create_default_context()
 ssl_context.check_hostname = False
 ssl_context.verify_mode = ssl.CERT_NONE
 
+class TimedAsyncAdaptedQueue(AsyncAdaptedQueue):
+    """Pool queue that records how long each get() waits for a free connection."""
+    
+    def get(self, block=True, timeout=None):
+        start = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            # Imported lazily: services imports db.models
+            from services.metrics_service import observe_db_pool_wait
+            observe_db_pool_wait(time.perf_counter() - start)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool with checkout metrics. Waiting for a pooled slot and opening a
+    new connection (TLS handshake included) are recorded separately.
+    """
+    
+    _queue_class = TimedAsyncAdaptedQueue
+    
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            from services.metrics_service import observe_db_connect
+            observe_db_connect(time.perf_counter() - start)
+
+
 # Create async engine with SSL and configurable pool
 engine = create_async_engine(
     DATABASE_URL,
     echo=False,
+    poolclass=InstrumentedQueuePool,
     pool_pre_ping=True,
     pool_size=DB_POOL_SIZE,
     max_overflow=DB_MAX_OVERFLOW,
@@ -294,4 +328,167 @@ async def init_db():
             FOR EACH ROW EXECUTE FUNCTION check_locked_content()
         """))
         
+        await install_epic_point_rollup_triggers(conn)
+        
     logger.info("Database initialized with tables and constraints")
+
+
+async def install_epic_point_rollup_triggers(conn):
+    """
+    Create the functions and triggers that keep epic_point_rollups current
+    (idempotent - safe to re-run). Called by init_db.
+    """
+    # Recomputes one initiative's rollup row from its features/stories
+    await conn.execute(text("""
+        CREATE OR REPLACE FUNCTION refresh_epic_point_rollup(p_epic_id VARCHAR)
+        RETURNS VOID AS $$
+        BEGIN
+            INSERT INTO epic_point_rollups (
+                epic_id, user_id, total_points, must_have_points, should_have_points,
+                nice_to_have_points, stories_count, scored_count, updated_at
+            )
+            SELECT
+                e.epic_id,
+                e.user_id,
+                COALESCE(SUM(COALESCE(s.story_points, 0)), 0),
+                COALESCE(SUM(CASE WHEN s.story_priority = 'must-have' THEN COALESCE(s.story_points, 0) ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN s.story_id IS NOT NULL
+                                   AND s.story_priority IS DISTINCT FROM 'must-have'
+                                   AND s.story_priority IS DISTINCT FROM 'nice-to-have'
+                                  THEN COALESCE(s.story_points, 0) ELSE 0 END), 0),
+                COALESCE(SUM(CASE WHEN s.story_priority = 'nice-to-have' THEN COALESCE(s.story_points, 0) ELSE 0 END), 0),
+                COUNT(s.story_id),
+                COUNT(s.story_points),
+                NOW()
+            FROM epics e
+            LEFT JOIN features f ON f.epic_id = e.epic_id
+            LEFT JOIN user_stories s ON s.feature_id = f.feature_id
+            WHERE e.epic_id = p_epic_id
+            GROUP BY e.epic_id, e.user_id
+            ON CONFLICT (epic_id) DO UPDATE SET
+                total_points = EXCLUDED.total_points,
+                must_have_points = EXCLUDED.must_have_points,
+                should_have_points = EXCLUDED.should_have_points,
+                nice_to_have_points = EXCLUDED.nice_to_have_points,
+                stories_count = EXCLUDED.stories_count,
+                scored_count = EXCLUDED.scored_count,
+                updated_at = EXCLUDED.updated_at;
+        END;
+        $$ LANGUAGE plpgsql;
+    """))
+    
+    # Applies the difference between a story's old and new contribution
+    await conn.execute(text("""
+        CREATE OR REPLACE FUNCTION apply_story_point_rollup_delta(
+            p_feature_id VARCHAR,
+            p_old_present BOOLEAN, p_old_points INTEGER, p_old_priority VARCHAR,
+            p_new_present BOOLEAN, p_new_points INTEGER, p_new_priority VARCHAR
+        )
+        RETURNS VOID AS $$
+        DECLARE
+            v_epic_id VARCHAR;
+            v_old INTEGER := CASE WHEN p_old_present THEN COALESCE(p_old_points, 0) ELSE 0 END;
+            v_new INTEGER := CASE WHEN p_new_present THEN COALESCE(p_new_points, 0) ELSE 0 END;
+            d_total INTEGER;
+            d_must INTEGER;
+            d_nice INTEGER;
+            d_count INTEGER;
+            d_scored INTEGER;
+        BEGIN
+            -- Standalone stories don't roll up into an initiative
+            IF p_feature_id IS NULL THEN
+                RETURN;
+            END IF;
+            
+            -- Feature already gone (cascade delete) - the feature trigger refreshes the epic
+            SELECT epic_id INTO v_epic_id FROM features WHERE feature_id = p_feature_id;
+            IF v_epic_id IS NULL THEN
+                RETURN;
+            END IF;
+            
+            d_total := v_new - v_old;
+            d_must := (CASE WHEN p_new_priority = 'must-have' THEN v_new ELSE 0 END)
+                    - (CASE WHEN p_old_priority = 'must-have' THEN v_old ELSE 0 END);
+            d_nice := (CASE WHEN p_new_priority = 'nice-to-have' THEN v_new ELSE 0 END)
+                    - (CASE WHEN p_old_priority = 'nice-to-have' THEN v_old ELSE 0 END);
+            d_count := p_new_present::INTEGER - p_old_present::INTEGER;
+            d_scored := (p_new_present AND p_new_points IS NOT NULL)::INTEGER
+                      - (p_old_present AND p_old_points IS NOT NULL)::INTEGER;
+            
+            IF d_total = 0 AND d_must = 0 AND d_nice = 0 AND d_count = 0 AND d_scored = 0 THEN
+                RETURN;
+            END IF;
+            
+            UPDATE epic_point_rollups SET
+                total_points = total_points + d_total,
+                must_have_points = must_have_points + d_must,
+                should_have_points = should_have_points + (d_total - d_must - d_nice),
+                nice_to_have_points = nice_to_have_points + d_nice,
+                stories_count = stories_count + d_count,
+                scored_count = scored_count + d_scored,
+                updated_at = NOW()
+            WHERE epic_id = v_epic_id;
+            
+            -- No row yet: compute it from scratch (already includes this change)
+            IF NOT FOUND THEN
+                PERFORM refresh_epic_point_rollup(v_epic_id);
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql;
+    """))
+    
+    await conn.execute(text("""
+        CREATE OR REPLACE FUNCTION maintain_epic_point_rollup_story()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                PERFORM apply_story_point_rollup_delta(
+                    NEW.feature_id, FALSE, NULL, NULL, TRUE, NEW.story_points, NEW.story_priority
+                );
+            ELSIF TG_OP = 'DELETE' THEN
+                PERFORM apply_story_point_rollup_delta(
+                    OLD.feature_id, TRUE, OLD.story_points, OLD.story_priority, FALSE, NULL, NULL
+                );
+            ELSIF OLD.feature_id IS NOT DISTINCT FROM NEW.feature_id THEN
+                PERFORM apply_story_point_rollup_delta(
+                    NEW.feature_id, TRUE, OLD.story_points, OLD.story_priority, TRUE, NEW.story_points, NEW.story_priority
+                );
+            ELSE
+                -- Story moved between features: recompute both initiatives
+                PERFORM refresh_epic_point_rollup((SELECT epic_id FROM features WHERE feature_id = OLD.feature_id));
+                PERFORM refresh_epic_point_rollup((SELECT epic_id FROM features WHERE feature_id = NEW.feature_id));
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """))
+    
+    await conn.execute(text("""
+        CREATE OR REPLACE FUNCTION maintain_epic_point_rollup_feature()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                PERFORM refresh_epic_point_rollup(OLD.epic_id);
+            ELSIF OLD.epic_id IS DISTINCT FROM NEW.epic_id THEN
+                PERFORM refresh_epic_point_rollup(OLD.epic_id);
+                PERFORM refresh_epic_point_rollup(NEW.epic_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """))
+    
+    # Apply epic point rollup triggers (epic deletes cascade to the rollup row)
+    await conn.execute(text("DROP TRIGGER IF EXISTS maintain_epic_point_rollup_story ON user_stories"))
+    await conn.execute(text("""
+        CREATE TRIGGER maintain_epic_point_rollup_story
+        AFTER INSERT OR DELETE OR UPDATE OF story_points, story_priority, feature_id ON user_stories
+        FOR EACH ROW EXECUTE FUNCTION maintain_epic_point_rollup_story()
+    """))
+    
+    await conn.execute(text("DROP TRIGGER IF EXISTS maintain_epic_point_rollup_feature ON features"))
+    await conn.execute(text("""
+        CREATE TRIGGER maintain_epic_point_rollup_feature
+        AFTER DELETE OR UPDATE OF epic_id ON features
+        FOR EACH ROW EXECUTE FUNCTION maintain_epic_point_rollup_feature()
+    """))
@@ -37,6 +37,8 @@ class IntegrationStatus(str, PyEnum):
 
 class PushStatus(str, PyEnum):
     """Status of a push run"""
+    PENDING = "pending"  # Queued for a push worker
+    RUNNING = "running"
     SUCCESS = "success"
     PARTIAL = "partial"
     FAILED = "failed"
@@ -181,6 +183,15 @@ class ExternalPushRun(Base):
     # Errors (provider error bodies)
     error_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
     
+    # Background job state (see services/push_jobs.py)
+    request_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Push request body
+    progress_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    # Example: {"total": 12, "done": 5, "failed": 0, "completed": {"feat_1": {"entity_type": "feature", "action": "created", ...}}}
+    result_json: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)  # Final push response
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     
     # Relationships
@@ -190,4 +201,5 @@ class ExternalPushRun(Base):
         Index('idx_push_run_user_id', 'user_id'),
         Index('idx_push_run_status', 'status'),
         Index('idx_push_run_started', 'started_at'),
+        Index('idx_push_run_queue', 'status', 'next_attempt_at'),
     )
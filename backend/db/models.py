@@ -352,6 +352,9 @@ class Epic(Base):
         Index('idx_epics_user_id', 'user_id'),
         Index('idx_epics_stage', 'current_stage'),
         Index('idx_epics_archived', 'is_archived'),
+        # Keyset pagination for the initiatives list
+        Index('idx_epics_user_updated', 'user_id', 'updated_at', 'id'),
+        Index('idx_epics_user_created', 'user_id', 'created_at', 'id'),
         # Stage can only be valid enum values
         CheckConstraint(
             "current_stage IN ('problem_capture', 'problem_confirmed', 'outcome_capture', 'outcome_confirmed', 'epic_drafted', 'epic_locked')",
@@ -456,6 +459,27 @@ class EpicArtifact(Base):
     )
 
 
+class ConversationSummary(Base):
+    """
+    Rolling summary of the older turns of an epic/feature/story conversation.
+    Kept alongside the (append-only) transcript; covers every user/assistant
+    event with id <= covers_through_id. See services.conversation_history_service.
+    """
+    __tablename__ = "conversation_summaries"
+    
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    parent_type: Mapped[str] = mapped_column(String(20), nullable=False)  # epic, feature, story
+    parent_id: Mapped[str] = mapped_column(String(50), nullable=False)
+    summary: Mapped[str] = mapped_column(Text, nullable=False)
+    covers_through_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    
+    __table_args__ = (
+        UniqueConstraint('parent_type', 'parent_id', name='uq_conversation_summary_parent'),
+    )
+
+
 # ============================================
 # PROMPT TEMPLATE
 # ============================================
@@ -560,6 +584,32 @@ class ScopePlan(Base):
     )
 
 
+class EpicPointRollup(Base):
+    """
+    Denormalized story point totals per initiative.
+    Maintained incrementally by database triggers on user_stories and features
+    (see init_db); rebuild with services.portfolio_rollup_service if it drifts.
+    """
+    __tablename__ = "epic_point_rollups"
+    
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    epic_id: Mapped[str] = mapped_column(String(50), ForeignKey("epics.epic_id", ondelete="CASCADE"), unique=True, nullable=False)
+    user_id: Mapped[str] = mapped_column(String(50), ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
+    
+    total_points: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    must_have_points: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    should_have_points: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # Includes stories with no priority
+    nice_to_have_points: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    stories_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    scored_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # Stories with story_points set
+    
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    
+    __table_args__ = (
+        Index('idx_epic_point_rollups_user_id', 'user_id'),
+    )
+
+
 # ============================================
 # BUG TRACKING
 # ============================================
@@ -634,7 +684,8 @@ class BugLink(Base):
     
     __table_args__ = (
         Index('idx_bug_links_bug_id', 'bug_id'),
-        Index('idx_bug_links_entity', 'entity_type', 'entity_id'),
+        # Epic-scoped bug lookups (entity_type, entity_id) -> bug_id, index-only
+        Index('idx_bug_links_entity_bug', 'entity_type', 'entity_id', 'bug_id'),
         UniqueConstraint('bug_id', 'entity_type', 'entity_id', name='uq_bug_entity_link'),
     )
 
@@ -4,13 +4,14 @@ Admin Routes for JarlPM
 Provides administrative endpoints for:
 - Database backup management
 - System health monitoring
+- Metrics (JSON summary, plus the Prometheus /metrics scrape endpoint)
 - Maintenance task execution
 
 Security: Admin access requires either:
 1. Valid X-Admin-Token header (for automation/scripts)
 2. Authenticated user whose email is in ADMIN_EMAIL_ALLOWLIST
 """
-from fastapi import APIRouter, HTTPException, Request, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Request, Depends, BackgroundTasks, Response
 from datetime import datetime, timezone
 import logging
 import os
@@ -26,7 +27,8 @@ from services.backup_service import (
     AuditLogRetentionService,
     run_maintenance_tasks
 )
-from services.logging_service import metrics
+from services.metrics_service import get_metrics_summary, render_metrics
+from services.portfolio_rollup_service import rebuild_epic_point_rollups
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,12 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 # Admin token for protected operations (set in environment)
 ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
 
+# Bearer token required by /metrics; with neither this nor METRICS_PUBLIC set, /metrics is off
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN", "")
+
+# Serve /metrics without a token (only when the port is reachable from a private network alone)
+METRICS_PUBLIC = os.environ.get("METRICS_PUBLIC", "false").lower() == "true"
+
 # Email allowlist for admin access (comma-separated)
 # Example: ADMIN_EMAIL_ALLOWLIST=admin@example.com,owner@company.com
 ADMIN_EMAIL_ALLOWLIST = [
@@ -219,6 +227,26 @@ async def run_maintenance(
     return result
 
 
+@router.post("/rollups/rebuild")
+async def rebuild_rollups(
+    request: Request,
+    user_id: str = None,
+    session: AsyncSession = Depends(get_db)
+):
+    """
+    Rebuild the materialized epic point rollups from stories.
+    
+    Args:
+        user_id: Optional user to restrict the rebuild to (default: all users)
+    """
+    await verify_admin_access(request, session)
+    
+    rebuilt = await rebuild_epic_point_rollups(session, user_id=user_id)
+    logger.info(f"Rebuilt epic point rollups for {rebuilt} initiatives")
+    
+    return {"rebuilt": rebuilt}
+
+
 # ============================================
 # System Health
 # ============================================
@@ -282,10 +310,29 @@ async def get_metrics(
 ):
     """
     Get application metrics for monitoring.
+    
+    Summary of the Prometheus metrics (aggregated across workers), with
+    p50/p95/p99 estimated from histogram buckets.
     """
     await verify_admin_access(request, session)
     
     return {
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "metrics": metrics.get_metrics()
+        "metrics": get_metrics_summary()
     }
+
+
+async def prometheus_metrics(request: Request):
+    """
+    Prometheus scrape endpoint (mounted at /metrics in server.py).
+    Requires `Authorization: Bearer <METRICS_TOKEN>` when METRICS_TOKEN is set;
+    open only with METRICS_PUBLIC=true; otherwise not served at all.
+    """
+    if METRICS_TOKEN:
+        if request.headers.get("Authorization") != f"Bearer {METRICS_TOKEN}":
+            raise HTTPException(status_code=403, detail="Metrics access denied")
+    elif not METRICS_PUBLIC:
+        raise HTTPException(status_code=404, detail="Not Found")
+    
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
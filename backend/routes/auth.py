@@ -4,9 +4,9 @@ from datetime import datetime, timezone, timedelta
 from dateutil.relativedelta import relativedelta
 import logging
 import uuid
-import bcrypt
 import jwt
 import os
+import hashlib
 
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +16,9 @@ from db.models import User, UserSession, Subscription, SubscriptionStatus, Produ
 from services.encryption import get_encryption_service
 from services.email_service import get_email_service
 from services.rate_limit import limiter, RATE_LIMITS, get_ip_only
+from services.cache_service import get_cache
+from services.ai_entitlement_service import invalidate_ai_entitlements
+from services.password_hasher import get_password_hasher, PasswordHasherBusy
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,12 @@ JWT_SECRET = os.environ.get("JWT_SECRET", "jarlpm-secret-key-change-in-productio
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRY_DAYS = 7
 
+# Session lookup cache (token -> user_id/expiry) - skips the user_sessions
+# query on most authenticated requests. Logout, login and password reset
+# invalidate it; with the in-memory backend other workers may serve a
+# revoked token for at most this many seconds.
+SESSION_CACHE_TTL_SECONDS = int(os.environ.get("SESSION_CACHE_TTL_SECONDS", "60"))
+
 # Test user credentials
 TEST_USER_EMAIL = "testuser@jarlpm.dev"
 TEST_USER_NAME = "Test User"
@@ -100,15 +109,31 @@ class ResendVerificationRequest(BaseModel):
 # Password Hashing Utilities
 # ============================================
 
-def hash_password(password: str) -> str:
+# bcrypt runs on the password hasher's bounded pool, never on the event loop
+# (see services/password_hasher.py)
+
+def password_hasher_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Too many sign-in requests right now, please try again",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+    try:
+        return await get_password_hasher().hash(password)
+    except PasswordHasherBusy:
+        raise password_hasher_busy()
 
 
-def verify_password(password: str, hashed: str) -> bool:
+async def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash"""
-    return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    try:
+        return await get_password_hasher().verify(password, hashed)
+    except PasswordHasherBusy:
+        raise password_hasher_busy()
 
 
 def generate_session_token(user_id: str) -> str:
@@ -164,7 +189,7 @@ async def signup(
     
     # Create new user
     user_id = f"user_{uuid.uuid4().hex[:12]}"
-    password_hash = hash_password(body.password)
+    password_hash = await hash_password(body.password)
     
     user = User(
         user_id=user_id,
@@ -259,9 +284,17 @@ async def login(
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
     # Verify password
-    if not user.password_hash or not verify_password(body.password, user.password_hash):
+    if not user.password_hash or not await verify_password(body.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
+    # Upgrade hashes made with a different BCRYPT_ROUNDS (saved with the new session)
+    hasher = get_password_hasher()
+    if hasher.needs_rehash(user.password_hash):
+        try:
+            user.password_hash = await hasher.hash(body.password)
+        except PasswordHasherBusy:
+            pass  # Upgraded on a later login
+    
     # Remove old sessions for this user
     await session.execute(
         delete(UserSession).where(UserSession.user_id == user.user_id)
@@ -280,6 +313,7 @@ async def login(
     session.add(user_session)
     
     await session.commit()
+    await invalidate_user_sessions(user.user_id)
     
     # Set httpOnly cookie
     response.set_cookie(
@@ -338,6 +372,7 @@ async def logout(
             delete(UserSession).where(UserSession.session_token == session_token)
         )
         await session.commit()
+        await invalidate_session_token(session_token)
     
     response.delete_cookie(
         key="session_token",
@@ -372,7 +407,7 @@ async def test_login(
             user_id=user_id,
             email=TEST_USER_EMAIL,
             name=TEST_USER_NAME,
-            password_hash=hash_password("testpassword123"),
+            password_hash=await hash_password("testpassword123"),
             picture=None
         )
         session.add(user)
@@ -483,6 +518,8 @@ async def test_login(
     session.add(user_session)
     
     await session.commit()
+    await invalidate_user_sessions(user_id)
+    await invalidate_ai_entitlements(user_id)
     
     # Set httpOnly cookie
     response.set_cookie(
@@ -506,6 +543,30 @@ async def test_login(
     }
 
 
+# ============================================
+# Session Cache
+# ============================================
+
+def get_session_cache():
+    """Cache of validated session tokens"""
+    return get_cache("sessions", SESSION_CACHE_TTL_SECONDS)
+
+
+def _session_cache_key(session_token: str) -> str:
+    """Cache key for a session token (hashed so raw tokens never leave the process)"""
+    return hashlib.sha256(session_token.encode('utf-8')).hexdigest()
+
+
+async def invalidate_session_token(session_token: str):
+    """Drop one session token from the cache (logout)"""
+    await get_session_cache().delete(_session_cache_key(session_token))
+
+
+async def invalidate_user_sessions(user_id: str):
+    """Drop all cached session tokens for a user (login, password reset)"""
+    await get_session_cache().invalidate_group(user_id)
+
+
 # Helper function to get current user (for use in other routes)
 async def get_current_user_id(request: Request, session: AsyncSession) -> str:
     """Extract and validate current user ID from request"""
@@ -518,6 +579,16 @@ async def get_current_user_id(request: Request, session: AsyncSession) -> str:
     if not session_token:
         raise HTTPException(status_code=401, detail="Not authenticated")
     
+    now = datetime.now(timezone.utc)
+    cache = get_session_cache()
+    cache_key = _session_cache_key(session_token)
+    
+    cached = await cache.get(cache_key)
+    if cached:
+        if datetime.fromisoformat(cached["expires_at"]) < now:
+            raise HTTPException(status_code=401, detail="Session expired")
+        return cached["user_id"]
+    
     result = await session.execute(
         select(UserSession).where(UserSession.session_token == session_token)
     )
@@ -527,9 +598,20 @@ async def get_current_user_id(request: Request, session: AsyncSession) -> str:
         raise HTTPException(status_code=401, detail="Invalid session")
     
     # Check expiry
-    if user_session.expires_at.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc):
+    expires_at = user_session.expires_at.replace(tzinfo=timezone.utc)
+    if expires_at < now:
         raise HTTPException(status_code=401, detail="Session expired")
     
+    # Cache valid sessions only, never past their expiry
+    ttl = min(SESSION_CACHE_TTL_SECONDS, (expires_at - now).total_seconds())
+    if ttl > 0:
+        await cache.set(
+            cache_key,
+            {"user_id": user_session.user_id, "expires_at": expires_at.isoformat()},
+            ttl=ttl,
+            group=user_session.user_id
+        )
+    
     return user_session.user_id
 
 
@@ -755,7 +837,7 @@ async def reset_password(
         raise HTTPException(status_code=404, detail="User not found")
     
     # Update password
-    user.password_hash = hash_password(body.new_password)
+    user.password_hash = await hash_password(body.new_password)
     user.updated_at = datetime.now(timezone.utc)
     
     # Mark token as used
@@ -767,6 +849,7 @@ async def reset_password(
     )
     
     await session.commit()
+    await invalidate_user_sessions(user.user_id)
     
     logger.info(f"Password reset for user: {user.user_id}")
     
@@ -12,9 +12,8 @@ from sqlalchemy import select, func, and_, or_, desc
 
 from db import get_db
 from db.models import Epic, EpicSnapshot, ProductDeliveryContext, ScopePlan
-from db.feature_models import Feature
-from db.user_story_models import UserStory
 from routes.auth import get_current_user_id
+from services.portfolio_rollup_service import get_epic_point_rollups, empty_rollup
 
 import logging
 
@@ -109,38 +108,6 @@ async def get_delivery_context(user_id: str, session: AsyncSession) -> dict:
     }
 
 
-async def get_initiative_points(epic_id: str, session: AsyncSession) -> dict:
-    """Get total points and breakdown by priority for an initiative"""
-    story_q = (
-        select(
-            UserStory.story_id,
-            UserStory.story_points,
-            UserStory.story_priority,
-        )
-        .join(Feature, UserStory.feature_id == Feature.feature_id)
-        .where(Feature.epic_id == epic_id)
-    )
-    
-    result = await session.execute(story_q)
-    stories = result.fetchall()
-    
-    total_points = 0
-    must_have = 0
-    
-    for story in stories:
-        points = story.story_points or 0
-        total_points += points
-        
-        if story.story_priority == "must-have":
-            must_have += points
-    
-    return {
-        "total_points": total_points,
-        "must_have_points": must_have,
-        "stories_count": len(stories),
-    }
-
-
 def calculate_assessment(delta: int, sprint_capacity: int) -> str:
     """Calculate delivery assessment"""
     if delta >= 0:
@@ -180,13 +147,16 @@ async def get_dashboard(
     epics_result = await session.execute(epics_q)
     epics = epics_result.scalars().all()
     
+    # Points for every active initiative in one grouped query
+    rollups = await get_epic_point_rollups(session, user_id)
+    
     # Build at-risk and focus lists
     at_risk_initiatives = []
     focus_list = []
     total_points_in_flight = 0
     
     for epic in epics:
-        points_data = await get_initiative_points(epic.epic_id, session)
+        points_data = rollups.get(epic.epic_id) or empty_rollup()
         total_points = points_data["total_points"]
         total_points_in_flight += total_points
         
@@ -295,18 +265,18 @@ async def get_dashboard(
                 details=None
             ))
     
-    # Recent scope plans
-    scope_plans_q = select(ScopePlan).where(
-        ScopePlan.user_id == user_id
-    ).order_by(ScopePlan.updated_at.desc()).limit(5)
+    # Recent scope plans (with epic titles joined in)
+    scope_plans_q = (
+        select(ScopePlan, Epic.title)
+        .outerjoin(Epic, Epic.epic_id == ScopePlan.epic_id)
+        .where(ScopePlan.user_id == user_id)
+        .order_by(ScopePlan.updated_at.desc())
+        .limit(5)
+    )
     scope_plans_result = await session.execute(scope_plans_q)
-    scope_plans = scope_plans_result.scalars().all()
     
-    for plan in scope_plans:
-        # Get epic title
-        epic_q = select(Epic.title).where(Epic.epic_id == plan.epic_id)
-        epic_result = await session.execute(epic_q)
-        epic_title = epic_result.scalar() or "Unknown"
+    for plan, title in scope_plans_result.all():
+        epic_title = title or "Unknown"
         
         recent_activity.append(ActivityEvent(
             event_type="scope_plan_saved",
@@ -18,7 +18,9 @@ from db.models import Epic, ProductDeliveryContext
 from db.feature_models import Feature
 from db.user_story_models import UserStory
 from routes.auth import get_current_user_id
+from services.portfolio_rollup_service import get_epic_point_rollups, empty_rollup
 
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -297,11 +299,14 @@ async def get_delivery_summary(
     epics_result = await session.execute(epics_q)
     epics = epics_result.scalars().all()
     
+    # Points for every active initiative in one grouped query
+    rollups = await get_epic_point_rollups(session, user_id)
+    
     total_points = 0
     status_breakdown = {"on_track": 0, "at_risk": 0, "overloaded": 0}
     
     for epic in epics:
-        points_data = await get_initiative_points(epic.epic_id, session)
+        points_data = rollups.get(epic.epic_id) or empty_rollup()
         epic_points = points_data["total_points"]
         total_points += epic_points
         
@@ -341,9 +346,12 @@ async def list_initiatives_delivery(
     epics_result = await session.execute(epics_q)
     epics = epics_result.scalars().all()
     
+    # Points for every active initiative in one grouped query
+    rollups = await get_epic_point_rollups(session, user_id)
+    
     initiatives = []
     for epic in epics:
-        points_data = await get_initiative_points(epic.epic_id, session)
+        points_data = rollups.get(epic.epic_id) or empty_rollup()
         total_points = points_data["total_points"]
         
         delta = ctx["two_sprint_capacity"] - total_points
@@ -894,6 +902,7 @@ class RiskReview(BaseModel):
 async def generate_cut_rationale(
     request: Request,
     epic_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """
@@ -905,6 +914,7 @@ async def generate_cut_rationale(
     - What to validate first
     """
     from services.llm_service import LLMService
+    from services.llm_response_cache import get_llm_response_cache
     from services.strict_output_service import StrictOutputService
     from services.epic_service import EpicService
     
@@ -988,11 +998,18 @@ Generate the rationale for these cuts."""
     llm_model = llm_config.model_name
     
     try:
-        # Generate response using sessionless streaming
-        full_response = ""
-        llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
-            full_response += chunk
+        # Reuse the last accepted response for identical prompts (unless regenerating)
+        response_cache = get_llm_response_cache()
+        cached_response = await response_cache.get(config_data, system_prompt, user_prompt, regenerate=regenerate)
+        
+        if cached_response is not None:
+            full_response = cached_response
+        else:
+            # Generate response using sessionless streaming
+            full_response = ""
+            llm = LLMService()  # No session needed
+            async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
+                full_response += chunk
         
         # Repair callback for StrictOutputService (also sessionless)
         async def repair_callback(repair_prompt: str) -> str:
@@ -1011,17 +1028,18 @@ Generate the rationale for these cuts."""
             original_prompt=user_prompt
         )
         
-        # Track model health (needs a fresh session)
-        from db import AsyncSessionLocal
-        async with AsyncSessionLocal() as track_session:
-            track_strict = StrictOutputService(track_session)
-            await track_strict.track_call(
-                user_id=user_id,
-                provider=llm_provider,
-                model_name=llm_model,
-                success=validation_result.valid,
-                repaired=validation_result.repair_attempts > 0
-            )
+        # Track model health (needs a fresh session; cached responses aren't model calls)
+        if cached_response is None:
+            from db import AsyncSessionLocal
+            async with AsyncSessionLocal() as track_session:
+                track_strict = StrictOutputService(track_session)
+                await track_strict.track_call(
+                    user_id=user_id,
+                    provider=llm_provider,
+                    model_name=llm_model,
+                    success=validation_result.valid,
+                    repaired=validation_result.repair_attempts > 0
+                )
         
         if not validation_result.valid:
             logger.error(f"Failed to parse AI cut-rationale response after repairs: {validation_result.errors}")
@@ -1030,6 +1048,11 @@ Generate the rationale for these cuts."""
                 detail=f"Failed to generate valid cut rationale: {', '.join(validation_result.errors)}"
             )
         
+        if cached_response is None:
+            await response_cache.set(
+                config_data, system_prompt, user_prompt, json.dumps(validation_result.data, default=str)
+            )
+        
         return ScopeCutRationale(**validation_result.data)
         
     except HTTPException:
@@ -1045,6 +1068,7 @@ Generate the rationale for these cuts."""
 async def generate_alternative_cuts(
     request: Request,
     epic_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """
@@ -1056,6 +1080,7 @@ async def generate_alternative_cuts(
     - Cut low adoption risk (features with uncertain usage)
     """
     from services.llm_service import LLMService
+    from services.llm_response_cache import get_llm_response_cache
     from services.strict_output_service import StrictOutputService
     from services.epic_service import EpicService
     from pydantic import BaseModel as PydanticBaseModel
@@ -1162,11 +1187,18 @@ Generate 3 alternative cut strategies, each cutting at least {points_to_cut} poi
     llm_model = llm_config.model_name
     
     try:
-        # Generate response using sessionless streaming
-        full_response = ""
-        llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
-            full_response += chunk
+        # Reuse the last accepted response for identical prompts (unless regenerating)
+        response_cache = get_llm_response_cache()
+        cached_response = await response_cache.get(config_data, system_prompt, user_prompt, regenerate=regenerate)
+        
+        if cached_response is not None:
+            full_response = cached_response
+        else:
+            # Generate response using sessionless streaming
+            full_response = ""
+            llm = LLMService()  # No session needed
+            async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
+                full_response += chunk
         
         # Repair callback for StrictOutputService (also sessionless)
         async def repair_callback(repair_prompt: str) -> str:
@@ -1185,17 +1217,18 @@ Generate 3 alternative cut strategies, each cutting at least {points_to_cut} poi
             original_prompt=user_prompt
         )
         
-        # Track model health (needs a fresh session)
-        from db import AsyncSessionLocal
-        async with AsyncSessionLocal() as track_session:
-            track_strict = StrictOutputService(track_session)
-            await track_strict.track_call(
-                user_id=user_id,
-                provider=llm_provider,
-                model_name=llm_model,
-                success=validation_result.valid,
-                repaired=validation_result.repair_attempts > 0
-            )
+        # Track model health (needs a fresh session; cached responses aren't model calls)
+        if cached_response is None:
+            from db import AsyncSessionLocal
+            async with AsyncSessionLocal() as track_session:
+                track_strict = StrictOutputService(track_session)
+                await track_strict.track_call(
+                    user_id=user_id,
+                    provider=llm_provider,
+                    model_name=llm_model,
+                    success=validation_result.valid,
+                    repaired=validation_result.repair_attempts > 0
+                )
         
         if not validation_result.valid:
             logger.error(f"Failed to parse AI alternative-cuts response after repairs: {validation_result.errors}")
@@ -1204,6 +1237,11 @@ Generate 3 alternative cut strategies, each cutting at least {points_to_cut} poi
                 detail=f"Failed to generate alternative cuts: {', '.join(validation_result.errors)}"
             )
         
+        if cached_response is None:
+            await response_cache.set(
+                config_data, system_prompt, user_prompt, json.dumps(validation_result.data, default=str)
+            )
+        
         # ===== VALIDATE STORY IDS TO PREVENT HALLUCINATION =====
         alternatives = []
         for alt in validation_result.data.get("alternatives", []):
@@ -1239,6 +1277,7 @@ Generate 3 alternative cut strategies, each cutting at least {points_to_cut} poi
 async def generate_risk_review(
     request: Request,
     epic_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """
@@ -1250,6 +1289,7 @@ async def generate_risk_review(
     - Suggested spike story (1-2 pts)
     """
     from services.llm_service import LLMService
+    from services.llm_response_cache import get_llm_response_cache
     from services.strict_output_service import StrictOutputService
     from services.epic_service import EpicService
     
@@ -1345,11 +1385,18 @@ Generate the risk review."""
     llm_model = llm_config.model_name
     
     try:
-        # Generate response using sessionless streaming
-        full_response = ""
-        llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
-            full_response += chunk
+        # Reuse the last accepted response for identical prompts (unless regenerating)
+        response_cache = get_llm_response_cache()
+        cached_response = await response_cache.get(config_data, system_prompt, user_prompt, regenerate=regenerate)
+        
+        if cached_response is not None:
+            full_response = cached_response
+        else:
+            # Generate response using sessionless streaming
+            full_response = ""
+            llm = LLMService()  # No session needed
+            async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
+                full_response += chunk
         
         # Repair callback for StrictOutputService (also sessionless)
         async def repair_callback(repair_prompt: str) -> str:
@@ -1368,17 +1415,18 @@ Generate the risk review."""
             original_prompt=user_prompt
         )
         
-        # Track model health (needs a fresh session)
-        from db import AsyncSessionLocal
-        async with AsyncSessionLocal() as track_session:
-            track_strict = StrictOutputService(track_session)
-            await track_strict.track_call(
-                user_id=user_id,
-                provider=llm_provider,
-                model_name=llm_model,
-                success=validation_result.valid,
-                repaired=validation_result.repair_attempts > 0
-            )
+        # Track model health (needs a fresh session; cached responses aren't model calls)
+        if cached_response is None:
+            from db import AsyncSessionLocal
+            async with AsyncSessionLocal() as track_session:
+                track_strict = StrictOutputService(track_session)
+                await track_strict.track_call(
+                    user_id=user_id,
+                    provider=llm_provider,
+                    model_name=llm_model,
+                    success=validation_result.valid,
+                    repaired=validation_result.repair_attempts > 0
+                )
         
         if not validation_result.valid:
             logger.error(f"Failed to parse AI risk-review response after repairs: {validation_result.errors}")
@@ -1387,6 +1435,11 @@ Generate the risk review."""
                 detail=f"Failed to generate risk review: {', '.join(validation_result.errors)}"
             )
         
+        if cached_response is None:
+            await response_cache.set(
+                config_data, system_prompt, user_prompt, json.dumps(validation_result.data, default=str)
+            )
+        
         return RiskReview(**validation_result.data)
         
     except HTTPException:
@@ -296,7 +296,7 @@ async def chat_with_epic(
     )
     
     # Get conversation history
-    history = await epic_service.get_conversation_history(epic_id, limit=20)
+    history = await epic_service.get_conversation_history(epic_id, config_data=config_data)
     
     # Capture epic data for use in generator
     epic_current_stage = epic.current_stage
@@ -6,13 +6,12 @@ from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
-import io
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from db import get_db
-from services.export_service import ExportService, ExportFormat, ExportPlatform
+from db import get_db, AsyncSessionLocal
+from services.export_service import ExportService, ExportFormat, ExportPlatform, get_export_writer
 from routes.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
@@ -30,6 +29,11 @@ class FileExportRequest(BaseModel):
     include_bugs: bool = True
 
 
+class PortfolioExportRequest(BaseModel):
+    format: ExportFormat
+    include_bugs: bool = True
+
+
 class JiraExportRequest(BaseModel):
     epic_id: str
     include_bugs: bool = True
@@ -115,7 +119,7 @@ async def preview_export(
     # Get bugs if requested
     bugs = []
     if include_bugs:
-        bugs = await export_service.get_bugs_for_export(user_id)
+        bugs = await export_service.get_bugs_for_export(user_id, epic_id)
     
     # Count items
     story_count = sum(len(f.get("user_stories", [])) for f in epic_data.get("features", []))
@@ -163,6 +167,33 @@ async def preview_export(
 # File Export Endpoints
 # ============================================
 
+def stream_file_export(
+    export_format: ExportFormat,
+    user_id: str,
+    filename_prefix: str,
+    epic_id: Optional[str] = None,
+    include_bugs: bool = True
+) -> StreamingResponse:
+    """
+    Stream a file export as it is generated. The generator opens its own
+    session because the request session is closed before the body is sent.
+    """
+    writer = get_export_writer(export_format, portfolio=epic_id is None)
+    
+    async def generate():
+        async with AsyncSessionLocal() as export_session:
+            export_service = ExportService(export_session)
+            async for chunk in export_service.stream_export(writer, user_id, epic_id, include_bugs):
+                yield chunk.encode("utf-8")
+    
+    filename = f"{filename_prefix.replace(' ', '_')}_{writer.filename_suffix}"
+    return StreamingResponse(
+        generate(),
+        media_type=writer.media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
 @router.post("/file")
 async def export_to_file(
     request: Request,
@@ -173,46 +204,22 @@ async def export_to_file(
     user_id = await get_current_user_id(request, session)
     export_service = ExportService(session)
     
-    # Get epic data
-    epic_data = await export_service.get_epic_with_all_children(body.epic_id, user_id)
-    if not epic_data:
+    epic_title = await export_service.get_epic_title(body.epic_id, user_id)
+    if epic_title is None:
         raise HTTPException(status_code=404, detail="Epic not found")
     
-    # Get bugs if requested
-    bugs = []
-    if body.include_bugs:
-        bugs = await export_service.get_bugs_for_export(user_id)
-    
-    # Generate export based on format
-    if body.format == ExportFormat.JIRA_CSV:
-        content = export_service.export_to_jira_csv(epic_data, bugs)
-        media_type = "text/csv"
-        filename = f"{epic_data['title'].replace(' ', '_')}_jira_export.csv"
-    
-    elif body.format == ExportFormat.AZURE_DEVOPS_CSV:
-        content = export_service.export_to_azure_devops_csv(epic_data, bugs)
-        media_type = "text/csv"
-        filename = f"{epic_data['title'].replace(' ', '_')}_azure_devops_export.csv"
-    
-    elif body.format == ExportFormat.JSON:
-        content = export_service.export_to_json(epic_data, bugs)
-        media_type = "application/json"
-        filename = f"{epic_data['title'].replace(' ', '_')}_export.json"
-    
-    elif body.format == ExportFormat.MARKDOWN:
-        content = export_service.export_to_markdown(epic_data, bugs)
-        media_type = "text/markdown"
-        filename = f"{epic_data['title'].replace(' ', '_')}_export.md"
-    
-    else:
-        raise HTTPException(status_code=400, detail="Unsupported export format")
-    
-    # Return as downloadable file
-    return StreamingResponse(
-        io.BytesIO(content.encode("utf-8")),
-        media_type=media_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"}
-    )
+    return stream_file_export(body.format, user_id, epic_title, body.epic_id, body.include_bugs)
+
+
+@router.post("/portfolio")
+async def export_portfolio(
+    request: Request,
+    body: PortfolioExportRequest,
+    session: AsyncSession = Depends(get_db)
+):
+    """Export all of the user's (non-archived) initiatives to one file"""
+    user_id = await get_current_user_id(request, session)
+    return stream_file_export(body.format, user_id, "portfolio", include_bugs=body.include_bugs)
 
 
 # ============================================
@@ -237,7 +244,7 @@ async def export_to_jira(
     # Get bugs if requested
     bugs = []
     if body.include_bugs:
-        bugs = await export_service.get_bugs_for_export(user_id)
+        bugs = await export_service.get_bugs_for_export(user_id, body.epic_id)
     
     # Export to Jira
     jira_config = {
@@ -281,7 +288,7 @@ async def export_to_azure_devops(
     # Get bugs if requested
     bugs = []
     if body.include_bugs:
-        bugs = await export_service.get_bugs_for_export(user_id)
+        bugs = await export_service.get_bugs_for_export(user_id, body.epic_id)
     
     # Export to Azure DevOps
     azure_config = {
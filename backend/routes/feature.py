@@ -18,6 +18,7 @@ from db.feature_models import Feature, FeatureStage
 from services.feature_service import FeatureService
 from services.llm_service import LLMService
 from services.prompt_service import PromptService
+from services.json_stream_parser import JSONArrayStreamParser, validate_item
 from services.lock_policy_service import lock_policy
 from routes.auth import get_current_user_id
 
@@ -79,6 +80,15 @@ class GenerateFeaturesRequest(BaseModel):
     count: int = 5  # Number of features to generate
 
 
+class GeneratedFeature(BaseModel):
+    """One AI-generated feature, validated as soon as it has streamed"""
+    model_config = {"extra": "allow"}
+    
+    title: str
+    description: str = ""
+    acceptance_criteria: List[str] = []
+
+
 def feature_to_response(feature: Feature) -> FeatureResponse:
     """Convert Feature model to response"""
     return FeatureResponse(
@@ -248,7 +258,8 @@ Respond ONLY with the JSON array, no other text."""
     user_prompt = "Generate the features now."
     
     async def generate():
-        full_response = ""
+        parser = JSONArrayStreamParser()
+        features = []
         try:
             # Use stream_with_config which doesn't need a session
             llm = LLMService()  # No session needed for streaming
@@ -258,20 +269,28 @@ Respond ONLY with the JSON array, no other text."""
                 user_prompt=user_prompt,
                 conversation_history=None
             ):
-                full_response += chunk
                 yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+                
+                # Send each feature as soon as its closing brace arrives
+                for element in parser.feed(chunk):
+                    if element.error:
+                        feature, problem = None, element.error
+                    else:
+                        feature, problem = validate_item(GeneratedFeature, element.value)
+                    if feature is None:
+                        yield f"data: {json.dumps({'type': 'invalid_item', 'index': element.index, 'message': problem})}\n\n"
+                        continue
+                    features.append(feature)
+                    yield f"data: {json.dumps({'type': 'feature', 'index': element.index, 'position': len(features) - 1, 'feature': feature})}\n\n"
             
-            # Parse and return features
-            import re
-            json_match = re.search(r'\[[\s\S]*\]', full_response)
-            if json_match:
-                try:
-                    features = json.loads(json_match.group(0))
-                    yield f"data: {json.dumps({'type': 'features', 'features': features})}\n\n"
-                except json.JSONDecodeError as e:
-                    yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to parse features: {str(e)}'})}\n\n"
-            else:
+            if not parser.started:
                 yield f"data: {json.dumps({'type': 'error', 'message': 'No valid JSON found in response'})}\n\n"
+            elif not features:
+                detail = "; ".join(parser.errors) or "no valid features"
+                yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to parse features: {detail}'})}\n\n"
+            else:
+                # Whole list too, for clients that don't handle per-feature events
+                yield f"data: {json.dumps({'type': 'features', 'features': features})}\n\n"
             
             yield f"data: {json.dumps({'type': 'done'})}\n\n"
             
@@ -507,7 +526,7 @@ async def chat_with_feature(
     delivery_context_text = prompt_service.format_delivery_context(delivery_context)
     
     # Get conversation history - capture before streaming
-    history = await feature_service.get_conversation_history(feature_id, limit=10)
+    history = await feature_service.get_conversation_history(feature_id, config_data=config_data)
     
     # Capture feature details for prompt (extract from ORM object before session releases)
     feature_title = feature.title
@@ -42,7 +42,7 @@ from services.strict_output_service import (
     StrictOutputService, get_strict_output_service,
     TaskType, QualityMode, TASK_TEMPERATURE
 )
-from services.subscription_helper import is_subscription_active, get_user_subscription
+from services.ai_entitlement_service import get_ai_entitlements
 from services.rate_limit import limiter, RATE_LIMITS
 from routes.auth import get_current_user_id
 
@@ -955,9 +955,8 @@ async def generate_initiative(
     user_id = await get_current_user_id(request, session)
     
     # Check subscription
-    subscription = await get_user_subscription(session, user_id)
-    
-    if not is_subscription_active(subscription):
+    entitlements = await get_ai_entitlements(session, user_id)
+    if not entitlements.subscription_active:
         raise HTTPException(status_code=402, detail="Active subscription required for AI features")
     
     # Check LLM config
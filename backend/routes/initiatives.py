@@ -9,15 +9,18 @@ from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime, timezone
 from enum import Enum
+import base64
+import json
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, and_, desc, asc
+from sqlalchemy import select, func, or_, and_, desc, asc, tuple_
 
 from db import get_db
 from db.models import Epic, EpicSnapshot
 from db.feature_models import Feature
 from db.user_story_models import UserStory
 from routes.auth import get_current_user_id
+from services.portfolio_rollup_service import get_epic_point_rollups, empty_rollup
 
 import logging
 
@@ -25,6 +28,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/initiatives", tags=["initiatives"])
 
+# Sort fields that support keyset (cursor) pagination
+KEYSET_SORT_FIELDS = ("updated_at", "created_at")
+
 
 class InitiativeStatus(str, Enum):
     """Initiative statuses for V1"""
@@ -62,6 +68,7 @@ class InitiativeListResponse(BaseModel):
     page: int
     page_size: int
     has_more: bool
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page (keyset pagination)
 
 
 class InitiativeStatusUpdate(BaseModel):
@@ -128,6 +135,23 @@ def map_status_to_stages(status: str) -> List[str]:
     return stage_map.get(status, [])
 
 
+def encode_cursor(sort_by: str, sort_value: datetime, row_id: int) -> str:
+    """Encode a keyset pagination cursor (opaque to clients)"""
+    payload = json.dumps({"s": sort_by, "v": sort_value.isoformat(), "id": row_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_by: str) -> tuple[datetime, int]:
+    """Decode a keyset pagination cursor into (sort_value, row_id)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        if payload["s"] != sort_by:
+            raise ValueError("cursor sort field mismatch")
+        return datetime.fromisoformat(payload["v"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+
 @router.get("", response_model=InitiativeListResponse)
 async def list_initiatives(
     request: Request,
@@ -137,12 +161,17 @@ async def list_initiatives(
     status: Optional[str] = Query(None, description="Filter by status: draft, active, completed, archived"),
     search: Optional[str] = Query(None, description="Search in title, tagline, or problem statement"),
     sort_by: str = Query("updated_at", description="Sort field: updated_at, created_at, title"),
-    sort_order: str = Query("desc", description="Sort order: asc or desc")
+    sort_order: str = Query("desc", description="Sort order: asc or desc"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page's next_cursor (updated_at/created_at sorts only)")
 ):
     """
     List all initiatives for the current user with pagination and filtering.
     Default sort: Most recently updated first.
     Search is performed in SQL for correct pagination.
+    
+    Pagination: offset via `page`, or keyset via `cursor` when sorting by
+    updated_at/created_at (stays fast at any depth). Counts, points and
+    snapshot text are loaded for the whole page in a constant number of queries.
     """
     user_id = await get_current_user_id(request, session)
     
@@ -186,58 +215,64 @@ async def list_initiatives(
     total_result = await session.execute(count_query)
     total = total_result.scalar() or 0
     
-    # Sort
+    # Sort (Epic.id breaks ties so pages are stable)
     sort_column = getattr(Epic, sort_by, Epic.updated_at)
     order_func = desc if sort_order == "desc" else asc
+    keyset_supported = sort_by in KEYSET_SORT_FIELDS
+    
+    # Fetch initiatives with snapshot text in the same query
+    query = (
+        select(Epic, EpicSnapshot.problem_statement)
+        .outerjoin(EpicSnapshot, Epic.epic_id == EpicSnapshot.epic_id)
+        .where(and_(*filters))
+        .order_by(order_func(sort_column), order_func(Epic.id))
+    )
     
-    # Fetch initiatives with pagination
-    offset = (page - 1) * page_size
-    if search:
-        query = (
-            select(Epic)
-            .outerjoin(EpicSnapshot, Epic.epic_id == EpicSnapshot.epic_id)
-            .where(and_(*filters))
-            .order_by(order_func(sort_column))
-            .offset(offset)
-            .limit(page_size)
-        )
+    if cursor:
+        if not keyset_supported:
+            raise HTTPException(status_code=400, detail="Cursor pagination requires sort_by updated_at or created_at")
+        cursor_value, cursor_id = decode_cursor(cursor, sort_by)
+        position = tuple_(sort_column, Epic.id)
+        if sort_order == "desc":
+            query = query.where(position < tuple_(cursor_value, cursor_id))
+        else:
+            query = query.where(position > tuple_(cursor_value, cursor_id))
+        offset = 0
     else:
-        query = (
-            select(Epic)
-            .where(and_(*filters))
-            .order_by(order_func(sort_column))
-            .offset(offset)
-            .limit(page_size)
+        offset = (page - 1) * page_size
+        query = query.offset(offset)
+    
+    # Fetch one extra row to know whether another page exists
+    result = await session.execute(query.limit(page_size + 1))
+    rows = result.all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    
+    epic_ids = [epic.epic_id for epic, _ in rows]
+    
+    # Feature counts for the whole page in one grouped query
+    features_counts = {}
+    if epic_ids:
+        feature_count_q = (
+            select(Feature.epic_id, func.count(Feature.id))
+            .where(Feature.epic_id.in_(epic_ids))
+            .group_by(Feature.epic_id)
         )
+        feature_result = await session.execute(feature_count_q)
+        features_counts = dict(feature_result.all())
     
-    result = await session.execute(query)
-    epics = result.scalars().all()
+    # Story counts and points from the materialized rollups
+    rollups = await get_epic_point_rollups(
+        session, user_id, epic_ids=epic_ids, include_archived=True
+    )
     
-    # Build summaries with feature/story counts
+    # Build summaries
     initiatives = []
-    for epic in epics:
-        # Get feature count
-        feature_count_q = select(func.count(Feature.id)).where(Feature.epic_id == epic.epic_id)
-        feature_result = await session.execute(feature_count_q)
-        features_count = feature_result.scalar() or 0
-        
-        # Get story count and total points
-        story_q = select(
-            func.count(UserStory.id),
-            func.coalesce(func.sum(UserStory.story_points), 0)
-        ).join(Feature, UserStory.feature_id == Feature.feature_id).where(Feature.epic_id == epic.epic_id)
-        story_result = await session.execute(story_q)
-        story_row = story_result.fetchone()
-        stories_count = story_row[0] if story_row else 0
-        total_points = int(story_row[1]) if story_row else 0
-        
-        # Get snapshot for problem statement and tagline
-        snapshot_q = select(EpicSnapshot).where(EpicSnapshot.epic_id == epic.epic_id)
-        snapshot_result = await session.execute(snapshot_q)
-        snapshot = snapshot_result.scalar_one_or_none()
+    for epic, problem_text in rows:
+        points_data = rollups.get(epic.epic_id) or empty_rollup()
         
         # Generate tagline from problem statement if needed
-        problem_text = snapshot.problem_statement if snapshot and snapshot.problem_statement else None
+        problem_text = problem_text or None
         tagline = problem_text[:100] + "..." if problem_text and len(problem_text) > 100 else problem_text
         
         # Map stage to display status (respects is_archived)
@@ -249,19 +284,25 @@ async def list_initiatives(
             tagline=tagline,
             status=display_status,
             problem_statement=problem_text[:200] if problem_text and len(problem_text) > 200 else problem_text,
-            features_count=features_count,
-            stories_count=stories_count,
-            total_points=total_points,
+            features_count=features_counts.get(epic.epic_id, 0),
+            stories_count=points_data["stories_count"],
+            total_points=points_data["total_points"],
             created_at=epic.created_at,
             updated_at=epic.updated_at
         ))
     
+    next_cursor = None
+    if has_more and keyset_supported and rows:
+        last_epic = rows[-1][0]
+        next_cursor = encode_cursor(sort_by, getattr(last_epic, sort_by), last_epic.id)
+    
     return InitiativeListResponse(
         initiatives=initiatives,
         total=total,
         page=page,
         page_size=page_size,
-        has_more=(offset + len(initiatives)) < total
+        has_more=has_more,
+        next_cursor=next_cursor
     )
 
 
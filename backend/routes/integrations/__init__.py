@@ -13,14 +13,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from db import get_db
 from db.integration_models import (
     ExternalIntegration, ExternalPushMapping, ExternalPushRun,
-    IntegrationProvider, IntegrationStatus
+    IntegrationProvider, IntegrationStatus, PushStatus
 )
 from routes.auth import get_current_user_id
 from services.linear_service import LinearOAuthService
+from services.push_jobs import get_push_job_queue
 
 from .shared import (
     check_subscription_required,
     get_user_integration,
+    get_user_push_run,
     IntegrationStatusResponse
 )
 
@@ -164,6 +166,62 @@ async def get_push_history(
     }
 
 
+@router.get("/push-runs/{run_id}")
+async def get_push_run(
+    run_id: str,
+    request: Request,
+    session: AsyncSession = Depends(get_db)
+):
+    """Get status and progress of a queued push; result is set once it has finished"""
+    user_id = await get_current_user_id(request, session)
+    run = await get_user_push_run(session, user_id, run_id)
+    progress = run.progress_json or {}
+    
+    return {
+        "run_id": run.run_id,
+        "provider": run.provider,
+        "epic_id": run.epic_id,
+        "status": run.status,
+        "attempts": run.attempts,
+        "next_attempt_at": run.next_attempt_at,
+        "started_at": run.started_at,
+        "ended_at": run.ended_at,
+        "progress": {
+            "total": progress.get("total"),
+            "done": progress.get("done", 0),
+            "failed": progress.get("failed", 0)
+        },
+        "result": run.result_json,
+        "errors": run.error_json
+    }
+
+
+@router.post("/push-runs/{run_id}/resume")
+async def resume_push_run(
+    run_id: str,
+    request: Request,
+    session: AsyncSession = Depends(get_db)
+):
+    """Re-queue a failed or partial push; items it already pushed are not pushed again"""
+    user_id = await get_current_user_id(request, session)
+    await check_subscription_required(session, user_id)
+    run = await get_user_push_run(session, user_id, run_id)
+    
+    if run.status not in (PushStatus.FAILED.value, PushStatus.PARTIAL.value) or not run.request_json:
+        raise HTTPException(status_code=400, detail="Only failed or partial background pushes can be resumed")
+    
+    run.status = PushStatus.PENDING.value
+    run.attempts = 0
+    run.next_attempt_at = None
+    run.ended_at = None
+    run.error_json = None
+    run.result_json = None
+    await session.commit()
+    get_push_job_queue().notify()
+    
+    return {"run_id": run.run_id, "status": run.status}
+
+
 @router.get("/mappings/{entity_id}")
 async def get_entity_mappings(
     entity_id: str,
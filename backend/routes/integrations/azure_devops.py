@@ -16,15 +16,20 @@ from db.feature_models import Feature
 from db.user_story_models import UserStory
 from db.integration_models import (
     ExternalIntegration, ExternalPushMapping, ExternalPushRun,
-    IntegrationProvider, IntegrationStatus, PushStatus, EntityType
+    IntegrationProvider, IntegrationStatus, EntityType
 )
 from routes.auth import get_current_user_id
 from services.encryption import get_encryption_service
 from services.rate_limit import limiter, RATE_LIMITS
+from services.integration_metadata_cache import get_integration_metadata_cache
+from services.retry_service import PushResult
+from services.push_executor import PushExecutor, finalize_push_run, push_response
+from services.push_jobs import PushCheckpoint, PushJobError, enqueue_push_run, register_push_handler
 from services.azure_devops_service import (
     AzureDevOpsRESTService, AzureDevOpsPushService,
-    AzureDevOpsAPIError, AuthenticationError as ADOAuthError
+    AzureDevOpsAPIError, AuthenticationError as ADOAuthError, ADO_BATCH_LIMIT
 )
+from services.jira_service import chunked
 
 from .shared import (
     check_subscription_required,
@@ -95,6 +100,7 @@ async def connect_azure_devops(
         session.add(integration)
     
     await session.commit()
+    await get_integration_metadata_cache().invalidate(integration.integration_id)
     logger.info(f"Azure DevOps integration connected for user {user_id}, org: {org_name}")
     
     return {
@@ -122,6 +128,7 @@ async def disconnect_azure_devops(
     integration.updated_at = datetime.now(timezone.utc)
     
     await session.commit()
+    await get_integration_metadata_cache().invalidate(integration.integration_id)
     
     return {"status": "disconnected"}
 
@@ -168,6 +175,7 @@ async def configure_azure_devops_integration(
     integration.updated_at = datetime.now(timezone.utc)
     
     await session.commit()
+    await get_integration_metadata_cache().invalidate(integration.integration_id)
     
     return {
         "status": "configured",
@@ -467,7 +475,7 @@ async def push_to_azure_devops(
     body: AzureDevOpsPushRequest,
     session: AsyncSession = Depends(get_db)
 ):
-    """Push epic (and optionally features/stories) to Azure DevOps"""
+    """Queue a push of the epic (and optionally features/stories) to Azure DevOps; poll /integrations/push-runs/{run_id}"""
     user_id = await get_current_user_id(request, session)
     await check_subscription_required(session, user_id)
     
@@ -475,6 +483,41 @@ async def push_to_azure_devops(
     if not integration or integration.status != IntegrationStatus.CONNECTED.value:
         raise HTTPException(status_code=400, detail="Azure DevOps not connected")
     
+    epic_result = await session.execute(
+        select(Epic.epic_id).where(and_(Epic.epic_id == body.epic_id, Epic.user_id == user_id))
+    )
+    if epic_result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Epic not found")
+    
+    push_run = ExternalPushRun(
+        user_id=user_id,
+        integration_id=integration.integration_id,
+        provider=IntegrationProvider.AZURE_DEVOPS.value,
+        epic_id=body.epic_id,
+        push_scope=body.push_scope,
+        include_bugs=body.include_bugs,
+        is_dry_run=body.dry_run
+    )
+    
+    if body.dry_run:
+        result = PushResult()
+        finalize_push_run(push_run, result, [])
+        session.add(push_run)
+        await session.commit()
+        return push_response(push_run.run_id, result, [])
+    
+    return await enqueue_push_run(session, push_run, body.model_dump())
+
+
+async def run_azure_devops_push(session: AsyncSession, push_run: ExternalPushRun, executor: PushExecutor, checkpoint: PushCheckpoint):
+    """Push job handler: load the epic tree and queue its items on the executor"""
+    body = AzureDevOpsPushRequest(**push_run.request_json)
+    user_id = push_run.user_id
+    
+    integration = await get_user_integration(session, user_id, IntegrationProvider.AZURE_DEVOPS.value)
+    if not integration or integration.status != IntegrationStatus.CONNECTED.value:
+        raise PushJobError("Azure DevOps not connected")
+    
     ado = await get_azure_devops_service(session, user_id)
     push_service = AzureDevOpsPushService(ado)
     
@@ -494,267 +537,176 @@ async def push_to_azure_devops(
     epic = epic_result.scalar_one_or_none()
     
     if not epic:
-        raise HTTPException(status_code=404, detail="Epic not found")
+        raise PushJobError("Epic not found")
     
-    push_run = ExternalPushRun(
-        user_id=user_id,
-        integration_id=integration.integration_id,
-        provider=IntegrationProvider.AZURE_DEVOPS.value,
-        epic_id=body.epic_id,
-        push_scope=body.push_scope,
-        include_bugs=body.include_bugs,
-        is_dry_run=body.dry_run
+    mappings_result = await session.execute(
+        select(ExternalPushMapping).where(
+            and_(
+                ExternalPushMapping.user_id == user_id,
+                ExternalPushMapping.provider == IntegrationProvider.AZURE_DEVOPS.value
+            )
+        )
     )
-    session.add(push_run)
-    
-    results = {
-        "run_id": push_run.run_id,
-        "created": [],
-        "updated": [],
-        "errors": [],
-        "links": []
-    }
+    existing_mappings = {m.entity_id: m for m in mappings_result.scalars().all()}
     
-    try:
-        mappings_result = await session.execute(
-            select(ExternalPushMapping).where(
-                and_(
-                    ExternalPushMapping.user_id == user_id,
-                    ExternalPushMapping.provider == IntegrationProvider.AZURE_DEVOPS.value
-                )
-            )
+    snapshot = epic.snapshot
+    epic_description = push_service.format_epic_description(
+        {"epic_id": epic.epic_id, "title": epic.title},
+        {
+            "problem_statement": snapshot.problem_statement if snapshot else epic.title,
+            "desired_outcome": snapshot.desired_outcome if snapshot else None,
+            "epic_summary": snapshot.epic_summary if snapshot else None,
+            "acceptance_criteria": snapshot.acceptance_criteria if snapshot else None
+        }
+    )
+    
+    # Load the whole tree up front; pushes run concurrently and must not touch the session
+    features = []
+    stories_by_feature = {}
+    if body.push_scope in ["epic_features", "epic_features_stories", "full"]:
+        features_result = await session.execute(
+            select(Feature).where(Feature.epic_id == body.epic_id)
         )
-        existing_mappings = {m.entity_id: m for m in mappings_result.scalars().all()}
-        
-        snapshot = epic.snapshot
-        epic_description = push_service.format_description(
-            snapshot.problem_statement if snapshot else epic.title,
-            snapshot.desired_outcome if snapshot else None,
-            snapshot.acceptance_criteria if snapshot else None
+        features = features_result.scalars().all()
+    if body.push_scope in ["epic_features_stories", "full"] and features:
+        stories_result = await session.execute(
+            select(UserStory).where(UserStory.feature_id.in_([f.feature_id for f in features]))
         )
-        
-        existing_epic_mapping = existing_mappings.get(epic.epic_id)
-        
-        if not body.dry_run:
-            try:
-                epic_result = await push_service.push_work_item(
-                    project=body.project_name,
-                    work_item_type=work_item_types.get("epic", "Epic"),
-                    title=epic.title,
-                    description=epic_description,
-                    area_path=body.area_path,
-                    iteration_path=body.iteration_path,
-                    existing_id=existing_epic_mapping.external_id if existing_epic_mapping else None,
-                    tags=["jarlpm", "epic"]
+        for story in stories_result.scalars().all():
+            stories_by_feature.setdefault(story.feature_id, []).append(story)
+    
+    def record_push(entity_type: str, entity_id: str, result: dict) -> dict:
+        """Create/update the push mapping for a pushed item; returns the executor outcome."""
+        mapping = existing_mappings.get(entity_id)
+        if result["action"] != "skipped":
+            if mapping:
+                mapping.external_id = str(result["id"])
+                mapping.external_url = result["url"]
+                mapping.last_pushed_at = datetime.now(timezone.utc)
+                mapping.last_push_hash = result["payload_hash"]
+            else:
+                mapping = ExternalPushMapping(
+                    user_id=user_id,
+                    integration_id=integration.integration_id,
+                    provider=IntegrationProvider.AZURE_DEVOPS.value,
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    external_type="Work Item",
+                    external_id=str(result["id"]),
+                    external_url=result["url"],
+                    project_id=body.project_name,
+                    last_push_hash=result["payload_hash"]
                 )
-                
-                if existing_epic_mapping:
-                    existing_epic_mapping.external_id = str(epic_result["id"])
-                    existing_epic_mapping.external_url = epic_result["url"]
-                    existing_epic_mapping.last_pushed_at = datetime.now(timezone.utc)
-                    results["updated"].append({
-                        "type": "epic",
-                        "entity_id": epic.epic_id,
-                        "external_id": epic_result["id"],
-                        "url": epic_result["url"]
-                    })
-                else:
-                    new_mapping = ExternalPushMapping(
-                        user_id=user_id,
-                        integration_id=integration.integration_id,
-                        provider=IntegrationProvider.AZURE_DEVOPS.value,
-                        entity_type=EntityType.EPIC.value,
-                        entity_id=epic.epic_id,
-                        external_type="Work Item",
-                        external_id=str(epic_result["id"]),
-                        external_url=epic_result["url"],
-                        project_id=body.project_name
-                    )
-                    session.add(new_mapping)
-                    existing_mappings[epic.epic_id] = new_mapping
-                    results["created"].append({
-                        "type": "epic",
-                        "entity_id": epic.epic_id,
-                        "external_id": epic_result["id"],
-                        "url": epic_result["url"]
-                    })
-                
-                results["links"].append(epic_result["url"])
-                parent_epic_id = epic_result["id"]
-            except Exception as e:
-                logger.error(f"Error pushing epic: {e}")
-                results["errors"].append({
-                    "type": "epic",
-                    "entity_id": epic.epic_id,
-                    "error": str(e)
-                })
-                parent_epic_id = None
-        else:
-            parent_epic_id = None
-        
-        if body.push_scope in ["epic_features", "epic_features_stories", "full"]:
-            features_result = await session.execute(
-                select(Feature).where(Feature.epic_id == body.epic_id)
+                session.add(mapping)
+                existing_mappings[entity_id] = mapping
+        return {
+            "action": result["action"],
+            "external_id": result["id"],
+            "external_key": None,
+            "url": result["url"]
+        }
+    
+    def existing(entity_id: str) -> dict:
+        mapping = existing_mappings.get(entity_id)
+        return {
+            "existing_work_item_id": int(mapping.external_id) if mapping else None,
+            "last_push_hash": mapping.last_push_hash if mapping else None
+        }
+    
+    async def push_epic(parent):
+        result = await push_service.push_item(
+            project_name=body.project_name,
+            work_item_type=work_item_types.get("epic", "Epic"),
+            title=epic.title,
+            description=epic_description,
+            entity_type=EntityType.EPIC.value,
+            entity_id=epic.epic_id,
+            area_path=body.area_path,
+            iteration_path=body.iteration_path,
+            tags=["jarlpm", "epic"],
+            force=body.force,
+            **existing(epic.epic_id)
+        )
+        return await checkpoint.record(record_push, EntityType.EPIC.value, epic.epic_id, result)
+    
+    def feature_item(feature) -> dict:
+        return {
+            "work_item_type": work_item_types.get("feature", "Feature"),
+            "title": feature.title,
+            "description": push_service.format_feature_description({
+                "feature_id": feature.feature_id,
+                "description": feature.description,
+                "acceptance_criteria": feature.acceptance_criteria
+            }),
+            "entity_type": EntityType.FEATURE.value,
+            "entity_id": feature.feature_id,
+            "tags": ["jarlpm", "feature"],
+            **existing(feature.feature_id)
+        }
+    
+    def story_item(story) -> dict:
+        return {
+            "work_item_type": work_item_types.get("story", "User Story"),
+            "title": story.title or story.story_text[:80],
+            "description": push_service.format_story_description({
+                "story_id": story.story_id,
+                "persona": story.persona,
+                "action": story.action,
+                "benefit": story.benefit,
+                "acceptance_criteria": story.acceptance_criteria
+            }),
+            "entity_type": EntityType.STORY.value,
+            "entity_id": story.story_id,
+            "story_points": story.story_points,
+            "tags": ["jarlpm", "story"],
+            **existing(story.story_id)
+        }
+    
+    def batch_push(items):
+        """
+        Push one $batch chunk of a hierarchy level; per-item errors come back as exceptions.
+        Receives parent entity_id -> outcome; items under a failed parent are left out.
+        """
+        async def push(parents):
+            items_to_push = [item for item in items if item["parent_entity_id"] in parents]
+            for item in items_to_push:
+                item["parent_work_item_id"] = int(parents[item["parent_entity_id"]]["external_id"])
+            results = await push_service.push_items_batch(
+                project_name=body.project_name,
+                items=items_to_push,
+                area_path=body.area_path,
+                iteration_path=body.iteration_path,
+                force=body.force
             )
-            features = features_result.scalars().all()
-            
-            for feature in features:
-                feature_description = push_service.format_description(
-                    feature.description,
-                    None,
-                    feature.acceptance_criteria
-                )
-                
-                existing_feature_mapping = existing_mappings.get(feature.feature_id)
-                
-                if not body.dry_run:
-                    try:
-                        feature_result = await push_service.push_work_item(
-                            project=body.project_name,
-                            work_item_type=work_item_types.get("feature", "Feature"),
-                            title=feature.title,
-                            description=feature_description,
-                            area_path=body.area_path,
-                            iteration_path=body.iteration_path,
-                            existing_id=existing_feature_mapping.external_id if existing_feature_mapping else None,
-                            parent_id=parent_epic_id,
-                            tags=["jarlpm", "feature"]
-                        )
-                        
-                        if existing_feature_mapping:
-                            existing_feature_mapping.external_id = str(feature_result["id"])
-                            existing_feature_mapping.external_url = feature_result["url"]
-                            existing_feature_mapping.last_pushed_at = datetime.now(timezone.utc)
-                            results["updated"].append({
-                                "type": "feature",
-                                "entity_id": feature.feature_id,
-                                "external_id": feature_result["id"],
-                                "url": feature_result["url"]
-                            })
-                        else:
-                            new_mapping = ExternalPushMapping(
-                                user_id=user_id,
-                                integration_id=integration.integration_id,
-                                provider=IntegrationProvider.AZURE_DEVOPS.value,
-                                entity_type=EntityType.FEATURE.value,
-                                entity_id=feature.feature_id,
-                                external_type="Work Item",
-                                external_id=str(feature_result["id"]),
-                                external_url=feature_result["url"],
-                                project_id=body.project_name
-                            )
-                            session.add(new_mapping)
-                            existing_mappings[feature.feature_id] = new_mapping
-                            results["created"].append({
-                                "type": "feature",
-                                "entity_id": feature.feature_id,
-                                "external_id": feature_result["id"],
-                                "url": feature_result["url"]
-                            })
-                        
-                        results["links"].append(feature_result["url"])
-                        parent_feature_id = feature_result["id"]
-                    except Exception as e:
-                        logger.error(f"Error pushing feature {feature.feature_id}: {e}")
-                        results["errors"].append({
-                            "type": "feature",
-                            "entity_id": feature.feature_id,
-                            "error": str(e)
-                        })
-                        parent_feature_id = None
-                        continue
-                else:
-                    parent_feature_id = None
-                
-                if body.push_scope in ["epic_features_stories", "full"] and parent_feature_id:
-                    stories_result = await session.execute(
-                        select(UserStory).where(UserStory.feature_id == feature.feature_id)
+            async with checkpoint.lock:
+                return {
+                    item["entity_id"]: (
+                        results[item["entity_id"]]
+                        if isinstance(results[item["entity_id"]], Exception)
+                        else record_push(item["entity_type"], item["entity_id"], results[item["entity_id"]])
                     )
-                    stories = stories_result.scalars().all()
-                    
-                    for story in stories:
-                        story_title = story.title or story.story_text[:80]
-                        story_description = push_service.format_description(
-                            story.description or story.story_text,
-                            None,
-                            story.acceptance_criteria
-                        )
-                        
-                        existing_story_mapping = existing_mappings.get(story.story_id)
-                        
-                        if not body.dry_run:
-                            try:
-                                story_result = await push_service.push_work_item(
-                                    project=body.project_name,
-                                    work_item_type=work_item_types.get("story", "User Story"),
-                                    title=story_title,
-                                    description=story_description,
-                                    area_path=body.area_path,
-                                    iteration_path=body.iteration_path,
-                                    existing_id=existing_story_mapping.external_id if existing_story_mapping else None,
-                                    parent_id=parent_feature_id,
-                                    story_points=story.story_points,
-                                    tags=["jarlpm", "story"]
-                                )
-                                
-                                if existing_story_mapping:
-                                    existing_story_mapping.external_id = str(story_result["id"])
-                                    existing_story_mapping.external_url = story_result["url"]
-                                    existing_story_mapping.last_pushed_at = datetime.now(timezone.utc)
-                                    results["updated"].append({
-                                        "type": "story",
-                                        "entity_id": story.story_id,
-                                        "external_id": story_result["id"],
-                                        "url": story_result["url"]
-                                    })
-                                else:
-                                    new_mapping = ExternalPushMapping(
-                                        user_id=user_id,
-                                        integration_id=integration.integration_id,
-                                        provider=IntegrationProvider.AZURE_DEVOPS.value,
-                                        entity_type=EntityType.STORY.value,
-                                        entity_id=story.story_id,
-                                        external_type="Work Item",
-                                        external_id=str(story_result["id"]),
-                                        external_url=story_result["url"],
-                                        project_id=body.project_name
-                                    )
-                                    session.add(new_mapping)
-                                    results["created"].append({
-                                        "type": "story",
-                                        "entity_id": story.story_id,
-                                        "external_id": story_result["id"],
-                                        "url": story_result["url"]
-                                    })
-                                
-                                results["links"].append(story_result["url"])
-                            except Exception as e:
-                                logger.error(f"Error pushing story {story.story_id}: {e}")
-                                results["errors"].append({
-                                    "type": "story",
-                                    "entity_id": story.story_id,
-                                    "error": str(e)
-                                })
-        
-        push_run.ended_at = datetime.now(timezone.utc)
-        push_run.status = PushStatus.PARTIAL.value if results["errors"] else PushStatus.SUCCESS.value
-        push_run.summary_json = {
-            "created": len(results["created"]),
-            "updated": len(results["updated"]),
-            "errors": len(results["errors"]),
-            "links": results["links"][:10]
-        }
-        if results["errors"]:
-            push_run.error_json = {"errors": results["errors"]}
-        
-        await session.commit()
-        
-        return results
+                    for item in items_to_push
+                }
+        return push
+    
+    def add_level(items):
+        # One $batch per hierarchy level, split into ADO_BATCH_LIMIT chunks.
+        # Each chunk is its own executor batch, so a retry only resends that
+        # chunk; items restored from an earlier attempt are left out
+        items = [item for item in items if item["entity_id"] not in executor.restored]
+        for chunk in chunked(items, ADO_BATCH_LIMIT):
+            executor.add_batch(
+                [(item["entity_type"], item["entity_id"]) for item in chunk],
+                batch_push(chunk),
+                parents={item["entity_id"]: item["parent_entity_id"] for item in chunk}
+            )
     
-    except Exception as e:
-        logger.error(f"Push to Azure DevOps failed: {e}")
-        push_run.ended_at = datetime.now(timezone.utc)
-        push_run.status = PushStatus.FAILED.value
-        push_run.error_json = {"error": str(e)}
-        await session.commit()
-        raise HTTPException(status_code=500, detail=str(e))
+    executor.add(EntityType.EPIC.value, epic.epic_id, push_epic)
+    add_level([{**feature_item(feature), "parent_entity_id": epic.epic_id} for feature in features])
+    add_level([
+        {**story_item(story), "parent_entity_id": feature.feature_id}
+        for feature in features
+        for story in stories_by_feature.get(feature.feature_id, [])
+    ])
+
+register_push_handler(IntegrationProvider.AZURE_DEVOPS.value, run_azure_devops_push)
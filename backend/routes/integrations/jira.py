@@ -18,14 +18,18 @@ from db.feature_models import Feature
 from db.user_story_models import UserStory
 from db.integration_models import (
     ExternalIntegration, ExternalPushMapping, ExternalPushRun,
-    IntegrationProvider, IntegrationStatus, PushStatus, EntityType
+    IntegrationProvider, IntegrationStatus, EntityType
 )
 from routes.auth import get_current_user_id
 from services.encryption import get_encryption_service
 from services.rate_limit import limiter, RATE_LIMITS
+from services.integration_metadata_cache import get_integration_metadata_cache
+from services.retry_service import PushResult
+from services.push_executor import PushExecutor, finalize_push_run, push_response
+from services.push_jobs import PushCheckpoint, PushJobError, enqueue_push_run, register_push_handler
 from services.jira_service import (
     JiraOAuthService, JiraRESTService, JiraPushService,
-    JiraAPIError, AuthenticationError as JiraAuthError
+    JiraAPIError, AuthenticationError as JiraAuthError, chunked
 )
 
 from .shared import (
@@ -158,6 +162,7 @@ async def jira_oauth_callback(
             session.add(integration)
         
         await session.commit()
+        await get_integration_metadata_cache().invalidate(integration.integration_id)
         logger.info(f"Jira integration connected for user {user_id}, cloud_id: {cloud_id}")
         
         return RedirectResponse(url=f"{frontend_callback_url}?success=true&provider=jira")
@@ -189,6 +194,7 @@ async def disconnect_jira(
     integration.updated_at = datetime.now(timezone.utc)
     
     await session.commit()
+    await get_integration_metadata_cache().invalidate(integration.integration_id)
     
     return {"status": "disconnected"}
 
@@ -231,6 +237,7 @@ async def configure_jira_integration(
     integration.updated_at = datetime.now(timezone.utc)
     
     await session.commit()
+    await get_integration_metadata_cache().invalidate(integration.integration_id)
     
     return {
         "status": "configured",
@@ -490,7 +497,7 @@ async def push_to_jira(
     body: JiraPushRequest,
     session: AsyncSession = Depends(get_db)
 ):
-    """Push epic (and optionally features/stories) to Jira"""
+    """Queue a push of the epic (and optionally features/stories) to Jira; poll /integrations/push-runs/{run_id}"""
     user_id = await get_current_user_id(request, session)
     await check_subscription_required(session, user_id)
     
@@ -498,6 +505,41 @@ async def push_to_jira(
     if not integration or integration.status != IntegrationStatus.CONNECTED.value:
         raise HTTPException(status_code=400, detail="Jira not connected")
     
+    epic_result = await session.execute(
+        select(Epic.epic_id).where(and_(Epic.epic_id == body.epic_id, Epic.user_id == user_id))
+    )
+    if epic_result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Epic not found")
+    
+    push_run = ExternalPushRun(
+        user_id=user_id,
+        integration_id=integration.integration_id,
+        provider=IntegrationProvider.JIRA.value,
+        epic_id=body.epic_id,
+        push_scope=body.push_scope,
+        include_bugs=body.include_bugs,
+        is_dry_run=body.dry_run
+    )
+    
+    if body.dry_run:
+        result = PushResult()
+        finalize_push_run(push_run, result, [])
+        session.add(push_run)
+        await session.commit()
+        return push_response(push_run.run_id, result, [])
+    
+    return await enqueue_push_run(session, push_run, body.model_dump())
+
+
+async def run_jira_push(session: AsyncSession, push_run: ExternalPushRun, executor: PushExecutor, checkpoint: PushCheckpoint):
+    """Push job handler: load the epic tree and queue its items on the executor"""
+    body = JiraPushRequest(**push_run.request_json)
+    user_id = push_run.user_id
+    
+    integration = await get_user_integration(session, user_id, IntegrationProvider.JIRA.value)
+    if not integration or integration.status != IntegrationStatus.CONNECTED.value:
+        raise PushJobError("Jira not connected")
+    
     jira = await get_jira_service(session, user_id)
     push_service = JiraPushService(jira)
     
@@ -512,275 +554,183 @@ async def push_to_jira(
     epic = epic_result.scalar_one_or_none()
     
     if not epic:
-        raise HTTPException(status_code=404, detail="Epic not found")
+        raise PushJobError("Epic not found")
     
-    push_run = ExternalPushRun(
-        user_id=user_id,
-        integration_id=integration.integration_id,
-        provider=IntegrationProvider.JIRA.value,
-        epic_id=body.epic_id,
-        push_scope=body.push_scope,
-        include_bugs=body.include_bugs,
-        is_dry_run=body.dry_run
+    mappings_result = await session.execute(
+        select(ExternalPushMapping).where(
+            and_(
+                ExternalPushMapping.user_id == user_id,
+                ExternalPushMapping.provider == IntegrationProvider.JIRA.value
+            )
+        )
     )
-    session.add(push_run)
-    
-    results = {
-        "run_id": push_run.run_id,
-        "created": [],
-        "updated": [],
-        "errors": [],
-        "links": []
-    }
+    existing_mappings = {m.entity_id: m for m in mappings_result.scalars().all()}
     
-    try:
-        mappings_result = await session.execute(
-            select(ExternalPushMapping).where(
-                and_(
-                    ExternalPushMapping.user_id == user_id,
-                    ExternalPushMapping.provider == IntegrationProvider.JIRA.value
-                )
-            )
+    snapshot = epic.snapshot
+    epic_description = push_service.format_epic_description(
+        {"epic_id": epic.epic_id, "title": epic.title},
+        {
+            "problem_statement": snapshot.problem_statement if snapshot else None,
+            "desired_outcome": snapshot.desired_outcome if snapshot else None,
+            "epic_summary": snapshot.epic_summary if snapshot else None,
+            "acceptance_criteria": snapshot.acceptance_criteria if snapshot else None
+        }
+    )
+    
+    # Load the whole tree up front; pushes run concurrently and must not touch the session
+    features = []
+    stories_by_feature = {}
+    if body.push_scope in ["epic_features", "epic_features_stories", "full"]:
+        features_result = await session.execute(
+            select(Feature).where(Feature.epic_id == body.epic_id)
         )
-        existing_mappings = {m.entity_id: m for m in mappings_result.scalars().all()}
-        
-        snapshot = epic.snapshot
-        epic_description = push_service.format_epic_description(
-            {"epic_id": epic.epic_id, "title": epic.title},
-            {
-                "problem_statement": snapshot.problem_statement if snapshot else None,
-                "desired_outcome": snapshot.desired_outcome if snapshot else None,
-                "epic_summary": snapshot.epic_summary if snapshot else None,
-                "acceptance_criteria": snapshot.acceptance_criteria if snapshot else None
-            }
+        features = features_result.scalars().all()
+    if body.push_scope in ["epic_features_stories", "full"] and features:
+        stories_result = await session.execute(
+            select(UserStory).where(UserStory.feature_id.in_([f.feature_id for f in features]))
         )
-        
-        existing_epic_mapping = existing_mappings.get(epic.epic_id)
-        
-        if not body.dry_run:
-            epic_result = await push_service.push_item(
-                project_key=body.project_key,
-                issue_type="Epic",
-                title=epic.title,
-                description=epic_description,
-                entity_type=EntityType.EPIC.value,
-                entity_id=epic.epic_id,
-                existing_issue_key=existing_epic_mapping.external_key if existing_epic_mapping else None,
-                field_mappings=field_mappings
-            )
-            
-            if existing_epic_mapping:
-                existing_epic_mapping.external_key = epic_result["key"]
-                existing_epic_mapping.external_url = epic_result["url"]
-                existing_epic_mapping.last_pushed_at = datetime.now(timezone.utc)
-                existing_epic_mapping.last_push_hash = epic_result["payload_hash"]
-                results["updated"].append({
-                    "type": "epic",
-                    "entity_id": epic.epic_id,
-                    "external_key": epic_result["key"],
-                    "url": epic_result["url"]
-                })
+        for story in stories_result.scalars().all():
+            stories_by_feature.setdefault(story.feature_id, []).append(story)
+    
+    feature_issue_type = issue_type_mapping.get("feature", "Task")
+    story_issue_type = issue_type_mapping.get("story", "Story")
+    
+    def record_push(entity_type: str, entity_id: str, result: dict) -> dict:
+        """Create/update the push mapping for a pushed item; returns the executor outcome."""
+        mapping = existing_mappings.get(entity_id)
+        if result["action"] != "skipped":
+            if mapping:
+                mapping.external_key = result["key"]
+                mapping.external_url = result["url"]
+                mapping.last_pushed_at = datetime.now(timezone.utc)
+                mapping.last_push_hash = result["payload_hash"]
             else:
-                new_mapping = ExternalPushMapping(
+                mapping = ExternalPushMapping(
                     user_id=user_id,
                     integration_id=integration.integration_id,
                     provider=IntegrationProvider.JIRA.value,
-                    entity_type=EntityType.EPIC.value,
-                    entity_id=epic.epic_id,
+                    entity_type=entity_type,
+                    entity_id=entity_id,
                     external_type="Jira Issue",
-                    external_id=epic_result["id"],
-                    external_key=epic_result["key"],
-                    external_url=epic_result["url"],
+                    external_id=result["id"],
+                    external_key=result["key"],
+                    external_url=result["url"],
                     project_id=body.project_key,
-                    last_push_hash=epic_result["payload_hash"]
+                    last_push_hash=result["payload_hash"]
                 )
-                session.add(new_mapping)
-                existing_mappings[epic.epic_id] = new_mapping
-                results["created"].append({
-                    "type": "epic",
-                    "entity_id": epic.epic_id,
-                    "external_key": epic_result["key"],
-                    "url": epic_result["url"]
-                })
-            
-            results["links"].append(epic_result["url"])
-            parent_epic_key = epic_result["key"]
-        else:
-            parent_epic_key = None
-        
-        if body.push_scope in ["epic_features", "epic_features_stories", "full"]:
-            features_result = await session.execute(
-                select(Feature).where(Feature.epic_id == body.epic_id)
+                session.add(mapping)
+                existing_mappings[entity_id] = mapping
+        return {
+            "action": result["action"],
+            "external_id": result["id"] or (mapping.external_id if mapping else None),
+            "external_key": result["key"],
+            "url": result["url"]
+        }
+    
+    def existing(entity_id: str) -> dict:
+        mapping = existing_mappings.get(entity_id)
+        return {
+            "existing_issue_key": mapping.external_key if mapping else None,
+            "last_push_hash": mapping.last_push_hash if mapping else None
+        }
+    
+    async def push_epic(parent):
+        result = await push_service.push_item(
+            project_key=body.project_key,
+            issue_type="Epic",
+            title=epic.title,
+            description=epic_description,
+            entity_type=EntityType.EPIC.value,
+            entity_id=epic.epic_id,
+            field_mappings=field_mappings,
+            force=body.force,
+            **existing(epic.epic_id)
+        )
+        return await checkpoint.record(record_push, EntityType.EPIC.value, epic.epic_id, result)
+    
+    def feature_item(feature, epic_key):
+        return {
+            "issue_type": feature_issue_type,
+            "title": feature.title,
+            "description": push_service.format_feature_description({
+                "feature_id": feature.feature_id,
+                "description": feature.description,
+                "acceptance_criteria": feature.acceptance_criteria
+            }),
+            "entity_type": EntityType.FEATURE.value,
+            "entity_id": feature.feature_id,
+            "epic_link_key": epic_key
+        }
+    
+    def story_item(story, epic_key):
+        return {
+            "issue_type": story_issue_type,
+            "title": story.title if story.title else story.story_text[:80],
+            "description": push_service.format_story_description({
+                "story_id": story.story_id,
+                "persona": story.persona,
+                "action": story.action,
+                "benefit": story.benefit,
+                "acceptance_criteria": story.acceptance_criteria,
+                "story_points": story.story_points
+            }),
+            "entity_type": EntityType.STORY.value,
+            "entity_id": story.story_id,
+            "epic_link_key": epic_key,
+            "story_points": story.story_points
+        }
+    
+    def epic_key():
+        return executor.outcomes[epic.epic_id]["external_key"]
+    
+    def single_push(build, entity):
+        """Create or update one previously pushed item."""
+        async def push(parent):
+            item = build(entity, epic_key())
+            result = await push_service.push_item(
+                project_key=body.project_key,
+                field_mappings=field_mappings,
+                force=body.force,
+                **item,
+                **existing(item["entity_id"])
             )
-            features = features_result.scalars().all()
-            
-            feature_issue_type = issue_type_mapping.get("feature", "Task")
-            
-            for feature in features:
-                feature_description = push_service.format_feature_description({
-                    "feature_id": feature.feature_id,
-                    "description": feature.description,
-                    "acceptance_criteria": feature.acceptance_criteria
-                })
-                
-                existing_feature_mapping = existing_mappings.get(feature.feature_id)
-                
-                if not body.dry_run:
-                    try:
-                        feature_result = await push_service.push_item(
-                            project_key=body.project_key,
-                            issue_type=feature_issue_type,
-                            title=feature.title,
-                            description=feature_description,
-                            entity_type=EntityType.FEATURE.value,
-                            entity_id=feature.feature_id,
-                            existing_issue_key=existing_feature_mapping.external_key if existing_feature_mapping else None,
-                            epic_link_key=parent_epic_key,
-                            field_mappings=field_mappings
-                        )
-                        
-                        if existing_feature_mapping:
-                            existing_feature_mapping.external_key = feature_result["key"]
-                            existing_feature_mapping.external_url = feature_result["url"]
-                            existing_feature_mapping.last_pushed_at = datetime.now(timezone.utc)
-                            existing_feature_mapping.last_push_hash = feature_result["payload_hash"]
-                            results["updated"].append({
-                                "type": "feature",
-                                "entity_id": feature.feature_id,
-                                "external_key": feature_result["key"],
-                                "url": feature_result["url"]
-                            })
-                        else:
-                            new_mapping = ExternalPushMapping(
-                                user_id=user_id,
-                                integration_id=integration.integration_id,
-                                provider=IntegrationProvider.JIRA.value,
-                                entity_type=EntityType.FEATURE.value,
-                                entity_id=feature.feature_id,
-                                external_type="Jira Issue",
-                                external_id=feature_result["id"],
-                                external_key=feature_result["key"],
-                                external_url=feature_result["url"],
-                                project_id=body.project_key,
-                                last_push_hash=feature_result["payload_hash"]
-                            )
-                            session.add(new_mapping)
-                            existing_mappings[feature.feature_id] = new_mapping
-                            results["created"].append({
-                                "type": "feature",
-                                "entity_id": feature.feature_id,
-                                "external_key": feature_result["key"],
-                                "url": feature_result["url"]
-                            })
-                        
-                        results["links"].append(feature_result["url"])
-                        parent_feature_key = feature_result["key"]
-                    except Exception as e:
-                        logger.error(f"Error pushing feature {feature.feature_id}: {e}")
-                        results["errors"].append({
-                            "type": "feature",
-                            "entity_id": feature.feature_id,
-                            "error": str(e)
-                        })
-                        continue
-                
-                if body.push_scope in ["epic_features_stories", "full"]:
-                    stories_result = await session.execute(
-                        select(UserStory).where(UserStory.feature_id == feature.feature_id)
+            return await checkpoint.record(record_push, item["entity_type"], item["entity_id"], result)
+        return push
+    
+    def bulk_push(build, entities):
+        """Create never-pushed siblings with one bulk request; per-item errors come back as exceptions."""
+        async def push(parent):
+            items = [build(entity, epic_key()) for entity in entities]
+            results = await push_service.create_items_bulk(body.project_key, items, field_mappings)
+            async with checkpoint.lock:
+                return {
+                    item["entity_id"]: (
+                        results[item["entity_id"]]
+                        if isinstance(results[item["entity_id"]], Exception)
+                        else record_push(item["entity_type"], item["entity_id"], results[item["entity_id"]])
                     )
-                    stories = stories_result.scalars().all()
-                    
-                    story_issue_type = issue_type_mapping.get("story", "Story")
-                    
-                    for story in stories:
-                        story_title = story.title if story.title else story.story_text[:80]
-                        story_description = push_service.format_story_description({
-                            "story_id": story.story_id,
-                            "persona": story.persona,
-                            "action": story.action,
-                            "benefit": story.benefit,
-                            "acceptance_criteria": story.acceptance_criteria,
-                            "story_points": story.story_points
-                        })
-                        
-                        existing_story_mapping = existing_mappings.get(story.story_id)
-                        
-                        if not body.dry_run:
-                            try:
-                                story_result = await push_service.push_item(
-                                    project_key=body.project_key,
-                                    issue_type=story_issue_type,
-                                    title=story_title,
-                                    description=story_description,
-                                    entity_type=EntityType.STORY.value,
-                                    entity_id=story.story_id,
-                                    existing_issue_key=existing_story_mapping.external_key if existing_story_mapping else None,
-                                    epic_link_key=parent_epic_key,
-                                    story_points=story.story_points,
-                                    field_mappings=field_mappings
-                                )
-                                
-                                if existing_story_mapping:
-                                    existing_story_mapping.external_key = story_result["key"]
-                                    existing_story_mapping.external_url = story_result["url"]
-                                    existing_story_mapping.last_pushed_at = datetime.now(timezone.utc)
-                                    existing_story_mapping.last_push_hash = story_result["payload_hash"]
-                                    results["updated"].append({
-                                        "type": "story",
-                                        "entity_id": story.story_id,
-                                        "external_key": story_result["key"],
-                                        "url": story_result["url"]
-                                    })
-                                else:
-                                    new_mapping = ExternalPushMapping(
-                                        user_id=user_id,
-                                        integration_id=integration.integration_id,
-                                        provider=IntegrationProvider.JIRA.value,
-                                        entity_type=EntityType.STORY.value,
-                                        entity_id=story.story_id,
-                                        external_type="Jira Issue",
-                                        external_id=story_result["id"],
-                                        external_key=story_result["key"],
-                                        external_url=story_result["url"],
-                                        project_id=body.project_key,
-                                        last_push_hash=story_result["payload_hash"]
-                                    )
-                                    session.add(new_mapping)
-                                    results["created"].append({
-                                        "type": "story",
-                                        "entity_id": story.story_id,
-                                        "external_key": story_result["key"],
-                                        "url": story_result["url"]
-                                    })
-                                
-                                results["links"].append(story_result["url"])
-                            except Exception as e:
-                                logger.error(f"Error pushing story {story.story_id}: {e}")
-                                results["errors"].append({
-                                    "type": "story",
-                                    "entity_id": story.story_id,
-                                    "error": str(e)
-                                })
-        
-        push_run.ended_at = datetime.now(timezone.utc)
-        push_run.status = PushStatus.PARTIAL.value if results["errors"] else PushStatus.SUCCESS.value
-        push_run.summary_json = {
-            "created": len(results["created"]),
-            "updated": len(results["updated"]),
-            "errors": len(results["errors"]),
-            "links": results["links"][:10]
-        }
-        if results["errors"]:
-            push_run.error_json = {"errors": results["errors"]}
-        
-        await session.commit()
-        
-        return results
+                    for item in items
+                }
+        return push
+    
+    def add_pushes(entity_type, build, entities, id_attr, depends_on):
+        # Items restored from an earlier attempt already have mappings, so bulk chunks only hold new items
+        new = [e for e in entities if getattr(e, id_attr) not in existing_mappings]
+        for entity in entities:
+            if getattr(entity, id_attr) in existing_mappings:
+                executor.add(entity_type, getattr(entity, id_attr), single_push(build, entity), depends_on=depends_on)
+        for chunk in chunked(new):
+            executor.add_batch(
+                [(entity_type, getattr(e, id_attr)) for e in chunk], bulk_push(build, chunk), depends_on=depends_on
+            )
     
-    except Exception as e:
-        logger.error(f"Push to Jira failed: {e}")
-        push_run.ended_at = datetime.now(timezone.utc)
-        push_run.status = PushStatus.FAILED.value
-        push_run.error_json = {"error": str(e)}
-        await session.commit()
-        raise HTTPException(status_code=500, detail=str(e))
+    executor.add(EntityType.EPIC.value, epic.epic_id, push_epic)
+    add_pushes(EntityType.FEATURE.value, feature_item, features, "feature_id", epic.epic_id)
+    for feature in features:
+        add_pushes(
+            EntityType.STORY.value, story_item, stories_by_feature.get(feature.feature_id, []),
+            "story_id", feature.feature_id
+        )
+
+
+register_push_handler(IntegrationProvider.JIRA.value, run_jira_push)
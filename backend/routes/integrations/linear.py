@@ -17,14 +17,19 @@ from db.feature_models import Feature
 from db.user_story_models import UserStory
 from db.integration_models import (
     ExternalIntegration, ExternalPushMapping, ExternalPushRun,
-    IntegrationProvider, IntegrationStatus, PushStatus, EntityType
+    IntegrationProvider, IntegrationStatus, EntityType
 )
 from routes.auth import get_current_user_id
 from services.encryption import get_encryption_service
 from services.rate_limit import limiter, RATE_LIMITS
+from services.integration_metadata_cache import get_integration_metadata_cache
+from services.retry_service import PushResult
+from services.push_executor import PushExecutor, finalize_push_run, push_response
+from services.push_jobs import PushCheckpoint, PushJobError, enqueue_push_run, register_push_handler
+from services.jira_service import chunked
 from services.linear_service import (
     LinearOAuthService, LinearGraphQLService, LinearPushService,
-    LinearAPIError, AuthenticationError as LinearAuthError, compute_payload_hash
+    LinearAPIError, AuthenticationError as LinearAuthError, LINEAR_MUTATION_BATCH_SIZE
 )
 
 from .shared import (
@@ -148,6 +153,7 @@ async def linear_oauth_callback(
             session.add(integration)
         
         await session.commit()
+        await get_integration_metadata_cache().invalidate(integration.integration_id)
         logger.info(f"Linear integration connected for user {user_id}")
         
         return RedirectResponse(url=f"{frontend_callback_url}?success=true&provider=linear")
@@ -188,6 +194,7 @@ async def disconnect_linear(
     integration.updated_at = datetime.now(timezone.utc)
     
     await session.commit()
+    await get_integration_metadata_cache().invalidate(integration.integration_id)
     
     return {"status": "disconnected"}
 
@@ -231,6 +238,7 @@ async def configure_linear_integration(
     integration.updated_at = datetime.now(timezone.utc)
     
     await session.commit()
+    await get_integration_metadata_cache().invalidate(integration.integration_id)
     
     return {
         "status": "configured",
@@ -463,7 +471,7 @@ async def push_to_linear(
     body: LinearPushRequest,
     session: AsyncSession = Depends(get_db)
 ):
-    """Push Epic (and optionally Features/Stories) to Linear."""
+    """Queue a push of the Epic (and optionally Features/Stories) to Linear; poll /integrations/push-runs/{run_id}."""
     user_id = await get_current_user_id(request, session)
     await check_subscription_required(session, user_id)
     
@@ -472,13 +480,49 @@ async def push_to_linear(
     if not integration or integration.status != IntegrationStatus.CONNECTED.value:
         raise HTTPException(status_code=400, detail="Linear integration not connected")
     
+    # Verify Epic
+    epic_result = await session.execute(
+        select(Epic.epic_id).where(and_(Epic.epic_id == body.epic_id, Epic.user_id == user_id))
+    )
+    if epic_result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Epic not found")
+    
+    # Create push run record
+    push_run = ExternalPushRun(
+        user_id=user_id,
+        integration_id=integration.integration_id,
+        provider=IntegrationProvider.LINEAR.value,
+        epic_id=body.epic_id,
+        push_scope=body.push_scope,
+        is_dry_run=body.dry_run
+    )
+    
+    if body.dry_run:
+        result = PushResult()
+        finalize_push_run(push_run, result, [])
+        session.add(push_run)
+        await session.commit()
+        return push_response(push_run.run_id, result, [])
+    
+    return await enqueue_push_run(session, push_run, body.model_dump())
+
+
+async def run_linear_push(session: AsyncSession, push_run: ExternalPushRun, executor: PushExecutor, checkpoint: PushCheckpoint):
+    """Push job handler: load the epic tree and queue its items on the executor."""
+    body = LinearPushRequest(**push_run.request_json)
+    user_id = push_run.user_id
+    
+    integration = await get_user_integration(session, user_id, IntegrationProvider.LINEAR.value)
+    if not integration or integration.status != IntegrationStatus.CONNECTED.value:
+        raise PushJobError("Linear integration not connected")
+    
     # Fetch Epic
     epic_result = await session.execute(
         select(Epic).where(and_(Epic.epic_id == body.epic_id, Epic.user_id == user_id))
     )
     epic = epic_result.scalar_one_or_none()
     if not epic:
-        raise HTTPException(status_code=404, detail="Epic not found")
+        raise PushJobError("Epic not found")
     
     # Fetch snapshot for description
     snapshot_result = await session.execute(
@@ -488,319 +532,187 @@ async def push_to_linear(
         .limit(1)
     )
     snapshot = snapshot_result.scalar_one_or_none()
-    
-    # Create push run record
     now = datetime.now(timezone.utc)
-    push_run = ExternalPushRun(
-        user_id=user_id,
-        integration_id=integration.integration_id,
-        provider=IntegrationProvider.LINEAR.value,
-        epic_id=body.epic_id,
-        push_scope=body.push_scope,
-        is_dry_run=body.dry_run,
-        status=PushStatus.PENDING.value,
-        started_at=now
-    )
-    session.add(push_run)
-    await session.flush()
-    
-    results = {
-        "run_id": push_run.run_id,
-        "created": [],
-        "updated": [],
-        "errors": []
-    }
     
-    try:
-        graphql = await get_linear_service(session, user_id)
-        
-        # Get field mappings for priority, labels, etc.
-        field_mappings = integration.field_mappings or {}
-        priority_mapping = body.priority_mapping or field_mappings.get("priority_mapping", {
-            "must": 2, "should": 3, "could": 4, "wont": 0
-        })
-        label_policy = body.label_policy or field_mappings.get("label_policy", "create-missing")
-        epic_mapping_strategy = body.epic_mapping or field_mappings.get("epic_mapping", "issue")
-        
-        # Initialize push service with enhanced options
-        push_service = LinearPushService(graphql)
-        
-        # Push Epic
-        epic_data = {
-            "id": epic.epic_id,
-            "title": epic.title,
-            "description": snapshot.problem_statement if snapshot else epic.title,
-            "type": "epic"
-        }
-        
-        # Check existing mapping
-        existing_epic = await session.execute(
-            select(ExternalPushMapping).where(
-                and_(
-                    ExternalPushMapping.user_id == user_id,
-                    ExternalPushMapping.provider == IntegrationProvider.LINEAR.value,
-                    ExternalPushMapping.entity_id == epic.epic_id
-                )
+    graphql = await get_linear_service(session, user_id)
+    
+    # Get field mappings for priority, labels, etc.
+    field_mappings = integration.field_mappings or {}
+    priority_mapping = body.priority_mapping or field_mappings.get("priority_mapping", {
+        "must": 2, "should": 3, "could": 4, "wont": 0
+    })
+    label_policy = body.label_policy or field_mappings.get("label_policy", "create-missing")
+    epic_mapping_strategy = body.epic_mapping or field_mappings.get("epic_mapping", "issue")
+    
+    # Initialize push service with enhanced options
+    push_service = LinearPushService(graphql)
+    
+    # Load all Linear mappings for this user once
+    mappings_result = await session.execute(
+        select(ExternalPushMapping).where(
+            and_(
+                ExternalPushMapping.user_id == user_id,
+                ExternalPushMapping.provider == IntegrationProvider.LINEAR.value
             )
         )
-        existing_epic_mapping = existing_epic.scalar_one_or_none()
-        
-        if not body.dry_run:
-            try:
-                if existing_epic_mapping:
-                    # Update existing
-                    result = await push_service.update_issue(
-                        existing_epic_mapping.external_id,
-                        epic_data,
-                        body.team_id
-                    )
-                    results["updated"].append({
-                        "type": "epic",
-                        "id": epic.epic_id,
-                        "external_id": existing_epic_mapping.external_id,
-                        "external_key": existing_epic_mapping.external_key,
-                        "url": existing_epic_mapping.external_url
-                    })
-                    existing_epic_mapping.last_pushed_at = now
-                    existing_epic_mapping.last_push_hash = compute_payload_hash(epic_data)
-                else:
-                    # Create new with labels
-                    labels = ["epic"]
-                    result = await push_service.create_issue(
-                        epic_data, 
-                        body.team_id, 
-                        body.project_id,
-                        labels=labels,
-                        priority=priority_mapping.get("must", 2),
-                        label_policy=label_policy
-                    )
-                    
-                    # Create mapping
-                    mapping = ExternalPushMapping(
-                        user_id=user_id,
-                        provider=IntegrationProvider.LINEAR.value,
-                        entity_type=EntityType.EPIC.value,
-                        entity_id=epic.epic_id,
-                        external_id=result["id"],
-                        external_key=result.get("identifier"),
-                        external_url=result.get("url"),
-                        last_pushed_at=now,
-                        last_push_hash=compute_payload_hash(epic_data)
-                    )
-                    session.add(mapping)
-                    
-                    results["created"].append({
-                        "type": "epic",
-                        "id": epic.epic_id,
-                        "external_id": result["id"],
-                        "external_key": result.get("identifier"),
-                        "url": result.get("url")
-                    })
-                    
-                    existing_epic_mapping = mapping
-            except Exception as e:
-                logger.error(f"Failed to push epic: {e}")
-                results["errors"].append({
-                    "type": "epic",
-                    "id": epic.epic_id,
-                    "error": str(e)
-                })
-        
-        # Push Features
-        if body.push_scope in ["epic_features", "epic_features_stories"]:
-            features_result = await session.execute(
-                select(Feature).where(Feature.epic_id == body.epic_id)
-            )
-            features = features_result.scalars().all()
-            
-            for feature in features:
-                feature_data = {
-                    "id": feature.feature_id,
-                    "title": feature.title,
-                    "description": feature.description or "",
-                    "type": "feature",
-                    "parent_id": existing_epic_mapping.external_id if existing_epic_mapping else None
-                }
-                
-                # Determine priority based on MoSCoW
-                moscow = getattr(feature, 'moscow_score', None)
-                feature_priority = priority_mapping.get(moscow.lower() if moscow else "should", 3)
-                
-                existing_feature = await session.execute(
-                    select(ExternalPushMapping).where(
-                        and_(
-                            ExternalPushMapping.user_id == user_id,
-                            ExternalPushMapping.provider == IntegrationProvider.LINEAR.value,
-                            ExternalPushMapping.entity_id == feature.feature_id
-                        )
-                    )
+    )
+    existing_mappings = {m.entity_id: m for m in mappings_result.scalars().all()}
+    
+    # Load the whole tree up front; pushes run concurrently and must not touch the session
+    features = []
+    stories_by_feature = {}
+    if body.push_scope in ["epic_features", "epic_features_stories"]:
+        features_result = await session.execute(
+            select(Feature).where(Feature.epic_id == body.epic_id)
+        )
+        features = features_result.scalars().all()
+    if body.push_scope == "epic_features_stories" and features:
+        stories_result = await session.execute(
+            select(UserStory).where(UserStory.feature_id.in_([f.feature_id for f in features]))
+        )
+        for story in stories_result.scalars().all():
+            stories_by_feature.setdefault(story.feature_id, []).append(story)
+    
+    # Resolve labels once, before pushes run concurrently (missing ones are created in one request)
+    label_ids = {}
+    await push_service.ensure_labels(body.team_id, ["epic", "feature", "story"], label_policy)
+    for label in ["epic", "feature", "story"]:
+        label_ids[label] = await push_service.ensure_labels(body.team_id, [label], "only-existing")
+    
+    def record_push(entity_type: str, entity_id: str, result: dict) -> dict:
+        """Create/update the push mapping for a pushed item; returns the executor outcome."""
+        mapping = existing_mappings.get(entity_id)
+        if result["action"] != "skipped":
+            if mapping:
+                mapping.external_key = result["external_key"] or mapping.external_key
+                mapping.external_url = result["external_url"] or mapping.external_url
+                mapping.last_pushed_at = now
+                mapping.last_push_hash = result["payload_hash"]
+            else:
+                mapping = ExternalPushMapping(
+                    user_id=user_id,
+                    integration_id=integration.integration_id,
+                    provider=IntegrationProvider.LINEAR.value,
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    external_type="Linear Issue",
+                    external_id=result["external_id"],
+                    external_key=result["external_key"],
+                    external_url=result["external_url"],
+                    project_id=body.project_id,
+                    team_id=body.team_id,
+                    last_pushed_at=now,
+                    last_push_hash=result["payload_hash"]
                 )
-                existing_feature_mapping = existing_feature.scalar_one_or_none()
-                
-                if not body.dry_run:
-                    try:
-                        if existing_feature_mapping:
-                            result = await push_service.update_issue(
-                                existing_feature_mapping.external_id,
-                                feature_data,
-                                body.team_id
-                            )
-                            results["updated"].append({
-                                "type": "feature",
-                                "id": feature.feature_id,
-                                "external_id": existing_feature_mapping.external_id,
-                                "external_key": existing_feature_mapping.external_key,
-                                "url": existing_feature_mapping.external_url
-                            })
-                            existing_feature_mapping.last_pushed_at = now
-                            existing_feature_mapping.last_push_hash = compute_payload_hash(feature_data)
-                        else:
-                            labels = ["feature"]
-                            result = await push_service.create_issue(
-                                feature_data, 
-                                body.team_id, 
-                                body.project_id,
-                                parent_id=feature_data.get("parent_id"),
-                                labels=labels,
-                                priority=feature_priority,
-                                label_policy=label_policy
-                            )
-                            
-                            mapping = ExternalPushMapping(
-                                user_id=user_id,
-                                provider=IntegrationProvider.LINEAR.value,
-                                entity_type=EntityType.FEATURE.value,
-                                entity_id=feature.feature_id,
-                                external_id=result["id"],
-                                external_key=result.get("identifier"),
-                                external_url=result.get("url"),
-                                last_pushed_at=now,
-                                last_push_hash=compute_payload_hash(feature_data)
-                            )
-                            session.add(mapping)
-                            
-                            results["created"].append({
-                                "type": "feature",
-                                "id": feature.feature_id,
-                                "external_id": result["id"],
-                                "external_key": result.get("identifier"),
-                                "url": result.get("url")
-                            })
-                            
-                            existing_feature_mapping = mapping
-                    except Exception as e:
-                        logger.error(f"Failed to push feature {feature.feature_id}: {e}")
-                        results["errors"].append({
-                            "type": "feature",
-                            "id": feature.feature_id,
-                            "error": str(e)
-                        })
-                
-                # Push Stories
-                if body.push_scope == "epic_features_stories" and existing_feature_mapping:
-                    stories_result = await session.execute(
-                        select(UserStory).where(UserStory.feature_id == feature.feature_id)
-                    )
-                    stories = stories_result.scalars().all()
-                    
-                    for story in stories:
-                        story_data = {
-                            "id": story.story_id,
-                            "title": story.title,
-                            "description": f"{story.description or ''}\n\n**Acceptance Criteria:**\n{story.acceptance_criteria or ''}".strip(),
-                            "type": "story",
-                            "parent_id": existing_feature_mapping.external_id if existing_feature_mapping else None,
-                            "estimate": story.story_points
-                        }
-                        
-                        existing_story = await session.execute(
-                            select(ExternalPushMapping).where(
-                                and_(
-                                    ExternalPushMapping.user_id == user_id,
-                                    ExternalPushMapping.provider == IntegrationProvider.LINEAR.value,
-                                    ExternalPushMapping.entity_id == story.story_id
-                                )
-                            )
-                        )
-                        existing_story_mapping = existing_story.scalar_one_or_none()
-                        
-                        if not body.dry_run:
-                            try:
-                                if existing_story_mapping:
-                                    result = await push_service.update_issue(
-                                        existing_story_mapping.external_id,
-                                        story_data,
-                                        body.team_id
-                                    )
-                                    results["updated"].append({
-                                        "type": "story",
-                                        "id": story.story_id,
-                                        "external_id": existing_story_mapping.external_id,
-                                        "external_key": existing_story_mapping.external_key,
-                                        "url": existing_story_mapping.external_url
-                                    })
-                                    existing_story_mapping.last_pushed_at = now
-                                    existing_story_mapping.last_push_hash = compute_payload_hash(story_data)
-                                else:
-                                    labels = ["story"]
-                                    result = await push_service.create_issue(
-                                        story_data, 
-                                        body.team_id, 
-                                        body.project_id,
-                                        parent_id=story_data.get("parent_id"),
-                                        labels=labels,
-                                        priority=priority_mapping.get("should", 3),
-                                        label_policy=label_policy,
-                                        estimate=story.story_points
-                                    )
-                                    
-                                    mapping = ExternalPushMapping(
-                                        user_id=user_id,
-                                        provider=IntegrationProvider.LINEAR.value,
-                                        entity_type=EntityType.STORY.value,
-                                        entity_id=story.story_id,
-                                        external_id=result["id"],
-                                        external_key=result.get("identifier"),
-                                        external_url=result.get("url"),
-                                        last_pushed_at=now,
-                                        last_push_hash=compute_payload_hash(story_data)
-                                    )
-                                    session.add(mapping)
-                                    
-                                    results["created"].append({
-                                        "type": "story",
-                                        "id": story.story_id,
-                                        "external_id": result["id"],
-                                        "external_key": result.get("identifier"),
-                                        "url": result.get("url")
-                                    })
-                            except Exception as e:
-                                logger.error(f"Failed to push story {story.story_id}: {e}")
-                                results["errors"].append({
-                                    "type": "story",
-                                    "id": story.story_id,
-                                    "error": str(e)
-                                })
+                session.add(mapping)
+                existing_mappings[entity_id] = mapping
         
-        # Update push run status
-        push_run.status = PushStatus.SUCCESS.value if not results["errors"] else PushStatus.PARTIAL.value
-        push_run.ended_at = datetime.now(timezone.utc)
-        push_run.summary_json = {
-            "created": len(results["created"]),
-            "updated": len(results["updated"]),
-            "errors": len(results["errors"])
+        return {
+            "action": result["action"],
+            "external_id": mapping.external_id,
+            "external_key": mapping.external_key,
+            "url": mapping.external_url
         }
-        if results["errors"]:
-            push_run.error_json = results["errors"]
-        
-        await session.commit()
-        
-    except Exception as e:
-        logger.error(f"Push to Linear failed: {e}")
-        push_run.status = PushStatus.FAILED.value
-        push_run.ended_at = datetime.now(timezone.utc)
-        push_run.error_json = [{"error": str(e)}]
-        await session.commit()
-        raise HTTPException(status_code=500, detail=str(e))
     
-    return results
+    def push_item_args(entity_type: str, entity_id: str, title: str, description: str,
+                       priority=None, estimate=None) -> dict:
+        mapping = existing_mappings.get(entity_id)
+        return {
+            "title": title,
+            "description": description,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "existing_external_id": mapping.external_id if mapping else None,
+            "estimate": estimate,
+            "priority": priority,
+            "project_id": body.project_id,
+            "label_ids": label_ids[entity_type],
+            "last_push_hash": mapping.last_push_hash if mapping else None
+        }
+    
+    def batch_push(items: list):
+        """Executor callable pushing sibling items with batched mutations under their parent's issue."""
+        async def push(parent):
+            for item in items:
+                item["parent_external_id"] = parent["external_id"]
+            results = await push_service.push_items_batch(body.team_id, items, force=body.force)
+            async with checkpoint.lock:
+                return {
+                    item["entity_id"]: (
+                        results[item["entity_id"]]
+                        if isinstance(results[item["entity_id"]], Exception)
+                        else record_push(item["entity_type"], item["entity_id"], results[item["entity_id"]])
+                    )
+                    for item in items
+                }
+        return push
+    
+    def add_batch(items: list, depends_on: str):
+        # Items restored from an earlier attempt of this run are not sent again;
+        # one executor batch per request, so a retry only resends that chunk
+        items = [item for item in items if item["entity_id"] not in executor.restored]
+        for chunk in chunked(items, LINEAR_MUTATION_BATCH_SIZE):
+            executor.add_batch([(item["entity_type"], item["entity_id"]) for item in chunk], batch_push(chunk), depends_on=depends_on)
+    
+    epic_args = push_item_args(
+        EntityType.EPIC.value,
+        epic.epic_id,
+        epic.title,
+        push_service.format_epic_description(
+            {"epic_id": epic.epic_id},
+            {
+                "problem_statement": snapshot.problem_statement if snapshot else epic.title,
+                "desired_outcome": snapshot.desired_outcome if snapshot else None,
+                "epic_summary": snapshot.epic_summary if snapshot else None,
+                "acceptance_criteria": snapshot.acceptance_criteria if snapshot else None
+            }
+        ),
+        priority=priority_mapping.get("must", 2)
+    )
+    
+    async def push_epic(parent):
+        result = await push_service.push_item(team_id=body.team_id, force=body.force, **epic_args)
+        return await checkpoint.record(record_push, EntityType.EPIC.value, epic.epic_id, result)
+    
+    executor.add(EntityType.EPIC.value, epic.epic_id, push_epic)
+    
+    feature_items = []
+    for feature in features:
+        # Determine priority based on MoSCoW
+        moscow = getattr(feature, 'moscow_score', None)
+        feature_items.append(push_item_args(
+            EntityType.FEATURE.value,
+            feature.feature_id,
+            feature.title,
+            push_service.format_feature_description({
+                "feature_id": feature.feature_id,
+                "description": feature.description or "",
+                "acceptance_criteria": feature.acceptance_criteria
+            }),
+            priority=priority_mapping.get(moscow.lower() if moscow else "should", 3)
+        ))
+    add_batch(feature_items, epic.epic_id)
+    
+    # Each feature's stories go out together once the feature exists
+    for feature in features:
+        add_batch([
+            push_item_args(
+                EntityType.STORY.value,
+                story.story_id,
+                story.title or story.story_text[:80],
+                push_service.format_story_description({
+                    "story_id": story.story_id,
+                    "persona": story.persona,
+                    "action": story.action,
+                    "benefit": story.benefit,
+                    "acceptance_criteria": story.acceptance_criteria,
+                    "story_points": story.story_points
+                }),
+                priority=priority_mapping.get("should", 3),
+                estimate=story.story_points
+            )
+            for story in stories_by_feature.get(feature.feature_id, [])
+        ], feature.feature_id)
+
+
+register_push_handler(IntegrationProvider.LINEAR.value, run_linear_push)
@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from db.models import Subscription, SubscriptionStatus
 from services.subscription_helper import is_subscription_active, get_user_subscription
 from db.integration_models import (
-    ExternalIntegration, IntegrationProvider, IntegrationStatus
+    ExternalIntegration, ExternalPushRun, IntegrationProvider, IntegrationStatus
 )
 from services.encryption import get_encryption_service
 from services.linear_service import LinearOAuthService, LinearGraphQLService
@@ -68,6 +68,7 @@ class LinearPushRequest(BaseModel):
     push_scope: Literal["epic_only", "epic_features", "epic_features_stories"] = "epic_features_stories"
     include_bugs: bool = False
     dry_run: bool = False
+    force: bool = False  # Push even if unchanged since the last push
     epic_mapping: Optional[str] = None
     priority_mapping: Optional[dict] = None
     label_policy: Optional[str] = None
@@ -98,6 +99,7 @@ class JiraPushRequest(BaseModel):
     push_scope: Literal["epic_only", "epic_features", "epic_features_stories", "full"] = "epic_features_stories"
     include_bugs: bool = False
     dry_run: bool = False
+    force: bool = False  # Push even if unchanged since the last push
 
 
 # ============================================
@@ -129,6 +131,7 @@ class AzureDevOpsPushRequest(BaseModel):
     push_scope: Literal["epic_only", "epic_features", "epic_features_stories", "full"] = "epic_features_stories"
     include_bugs: bool = False
     dry_run: bool = False
+    force: bool = False  # Push even if unchanged since the last push
 
 
 # ============================================
@@ -159,6 +162,22 @@ async def get_user_integration(
     return result.scalar_one_or_none()
 
 
+async def get_user_push_run(session: AsyncSession, user_id: str, run_id: str) -> ExternalPushRun:
+    """Get one of the user's push runs, or 404"""
+    result = await session.execute(
+        select(ExternalPushRun).where(
+            and_(
+                ExternalPushRun.run_id == run_id,
+                ExternalPushRun.user_id == user_id
+            )
+        )
+    )
+    run = result.scalar_one_or_none()
+    if not run:
+        raise HTTPException(status_code=404, detail="Push run not found")
+    return run
+
+
 async def get_linear_service(session: AsyncSession, user_id: str) -> LinearGraphQLService:
     """Get authenticated Linear GraphQL service for user"""
     integration = await get_user_integration(session, user_id, IntegrationProvider.LINEAR.value)
@@ -187,7 +206,7 @@ async def get_linear_service(session: AsyncSession, user_id: str) -> LinearGraph
                 )
                 await session.commit()
                 
-                return LinearGraphQLService(new_tokens["access_token"])
+                return LinearGraphQLService(new_tokens["access_token"], integration.integration_id)
             except Exception as e:
                 logger.error(f"Token refresh failed: {e}")
                 integration.status = IntegrationStatus.ERROR.value
@@ -198,7 +217,7 @@ async def get_linear_service(session: AsyncSession, user_id: str) -> LinearGraph
     
     encryption = get_encryption_service()
     access_token = encryption.decrypt(integration.access_token_encrypted)
-    return LinearGraphQLService(access_token)
+    return LinearGraphQLService(access_token, integration.integration_id)
 
 
 async def get_jira_service(session: AsyncSession, user_id: str) -> JiraRESTService:
@@ -231,7 +250,7 @@ async def get_jira_service(session: AsyncSession, user_id: str) -> JiraRESTServi
                 )
                 await session.commit()
                 
-                return JiraRESTService(new_tokens["access_token"], integration.external_account_id)
+                return JiraRESTService(new_tokens["access_token"], integration.external_account_id, integration.integration_id)
             except Exception as e:
                 logger.error(f"Jira token refresh failed: {e}")
                 integration.status = IntegrationStatus.ERROR.value
@@ -242,7 +261,7 @@ async def get_jira_service(session: AsyncSession, user_id: str) -> JiraRESTServi
     
     encryption = get_encryption_service()
     access_token = encryption.decrypt(integration.access_token_encrypted)
-    return JiraRESTService(access_token, integration.external_account_id)
+    return JiraRESTService(access_token, integration.external_account_id, integration.integration_id)
 
 
 async def get_azure_devops_service(session: AsyncSession, user_id: str) -> AzureDevOpsRESTService:
@@ -260,7 +279,7 @@ async def get_azure_devops_service(session: AsyncSession, user_id: str) -> Azure
     
     encryption = get_encryption_service()
     pat = encryption.decrypt(integration.pat_encrypted)
-    return AzureDevOpsRESTService(integration.org_url, pat)
+    return AzureDevOpsRESTService(integration.org_url, pat, integration.integration_id)
 
 
 # ============================================
@@ -15,7 +15,7 @@ from pydantic import BaseModel, Field
 from db import get_db
 from db.models import Epic, EpicSnapshot, Subscription, SubscriptionStatus, LeanCanvas
 from services.llm_service import LLMService
-from services.subscription_helper import is_subscription_active, get_user_subscription
+from services.ai_entitlement_service import get_ai_entitlements
 
 logger = logging.getLogger(__name__)
 
@@ -169,8 +169,8 @@ async def generate_lean_canvas(
     user_id = await get_current_user_id(request, session)
     
     # Check subscription
-    subscription = await get_user_subscription(session, user_id)
-    if not is_subscription_active(subscription):
+    entitlements = await get_ai_entitlements(session, user_id)
+    if not entitlements.subscription_active:
         raise HTTPException(status_code=402, detail="Active subscription required")
     
     # Get epic data
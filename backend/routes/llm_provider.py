@@ -12,6 +12,7 @@ from db import get_db
 from db.models import LLMProviderConfig, LLMProvider
 from services.encryption import get_encryption_service
 from services.llm_service import LLMService
+from services.ai_entitlement_service import invalidate_ai_entitlements
 from routes.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
@@ -140,6 +141,7 @@ async def create_llm_provider(
     )
     
     await session.commit()
+    await invalidate_ai_entitlements(user_id)
     
     return LLMProviderConfigResponse(
         config_id=config_id,
@@ -185,6 +187,7 @@ async def delete_llm_provider(
         .where(LLMProviderConfig.config_id == config_id, LLMProviderConfig.user_id == user_id)
     )
     await session.commit()
+    await invalidate_ai_entitlements(user_id)
     
     if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Configuration not found")
@@ -225,5 +228,6 @@ async def activate_llm_provider(
     config.updated_at = datetime.now(timezone.utc)
     
     await session.commit()
+    await invalidate_ai_entitlements(user_id)
     
     return {"message": "Configuration activated"}
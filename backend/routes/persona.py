@@ -17,6 +17,7 @@ from db.persona_models import Persona, PersonaGenerationSettings
 from services.persona_service import PersonaService
 from services.llm_service import LLMService
 from services.epic_service import EpicService
+from routes.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/personas", tags=["personas"])
@@ -79,27 +80,6 @@ class RegeneratePortraitRequest(BaseModel):
     prompt: Optional[str] = None
 
 
-# Helper to get current user
-async def get_current_user_id(request: Request, session: AsyncSession) -> str:
-    """Extract user_id from session"""
-    session_token = request.cookies.get("session_token")
-    if not session_token:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    from db.models import UserSession
-    from sqlalchemy import select
-    
-    result = await session.execute(
-        select(UserSession).where(UserSession.session_token == session_token)
-    )
-    session_record = result.scalar_one_or_none()
-    
-    if not session_record:
-        raise HTTPException(status_code=401, detail="Invalid session")
-    
-    return session_record.user_id
-
-
 def persona_to_response(persona: Persona) -> PersonaResponse:
     """Convert Persona model to response"""
     return PersonaResponse(
@@ -6,9 +6,13 @@ from datetime import datetime, timezone
 from fastapi import APIRouter, HTTPException, Request, Depends
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Optional, Callable, AsyncGenerator
+import asyncio
 import json
 import logging
+import os
+import re
+import weakref
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -159,6 +163,138 @@ class EstimateResponse(BaseModel):
     confidence: str  # "low", "medium", "high"
 
 
+# ============================================
+# Concurrent Persona Estimation
+# ============================================
+
+# Max persona LLM calls in flight per user (shared across that user's poker rounds)
+POKER_PERSONA_CONCURRENCY = int(os.environ.get("POKER_PERSONA_CONCURRENCY", "5"))
+
+VALID_ESTIMATES = [1, 2, 3, 5, 8, 13]
+
+# Semaphores live only while some round for the user holds a reference
+_user_persona_semaphores: "weakref.WeakValueDictionary[str, asyncio.Semaphore]" = weakref.WeakValueDictionary()
+
+
+def get_user_persona_semaphore(user_id: str) -> asyncio.Semaphore:
+    """Get the per-user semaphore bounding concurrent persona estimates"""
+    semaphore = _user_persona_semaphores.get(user_id)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(POKER_PERSONA_CONCURRENCY)
+        _user_persona_semaphores[user_id] = semaphore
+    return semaphore
+
+
+def persona_info(persona: dict) -> dict:
+    """Public persona fields sent to the client"""
+    return {
+        "id": persona["id"],
+        "name": persona["name"],
+        "role": persona["role"],
+        "avatar": persona["avatar"]
+    }
+
+
+async def estimate_with_persona(
+    config_data: dict,
+    persona: dict,
+    system_prompt: str,
+    user_prompt: str
+) -> dict:
+    """
+    Get one persona's estimate (sessionless).
+    Returns a `persona_estimate` or `persona_error` event payload.
+    """
+    try:
+        full_response = ""
+        llm = LLMService()  # No session needed
+        async for chunk in llm.stream_with_config(
+            config_data=config_data,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            conversation_history=None
+        ):
+            full_response += chunk
+        
+        json_match = re.search(r'\{[\s\S]*?\}', full_response)
+        if not json_match:
+            return {'type': 'persona_error', 'persona_id': persona['id'], 'error': 'No valid JSON in response'}
+        
+        try:
+            estimate_data = json.loads(json_match.group(0))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse estimate from {persona['name']}: {e}")
+            return {'type': 'persona_error', 'persona_id': persona['id'], 'error': 'Failed to parse response'}
+        
+        # Validate and clamp estimate to the closest valid Fibonacci number
+        estimate = estimate_data.get("estimate", 3)
+        if estimate not in VALID_ESTIMATES:
+            estimate = min(VALID_ESTIMATES, key=lambda x: abs(x - estimate))
+        
+        return {
+            'type': 'persona_estimate',
+            'estimate': {
+                "persona_id": persona["id"],
+                "name": persona["name"],
+                "role": persona["role"],
+                "avatar": persona["avatar"],
+                "estimate": estimate,
+                "reasoning": estimate_data.get("reasoning", "No reasoning provided"),
+                "confidence": estimate_data.get("confidence", "medium")
+            }
+        }
+    except Exception as e:
+        logger.error(f"Error getting estimate from {persona['name']}: {e}")
+        return {'type': 'persona_error', 'persona_id': persona['id'], 'error': str(e)}
+
+
+async def stream_persona_estimates(
+    user_id: str,
+    config_data: dict,
+    build_prompts: Callable[[dict], tuple[str, str]],
+    estimates: list
+) -> AsyncGenerator[str, None]:
+    """
+    Run every AI persona concurrently (bounded per user) and yield SSE events
+    as each one starts and finishes.
+    
+    Successful estimates are appended to `estimates`, which is sorted back into
+    AI_PERSONAS order once all personas are done so summaries stay stable.
+    """
+    semaphore = get_user_persona_semaphore(user_id)
+    queue: asyncio.Queue = asyncio.Queue()
+    
+    async def run(persona: dict):
+        try:
+            async with semaphore:
+                await queue.put({'type': 'persona_start', 'persona': persona_info(persona)})
+                system_prompt, user_prompt = build_prompts(persona)
+                await queue.put(await estimate_with_persona(config_data, persona, system_prompt, user_prompt))
+        except Exception as e:
+            # Every persona must report back or the stream waits forever
+            logger.error(f"Error preparing estimate from {persona['name']}: {e}")
+            await queue.put({'type': 'persona_error', 'persona_id': persona['id'], 'error': str(e)})
+    
+    tasks = [asyncio.create_task(run(persona)) for persona in AI_PERSONAS]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            event = await queue.get()
+            if event['type'] != 'persona_start':
+                remaining -= 1
+                if event['type'] == 'persona_estimate':
+                    estimates.append(event['estimate'])
+            yield f"data: {json.dumps(event)}\n\n"
+    finally:
+        # Client disconnected or stream closed early - stop outstanding LLM calls
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    
+    persona_order = {persona["id"]: i for i, persona in enumerate(AI_PERSONAS)}
+    estimates.sort(key=lambda e: persona_order.get(e["persona_id"], len(persona_order)))
+
+
 # ============================================
 # Endpoints
 # ============================================
@@ -166,15 +302,7 @@ class EstimateResponse(BaseModel):
 @router.get("/personas")
 async def get_ai_personas():
     """Get list of AI personas available for estimation"""
-    return [
-        {
-            "id": p["id"],
-            "name": p["name"],
-            "role": p["role"],
-            "avatar": p["avatar"]
-        }
-        for p in AI_PERSONAS
-    ]
+    return [persona_info(p) for p in AI_PERSONAS]
 
 
 @router.post("/estimate")
@@ -234,18 +362,9 @@ USER STORY TO ESTIMATE:
 {chr(10).join(f'  - {c}' for c in story_acceptance_criteria)}
 """
     
-    async def generate():
-        # Start the estimation process
-        yield f"data: {json.dumps({'type': 'start', 'total_personas': len(AI_PERSONAS)})}\n\n"
-        
-        estimates = []
-        
-        for persona in AI_PERSONAS:
-            # Signal which persona is estimating
-            yield f"data: {json.dumps({'type': 'persona_start', 'persona': {'id': persona['id'], 'name': persona['name'], 'role': persona['role'], 'avatar': persona['avatar']}})}\n\n"
-            
-            # Build persona-specific prompt
-            system_prompt = f"""{delivery_context_text}
+    def build_prompts(persona: dict) -> tuple[str, str]:
+        """Build persona-specific system and user prompts"""
+        system_prompt = f"""{delivery_context_text}
 
 {persona['perspective']}
 
@@ -272,60 +391,22 @@ RESPONSE FORMAT (JSON only):
 
 Respond ONLY with the JSON, no other text."""
 
-            user_prompt = f"""Please estimate the following user story from your perspective as a {persona['role']}:
+        user_prompt = f"""Please estimate the following user story from your perspective as a {persona['role']}:
 
 {story_context}
 
 Provide your estimate in the specified JSON format."""
-
-            try:
-                full_response = ""
-                # Use sessionless streaming
-                llm = LLMService()  # No session needed
-                async for chunk in llm.stream_with_config(
-                    config_data=config_data,
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    conversation_history=None
-                ):
-                    full_response += chunk
-                
-                # Parse the response
-                import re
-                json_match = re.search(r'\{[\s\S]*?\}', full_response)
-                if json_match:
-                    try:
-                        estimate_data = json.loads(json_match.group(0))
-                        
-                        # Validate and clamp estimate
-                        estimate = estimate_data.get("estimate", 3)
-                        if estimate not in [1, 2, 3, 5, 8, 13]:
-                            # Find closest valid Fibonacci number
-                            valid = [1, 2, 3, 5, 8, 13]
-                            estimate = min(valid, key=lambda x: abs(x - estimate))
-                        
-                        persona_estimate = {
-                            "persona_id": persona["id"],
-                            "name": persona["name"],
-                            "role": persona["role"],
-                            "avatar": persona["avatar"],
-                            "estimate": estimate,
-                            "reasoning": estimate_data.get("reasoning", "No reasoning provided"),
-                            "confidence": estimate_data.get("confidence", "medium")
-                        }
-                        estimates.append(persona_estimate)
-                        
-                        yield f"data: {json.dumps({'type': 'persona_estimate', 'estimate': persona_estimate})}\n\n"
-                        
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse estimate from {persona['name']}: {e}")
-                        yield f"data: {json.dumps({'type': 'persona_error', 'persona_id': persona['id'], 'error': 'Failed to parse response'})}\n\n"
-                else:
-                    yield f"data: {json.dumps({'type': 'persona_error', 'persona_id': persona['id'], 'error': 'No valid JSON in response'})}\n\n"
-                    
-            except Exception as e:
-                logger.error(f"Error getting estimate from {persona['name']}: {e}")
-                yield f"data: {json.dumps({'type': 'persona_error', 'persona_id': persona['id'], 'error': str(e)})}\n\n"
+        
+        return system_prompt, user_prompt
+    
+    async def generate():
+        # Start the estimation process
+        yield f"data: {json.dumps({'type': 'start', 'total_personas': len(AI_PERSONAS)})}\n\n"
+        
+        # Personas estimate concurrently; events stream as each one finishes
+        estimates = []
+        async for event in stream_persona_estimates(user_id, config_data, build_prompts, estimates):
+            yield event
         
         # Calculate summary statistics and save session
         session_id = None
@@ -492,15 +573,9 @@ USER STORY TO ESTIMATE:
 {chr(10).join(f'  - {c}' for c in (acceptance_criteria or ['No criteria specified']))}
 """
     
-    async def generate():
-        yield f"data: {json.dumps({'type': 'start', 'total_personas': len(AI_PERSONAS)})}\n\n"
-        
-        estimates = []
-        
-        for persona in AI_PERSONAS:
-            yield f"data: {json.dumps({'type': 'persona_start', 'persona': {'id': persona['id'], 'name': persona['name'], 'role': persona['role'], 'avatar': persona['avatar']}})}\n\n"
-            
-            system_prompt = f"""{delivery_context_text}
+    def build_prompts(persona: dict) -> tuple[str, str]:
+        """Build persona-specific system and user prompts"""
+        system_prompt = f"""{delivery_context_text}
 
 {persona['perspective']}
 
@@ -519,47 +594,19 @@ RESPONSE FORMAT (JSON only):
   "confidence": "<low|medium|high>"
 }}"""
 
-            user_prompt = f"""Please estimate from your perspective as a {persona['role']}:
+        user_prompt = f"""Please estimate from your perspective as a {persona['role']}:
 
 {story_context}"""
-
-            try:
-                full_response = ""
-                # Use sessionless streaming
-                llm = LLMService()  # No session needed
-                async for chunk in llm.stream_with_config(
-                    config_data=config_data,
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    conversation_history=None
-                ):
-                    full_response += chunk
-                
-                import re
-                json_match = re.search(r'\{[\s\S]*?\}', full_response)
-                if json_match:
-                    try:
-                        estimate_data = json.loads(json_match.group(0))
-                        estimate = estimate_data.get("estimate", 3)
-                        if estimate not in [1, 2, 3, 5, 8, 13]:
-                            valid = [1, 2, 3, 5, 8, 13]
-                            estimate = min(valid, key=lambda x: abs(x - estimate))
-                        
-                        persona_estimate = {
-                            "persona_id": persona["id"],
-                            "name": persona["name"],
-                            "role": persona["role"],
-                            "avatar": persona["avatar"],
-                            "estimate": estimate,
-                            "reasoning": estimate_data.get("reasoning", "No reasoning provided"),
-                            "confidence": estimate_data.get("confidence", "medium")
-                        }
-                        estimates.append(persona_estimate)
-                        yield f"data: {json.dumps({'type': 'persona_estimate', 'estimate': persona_estimate})}\n\n"
-                    except json.JSONDecodeError:
-                        yield f"data: {json.dumps({'type': 'persona_error', 'persona_id': persona['id'], 'error': 'Parse error'})}\n\n"
-            except Exception as e:
-                yield f"data: {json.dumps({'type': 'persona_error', 'persona_id': persona['id'], 'error': str(e)})}\n\n"
+        
+        return system_prompt, user_prompt
+    
+    async def generate():
+        yield f"data: {json.dumps({'type': 'start', 'total_personas': len(AI_PERSONAS)})}\n\n"
+        
+        # Personas estimate concurrently; events stream as each one finishes
+        estimates = []
+        async for event in stream_persona_estimates(user_id, config_data, build_prompts, estimates):
+            yield event
         
         if estimates:
             valid_estimates = [e["estimate"] for e in estimates]
@@ -2,7 +2,7 @@
 Scoring Routes for JarlPM
 Handles RICE and MoSCoW scoring with AI assistance
 """
-from fastapi import APIRouter, HTTPException, Request, Depends
+from fastapi import APIRouter, HTTPException, Request, Depends, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
@@ -15,10 +15,13 @@ from db import get_db
 from db.models import EpicStage
 from db.scoring_models import MoSCoWScore, IMPACT_VALUES, CONFIDENCE_VALUES, IMPACT_LABELS, CONFIDENCE_LABELS, MOSCOW_LABELS
 from services.scoring_service import ScoringService
+from services.scoring_analytics import ScoringAnalyticsService
 from services.llm_service import LLMService
 from services.prompt_service import PromptService
 from services.epic_service import EpicService
-from services.subscription_helper import is_subscription_active, get_user_subscription
+from services.bug_service import epic_linked_bug_ids
+from services.epic_tree_loader import EpicTreeLoader
+from services.ai_entitlement_service import get_ai_entitlements
 from routes.auth import get_current_user_id
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,37 @@ router = APIRouter(prefix="/scoring", tags=["scoring"])
 # Helper Functions
 # ============================================
 
+def suggestion_block_parses(response: str) -> bool:
+    """True if a streamed suggestion ends with a parsable [SUGGESTION] block (cacheable)"""
+    import re
+    match = re.search(r'\[SUGGESTION\]([\s\S]*?)\[/SUGGESTION\]', response)
+    if not match:
+        return False
+    try:
+        json.loads(match.group(1).strip())
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
+def strip_code_fences(response: str) -> str:
+    """Strip a surrounding ```json fence from an LLM response"""
+    clean_response = response.strip()
+    if clean_response.startswith("```"):
+        lines = clean_response.split("\n")
+        clean_response = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+    return clean_response
+
+
+def json_response_parses(response: str) -> bool:
+    """True if a bulk scoring response is valid JSON (cacheable)"""
+    try:
+        json.loads(strip_code_fences(response))
+        return True
+    except json.JSONDecodeError:
+        return False
+
+
 def normalize_rice_values(rice: dict) -> dict:
     """Normalize AI-generated RICE values to allowed discrete values"""
     if not rice:
@@ -60,6 +94,39 @@ def normalize_rice_values(rice: dict) -> dict:
     return normalized
 
 
+def bulk_score_item(
+    item_type: str,
+    item_id: str,
+    moscow: Optional[dict],
+    rice: Optional[dict],
+    with_reasoning: bool = True
+) -> dict:
+    """Turn an AI suggestion into a ScoringService.apply_bulk_scores item"""
+    item = {"item_type": item_type, "item_id": item_id}
+    # MoSCoW is only tracked on features
+    if item_type == "feature" and moscow and moscow.get("score"):
+        item["moscow_score"] = moscow["score"]
+        if with_reasoning:
+            item["moscow_reasoning"] = moscow.get("reasoning")
+    if rice:
+        try:
+            # Normalize RICE values to allowed discrete values
+            normalized = normalize_rice_values(rice)
+        except (TypeError, ValueError):
+            normalized = rice  # Rejected by validation with a proper message
+        if all(k in normalized for k in ["reach", "impact", "confidence", "effort"]):
+            item["rice"] = normalized
+            if with_reasoning:
+                item["rice_reasoning"] = rice.get("reasoning")
+    return item
+
+
+def log_failed_scores(results: List[dict]):
+    for result in results:
+        if result["status"] in ("invalid", "not_found"):
+            logger.error(f"Failed to apply scores for {result['item_type']} {result['item_id']}: {result.get('error')}")
+
+
 # ============================================
 # Request/Response Models
 # ============================================
@@ -198,6 +265,7 @@ async def update_epic_moscow(
 async def suggest_epic_moscow(
     request: Request,
     epic_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """Get AI suggestion for Epic MoSCoW score (streaming)"""
@@ -257,12 +325,14 @@ Provide your analysis, then end with:
     async def generate():
         full_response = ""
         try:
-            # Use stream_with_config which doesn't need a session
+            # Use stream_cached which doesn't need a session (replays identical requests)
             llm = LLMService()  # No session needed for streaming
-            async for chunk in llm.stream_with_config(
+            async for chunk in llm.stream_cached(
                 config_data=config_data,
                 system_prompt=system_prompt,
-                user_prompt=user_prompt
+                user_prompt=user_prompt,
+                regenerate=regenerate,
+                should_cache=suggestion_block_parses
             ):
                 full_response += chunk
                 yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
@@ -400,6 +470,7 @@ async def update_feature_rice(
 async def suggest_feature_scores(
     request: Request,
     feature_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """Get AI suggestion for Feature MoSCoW and RICE scores (streaming)"""
@@ -476,12 +547,14 @@ Provide analysis, then end with:
     async def generate():
         full_response = ""
         try:
-            # Use stream_with_config which doesn't need a session
+            # Use stream_cached which doesn't need a session (replays identical requests)
             llm = LLMService()  # No session needed for streaming
-            async for chunk in llm.stream_with_config(
+            async for chunk in llm.stream_cached(
                 config_data=config_data,
                 system_prompt=system_prompt,
-                user_prompt=user_prompt
+                user_prompt=user_prompt,
+                regenerate=regenerate,
+                should_cache=suggestion_block_parses
             ):
                 full_response += chunk
                 yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
@@ -574,6 +647,7 @@ async def update_story_rice(
 async def suggest_story_rice(
     request: Request,
     story_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """Get AI suggestion for User Story RICE score (streaming)"""
@@ -641,12 +715,14 @@ Provide analysis, then end with:
     async def generate():
         full_response = ""
         try:
-            # Use stream_with_config which doesn't need a session
+            # Use stream_cached which doesn't need a session (replays identical requests)
             llm = LLMService()  # No session needed for streaming
-            async for chunk in llm.stream_with_config(
+            async for chunk in llm.stream_cached(
                 config_data=config_data,
                 system_prompt=system_prompt,
-                user_prompt=user_prompt
+                user_prompt=user_prompt,
+                regenerate=regenerate,
+                should_cache=suggestion_block_parses
             ):
                 full_response += chunk
                 yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
@@ -739,6 +815,7 @@ async def update_bug_rice(
 async def suggest_bug_rice(
     request: Request,
     bug_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """Get AI suggestion for Bug RICE score (streaming)"""
@@ -808,12 +885,14 @@ Provide analysis, then end with:
     async def generate():
         full_response = ""
         try:
-            # Use stream_with_config which doesn't need a session
+            # Use stream_cached which doesn't need a session (replays identical requests)
             llm = LLMService()  # No session needed for streaming
-            async for chunk in llm.stream_with_config(
+            async for chunk in llm.stream_cached(
                 config_data=config_data,
                 system_prompt=system_prompt,
-                user_prompt=user_prompt
+                user_prompt=user_prompt,
+                regenerate=regenerate,
+                should_cache=suggestion_block_parses
             ):
                 full_response += chunk
                 yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
@@ -867,6 +946,7 @@ class BulkScoringResponse(BaseModel):
 async def bulk_score_epic_features(
     request: Request,
     epic_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """Generate AI scoring suggestions for all features in an Epic"""
@@ -878,8 +958,8 @@ async def bulk_score_epic_features(
     user_id = await get_current_user_id(request, session)
     
     # Check subscription
-    subscription = await get_user_subscription(session, user_id)
-    if not is_subscription_active(subscription):
+    entitlements = await get_ai_entitlements(session, user_id)
+    if not entitlements.subscription_active:
         raise HTTPException(status_code=402, detail="Active subscription required")
     
     # Get epic
@@ -951,20 +1031,19 @@ Return format:
     
     try:
         response_text = ""
-        # Use sessionless streaming
+        # Use sessionless streaming (identical requests are served from the response cache)
         llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(
+        async for chunk in llm.stream_cached(
             config_data=config_data,
             system_prompt=system_prompt,
-            user_prompt=user_prompt
+            user_prompt=user_prompt,
+            regenerate=regenerate,
+            should_cache=json_response_parses
         ):
             response_text += chunk
         
         # Parse JSON response
-        clean_response = response_text.strip()
-        if clean_response.startswith("```"):
-            lines = clean_response.split("\n")
-            clean_response = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+        clean_response = strip_code_fences(response_text)
         
         import json as json_lib
         result = json_lib.loads(clean_response)
@@ -1008,9 +1087,6 @@ async def apply_bulk_scores(
     session: AsyncSession = Depends(get_db)
 ):
     """Apply AI-generated scores to features"""
-    from db.feature_models import Feature
-    from sqlalchemy import select
-    
     user_id = await get_current_user_id(request, session)
     scoring_service = ScoringService(session)
     
@@ -1020,36 +1096,15 @@ async def apply_bulk_scores(
     if not epic:
         raise HTTPException(status_code=404, detail="Epic not found")
     
-    applied = []
-    for suggestion in body:
-        try:
-            # Update MoSCoW
-            if suggestion.moscow and suggestion.moscow.get("score"):
-                await scoring_service.update_feature_moscow(
-                    suggestion.feature_id, 
-                    suggestion.moscow["score"]
-                )
-            
-            # Update RICE
-            if suggestion.rice:
-                # Normalize RICE values to allowed discrete values
-                rice = normalize_rice_values(suggestion.rice)
-                if all(k in rice for k in ["reach", "impact", "confidence", "effort"]):
-                    await scoring_service.update_feature_rice(
-                        suggestion.feature_id,
-                        rice["reach"],
-                        rice["impact"],
-                        rice["confidence"],
-                        rice["effort"]
-                    )
-            
-            applied.append(suggestion.feature_id)
-        except Exception as e:
-            logger.error(f"Failed to apply scores for feature {suggestion.feature_id}: {e}")
+    items = [
+        bulk_score_item("feature", suggestion.feature_id, suggestion.moscow, suggestion.rice, with_reasoning=False)
+        for suggestion in body
+    ]
+    results = await scoring_service.apply_bulk_scores(epic_id, user_id, items)
+    log_failed_scores(results)
     
-    await session.commit()
-    
-    return {"applied": len(applied), "feature_ids": applied}
+    applied = [result["item_id"] for result in results if result["status"] in ("applied", "skipped")]
+    return {"applied": len(applied), "feature_ids": applied, "results": results}
 
 
 
@@ -1078,50 +1133,29 @@ class ComprehensiveScoringResponse(BaseModel):
 async def bulk_score_all_items(
     request: Request,
     epic_id: str,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """Generate AI scoring suggestions for all features, stories, and bugs in an Epic"""
     from datetime import datetime, timezone
-    from db.models import Epic, Subscription, SubscriptionStatus, Bug
-    from db.feature_models import Feature
-    from db.user_story_models import UserStory
-    from sqlalchemy import select
+    from db.models import Epic
     
     user_id = await get_current_user_id(request, session)
     
     # Check subscription
-    subscription = await get_user_subscription(session, user_id)
-    if not is_subscription_active(subscription):
+    entitlements = await get_ai_entitlements(session, user_id)
+    if not entitlements.subscription_active:
         raise HTTPException(status_code=402, detail="Active subscription required")
     
-    # Get epic
-    epic_result = await session.execute(
-        select(Epic).where(Epic.epic_id == epic_id, Epic.user_id == user_id)
-    )
-    epic = epic_result.scalar_one_or_none()
-    if not epic:
+    # Get epic with its features, stories and the bugs linked (via BugLink)
+    # to any of them
+    trees = await EpicTreeLoader(session).load(user_id, Epic.epic_id == epic_id, include_bugs=True)
+    if not trees:
         raise HTTPException(status_code=404, detail="Epic not found")
-    
-    # Get features for this epic
-    features_result = await session.execute(
-        select(Feature).where(Feature.epic_id == epic_id)
-    )
-    features = features_result.scalars().all()
-    
-    # Get stories for all features
-    stories = []
-    for feature in features:
-        stories_result = await session.execute(
-            select(UserStory).where(UserStory.feature_id == feature.feature_id)
-        )
-        stories.extend(stories_result.scalars().all())
-    
-    # Get bugs for this user (bugs are linked to epics via BugLink, not directly)
-    # For now, get all bugs for the user
-    bugs_result = await session.execute(
-        select(Bug).where(Bug.user_id == user_id, Bug.is_deleted.is_(False))
-    )
-    bugs = bugs_result.scalars().all()
+    epic = trees[0].epic
+    features = trees[0].features
+    stories = trees[0].stories
+    bugs = trees[0].bugs
     
     if not features and not stories and not bugs:
         raise HTTPException(status_code=400, detail="No items found for this epic")
@@ -1208,20 +1242,19 @@ Return format:
     
     try:
         response_text = ""
-        # Use sessionless streaming
+        # Use sessionless streaming (identical requests are served from the response cache)
         llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(
+        async for chunk in llm.stream_cached(
             config_data=config_data,
             system_prompt=system_prompt,
-            user_prompt=user_prompt
+            user_prompt=user_prompt,
+            regenerate=regenerate,
+            should_cache=json_response_parses
         ):
             response_text += chunk
         
         # Parse JSON response
-        clean_response = response_text.strip()
-        if clean_response.startswith("```"):
-            lines = clean_response.split("\n")
-            clean_response = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+        clean_response = strip_code_fences(response_text)
         
         import json as json_lib
         result = json_lib.loads(clean_response)
@@ -1305,81 +1338,28 @@ async def apply_all_bulk_scores(
     if not epic:
         raise HTTPException(status_code=404, detail="Epic not found")
     
-    applied = {"features": 0, "stories": 0, "bugs": 0}
-    
-    # Apply feature scores
-    for suggestion in body.feature_suggestions:
-        try:
-            if suggestion.moscow and suggestion.moscow.get("score"):
-                moscow_reasoning = suggestion.moscow.get("reasoning")
-                await scoring_service.update_feature_moscow(
-                    suggestion.item_id, 
-                    suggestion.moscow["score"],
-                    moscow_reasoning
-                )
-            if suggestion.rice:
-                # Normalize RICE values to allowed discrete values
-                rice = normalize_rice_values(suggestion.rice)
-                rice_reasoning = suggestion.rice.get("reasoning")
-                if all(k in rice for k in ["reach", "impact", "confidence", "effort"]):
-                    await scoring_service.update_feature_rice(
-                        suggestion.item_id,
-                        rice["reach"],
-                        rice["impact"],
-                        rice["confidence"],
-                        rice["effort"],
-                        rice_reasoning
-                    )
-            applied["features"] += 1
-        except Exception as e:
-            logger.error(f"Failed to apply scores for feature {suggestion.item_id}: {e}")
-    
-    # Apply story scores
-    for suggestion in body.story_suggestions:
-        try:
-            if suggestion.rice:
-                # Normalize RICE values to allowed discrete values
-                rice = normalize_rice_values(suggestion.rice)
-                rice_reasoning = suggestion.rice.get("reasoning")
-                if all(k in rice for k in ["reach", "impact", "confidence", "effort"]):
-                    await scoring_service.update_story_rice(
-                        suggestion.item_id,
-                        rice["reach"],
-                        rice["impact"],
-                        rice["confidence"],
-                        rice["effort"],
-                        rice_reasoning
-                    )
-            applied["stories"] += 1
-        except Exception as e:
-            logger.error(f"Failed to apply scores for story {suggestion.item_id}: {e}")
-    
-    # Apply bug scores
-    for suggestion in body.bug_suggestions:
-        try:
-            if suggestion.rice:
-                # Normalize RICE values to allowed discrete values
-                rice = normalize_rice_values(suggestion.rice)
-                rice_reasoning = suggestion.rice.get("reasoning")
-                if all(k in rice for k in ["reach", "impact", "confidence", "effort"]):
-                    await scoring_service.update_bug_rice(
-                        suggestion.item_id,
-                        user_id,
-                        rice["reach"],
-                        rice["impact"],
-                        rice["confidence"],
-                        rice["effort"],
-                        rice_reasoning
-                    )
-            applied["bugs"] += 1
-        except Exception as e:
-            logger.error(f"Failed to apply scores for bug {suggestion.item_id}: {e}")
+    items = [
+        bulk_score_item(item_type, suggestion.item_id, suggestion.moscow, suggestion.rice)
+        for item_type, suggestions in (
+            ("feature", body.feature_suggestions),
+            ("story", body.story_suggestions),
+            ("bug", body.bug_suggestions),
+        )
+        for suggestion in suggestions
+    ]
+    results = await scoring_service.apply_bulk_scores(epic_id, user_id, items)
+    log_failed_scores(results)
     
-    await session.commit()
+    applied = {"features": 0, "stories": 0, "bugs": 0}
+    plural = {"feature": "features", "story": "stories", "bug": "bugs"}
+    for result in results:
+        if result["status"] in ("applied", "skipped"):
+            applied[plural[result["item_type"]]] += 1
     
     return {
         "applied": applied,
-        "total": applied["features"] + applied["stories"] + applied["bugs"]
+        "total": applied["features"] + applied["stories"] + applied["bugs"],
+        "results": results
     }
 
 
@@ -1421,48 +1401,31 @@ async def get_scored_items(
     session: AsyncSession = Depends(get_db)
 ):
     """Get all scored items: Epics, Standalone Stories, Standalone Bugs"""
-    from datetime import datetime, timezone
     from db.models import Epic, Bug
-    from db.feature_models import Feature
     from db.user_story_models import UserStory
-    from db.models import EpicSnapshot
-    from sqlalchemy import select, func
-    from sqlalchemy.orm import selectinload
+    from sqlalchemy import select
     
     user_id = await get_current_user_id(request, session)
     
     items = []
     
     # Get scored Epics (epics that have moscow_score OR have scored features/stories)
-    epics_result = await session.execute(
-        select(Epic).where(
-            Epic.user_id == user_id,
-            Epic.is_archived.is_(False),
-            Epic.current_stage == 'epic_locked'
-        ).options(selectinload(Epic.snapshot))
+    trees = await EpicTreeLoader(session).load(
+        user_id,
+        Epic.is_archived.is_(False),
+        Epic.current_stage == 'epic_locked',
+        include_snapshot=True
     )
-    epics = epics_result.scalars().all()
     
-    for epic in epics:
+    for tree in trees:
+        epic = tree.epic
         # Check if epic or its children have scores
-        features_result = await session.execute(
-            select(Feature).where(Feature.epic_id == epic.epic_id)
-        )
-        features = features_result.scalars().all()
+        features = tree.features
+        stories = tree.stories
         
         has_epic_score = epic.moscow_score is not None
         scored_features = [f for f in features if f.moscow_score or f.rice_total]
-        
-        # Get stories for features
-        stories = []
-        scored_stories = []
-        for feature in features:
-            stories_result = await session.execute(
-                select(UserStory).where(UserStory.feature_id == feature.feature_id)
-            )
-            feature_stories = stories_result.scalars().all()
-            stories.extend(feature_stories)
-            scored_stories.extend([s for s in feature_stories if s.rice_total])
+        scored_stories = [s for s in stories if s.rice_total]
         
         total_children = len(features) + len(stories)
         scored_children = len(scored_features) + len(scored_stories)
@@ -1504,39 +1467,30 @@ async def get_scored_items(
             scored_at=story.updated_at.isoformat() if story.updated_at else None
         ))
     
-    # Get scored standalone bugs
+    # Get scored standalone bugs (not linked to any epic)
     bugs_result = await session.execute(
         select(Bug).where(
             Bug.user_id == user_id,
             Bug.is_deleted.is_(False),
-            Bug.rice_total.isnot(None)
+            Bug.rice_total.isnot(None),
+            Bug.bug_id.not_in(epic_linked_bug_ids())
         )
     )
     bugs = bugs_result.scalars().all()
     
-    # Filter to only bugs that are not linked to any epic
-    from db.models import BugLink
     for bug in bugs:
-        links_result = await session.execute(
-            select(BugLink).where(BugLink.bug_id == bug.bug_id)
-        )
-        links = links_result.scalars().all()
-        
-        # Consider it standalone if no links to epics
-        epic_links = [link for link in links if link.entity_type == 'epic']
-        if not epic_links:
-            items.append(ScoredItemResponse(
-                item_id=bug.bug_id,
-                item_type='standalone_bug',
-                title=bug.title,
-                description=bug.description,
-                rice_reach=bug.rice_reach,
-                rice_impact=bug.rice_impact,
-                rice_confidence=bug.rice_confidence,
-                rice_effort=bug.rice_effort,
-                rice_total=bug.rice_total,
-                scored_at=bug.updated_at.isoformat() if bug.updated_at else None
-            ))
+        items.append(ScoredItemResponse(
+            item_id=bug.bug_id,
+            item_type='standalone_bug',
+            title=bug.title,
+            description=bug.description,
+            rice_reach=bug.rice_reach,
+            rice_impact=bug.rice_impact,
+            rice_confidence=bug.rice_confidence,
+            rice_effort=bug.rice_effort,
+            rice_total=bug.rice_total,
+            scored_at=bug.updated_at.isoformat() if bug.updated_at else None
+        ))
     
     return {"items": items, "total": len(items)}
 
@@ -1547,7 +1501,7 @@ async def get_items_for_scoring(
     session: AsyncSession = Depends(get_db)
 ):
     """Get items available for scoring: Locked Epics, Standalone Stories, Standalone Bugs"""
-    from db.models import Epic, Bug, BugLink
+    from db.models import Epic, Bug
     from db.user_story_models import UserStory
     from sqlalchemy import select
     
@@ -1598,29 +1552,20 @@ async def get_items_for_scoring(
     bugs_result = await session.execute(
         select(Bug).where(
             Bug.user_id == user_id,
-            Bug.is_deleted.is_(False)
+            Bug.is_deleted.is_(False),
+            Bug.bug_id.not_in(epic_linked_bug_ids())
         )
     )
     bugs = bugs_result.scalars().all()
     
     for bug in bugs:
-        # Check if bug is linked to an epic
-        links_result = await session.execute(
-            select(BugLink).where(
-                BugLink.bug_id == bug.bug_id,
-                BugLink.entity_type == 'epic'
-            )
-        )
-        epic_links = links_result.scalars().all()
-        
-        if not epic_links:  # Standalone bug
-            result["standalone_bugs"].append({
-                "bug_id": bug.bug_id,
-                "title": bug.title,
-                "severity": bug.severity,
-                "rice_total": bug.rice_total,
-                "has_rice": bug.rice_total is not None
-            })
+        result["standalone_bugs"].append({
+            "bug_id": bug.bug_id,
+            "title": bug.title,
+            "severity": bug.severity,
+            "rice_total": bug.rice_total,
+            "has_rice": bug.rice_total is not None
+        })
     
     return result
 
@@ -1632,20 +1577,15 @@ async def get_epic_scores(
     session: AsyncSession = Depends(get_db)
 ):
     """Get all scores for an epic and its children (features, stories, bugs)"""
-    from db.models import Epic, Bug, BugLink
-    from db.feature_models import Feature
-    from db.user_story_models import UserStory
-    from sqlalchemy import select
+    from db.models import Epic
     
     user_id = await get_current_user_id(request, session)
     
-    # Get epic
-    epic_result = await session.execute(
-        select(Epic).where(Epic.epic_id == epic_id, Epic.user_id == user_id)
-    )
-    epic = epic_result.scalar_one_or_none()
-    if not epic:
+    # Get epic with features, stories and linked bugs
+    trees = await EpicTreeLoader(session).load(user_id, Epic.epic_id == epic_id, include_bugs=True)
+    if not trees:
         raise HTTPException(status_code=404, detail="Epic not found")
+    epic = trees[0].epic
     
     result = {
         "epic_id": epic.epic_id,
@@ -1657,13 +1597,8 @@ async def get_epic_scores(
         "bugs": []
     }
     
-    # Get features with scores
-    features_result = await session.execute(
-        select(Feature).where(Feature.epic_id == epic_id)
-    )
-    features = features_result.scalars().all()
-    
-    for feature in features:
+    # Features with scores
+    for feature in trees[0].features:
         result["features"].append({
             "feature_id": feature.feature_id,
             "title": feature.title,
@@ -1677,13 +1612,8 @@ async def get_epic_scores(
             "rice_reasoning": feature.rice_reasoning
         })
         
-        # Get stories for this feature
-        stories_result = await session.execute(
-            select(UserStory).where(UserStory.feature_id == feature.feature_id)
-        )
-        stories = stories_result.scalars().all()
-        
-        for story in stories:
+        # Stories of this feature
+        for story in feature.user_stories:
             result["stories"].append({
                 "story_id": story.story_id,
                 "feature_id": feature.feature_id,
@@ -1697,32 +1627,19 @@ async def get_epic_scores(
                 "story_points": story.story_points
             })
     
-    # Get bugs linked to this epic
-    bug_links_result = await session.execute(
-        select(BugLink).where(
-            BugLink.entity_type == 'epic',
-            BugLink.entity_id == epic_id
-        )
-    )
-    bug_links = bug_links_result.scalars().all()
-    
-    for link in bug_links:
-        bug_result = await session.execute(
-            select(Bug).where(Bug.bug_id == link.bug_id, Bug.is_deleted.is_(False))
-        )
-        bug = bug_result.scalar_one_or_none()
-        if bug:
-            result["bugs"].append({
-                "bug_id": bug.bug_id,
-                "title": bug.title,
-                "severity": bug.severity,
-                "rice_reach": bug.rice_reach,
-                "rice_impact": bug.rice_impact,
-                "rice_confidence": bug.rice_confidence,
-                "rice_effort": bug.rice_effort,
-                "rice_total": bug.rice_total,
-                "rice_reasoning": bug.rice_reasoning
-            })
+    # Bugs linked to the epic, its features or their stories
+    for bug in trees[0].bugs:
+        result["bugs"].append({
+            "bug_id": bug.bug_id,
+            "title": bug.title,
+            "severity": bug.severity,
+            "rice_reach": bug.rice_reach,
+            "rice_impact": bug.rice_impact,
+            "rice_confidence": bug.rice_confidence,
+            "rice_effort": bug.rice_effort,
+            "rice_total": bug.rice_total,
+            "rice_reasoning": bug.rice_reasoning
+        })
     
     return result
 
@@ -1785,3 +1702,27 @@ async def score_standalone_bug(
         if "not found" in error_msg.lower():
             raise HTTPException(status_code=404, detail=error_msg)
         raise HTTPException(status_code=400, detail=error_msg)
+
+
+# ============================================
+# Scoring Analytics
+# ============================================
+
+@router.get("/analytics")
+async def get_scoring_analytics(
+    request: Request,
+    epic_id: Optional[str] = Query(None, description="Limit to one epic (default: all active epics, standalone stories and bugs)"),
+    top_n: int = Query(10, ge=1, le=100, description="Size of the top-by-RICE-per-effort list"),
+    session: AsyncSession = Depends(get_db)
+):
+    """Ranks, percentiles and score distributions for all scored items"""
+    user_id = await get_current_user_id(request, session)
+    
+    if epic_id:
+        epic = await EpicService(session).get_epic(epic_id, user_id)
+        if not epic:
+            raise HTTPException(status_code=404, detail="Epic not found")
+    
+    analytics_service = ScoringAnalyticsService(session)
+    table = await analytics_service.load_scores(user_id, epic_id)
+    return {"epic_id": epic_id, **analytics_service.compute(table, top_n)}
@@ -579,6 +579,7 @@ async def get_sprint_insights(
 @router.post("/ai/kickoff-plan", response_model=SprintKickoffPlan)
 async def generate_sprint_kickoff(
     request: Request,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """
@@ -588,6 +589,7 @@ async def generate_sprint_kickoff(
     Output: Sprint goal, top 5 stories, sequencing, risks
     """
     from services.llm_service import LLMService
+    from services.llm_response_cache import get_llm_response_cache
     from services.strict_output_service import StrictOutputService
     from services.epic_service import EpicService
     
@@ -700,11 +702,18 @@ Generate the sprint kickoff plan."""
     llm_model = llm_config.model_name
     
     try:
-        # Generate response using sessionless streaming
-        full_response = ""
-        llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
-            full_response += chunk
+        # Reuse the last accepted response for identical prompts (unless regenerating)
+        response_cache = get_llm_response_cache()
+        cached_response = await response_cache.get(config_data, system_prompt, user_prompt, regenerate=regenerate)
+        
+        if cached_response is not None:
+            full_response = cached_response
+        else:
+            # Generate response using sessionless streaming
+            full_response = ""
+            llm = LLMService()  # No session needed
+            async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
+                full_response += chunk
         
         # Repair callback for StrictOutputService (also sessionless)
         async def repair_callback(repair_prompt: str) -> str:
@@ -723,17 +732,18 @@ Generate the sprint kickoff plan."""
             original_prompt=user_prompt
         )
         
-        # Track model health (needs a fresh session)
-        from db import AsyncSessionLocal
-        async with AsyncSessionLocal() as track_session:
-            track_strict = StrictOutputService(track_session)
-            await track_strict.track_call(
-                user_id=user_id,
-                provider=llm_provider,
-                model_name=llm_model,
-                success=validation_result.valid,
-                repaired=validation_result.repair_attempts > 0
-            )
+        # Track model health (needs a fresh session; cached responses aren't model calls)
+        if cached_response is None:
+            from db import AsyncSessionLocal
+            async with AsyncSessionLocal() as track_session:
+                track_strict = StrictOutputService(track_session)
+                await track_strict.track_call(
+                    user_id=user_id,
+                    provider=llm_provider,
+                    model_name=llm_model,
+                    success=validation_result.valid,
+                    repaired=validation_result.repair_attempts > 0
+                )
         
         if not validation_result.valid:
             logger.error(f"Failed to parse AI kickoff-plan response after repairs: {validation_result.errors}")
@@ -742,6 +752,11 @@ Generate the sprint kickoff plan."""
                 detail=f"Failed to generate sprint kickoff plan: {', '.join(validation_result.errors)}"
             )
         
+        if cached_response is None:
+            await response_cache.set(
+                config_data, system_prompt, user_prompt, json_lib.dumps(validation_result.data, default=str)
+            )
+        
         # Validate story IDs in top_stories to prevent hallucination
         result_data = validation_result.data
         validated_top_stories = [
@@ -775,6 +790,7 @@ Generate the sprint kickoff plan."""
 @router.post("/ai/standup-summary", response_model=StandupSummary)
 async def generate_standup_summary(
     request: Request,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """
@@ -784,6 +800,7 @@ async def generate_standup_summary(
     Output: What changed, what's blocked, what to do next
     """
     from services.llm_service import LLMService
+    from services.llm_response_cache import get_llm_response_cache
     from services.strict_output_service import StrictOutputService
     from services.epic_service import EpicService
     
@@ -877,11 +894,18 @@ Generate the standup summary."""
     llm_model = llm_config.model_name
     
     try:
-        # Generate response using sessionless streaming
-        full_response = ""
-        llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
-            full_response += chunk
+        # Reuse the last accepted response for identical prompts (unless regenerating)
+        response_cache = get_llm_response_cache()
+        cached_response = await response_cache.get(config_data, system_prompt, user_prompt, regenerate=regenerate)
+        
+        if cached_response is not None:
+            full_response = cached_response
+        else:
+            # Generate response using sessionless streaming
+            full_response = ""
+            llm = LLMService()  # No session needed
+            async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
+                full_response += chunk
         
         # Repair callback for StrictOutputService (also sessionless)
         async def repair_callback(repair_prompt: str) -> str:
@@ -900,17 +924,18 @@ Generate the standup summary."""
             original_prompt=user_prompt
         )
         
-        # Track model health (needs a fresh session)
-        from db import AsyncSessionLocal
-        async with AsyncSessionLocal() as track_session:
-            track_strict = StrictOutputService(track_session)
-            await track_strict.track_call(
-                user_id=user_id,
-                provider=llm_provider,
-                model_name=llm_model,
-                success=validation_result.valid,
-                repaired=validation_result.repair_attempts > 0
-            )
+        # Track model health (needs a fresh session; cached responses aren't model calls)
+        if cached_response is None:
+            from db import AsyncSessionLocal
+            async with AsyncSessionLocal() as track_session:
+                track_strict = StrictOutputService(track_session)
+                await track_strict.track_call(
+                    user_id=user_id,
+                    provider=llm_provider,
+                    model_name=llm_model,
+                    success=validation_result.valid,
+                    repaired=validation_result.repair_attempts > 0
+                )
         
         if not validation_result.valid:
             logger.error(f"Failed to parse AI standup-summary response after repairs: {validation_result.errors}")
@@ -919,6 +944,11 @@ Generate the standup summary."""
                 detail=f"Failed to generate standup summary: {', '.join(validation_result.errors)}"
             )
         
+        if cached_response is None:
+            await response_cache.set(
+                config_data, system_prompt, user_prompt, json_lib.dumps(validation_result.data, default=str)
+            )
+        
         # ===== SAVE INSIGHT TO DATABASE (fresh session) =====
         from db import AsyncSessionLocal
         async with AsyncSessionLocal() as save_session:
@@ -944,6 +974,7 @@ Generate the standup summary."""
 @router.post("/ai/wip-suggestions", response_model=WipSuggestions)
 async def generate_wip_suggestions(
     request: Request,
+    regenerate: bool = False,
     session: AsyncSession = Depends(get_db)
 ):
     """
@@ -952,6 +983,7 @@ async def generate_wip_suggestions(
     If in_progress is overloaded, recommend what to finish first vs pause.
     """
     from services.llm_service import LLMService
+    from services.llm_response_cache import get_llm_response_cache
     from services.strict_output_service import StrictOutputService
     from services.epic_service import EpicService
     
@@ -1053,11 +1085,18 @@ Generate WIP optimization suggestions."""
     llm_model = llm_config.model_name
     
     try:
-        # Generate response using sessionless streaming
-        full_response = ""
-        llm = LLMService()  # No session needed
-        async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
-            full_response += chunk
+        # Reuse the last accepted response for identical prompts (unless regenerating)
+        response_cache = get_llm_response_cache()
+        cached_response = await response_cache.get(config_data, system_prompt, user_prompt, regenerate=regenerate)
+        
+        if cached_response is not None:
+            full_response = cached_response
+        else:
+            # Generate response using sessionless streaming
+            full_response = ""
+            llm = LLMService()  # No session needed
+            async for chunk in llm.stream_with_config(config_data, system_prompt, user_prompt):
+                full_response += chunk
         
         # Repair callback for StrictOutputService (also sessionless)
         async def repair_callback(repair_prompt: str) -> str:
@@ -1076,17 +1115,18 @@ Generate WIP optimization suggestions."""
             original_prompt=user_prompt
         )
         
-        # Track model health (needs a fresh session)
-        from db import AsyncSessionLocal
-        async with AsyncSessionLocal() as track_session:
-            track_strict = StrictOutputService(track_session)
-            await track_strict.track_call(
-                user_id=user_id,
-                provider=llm_provider,
-                model_name=llm_model,
-                success=validation_result.valid,
-                repaired=validation_result.repair_attempts > 0
-            )
+        # Track model health (needs a fresh session; cached responses aren't model calls)
+        if cached_response is None:
+            from db import AsyncSessionLocal
+            async with AsyncSessionLocal() as track_session:
+                track_strict = StrictOutputService(track_session)
+                await track_strict.track_call(
+                    user_id=user_id,
+                    provider=llm_provider,
+                    model_name=llm_model,
+                    success=validation_result.valid,
+                    repaired=validation_result.repair_attempts > 0
+                )
         
         if not validation_result.valid:
             logger.error(f"Failed to parse AI wip-suggestions response after repairs: {validation_result.errors}")
@@ -1095,6 +1135,11 @@ Generate WIP optimization suggestions."""
                 detail=f"Failed to generate WIP suggestions: {', '.join(validation_result.errors)}"
             )
         
+        if cached_response is None:
+            await response_cache.set(
+                config_data, system_prompt, user_prompt, json_lib.dumps(validation_result.data, default=str)
+            )
+        
         # Validate story IDs to prevent hallucination
         result_data = validation_result.data
         validated_finish_first = [
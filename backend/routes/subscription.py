@@ -16,19 +16,18 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from db import get_db
 from db.models import Subscription, SubscriptionStatus, PaymentTransaction, User
 from routes.auth import get_current_user_id
+from services.ai_entitlement_service import invalidate_ai_entitlements
+from services.stripe_catalog import (
+    MONTHLY_PRICE, ANNUAL_PRICE, SUBSCRIPTION_CURRENCY,
+    configure_stripe, get_stripe_price_catalog
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/subscription", tags=["subscription"])
 
-# Subscription pricing configuration
-MONTHLY_PRICE = 45.00  # $45/month
-ANNUAL_PRICE = 432.00  # $432/year ($36/mo, 2 months free)
-SUBSCRIPTION_CURRENCY = "usd"
-
-# Stripe Price IDs - set in .env or create dynamically
-STRIPE_MONTHLY_PRICE_ID = os.environ.get("STRIPE_MONTHLY_PRICE_ID")
-STRIPE_ANNUAL_PRICE_ID = os.environ.get("STRIPE_ANNUAL_PRICE_ID")
+# Pricing and Stripe price IDs live in services/stripe_catalog.py. Stripe is
+# called through the SDK's *_async methods so requests never block the loop.
 
 
 class CreateCheckoutRequest(BaseModel):
@@ -50,13 +49,11 @@ class CancelSubscriptionRequest(BaseModel):
 
 def get_stripe_client():
     """Get configured Stripe client"""
-    api_key = os.environ.get("STRIPE_API_KEY")
-    if not api_key or api_key == "your-stripe-api-key-here":
+    if not configure_stripe():
         raise HTTPException(
             status_code=500, 
             detail="Payment system not configured. Please add your STRIPE_API_KEY to .env"
         )
-    stripe.api_key = api_key
     return stripe
 
 
@@ -76,14 +73,14 @@ async def get_or_create_stripe_customer(
     if subscription and subscription.stripe_customer_id:
         # Verify customer still exists in Stripe
         try:
-            stripe_client.Customer.retrieve(subscription.stripe_customer_id)
+            await stripe_client.Customer.retrieve_async(subscription.stripe_customer_id)
             return subscription.stripe_customer_id
         except stripe.error.InvalidRequestError:
             # Customer was deleted, create new one
             pass
     
     # Create new Stripe customer
-    customer = stripe_client.Customer.create(
+    customer = await stripe_client.Customer.create_async(
         email=user_email,
         metadata={"user_id": user_id}
     )
@@ -103,59 +100,6 @@ async def get_or_create_stripe_customer(
     return customer.id
 
 
-async def get_or_create_price(stripe_client, billing_cycle: str = "monthly") -> str:
-    """Get existing price or create a new one for the specified billing cycle"""
-    is_annual = billing_cycle == "annual"
-    
-    # If price ID is configured, use it
-    if is_annual and STRIPE_ANNUAL_PRICE_ID:
-        return STRIPE_ANNUAL_PRICE_ID
-    if not is_annual and STRIPE_MONTHLY_PRICE_ID:
-        return STRIPE_MONTHLY_PRICE_ID
-    
-    # Check for existing JarlPM product
-    products = stripe_client.Product.list(limit=10)
-    jarlpm_product = None
-    
-    for product in products.data:
-        if product.metadata.get("app") == "jarlpm":
-            jarlpm_product = product
-            break
-    
-    # Create product if not exists
-    if not jarlpm_product:
-        jarlpm_product = stripe_client.Product.create(
-            name="JarlPM Pro",
-            description="AI-agnostic Product Management - Turn ideas into plans",
-            metadata={"app": "jarlpm"}
-        )
-        logger.info(f"Created Stripe product: {jarlpm_product.id}")
-    
-    # Check for existing price on this product
-    prices = stripe_client.Price.list(product=jarlpm_product.id, active=True, limit=10)
-    
-    target_amount = int(ANNUAL_PRICE * 100) if is_annual else int(MONTHLY_PRICE * 100)
-    target_interval = "year" if is_annual else "month"
-    
-    for price in prices.data:
-        if (price.recurring and 
-            price.recurring.interval == target_interval and 
-            price.unit_amount == target_amount):
-            return price.id
-    
-    # Create new recurring price
-    price = stripe_client.Price.create(
-        product=jarlpm_product.id,
-        unit_amount=target_amount,
-        currency=SUBSCRIPTION_CURRENCY,
-        recurring={"interval": target_interval},
-        metadata={"app": "jarlpm", "billing_cycle": billing_cycle}
-    )
-    logger.info(f"Created Stripe {billing_cycle} price: {price.id}")
-    
-    return price.id
-
-
 @router.post("/create-checkout")
 async def create_checkout_session(
     request: Request, 
@@ -180,8 +124,9 @@ async def create_checkout_session(
         stripe_client, user_id, user.email, session
     )
     
-    # Get or create price for selected billing cycle
-    price_id = await get_or_create_price(stripe_client, body.billing_cycle)
+    # Price for selected billing cycle (cached; resolved once per cycle)
+    price_catalog = get_stripe_price_catalog()
+    price_id = await price_catalog.get_price_id(body.billing_cycle)
     
     # Build URLs from frontend origin
     success_url = f"{body.origin_url}/settings?payment=success&session_id={{CHECKOUT_SESSION_ID}}"
@@ -189,9 +134,8 @@ async def create_checkout_session(
     
     price_amount = ANNUAL_PRICE if body.billing_cycle == "annual" else MONTHLY_PRICE
     
-    try:
-        # Create subscription checkout session
-        checkout_session = stripe_client.checkout.Session.create(
+    async def create_session(price_id: str):
+        return await stripe_client.checkout.Session.create_async(
             customer=customer_id,
             payment_method_types=["card"],
             line_items=[{"price": price_id, "quantity": 1}],
@@ -211,6 +155,18 @@ async def create_checkout_session(
                 "billing_cycle": body.billing_cycle
             }
         )
+    
+    try:
+        # Create subscription checkout session
+        try:
+            checkout_session = await create_session(price_id)
+        except stripe.error.InvalidRequestError as e:
+            if getattr(e, "param", None) != "line_items[0][price]":
+                raise
+            # Cached price was archived/deleted in Stripe - look it up again once
+            logger.warning(f"Stripe rejected cached {body.billing_cycle} price {price_id}: {e}")
+            await price_catalog.invalidate(body.billing_cycle)
+            checkout_session = await create_session(await price_catalog.get_price_id(body.billing_cycle))
     except stripe.error.StripeError as e:
         logger.error(f"Stripe checkout creation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to create checkout session: {str(e)}")
@@ -219,7 +175,7 @@ async def create_checkout_session(
     transaction = PaymentTransaction(
         user_id=user_id,
         stripe_session_id=checkout_session.id,
-        amount=SUBSCRIPTION_PRICE,
+        amount=price_amount,
         currency=SUBSCRIPTION_CURRENCY,
         payment_status="pending",
         transaction_type="subscription",
@@ -265,7 +221,7 @@ async def get_checkout_status(
     stripe_client = get_stripe_client()
     
     try:
-        checkout_session = stripe_client.checkout.Session.retrieve(
+        checkout_session = await stripe_client.checkout.Session.retrieve_async(
             session_id,
             expand=["subscription"]
         )
@@ -294,7 +250,7 @@ async def get_checkout_status(
         stripe_sub = checkout_session.subscription
         if isinstance(stripe_sub, str):
             # Need to fetch the subscription object
-            stripe_sub = stripe_client.Subscription.retrieve(stripe_sub)
+            stripe_sub = await stripe_client.Subscription.retrieve_async(stripe_sub)
         
         # Update local subscription record
         sub_result = await session.execute(
@@ -320,6 +276,7 @@ async def get_checkout_status(
                 transaction.payment_status = "processed"
     
     await session.commit()
+    await invalidate_ai_entitlements(user_id)
     
     return {
         "status": checkout_session.status,
@@ -353,7 +310,7 @@ async def get_subscription_status(
     if subscription.stripe_subscription_id:
         try:
             stripe_client = get_stripe_client()
-            stripe_sub = stripe_client.Subscription.retrieve(subscription.stripe_subscription_id)
+            stripe_sub = await stripe_client.Subscription.retrieve_async(subscription.stripe_subscription_id)
             
             # Always sync from Stripe - this is our fallback if webhooks missed
             new_status = _map_stripe_status(stripe_sub.status)
@@ -373,6 +330,7 @@ async def get_subscription_status(
                 subscription.cancel_at_period_end = new_cancel_at_period_end
                 subscription.updated_at = datetime.now(timezone.utc)
                 await session.commit()
+                await invalidate_ai_entitlements(user_id)
                 logger.info(f"Synced subscription {subscription.stripe_subscription_id} from Stripe (fallback)")
             
             return SubscriptionStatusResponse(
@@ -422,18 +380,19 @@ async def cancel_subscription(
     try:
         if body.cancel_at_period_end:
             # Cancel at end of billing period
-            stripe_sub = stripe_client.Subscription.modify(
+            stripe_sub = await stripe_client.Subscription.modify_async(
                 subscription.stripe_subscription_id,
                 cancel_at_period_end=True
             )
             subscription.status = SubscriptionStatus.ACTIVE.value  # Still active until period end
         else:
             # Cancel immediately
-            stripe_sub = stripe_client.Subscription.cancel(subscription.stripe_subscription_id)
+            stripe_sub = await stripe_client.Subscription.cancel_async(subscription.stripe_subscription_id)
             subscription.status = SubscriptionStatus.CANCELED.value
         
         subscription.updated_at = datetime.now(timezone.utc)
         await session.commit()
+        await invalidate_ai_entitlements(user_id)
         
         return {
             "status": "canceled" if not body.cancel_at_period_end else "cancel_scheduled",
@@ -466,7 +425,7 @@ async def reactivate_subscription(
     stripe_client = get_stripe_client()
     
     try:
-        stripe_sub = stripe_client.Subscription.modify(
+        stripe_sub = await stripe_client.Subscription.modify_async(
             subscription.stripe_subscription_id,
             cancel_at_period_end=False
         )
@@ -474,6 +433,7 @@ async def reactivate_subscription(
         subscription.status = _map_stripe_status(stripe_sub.status)
         subscription.updated_at = datetime.now(timezone.utc)
         await session.commit()
+        await invalidate_ai_entitlements(user_id)
         
         return {
             "status": "reactivated",
@@ -516,12 +476,9 @@ async def stripe_webhook(request: Request):
     """
     from db.database import AsyncSessionLocal
     
-    api_key = os.environ.get("STRIPE_API_KEY")
-    if not api_key or api_key == "your-stripe-api-key-here":
+    if not configure_stripe():
         raise HTTPException(status_code=500, detail="Payment system not configured")
     
-    stripe.api_key = api_key
-    
     body = await request.body()
     signature = request.headers.get("Stripe-Signature")
     webhook_secret = os.environ.get("STRIPE_WEBHOOK_SECRET")
@@ -611,6 +568,7 @@ async def _handle_subscription_created(subscription_obj):
             session.add(subscription)
         
         await session.commit()
+        await invalidate_ai_entitlements(user_id)
         logger.info(f"Subscription created for user {user_id}: {subscription_obj.id}")
 
 
@@ -645,6 +603,7 @@ async def _handle_subscription_updated(subscription_obj):
         subscription.updated_at = datetime.now(timezone.utc)
         
         await session.commit()
+        await invalidate_ai_entitlements(subscription.user_id)
         logger.info(f"Subscription updated via webhook: {subscription_obj.id} -> status={subscription_obj.status}, cancel_at_period_end={subscription_obj.cancel_at_period_end}")
 
 
@@ -668,6 +627,7 @@ async def _handle_subscription_deleted(subscription_obj):
             subscription.cancel_at_period_end = False  # No longer pending, actually canceled
             subscription.updated_at = datetime.now(timezone.utc)
             await session.commit()
+            await invalidate_ai_entitlements(subscription.user_id)
             logger.info(f"Subscription deleted via webhook: {subscription_obj.id}")
 
 
@@ -692,6 +652,7 @@ async def _handle_invoice_paid(invoice_obj):
             subscription.status = SubscriptionStatus.ACTIVE.value
             subscription.updated_at = datetime.now(timezone.utc)
             await session.commit()
+            await invalidate_ai_entitlements(subscription.user_id)
             logger.info(f"Invoice paid for subscription: {subscription_id}")
 
 
@@ -715,6 +676,7 @@ async def _handle_payment_failed(invoice_obj):
             subscription.status = SubscriptionStatus.PAST_DUE.value
             subscription.updated_at = datetime.now(timezone.utc)
             await session.commit()
+            await invalidate_ai_entitlements(subscription.user_id)
             logger.warning(f"Payment failed for subscription: {subscription_id}")
 
 
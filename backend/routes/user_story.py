@@ -18,6 +18,7 @@ from db.user_story_models import UserStory, UserStoryStage
 from services.user_story_service import UserStoryService
 from services.llm_service import LLMService
 from services.prompt_service import PromptService
+from services.json_stream_parser import JSONArrayStreamParser, validate_item
 from services.lock_policy_service import lock_policy
 from routes.auth import get_current_user_id
 
@@ -101,6 +102,16 @@ class GenerateStoriesRequest(BaseModel):
     count: int = 5  # Target number of stories to generate
 
 
+class GeneratedStory(BaseModel):
+    """One AI-generated user story, validated as soon as it has streamed"""
+    model_config = {"extra": "allow"}
+    
+    persona: str
+    action: str
+    benefit: str
+    acceptance_criteria: List[str] = []
+
+
 # Standalone story models
 class StandaloneStoryCreate(BaseModel):
     title: str
@@ -327,7 +338,8 @@ Respond ONLY with the JSON array, no other text."""
     user_prompt = "Generate user stories to accomplish this feature. Aim for stories that are each completable in one sprint."
     
     async def generate():
-        full_response = ""
+        parser = JSONArrayStreamParser()
+        stories = []
         try:
             # Use sessionless streaming
             llm = LLMService()  # No session needed
@@ -337,20 +349,28 @@ Respond ONLY with the JSON array, no other text."""
                 user_prompt=user_prompt,
                 conversation_history=None
             ):
-                full_response += chunk
                 yield f"data: {json.dumps({'type': 'chunk', 'content': chunk})}\n\n"
+                
+                # Send each story as soon as its closing brace arrives
+                for element in parser.feed(chunk):
+                    if element.error:
+                        story, problem = None, element.error
+                    else:
+                        story, problem = validate_item(GeneratedStory, element.value)
+                    if story is None:
+                        yield f"data: {json.dumps({'type': 'invalid_item', 'index': element.index, 'message': problem})}\n\n"
+                        continue
+                    stories.append(story)
+                    yield f"data: {json.dumps({'type': 'story', 'index': element.index, 'position': len(stories) - 1, 'story': story})}\n\n"
             
-            # Parse and return stories
-            import re
-            json_match = re.search(r'\[[\s\S]*\]', full_response)
-            if json_match:
-                try:
-                    stories = json.loads(json_match.group(0))
-                    yield f"data: {json.dumps({'type': 'stories', 'stories': stories})}\n\n"
-                except json.JSONDecodeError as e:
-                    yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to parse stories: {str(e)}'})}\n\n"
-            else:
+            if not parser.started:
                 yield f"data: {json.dumps({'type': 'error', 'message': 'No valid JSON found in response'})}\n\n"
+            elif not stories:
+                detail = "; ".join(parser.errors) or "no valid stories"
+                yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to parse stories: {detail}'})}\n\n"
+            else:
+                # Whole list too, for clients that don't handle per-story events
+                yield f"data: {json.dumps({'type': 'stories', 'stories': stories})}\n\n"
             
             yield f"data: {json.dumps({'type': 'done'})}\n\n"
             
@@ -596,7 +616,7 @@ async def chat_with_standalone_story(
     delivery_context_text = prompt_service.format_delivery_context(delivery_context)
     
     # Get conversation history before entering generator
-    history = await story_service.get_conversation_history(story_id, limit=10)
+    history = await story_service.get_conversation_history(story_id, config_data=config_data)
     
     # Capture story data for use in generator
     story_title = story.title or 'Untitled'
@@ -1088,7 +1108,7 @@ async def chat_with_story(
     user_prompt = body.content
     
     # Get conversation history before entering generator
-    history = await story_service.get_conversation_history(story_id, limit=10)
+    history = await story_service.get_conversation_history(story_id, config_data=config_data)
     
     # Capture story data for use in generator
     story_persona = story.persona
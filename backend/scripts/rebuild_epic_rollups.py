@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Rebuild the materialized epic point rollups (epic_point_rollups).
+
+The table is maintained incrementally by database triggers; run this to
+repair it after bulk data fixes or if totals ever drift.
+
+Usage:
+    python scripts/rebuild_epic_rollups.py [--user-id USER_ID]
+"""
+import asyncio
+import sys
+import os
+import argparse
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.database import AsyncSessionLocal
+from services.portfolio_rollup_service import rebuild_epic_point_rollups
+
+
+async def main(user_id: str = None):
+    if not AsyncSessionLocal:
+        raise ValueError("Database engine not configured")
+    
+    async with AsyncSessionLocal() as session:
+        rebuilt = await rebuild_epic_point_rollups(session, user_id=user_id)
+    
+    print(f"Rebuilt epic point rollups for {rebuilt} initiatives")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild epic point rollups")
+    parser.add_argument("--user-id", help="Only rebuild this user's initiatives")
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.user_id))
@@ -60,4 +60,13 @@ echo "----------------------------------------"
 echo "Pool config: DB_POOL_SIZE=${DB_POOL_SIZE:-5}, DB_MAX_OVERFLOW=${DB_MAX_OVERFLOW:-10}"
 echo ""
 
+# Multi-worker metrics: all workers write to one dir so /metrics aggregates them
+if [ "${WORKERS:-1}" -gt 1 ]; then
+    export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/jarlpm-metrics}"
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+    echo "Metrics: aggregating ${WORKERS} workers via $PROMETHEUS_MULTIPROC_DIR"
+    echo ""
+fi
+
 exec uvicorn server:app --host 0.0.0.0 --port ${PORT:-8001} --workers ${WORKERS:-1}
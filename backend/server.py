@@ -4,6 +4,7 @@ from starlette.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 import os
+import asyncio
 import logging
 from pathlib import Path
 import sys
@@ -92,6 +93,14 @@ app.include_router(api_router)
 from routes.subscription import stripe_webhook
 app.add_api_route("/api/webhook/stripe", stripe_webhook, methods=["POST"])
 
+# Prometheus scrape endpoint (root level, scrapers expect /metrics)
+from routes.admin import prometheus_metrics
+app.add_api_route("/metrics", prometheus_metrics, methods=["GET"], include_in_schema=False)
+
+# Request metrics (route latency/counts)
+from services.metrics_service import MetricsMiddleware
+app.add_middleware(MetricsMiddleware)
+
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
@@ -140,11 +149,45 @@ async def startup_event():
             prompt_service = PromptService(session)
             await prompt_service.initialize_default_prompts()
     
+    # Warm pooled HTTP clients for LLM providers
+    from services.http_client import get_http_client_registry
+    await get_http_client_registry().startup()
+    
+    # Background integration pushes (see services/push_jobs.py)
+    if AsyncSessionLocal:
+        from services.push_jobs import get_push_job_queue
+        await get_push_job_queue().start()
+    
+    # Resolve Stripe prices before the first checkout (see services/stripe_catalog.py)
+    from services.stripe_catalog import configure_stripe, get_stripe_price_catalog
+    if configure_stripe():
+        # Keep a reference so the task isn't garbage-collected mid-lookup
+        app.state.stripe_warm_task = asyncio.create_task(get_stripe_price_catalog().warm())
+    
     logger.info("JarlPM API started successfully with PostgreSQL")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
+    stripe_warm_task = getattr(app.state, "stripe_warm_task", None)
+    if stripe_warm_task and not stripe_warm_task.done():
+        stripe_warm_task.cancel()
+    
+    from services.push_jobs import get_push_job_queue
+    await get_push_job_queue().stop()
+    
+    from services.http_client import get_http_client_registry
+    await get_http_client_registry().close()
+    
+    from services.password_hasher import get_password_hasher
+    get_password_hasher().shutdown()
+    
+    from services.cache_service import close_cache
+    await close_cache()
+    
+    from services.metrics_service import mark_worker_dead
+    mark_worker_dead()
+    
     from db.database import engine
     if engine:
         await engine.dispose()
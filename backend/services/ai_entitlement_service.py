@@ -0,0 +1,133 @@
+"""
+AI Entitlement Service for JarlPM
+
+Every AI endpoint starts by resolving the same per-user bundle:
+- is the subscription active?
+- which LLM provider config is active, with its API key decrypted?
+
+This module caches that bundle for a short TTL so repeated AI calls skip
+the subscription/config queries and the Fernet decryption.
+
+Storage:
+- Bundles (which contain decrypted API keys) are only ever held in process
+  memory, never written to Redis
+- A per-user generation token lives in the shared cache (see cache_service);
+  invalidate_ai_entitlements() rotates it, so bundles cached by other
+  workers are dropped on their next lookup
+
+Call invalidate_ai_entitlements() after committing any change to a user's
+Subscription or LLMProviderConfig rows.
+"""
+import os
+import uuid
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import LLMProviderConfig
+from services.cache_service import MemoryCacheBackend, Cache, get_cache
+from services.encryption import get_encryption_service
+from services.subscription_helper import get_user_subscription, is_subscription_active
+
+logger = logging.getLogger(__name__)
+
+AI_ENTITLEMENT_CACHE_TTL_SECONDS = float(os.environ.get("AI_ENTITLEMENT_CACHE_TTL_SECONDS", "30"))
+AI_ENTITLEMENT_CACHE_MAX_ENTRIES = int(os.environ.get("AI_ENTITLEMENT_CACHE_MAX_ENTRIES", "5000"))
+
+
+@dataclass
+class ResolvedLLMConfig:
+    """Active LLM provider config with the API key already decrypted."""
+    config_id: str
+    provider: str
+    model_name: Optional[str]
+    base_url: Optional[str]
+    api_key: str
+
+
+@dataclass
+class AIEntitlements:
+    """Resolved AI entitlement bundle for one user."""
+    subscription_active: bool
+    llm_config: Optional[ResolvedLLMConfig]
+
+
+# Singletons
+_local_cache: Optional[Cache] = None
+
+
+def _get_local_cache() -> Cache:
+    """In-process cache for bundles (decrypted keys must not leave the worker)."""
+    global _local_cache
+    if _local_cache is None:
+        _local_cache = Cache(
+            "ai_entitlements",
+            MemoryCacheBackend(max_entries=AI_ENTITLEMENT_CACHE_MAX_ENTRIES),
+            AI_ENTITLEMENT_CACHE_TTL_SECONDS,
+        )
+    return _local_cache
+
+
+def _get_generation_cache() -> Cache:
+    # Generation tokens must outlive any bundle cached against them
+    return get_cache("ai_entitlement_generations", default_ttl=AI_ENTITLEMENT_CACHE_TTL_SECONDS * 2)
+
+
+async def _resolve_ai_entitlements(session: AsyncSession, user_id: str) -> AIEntitlements:
+    subscription = await get_user_subscription(session, user_id)
+
+    result = await session.execute(
+        select(LLMProviderConfig)
+        .where(LLMProviderConfig.user_id == user_id, LLMProviderConfig.is_active.is_(True))
+    )
+    config = result.scalar_one_or_none()
+
+    llm_config = None
+    if config:
+        llm_config = ResolvedLLMConfig(
+            config_id=config.config_id,
+            provider=config.provider,
+            model_name=config.model_name,
+            base_url=config.base_url,
+            api_key=get_encryption_service().decrypt(config.encrypted_api_key),
+        )
+
+    return AIEntitlements(
+        subscription_active=is_subscription_active(subscription),
+        llm_config=llm_config,
+    )
+
+
+async def get_ai_entitlements(session: AsyncSession, user_id: str) -> AIEntitlements:
+    """
+    Get the AI entitlement bundle for a user (cached).
+
+    Args:
+        session: Database session (only used on a cache miss)
+        user_id: User to resolve
+
+    Returns:
+        AIEntitlements with the subscription flag and decrypted LLM config
+    """
+    local_cache = _get_local_cache()
+    generation = await _get_generation_cache().get(user_id)
+
+    cached = await local_cache.get(user_id)
+    if cached is not None:
+        cached_generation, entitlements = cached
+        if cached_generation == generation:
+            return entitlements
+
+    entitlements = await _resolve_ai_entitlements(session, user_id)
+    await local_cache.set(user_id, (generation, entitlements))
+    return entitlements
+
+
+async def invalidate_ai_entitlements(user_id: str):
+    """Drop the cached bundle for a user on every worker."""
+    await _get_local_cache().delete(user_id)
+    await _get_generation_cache().set(user_id, uuid.uuid4().hex)
+    logger.debug(f"Invalidated AI entitlements for user {user_id}")
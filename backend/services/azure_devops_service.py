@@ -9,12 +9,17 @@ import hashlib
 import json
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
+from urllib.parse import quote
 import logging
 
 from services.encryption import get_encryption_service
+from services.integration_metadata_cache import integration_metadata
 
 logger = logging.getLogger(__name__)
 
+# Maximum sub-requests per work item $batch call
+ADO_BATCH_LIMIT = 200
+
 
 class AzureDevOpsAPIError(Exception):
     """Base exception for Azure DevOps API errors"""
@@ -38,16 +43,18 @@ class AzureDevOpsRESTService:
     
     API_VERSION = "7.1"
     
-    def __init__(self, organization_url: str, pat: str):
+    def __init__(self, organization_url: str, pat: str, integration_id: Optional[str] = None):
         """
         Initialize Azure DevOps service.
         
         Args:
             organization_url: e.g., "https://dev.azure.com/myorg" or "https://myorg.visualstudio.com"
             pat: Personal Access Token
+            integration_id: Enables the integration metadata cache
         """
         self.organization_url = organization_url.rstrip('/')
         self.pat = pat
+        self.integration_id = integration_id
         
         # Create Basic Auth header from PAT
         # Format: Base64(":{PAT}")
@@ -112,6 +119,7 @@ class AzureDevOpsRESTService:
             "project_count": result.get("count", 0)
         }
     
+    @integration_metadata("projects")
     async def get_projects(self) -> List[Dict]:
         """Get all projects in the organization"""
         url = f"{self.organization_url}/_apis/projects"
@@ -123,12 +131,14 @@ class AzureDevOpsRESTService:
         url = f"{self.organization_url}/_apis/projects/{project_name}"
         return await self._request("GET", url)
     
+    @integration_metadata("teams")
     async def get_teams(self, project_name: str) -> List[Dict]:
         """Get teams for a project"""
         url = f"{self.organization_url}/_apis/projects/{project_name}/teams"
         result = await self._request("GET", url)
         return result.get("value", [])
     
+    @integration_metadata("iterations")
     async def get_iterations(self, project_name: str, team_name: Optional[str] = None) -> List[Dict]:
         """Get iterations (sprints) for a project/team"""
         if team_name:
@@ -145,6 +155,7 @@ class AzureDevOpsRESTService:
             return self._flatten_classification_nodes(result)
         return [result] if result.get("id") else []
     
+    @integration_metadata("area_paths")
     async def get_area_paths(self, project_name: str) -> List[Dict]:
         """Get area paths for a project"""
         url = f"{self.organization_url}/{project_name}/_apis/wit/classificationnodes/areas?$depth=10"
@@ -170,12 +181,14 @@ class AzureDevOpsRESTService:
         
         return results
     
+    @integration_metadata("work_item_types")
     async def get_work_item_types(self, project_name: str) -> List[Dict]:
         """Get available work item types for a project"""
         url = f"{self.organization_url}/{project_name}/_apis/wit/workitemtypes"
         result = await self._request("GET", url)
         return result.get("value", [])
     
+    @integration_metadata("fields")
     async def get_fields(self, project_name: str) -> List[Dict]:
         """Get all fields for a project"""
         url = f"{self.organization_url}/{project_name}/_apis/wit/fields"
@@ -199,33 +212,10 @@ class AzureDevOpsRESTService:
         """Create a new work item in Azure DevOps"""
         url = f"{self.organization_url}/{project_name}/_apis/wit/workitems/${work_item_type}"
         
-        # Build JSON Patch operations
-        operations = [
-            {"op": "add", "path": "/fields/System.Title", "value": title}
-        ]
-        
-        if description:
-            # Use appropriate field based on format preference
-            desc_field = "/fields/System.Description"
-            if description_format == "html":
-                # Convert basic markdown to HTML
-                description = self._markdown_to_html(description)
-            operations.append({"op": "add", "path": desc_field, "value": description})
-        
-        if area_path:
-            operations.append({"op": "add", "path": "/fields/System.AreaPath", "value": area_path})
-        
-        if iteration_path:
-            operations.append({"op": "add", "path": "/fields/System.IterationPath", "value": iteration_path})
-        
-        if state:
-            operations.append({"op": "add", "path": "/fields/System.State", "value": state})
-        
-        if story_points is not None:
-            operations.append({"op": "add", "path": f"/fields/{story_points_field}", "value": story_points})
-        
-        if tags:
-            operations.append({"op": "add", "path": "/fields/System.Tags", "value": "; ".join(tags)})
+        operations = self.build_create_operations(
+            title, description, area_path, iteration_path, state,
+            story_points, story_points_field, tags, description_format
+        )
         
         # Use JSON Patch content type
         headers = {**self.headers, "Content-Type": "application/json-patch+json"}
@@ -261,24 +251,9 @@ class AzureDevOpsRESTService:
         """Update an existing work item"""
         url = f"{self.organization_url}/_apis/wit/workitems/{work_item_id}"
         
-        operations = []
-        
-        if title:
-            operations.append({"op": "replace", "path": "/fields/System.Title", "value": title})
-        
-        if description:
-            if description_format == "html":
-                description = self._markdown_to_html(description)
-            operations.append({"op": "replace", "path": "/fields/System.Description", "value": description})
-        
-        if state:
-            operations.append({"op": "replace", "path": "/fields/System.State", "value": state})
-        
-        if story_points is not None:
-            operations.append({"op": "replace", "path": f"/fields/{story_points_field}", "value": story_points})
-        
-        if tags is not None:
-            operations.append({"op": "replace", "path": "/fields/System.Tags", "value": "; ".join(tags)})
+        operations = self.build_update_operations(
+            title, description, state, story_points, story_points_field, tags, description_format
+        )
         
         if not operations:
             return await self.get_work_item(work_item_id)
@@ -316,19 +291,7 @@ class AzureDevOpsRESTService:
         """Add a link between work items (e.g., parent-child relationship)"""
         url = f"{self.organization_url}/_apis/wit/workitems/{work_item_id}"
         
-        # The relation URL format for Azure DevOps
-        target_url = f"{self.organization_url}/_apis/wit/workItems/{target_work_item_id}"
-        
-        operations = [
-            {
-                "op": "add",
-                "path": "/relations/-",
-                "value": {
-                    "rel": link_type,
-                    "url": target_url
-                }
-            }
-        ]
+        operations = [self.build_link_operation(target_work_item_id, link_type)]
         
         headers = {**self.headers, "Content-Type": "application/json-patch+json"}
         
@@ -349,6 +312,153 @@ class AzureDevOpsRESTService:
             
             return response.json()
     
+    # ============================================
+    # JSON Patch builders
+    # ============================================
+    
+    def build_create_operations(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        area_path: Optional[str] = None,
+        iteration_path: Optional[str] = None,
+        state: Optional[str] = None,
+        story_points: Optional[int] = None,
+        story_points_field: str = "Microsoft.VSTS.Scheduling.StoryPoints",
+        tags: Optional[List[str]] = None,
+        description_format: str = "html"
+    ) -> List[Dict[str, Any]]:
+        """JSON Patch operations for creating a work item"""
+        operations = [
+            {"op": "add", "path": "/fields/System.Title", "value": title}
+        ]
+        
+        if description:
+            # Use appropriate field based on format preference
+            desc_field = "/fields/System.Description"
+            if description_format == "html":
+                # Convert basic markdown to HTML
+                description = self._markdown_to_html(description)
+            operations.append({"op": "add", "path": desc_field, "value": description})
+        
+        if area_path:
+            operations.append({"op": "add", "path": "/fields/System.AreaPath", "value": area_path})
+        
+        if iteration_path:
+            operations.append({"op": "add", "path": "/fields/System.IterationPath", "value": iteration_path})
+        
+        if state:
+            operations.append({"op": "add", "path": "/fields/System.State", "value": state})
+        
+        if story_points is not None:
+            operations.append({"op": "add", "path": f"/fields/{story_points_field}", "value": story_points})
+        
+        if tags:
+            operations.append({"op": "add", "path": "/fields/System.Tags", "value": "; ".join(tags)})
+        
+        return operations
+    
+    def build_update_operations(
+        self,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        state: Optional[str] = None,
+        story_points: Optional[int] = None,
+        story_points_field: str = "Microsoft.VSTS.Scheduling.StoryPoints",
+        tags: Optional[List[str]] = None,
+        description_format: str = "html"
+    ) -> List[Dict[str, Any]]:
+        """JSON Patch operations for updating a work item"""
+        operations = []
+        
+        if title:
+            operations.append({"op": "replace", "path": "/fields/System.Title", "value": title})
+        
+        if description:
+            if description_format == "html":
+                description = self._markdown_to_html(description)
+            operations.append({"op": "replace", "path": "/fields/System.Description", "value": description})
+        
+        if state:
+            operations.append({"op": "replace", "path": "/fields/System.State", "value": state})
+        
+        if story_points is not None:
+            operations.append({"op": "replace", "path": f"/fields/{story_points_field}", "value": story_points})
+        
+        if tags is not None:
+            operations.append({"op": "replace", "path": "/fields/System.Tags", "value": "; ".join(tags)})
+        
+        return operations
+    
+    def build_link_operation(
+        self,
+        target_work_item_id: int,
+        link_type: str = "System.LinkTypes.Hierarchy-Forward"
+    ) -> Dict[str, Any]:
+        """JSON Patch operation adding a relation (target may be a batch temporary ID)"""
+        return {
+            "op": "add",
+            "path": "/relations/-",
+            "value": {
+                "rel": link_type,
+                # The relation URL format for Azure DevOps
+                "url": f"{self.organization_url}/_apis/wit/workItems/{target_work_item_id}"
+            }
+        }
+    
+    # ============================================
+    # Batch
+    # ============================================
+    
+    def batch_create_request(
+        self,
+        project_name: str,
+        work_item_type: str,
+        operations: List[Dict[str, Any]],
+        temp_id: int
+    ) -> Dict[str, Any]:
+        """$batch sub-request creating a work item under a negative temporary ID"""
+        return {
+            "method": "PATCH",
+            "uri": f"/{quote(project_name)}/_apis/wit/workitems/${quote(work_item_type)}?api-version={self.API_VERSION}",
+            "headers": {"Content-Type": "application/json-patch+json"},
+            "body": [{"op": "add", "path": "/id", "value": temp_id}] + operations
+        }
+    
+    def batch_update_request(self, work_item_id: int, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """$batch sub-request updating an existing work item"""
+        return {
+            "method": "PATCH",
+            "uri": f"/_apis/wit/workitems/{work_item_id}?api-version={self.API_VERSION}",
+            "headers": {"Content-Type": "application/json-patch+json"},
+            "body": operations
+        }
+    
+    async def batch_work_items(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run up to ADO_BATCH_LIMIT work item sub-requests in one $batch call.
+        
+        Sub-requests run in order, so later ones can reference earlier
+        temporary IDs. The call is not transactional: returns one
+        {"code", "body"} per sub-request, with body parsed from JSON.
+        """
+        if len(requests) > ADO_BATCH_LIMIT:
+            raise ValueError(f"Azure DevOps $batch accepts at most {ADO_BATCH_LIMIT} requests")
+        
+        url = f"{self.organization_url}/_apis/wit/$batch"
+        result = await self._request("POST", url, json=requests)
+        
+        responses = []
+        for response in result.get("value", []):
+            body = response.get("body")
+            if isinstance(body, str):
+                try:
+                    body = json.loads(body) if body else {}
+                except ValueError:
+                    body = {"message": body}
+            responses.append({"code": response.get("code", 500), "body": body or {}})
+        return responses
+    
     def _markdown_to_html(self, text: str) -> str:
         """Convert basic markdown to HTML for Azure DevOps description field"""
         import re
@@ -458,19 +568,21 @@ class AzureDevOpsPushService:
         story_points: Optional[int] = None,
         story_points_field: str = "Microsoft.VSTS.Scheduling.StoryPoints",
         tags: Optional[List[str]] = None,
-        description_format: str = "html"
+        description_format: str = "html",
+        last_push_hash: Optional[str] = None,
+        force: bool = False
     ) -> Dict[str, Any]:
         """
         Push a single item to Azure DevOps (create or update).
         Returns the work item data with ID and URL.
+        
+        Existing work items whose payload hash matches last_push_hash are not
+        touched (action "skipped") unless force is set.
         """
-        payload = {
-            "title": title,
-            "description": description,
-            "entity_type": entity_type,
-            "entity_id": entity_id
-        }
-        payload_hash = compute_payload_hash(payload)
+        payload_hash = self._payload_hash(title, description, entity_type, entity_id, story_points, tags)
+        
+        if existing_work_item_id and not force and payload_hash == last_push_hash:
+            return self._skipped_result(existing_work_item_id, payload_hash)
         
         if existing_work_item_id:
             # Update existing work item
@@ -511,16 +623,125 @@ class AzureDevOpsPushService:
                 except Exception as e:
                     logger.warning(f"Failed to link work item to parent: {e}")
         
-        work_item_id = work_item.get("id")
-        work_item_url = work_item.get("_links", {}).get("html", {}).get("href", "")
+        return {
+            "action": action,
+            "id": work_item.get("id"),
+            "url": self._work_item_url(work_item),
+            "payload_hash": payload_hash
+        }
+    
+    async def push_items_batch(
+        self,
+        project_name: str,
+        items: List[Dict[str, Any]],
+        area_path: Optional[str] = None,
+        iteration_path: Optional[str] = None,
+        story_points_field: str = "Microsoft.VSTS.Scheduling.StoryPoints",
+        description_format: str = "html",
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Create/update many work items with $batch calls (ADO_BATCH_LIMIT each).
         
-        # Build URL if not provided
-        if not work_item_url:
-            work_item_url = f"{self.ado.organization_url}/_workitems/edit/{work_item_id}"
+        Each item holds push_item's per-item arguments (work_item_type, title,
+        description, entity_type, entity_id, existing_work_item_id,
+        parent_work_item_id, story_points, tags, last_push_hash). Parents must
+        already exist: the push route sends one hierarchy level per call.
+        
+        Returns entity_id -> push_item-style result, or an AzureDevOpsAPIError
+        for items that failed or got no response.
+        """
+        results: Dict[str, Any] = {}
+        
+        pending = []
+        for item in items:
+            payload_hash = self._payload_hash(
+                item["title"], item["description"], item["entity_type"], item["entity_id"],
+                item.get("story_points"), item.get("tags")
+            )
+            existing_id = item.get("existing_work_item_id")
+            if existing_id and not force and payload_hash == item.get("last_push_hash"):
+                results[item["entity_id"]] = self._skipped_result(existing_id, payload_hash)
+            else:
+                pending.append((item, payload_hash))
+        
+        for start in range(0, len(pending), ADO_BATCH_LIMIT):
+            requests = []
+            sent = []
+            for item, payload_hash in pending[start:start + ADO_BATCH_LIMIT]:
+                parent_id = item.get("parent_work_item_id")
+                existing_id = item.get("existing_work_item_id")
+                if existing_id:
+                    operations = self.ado.build_update_operations(
+                        item["title"], item["description"], None, item.get("story_points"),
+                        story_points_field, item.get("tags"), description_format
+                    )
+                    requests.append(self.ado.batch_update_request(existing_id, operations))
+                else:
+                    operations = self.ado.build_create_operations(
+                        item["title"], item["description"], area_path, iteration_path, None,
+                        item.get("story_points"), story_points_field, item.get("tags"), description_format
+                    )
+                    if parent_id:
+                        # Child points to Parent
+                        operations.append(
+                            self.ado.build_link_operation(parent_id, "System.LinkTypes.Hierarchy-Reverse")
+                        )
+                    requests.append(
+                        self.ado.batch_create_request(project_name, item["work_item_type"], operations, -(len(requests) + 1))
+                    )
+                sent.append((item, payload_hash))
+            
+            responses = await self.ado.batch_work_items(requests)
+            
+            for item, payload_hash in sent[len(responses):]:
+                results[item["entity_id"]] = AzureDevOpsAPIError("No response for work item in $batch reply")
+            for (item, payload_hash), response in zip(sent, responses):
+                entity_id = item["entity_id"]
+                body = response["body"]
+                if response["code"] >= 400 or not body.get("id"):
+                    message = body.get("message") or body.get("value", {}).get("Message") or f"status {response['code']}"
+                    results[entity_id] = AzureDevOpsAPIError(f"Failed to push work item: {message}")
+                    continue
+                results[entity_id] = {
+                    "action": "updated" if item.get("existing_work_item_id") else "created",
+                    "id": body["id"],
+                    "url": self._work_item_url(body),
+                    "payload_hash": payload_hash
+                }
         
+        return results
+    
+    def _payload_hash(
+        self,
+        title: str,
+        description: str,
+        entity_type: str,
+        entity_id: str,
+        story_points: Optional[int],
+        tags: Optional[List[str]]
+    ) -> str:
+        return compute_payload_hash({
+            "title": title,
+            "description": description,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "story_points": story_points,
+            "tags": tags
+        })
+    
+    def _skipped_result(self, work_item_id: int, payload_hash: str) -> Dict[str, Any]:
         return {
-            "action": action,
+            "action": "skipped",
             "id": work_item_id,
-            "url": work_item_url,
+            "url": f"{self.ado.organization_url}/_workitems/edit/{work_item_id}",
             "payload_hash": payload_hash
         }
+    
+    def _work_item_url(self, work_item: Dict[str, Any]) -> str:
+        work_item_url = work_item.get("_links", {}).get("html", {}).get("href", "")
+        
+        # Build URL if not provided
+        if not work_item_url:
+            work_item_url = f"{self.ado.organization_url}/_workitems/edit/{work_item.get('id')}"
+        return work_item_url
@@ -13,6 +13,27 @@ from db.models import (
     BugStatus, BugSeverity, BugPriority, BugLinkEntityType,
     BUG_STATUS_TRANSITIONS
 )
+from db.feature_models import Feature
+from db.user_story_models import UserStory
+
+
+def epic_bug_ids(epic_id: str):
+    """
+    Subquery of bug_ids linked to an epic, to any of its features or to any
+    of their stories; each branch is an idx_bug_links_entity_bug lookup.
+    """
+    feature_ids = select(Feature.feature_id).where(Feature.epic_id == epic_id)
+    story_ids = select(UserStory.story_id).where(UserStory.feature_id.in_(feature_ids))
+    return select(BugLink.bug_id).where(or_(
+        and_(BugLink.entity_type == BugLinkEntityType.EPIC.value, BugLink.entity_id == epic_id),
+        and_(BugLink.entity_type == BugLinkEntityType.FEATURE.value, BugLink.entity_id.in_(feature_ids)),
+        and_(BugLink.entity_type == BugLinkEntityType.STORY.value, BugLink.entity_id.in_(story_ids)),
+    ))
+
+
+def epic_linked_bug_ids():
+    """Subquery of bug_ids linked directly to any epic; bugs outside it are standalone"""
+    return select(BugLink.bug_id).where(BugLink.entity_type == BugLinkEntityType.EPIC.value)
 
 
 class BugService:
@@ -0,0 +1,251 @@
+"""
+Cache Service for JarlPM
+
+Small TTL cache with pluggable storage, shared by hot paths that want to
+skip repeated DB/API work (session lookups, LLM responses, etc.).
+
+Storage:
+- Uses Redis if REDIS_URL is set and the `redis` package is installed
+  (shared across workers/instances)
+- Falls back to an in-process LRU dict (per worker)
+- CACHE_BACKEND=memory forces the in-process backend
+
+Values must be JSON-serializable. Redis errors are logged and treated as
+cache misses so callers always fall back to the source of truth.
+"""
+import os
+import json
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+REDIS_URL = os.environ.get("REDIS_URL")
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "auto").lower()  # auto | memory | redis
+CACHE_KEY_PREFIX = "jarlpm"
+
+
+class MemoryCacheBackend:
+    """In-process TTL cache with LRU eviction."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._groups: Dict[str, Set[str]] = {}
+        # key -> groups it belongs to, so evicted keys leave their groups in O(1)
+        self._key_groups: Dict[str, Set[str]] = {}
+
+    def _forget(self, key: str):
+        for group in self._key_groups.pop(key, ()):
+            members = self._groups.get(group)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._groups[group]
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            self._forget(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float):
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            evicted, _ = self._data.popitem(last=False)
+            self._forget(evicted)
+
+    async def delete(self, *keys: str):
+        for key in keys:
+            self._data.pop(key, None)
+            self._forget(key)
+
+    async def add_to_group(self, group: str, key: str, ttl: float):
+        if key not in self._data:
+            return
+        self._groups.setdefault(group, set()).add(key)
+        self._key_groups.setdefault(key, set()).add(group)
+
+    async def pop_group(self, group: str) -> Set[str]:
+        members = self._groups.pop(group, set())
+        for key in members:
+            groups = self._key_groups.get(key)
+            if groups is not None:
+                groups.discard(group)
+                if not groups:
+                    del self._key_groups[key]
+        return members
+
+    async def clear(self):
+        self._data.clear()
+        self._groups.clear()
+        self._key_groups.clear()
+
+
+class RedisCacheBackend:
+    """Redis-backed TTL cache (JSON values)."""
+
+    def __init__(self, url: str):
+        self._redis = redis_asyncio.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            raw = await self._redis.get(key)
+        except Exception as e:
+            logger.warning(f"Redis cache get failed: {e}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: float):
+        try:
+            await self._redis.set(key, json.dumps(value), ex=max(1, int(ttl)))
+        except Exception as e:
+            logger.warning(f"Redis cache set failed: {e}")
+
+    async def delete(self, *keys: str):
+        if not keys:
+            return
+        try:
+            await self._redis.delete(*keys)
+        except Exception as e:
+            logger.warning(f"Redis cache delete failed: {e}")
+
+    async def add_to_group(self, group: str, key: str, ttl: float):
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.sadd(group, key)
+                pipe.expire(group, max(1, int(ttl)))
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Redis cache group add failed: {e}")
+
+    async def pop_group(self, group: str) -> Set[str]:
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.smembers(group)
+                pipe.delete(group)
+                members, _ = await pipe.execute()
+            return set(members or [])
+        except Exception as e:
+            logger.warning(f"Redis cache group pop failed: {e}")
+            return set()
+
+    async def clear(self):
+        try:
+            async for key in self._redis.scan_iter(match=f"{CACHE_KEY_PREFIX}:*"):
+                await self._redis.delete(key)
+        except Exception as e:
+            logger.warning(f"Redis cache clear failed: {e}")
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+class Cache:
+    """
+    Namespaced view over a cache backend.
+
+    Groups let callers invalidate a set of keys together (e.g. all cached
+    sessions for one user) without knowing the individual keys.
+    """
+
+    def __init__(self, namespace: str, backend, default_ttl: float):
+        self.namespace = namespace
+        self.backend = backend
+        self.default_ttl = default_ttl
+
+    def _key(self, key: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:{self.namespace}:{key}"
+
+    def _group_key(self, group: str) -> str:
+        return f"{CACHE_KEY_PREFIX}:{self.namespace}:group:{group}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self.backend.get(self._key(key))
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None, group: Optional[str] = None):
+        ttl = ttl if ttl is not None else self.default_ttl
+        full_key = self._key(key)
+        await self.backend.set(full_key, value, ttl)
+        if group:
+            await self.backend.add_to_group(self._group_key(group), full_key, ttl)
+
+    async def delete(self, *keys: str):
+        await self.backend.delete(*(self._key(key) for key in keys))
+
+    async def invalidate_group(self, group: str):
+        members = await self.backend.pop_group(self._group_key(group))
+        if members:
+            await self.backend.delete(*members)
+
+
+# Backend selection (singletons)
+_memory_backend: Optional[MemoryCacheBackend] = None
+_redis_backend: Optional[RedisCacheBackend] = None
+_caches: Dict[str, Cache] = {}
+
+
+def _use_redis() -> bool:
+    if CACHE_BACKEND == "memory" or not REDIS_URL:
+        return False
+    if not REDIS_AVAILABLE:
+        logger.warning("REDIS_URL is set but the redis package is not installed - using in-memory cache")
+        return False
+    return True
+
+
+def get_cache_backend():
+    """Get the shared cache backend (Redis if configured, else in-memory)."""
+    global _memory_backend, _redis_backend
+    if _use_redis():
+        if _redis_backend is None:
+            logger.info("Cache using Redis storage (distributed)")
+            _redis_backend = RedisCacheBackend(REDIS_URL)
+        return _redis_backend
+    if _memory_backend is None:
+        logger.info("Cache using in-memory storage (per worker)")
+        _memory_backend = MemoryCacheBackend(
+            max_entries=int(os.environ.get("CACHE_MAX_ENTRIES", "10000"))
+        )
+    return _memory_backend
+
+
+def get_cache(namespace: str, default_ttl: float = 60, max_entries: Optional[int] = None) -> Cache:
+    """
+    Get the cache for a namespace (created on first use).
+
+    max_entries gives the namespace its own in-process LRU of that size so
+    large values can't evict other namespaces' entries (ignored with Redis).
+    """
+    cache = _caches.get(namespace)
+    if cache is None:
+        backend = get_cache_backend()
+        if max_entries is not None and isinstance(backend, MemoryCacheBackend):
+            backend = MemoryCacheBackend(max_entries=max_entries)
+        cache = Cache(namespace, backend, default_ttl)
+        _caches[namespace] = cache
+    return cache
+
+
+async def close_cache():
+    """Close the Redis connection pool, if any (call on shutdown)."""
+    global _redis_backend
+    if _redis_backend is not None:
+        await _redis_backend.close()
+        _redis_backend = None
@@ -0,0 +1,320 @@
+"""
+Conversation History Service for JarlPM
+
+Builds the conversation history sent to the LLM for epic, feature and story
+chats. Instead of a fixed "last N events", messages are selected newest-first
+until an estimated token budget is used up, so a chat full of long pasted
+specs doesn't blow the context window and a chat of short turns keeps more
+of them.
+
+Budgets:
+- Default per provider (DEFAULT_HISTORY_TOKEN_BUDGETS), with per-model
+  overrides for small-context models (MODEL_HISTORY_TOKEN_BUDGETS)
+- CONVERSATION_HISTORY_TOKEN_BUDGET_<PROVIDER> overrides a provider default
+- Token counts are estimated as chars / 4 (no tokenizer dependency)
+
+Rolling summary (CONVERSATION_SUMMARY_ENABLED=true, off by default):
+- When older turns fall outside the budget, a stored ConversationSummary of
+  those turns is prepended as a user/assistant pair; turns it covers are left
+  out of the window
+- The summary is refreshed in the background (one extra LLM call, after the
+  request has been answered) whenever new turns fall out of the window
+"""
+import os
+import asyncio
+import logging
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import ConversationSummary
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_TOKEN_BUDGETS = {
+    "openai": 8000,
+    "anthropic": 12000,
+    "google": 12000,
+    "local": 2000,
+}
+FALLBACK_HISTORY_TOKEN_BUDGET = 4000
+
+# Model-name prefixes with smaller context windows than their provider default
+MODEL_HISTORY_TOKEN_BUDGETS = {
+    "gpt-3.5-turbo": 4000,
+    "gpt-4-0613": 3000,
+}
+
+# Upper bound on rows loaded per request, whatever the budget
+HISTORY_MAX_EVENTS = int(os.environ.get("CONVERSATION_HISTORY_MAX_EVENTS", "200"))
+
+# Per-message overhead (role, separators) added to the content estimate
+MESSAGE_TOKEN_OVERHEAD = 4
+
+CONVERSATION_SUMMARY_ENABLED = os.environ.get("CONVERSATION_SUMMARY_ENABLED", "false").lower() == "true"
+CONVERSATION_SUMMARY_MAX_TOKENS = int(os.environ.get("CONVERSATION_SUMMARY_MAX_TOKENS", "600"))
+
+SUMMARY_PREFIX = "[Summary of earlier conversation]"
+SUMMARY_ACK = "Understood. I'll continue with that context in mind."
+
+SUMMARY_SYSTEM_PROMPT = """You maintain a running summary of a product management conversation.
+Merge the previous summary (if any) with the new turns into one updated summary.
+Keep decisions made, requirements agreed, open questions and rejected options.
+Drop pleasantries and repetition. Write plain prose or short bullets, no preamble.
+Stay under {max_words} words."""
+
+# (parent_type, parent_id) pairs with a summary refresh currently running
+_refreshes_in_flight: Set[Tuple[str, str]] = set()
+
+# Running refresh tasks; the loop only keeps weak references to tasks
+_refresh_tasks: Set[asyncio.Task] = set()
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Rough token estimate (chars / 4)"""
+    return len(text or "") // 4
+
+
+def message_tokens(message: dict) -> int:
+    return estimate_tokens(message.get("content")) + MESSAGE_TOKEN_OVERHEAD
+
+
+def get_history_token_budget(config_data: Optional[dict] = None) -> int:
+    """History token budget for the provider/model in config_data"""
+    if not config_data:
+        return FALLBACK_HISTORY_TOKEN_BUDGET
+
+    provider = config_data.get("provider") or ""
+    env_override = os.environ.get(f"CONVERSATION_HISTORY_TOKEN_BUDGET_{provider.upper()}")
+    if env_override:
+        return int(env_override)
+
+    model = config_data.get("model_name") or ""
+    for prefix, budget in MODEL_HISTORY_TOKEN_BUDGETS.items():
+        if model.startswith(prefix):
+            return budget
+
+    return DEFAULT_HISTORY_TOKEN_BUDGETS.get(provider, FALLBACK_HISTORY_TOKEN_BUDGET)
+
+
+def window_messages(
+    messages: List[dict],
+    token_budget: int,
+    min_messages: int = 2,
+) -> Tuple[List[dict], int]:
+    """
+    Select the newest messages that fit in token_budget.
+
+    Args:
+        messages: Oldest-first list of {"role", "content"} dicts
+        token_budget: Estimated tokens available for the window
+        min_messages: Always keep at least this many of the newest messages,
+            even if they alone exceed the budget
+
+    Returns:
+        (window, dropped) - the oldest-first window, which always starts with
+        a user turn, and how many leading messages were left out
+    """
+    used = 0
+    start = len(messages)
+    for i in range(len(messages) - 1, -1, -1):
+        cost = message_tokens(messages[i])
+        kept = len(messages) - start
+        if kept >= min_messages and used + cost > token_budget:
+            break
+        used += cost
+        start = i
+
+    # Providers expect the conversation to open with a user turn
+    while start < len(messages) - 1 and messages[start]["role"] != "user":
+        start += 1
+
+    return messages[start:], start
+
+
+async def load_conversation_history(
+    session: AsyncSession,
+    event_model,
+    parent_column,
+    parent_type: str,
+    parent_id: str,
+    token_budget: Optional[int] = None,
+    config_data: Optional[dict] = None,
+) -> List[dict]:
+    """
+    Load token-budgeted conversation history for one epic/feature/story.
+
+    Args:
+        session: Database session
+        event_model: Transcript event model (EpicTranscriptEvent, ...)
+        parent_column: Column on event_model holding the parent id
+        parent_type: "epic", "feature" or "story" (ConversationSummary key)
+        parent_id: Parent id
+        token_budget: Token budget; defaults to get_history_token_budget(config_data)
+        config_data: Streaming config (from prepare_for_streaming), used for the
+            default budget and for refreshing the rolling summary
+
+    Returns:
+        Oldest-first list of {"role", "content"} dicts
+    """
+    if token_budget is None:
+        token_budget = get_history_token_budget(config_data)
+
+    result = await session.execute(
+        select(event_model.id, event_model.role, event_model.content)
+        .where(
+            parent_column == parent_id,
+            event_model.role.in_(['user', 'assistant'])
+        )
+        .order_by(event_model.id.desc())
+        .limit(HISTORY_MAX_EVENTS)
+    )
+    rows = list(result.all())
+    rows.reverse()  # Oldest first
+    messages = [{"role": row.role, "content": row.content} for row in rows]
+
+    if not CONVERSATION_SUMMARY_ENABLED:
+        window, _ = window_messages(messages, token_budget)
+        return window
+
+    summary_row = (await session.execute(
+        select(ConversationSummary).where(
+            ConversationSummary.parent_type == parent_type,
+            ConversationSummary.parent_id == parent_id,
+        )
+    )).scalar_one_or_none()
+
+    # Turns the stored summary already covers are never sent verbatim next to it
+    skipped = 0
+    summary_cost = 0
+    if summary_row:
+        while skipped < len(rows) and rows[skipped].id <= summary_row.covers_through_id:
+            skipped += 1
+        summary_cost = estimate_tokens(summary_row.summary) + estimate_tokens(SUMMARY_ACK) + 2 * MESSAGE_TOKEN_OVERHEAD
+
+    window, dropped = window_messages(messages[skipped:], max(token_budget - summary_cost, 0))
+    dropped += skipped
+    if not dropped:
+        return window
+
+    # Newest event that fell out of the window; refresh if the summary doesn't cover it yet
+    last_dropped_id = rows[dropped - 1].id
+    covered_through = summary_row.covers_through_id if summary_row else 0
+    if last_dropped_id > covered_through and config_data:
+        schedule_summary_refresh(event_model, parent_column, parent_type, parent_id, last_dropped_id, config_data)
+
+    if not summary_row:
+        return window
+
+    return [
+        {"role": "user", "content": f"{SUMMARY_PREFIX}\n{summary_row.summary}"},
+        {"role": "assistant", "content": SUMMARY_ACK},
+    ] + window
+
+
+# ============================================
+# Rolling summary refresh
+# ============================================
+
+def schedule_summary_refresh(
+    event_model,
+    parent_column,
+    parent_type: str,
+    parent_id: str,
+    through_id: int,
+    config_data: dict,
+):
+    """Refresh the rolling summary in the background (at most one per parent at a time)"""
+    key = (parent_type, parent_id)
+    if key in _refreshes_in_flight:
+        return
+    _refreshes_in_flight.add(key)
+
+    async def run():
+        try:
+            await refresh_conversation_summary(
+                event_model, parent_column, parent_type, parent_id, through_id, config_data
+            )
+        except Exception as e:
+            logger.warning(f"Conversation summary refresh failed for {parent_type} {parent_id}: {e}")
+        finally:
+            _refreshes_in_flight.discard(key)
+
+    task = asyncio.create_task(run())
+    _refresh_tasks.add(task)
+    task.add_done_callback(_refresh_tasks.discard)
+
+
+async def refresh_conversation_summary(
+    event_model,
+    parent_column,
+    parent_type: str,
+    parent_id: str,
+    through_id: int,
+    config_data: dict,
+):
+    """Fold every turn up to through_id into the stored summary (own session)"""
+    from db.database import AsyncSessionLocal
+    from services.llm_service import LLMService
+
+    if not AsyncSessionLocal:
+        return
+
+    async with AsyncSessionLocal() as session:
+        summary_row = (await session.execute(
+            select(ConversationSummary).where(
+                ConversationSummary.parent_type == parent_type,
+                ConversationSummary.parent_id == parent_id,
+            )
+        )).scalar_one_or_none()
+        covered_through = summary_row.covers_through_id if summary_row else 0
+        if covered_through >= through_id:
+            return
+
+        result = await session.execute(
+            select(event_model.id, event_model.role, event_model.content)
+            .where(
+                parent_column == parent_id,
+                event_model.role.in_(['user', 'assistant']),
+                event_model.id > covered_through,
+                event_model.id <= through_id,
+            )
+            .order_by(event_model.id)
+            .limit(HISTORY_MAX_EVENTS)
+        )
+        rows = result.all()
+        if not rows:
+            return
+        turns = "\n\n".join(f"{row.role.upper()}: {row.content}" for row in rows)
+        # Only what was read is summarized; later turns wait for the next refresh
+        covers_through = rows[-1].id
+
+        previous = summary_row.summary if summary_row else "(none)"
+        user_prompt = f"PREVIOUS SUMMARY:\n{previous}\n\nNEW TURNS:\n{turns}"
+        system_prompt = SUMMARY_SYSTEM_PROMPT.format(max_words=CONVERSATION_SUMMARY_MAX_TOKENS * 3 // 4)
+
+        summary = ""
+        async for chunk in LLMService().stream_with_config(
+            config_data=config_data,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=0.2,
+        ):
+            summary += chunk
+        summary = summary.strip()
+        if not summary:
+            return
+
+        if summary_row:
+            summary_row.summary = summary
+            summary_row.covers_through_id = covers_through
+        else:
+            session.add(ConversationSummary(
+                parent_type=parent_type,
+                parent_id=parent_id,
+                summary=summary,
+                covers_through_id=covers_through,
+            ))
+        await session.commit()
+        logger.debug(f"Refreshed conversation summary for {parent_type} {parent_id} through event {covers_through}")
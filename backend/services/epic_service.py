@@ -10,7 +10,8 @@ from db.models import (
     Epic, EpicStage, EpicSnapshot, EpicTranscriptEvent,
     EpicDecision, Subscription, SubscriptionStatus, STAGE_ORDER
 )
-from services.subscription_helper import is_subscription_active, get_user_subscription
+from services.ai_entitlement_service import get_ai_entitlements
+from services.conversation_history_service import load_conversation_history
 
 
 class EpicService:
@@ -20,9 +21,9 @@ class EpicService:
         self.session = session
     
     async def check_subscription_active(self, user_id: str) -> bool:
-        """Check if user has an active subscription"""
-        subscription = await get_user_subscription(self.session, user_id)
-        return is_subscription_active(subscription)
+        """Check if user has an active subscription (cached, see ai_entitlement_service)"""
+        entitlements = await get_ai_entitlements(self.session, user_id)
+        return entitlements.subscription_active
     
     async def create_epic(self, user_id: str, title: str) -> Epic:
         """Create a new epic with initial snapshot"""
@@ -108,22 +109,22 @@ class EpicService:
         )
         return list(result.scalars().all())
     
-    async def get_conversation_history(self, epic_id: str, limit: int = 20) -> List[dict]:
-        """Get recent conversation history for LLM context"""
-        result = await self.session.execute(
-            select(EpicTranscriptEvent)
-            .where(
-                and_(
-                    EpicTranscriptEvent.epic_id == epic_id,
-                    EpicTranscriptEvent.role.in_(['user', 'assistant'])
-                )
-            )
-            .order_by(EpicTranscriptEvent.created_at.desc())
-            .limit(limit)
+    async def get_conversation_history(
+        self,
+        epic_id: str,
+        token_budget: Optional[int] = None,
+        config_data: Optional[dict] = None
+    ) -> List[dict]:
+        """Get recent conversation history for LLM context, windowed by token budget"""
+        return await load_conversation_history(
+            self.session,
+            EpicTranscriptEvent,
+            EpicTranscriptEvent.epic_id,
+            "epic",
+            epic_id,
+            token_budget=token_budget,
+            config_data=config_data,
         )
-        events = list(result.scalars().all())
-        events.reverse()  # Oldest first
-        return [{"role": e.role, "content": e.content} for e in events]
     
     async def add_decision(
         self,
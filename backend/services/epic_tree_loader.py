@@ -0,0 +1,116 @@
+"""
+Epic Tree Loader for JarlPM
+Loads epics with their features, stories and linked bugs in a fixed number
+of queries.
+
+Walking the hierarchy with lazy per-parent queries costs one query per
+feature (for its stories) and one per bug link, so scoring views got slower
+with every feature added. The loader instead issues:
+
+- One query for the epics
+- One IN-batched query for all their features and one for all their stories
+  (selectinload)
+- Optionally one for the snapshots
+- Optionally one for every bug linked to the epics, their features or their
+  stories (via BugLink)
+
+so latency no longer depends on the size of the tree.
+"""
+import logging
+from dataclasses import dataclass, field
+from typing import List, Dict
+
+from sqlalchemy import select, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from db.models import Epic, Bug, BugLink, BugLinkEntityType
+from db.feature_models import Feature
+from db.user_story_models import UserStory
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EpicTree:
+    """An epic with its loaded features, stories and linked bugs"""
+    epic: Epic
+    features: List[Feature]
+    bugs: List[Bug] = field(default_factory=list)
+
+    @property
+    def stories(self) -> List[UserStory]:
+        """All stories of all features, in feature order"""
+        return [story for feature in self.features for story in feature.user_stories]
+
+
+class EpicTreeLoader:
+    """Eager hierarchical loading of epics for scoring and reporting"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def load(
+        self,
+        user_id: str,
+        *criteria,
+        include_bugs: bool = False,
+        include_snapshot: bool = False
+    ) -> List[EpicTree]:
+        """
+        Trees for the user's epics matching the extra Epic criteria
+        (e.g. Epic.epic_id == epic_id), in epic creation order.
+        """
+        options = [selectinload(Epic.features).selectinload(Feature.user_stories)]
+        if include_snapshot:
+            options.append(selectinload(Epic.snapshot))
+
+        result = await self.session.execute(
+            select(Epic)
+            .where(Epic.user_id == user_id, *criteria)
+            .options(*options)
+            .order_by(Epic.id)
+        )
+        trees = [EpicTree(epic=epic, features=list(epic.features)) for epic in result.scalars().all()]
+
+        if include_bugs and trees:
+            await self._attach_bugs(user_id, trees)
+        return trees
+
+    async def _attach_bugs(self, user_id: str, trees: List[EpicTree]):
+        """Fetch the bugs linked to any node of the trees in one query"""
+        owner: Dict[tuple, EpicTree] = {}
+        for tree in trees:
+            owner[(BugLinkEntityType.EPIC.value, tree.epic.epic_id)] = tree
+            for feature in tree.features:
+                owner[(BugLinkEntityType.FEATURE.value, feature.feature_id)] = tree
+                for story in feature.user_stories:
+                    owner[(BugLinkEntityType.STORY.value, story.story_id)] = tree
+
+        epic_ids = [tree.epic.epic_id for tree in trees]
+        feature_ids = select(Feature.feature_id).where(Feature.epic_id.in_(epic_ids))
+        story_ids = select(UserStory.story_id).where(UserStory.feature_id.in_(feature_ids))
+
+        result = await self.session.execute(
+            select(BugLink.entity_type, BugLink.entity_id, Bug)
+            .join(Bug, Bug.bug_id == BugLink.bug_id)
+            .where(
+                Bug.user_id == user_id,
+                Bug.is_deleted == False,
+                or_(
+                    and_(BugLink.entity_type == BugLinkEntityType.EPIC.value, BugLink.entity_id.in_(epic_ids)),
+                    and_(BugLink.entity_type == BugLinkEntityType.FEATURE.value, BugLink.entity_id.in_(feature_ids)),
+                    and_(BugLink.entity_type == BugLinkEntityType.STORY.value, BugLink.entity_id.in_(story_ids)),
+                ),
+            )
+            .order_by(Bug.id)
+        )
+
+        seen = set()
+        for entity_type, entity_id, bug in result.all():
+            tree = owner.get((entity_type, entity_id))
+            # A bug linked to several nodes of one epic is listed once
+            if tree is None or (tree.epic.epic_id, bug.bug_id) in seen:
+                continue
+            seen.add((tree.epic.epic_id, bug.bug_id))
+            tree.bugs.append(bug)
@@ -1,10 +1,16 @@
 """
 Export Service for JarlPM
 Handles export to Jira, Azure DevOps, and file formats (CSV, JSON, Markdown)
+
+File exports are rendered incrementally by an ExportWriter while epics,
+features (with their stories) and bugs are read in keyset pages of
+EXPORT_PAGE_SIZE, so stream_export() keeps memory flat for any export size,
+including the portfolio export of all of a user's epics.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable
 from datetime import datetime, timezone
 from enum import Enum
+import os
 import json
 import csv
 import io
@@ -19,9 +25,13 @@ from sqlalchemy.orm import selectinload
 from db.models import Epic, EpicSnapshot, Bug
 from db.feature_models import Feature
 from db.user_story_models import UserStory
+from services.bug_service import epic_bug_ids
+from services.jira_service import adf_paragraph, chunked, parse_bulk_create_response
 
 logger = logging.getLogger(__name__)
 
+EXPORT_PAGE_SIZE = int(os.environ.get("EXPORT_PAGE_SIZE", "200"))
+
 
 class ExportFormat(str, Enum):
     JIRA_CSV = "jira_csv"
@@ -149,136 +159,76 @@ SEVERITY_TO_AZURE = {
 }
 
 
-class ExportService:
-    """Service for exporting JarlPM data to external platforms and file formats"""
+# ============================================
+# Export Writers
+# ============================================
+
+class ExportWriter:
+    """
+    Renders a file export piece by piece; each method returns the text for
+    that part of the document (possibly empty).
     
-    def __init__(self, session: AsyncSession):
-        self.session = session
+    Call order: start, then per epic epic_start / feature* / epic_end, then
+    bugs_start / bug* / end.
+    """
+    media_type = "text/plain"
+    filename_suffix = "export.txt"
     
-    # ============================================
-    # Data Retrieval
-    # ============================================
+    def start(self) -> str:
+        return ""
     
-    async def get_epic_with_all_children(self, epic_id: str, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get an epic with all its features, stories, and bugs for export"""
-        result = await self.session.execute(
-            select(Epic)
-            .options(
-                selectinload(Epic.snapshot),
-                selectinload(Epic.features).selectinload(Feature.user_stories)
-            )
-            .where(Epic.epic_id == epic_id, Epic.user_id == user_id)
-        )
-        epic = result.scalar_one_or_none()
-        
-        if not epic:
-            return None
-        
-        # Convert to dict for export
-        epic_data = {
-            "epic_id": epic.epic_id,
-            "title": epic.title,
-            "current_stage": epic.current_stage,
-            "moscow_score": epic.moscow_score,
-            "problem_statement": epic.snapshot.problem_statement if epic.snapshot else None,
-            "desired_outcome": epic.snapshot.desired_outcome if epic.snapshot else None,
-            "acceptance_criteria": epic.snapshot.acceptance_criteria if epic.snapshot else [],
-            "created_at": epic.created_at.isoformat() if epic.created_at else None,
-            "features": [],
-        }
-        
-        for feature in epic.features:
-            feature_data = {
-                "feature_id": feature.feature_id,
-                "title": feature.title,
-                "description": feature.description,
-                "current_stage": feature.current_stage,
-                "moscow_score": feature.moscow_score,
-                "rice_reach": feature.rice_reach,
-                "rice_impact": feature.rice_impact,
-                "rice_confidence": feature.rice_confidence,
-                "rice_effort": feature.rice_effort,
-                "rice_total": feature.rice_total,
-                "acceptance_criteria": feature.acceptance_criteria or [],
-                "user_stories": [],
-            }
-            
-            for story in feature.user_stories:
-                story_data = {
-                    "story_id": story.story_id,
-                    "title": story.title,
-                    "story_text": story.story_text,
-                    "persona": story.persona,
-                    "action": story.action,
-                    "benefit": story.benefit,
-                    "current_stage": story.current_stage,
-                    "story_points": story.story_points,
-                    "rice_reach": story.rice_reach,
-                    "rice_impact": story.rice_impact,
-                    "rice_confidence": story.rice_confidence,
-                    "rice_effort": story.rice_effort,
-                    "rice_total": story.rice_total,
-                    "acceptance_criteria": story.acceptance_criteria or [],
-                    # Export-ready fields
-                    "labels": story.labels or [],
-                    "story_priority": story.story_priority,
-                    "dependencies": story.dependencies or [],
-                    "risks": story.risks or [],
-                }
-                feature_data["user_stories"].append(story_data)
-            
-            epic_data["features"].append(feature_data)
-        
-        return epic_data
+    def epic_start(self, epic: Dict[str, Any]) -> str:
+        return ""
     
-    async def get_bugs_for_export(self, user_id: str, epic_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get bugs for export, optionally filtered by epic"""
-        query = select(Bug).where(Bug.user_id == user_id, Bug.is_deleted.is_(False))
-        
-        result = await self.session.execute(query)
-        bugs = result.scalars().all()
-        
-        bug_list = []
-        for bug in bugs:
-            bug_data = {
-                "bug_id": bug.bug_id,
-                "title": bug.title,
-                "description": bug.description,
-                "severity": bug.severity,
-                "status": bug.status,
-                "steps_to_reproduce": bug.steps_to_reproduce,
-                "expected_behavior": bug.expected_behavior,
-                "actual_behavior": bug.actual_behavior,
-                "rice_reach": bug.rice_reach,
-                "rice_impact": bug.rice_impact,
-                "rice_confidence": bug.rice_confidence,
-                "rice_effort": bug.rice_effort,
-                "rice_total": bug.rice_total,
-                "created_at": bug.created_at.isoformat() if bug.created_at else None,
-            }
-            bug_list.append(bug_data)
-        
-        return bug_list
+    def feature(self, epic: Dict[str, Any], feature: Dict[str, Any]) -> str:
+        return ""
     
-    # ============================================
-    # File Export (CSV, JSON, Markdown)
-    # ============================================
+    def epic_end(self, epic: Dict[str, Any]) -> str:
+        return ""
     
-    def export_to_jira_csv(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
-        """Export to Jira-compatible CSV format with export-ready story fields"""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Jira CSV headers - enhanced for export-ready stories
-        headers = [
-            "Issue Type", "Summary", "Description", "Priority", 
-            "Acceptance Criteria", "Story Points", "Parent", "Labels",
-            "Dependencies", "Risks"
-        ]
-        writer.writerow(headers)
-        
-        # Export Epic
-        epic_row = [
+    def bugs_start(self) -> str:
+        return ""
+    
+    def bug(self, bug: Dict[str, Any]) -> str:
+        return ""
+    
+    def end(self) -> str:
+        return ""
+
+
+class CSVExportWriter(ExportWriter):
+    """Base for CSV writers; rows are encoded through one small reusable buffer"""
+    media_type = "text/csv"
+    headers: List[str] = []
+    
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+    
+    def rows(self, rows: Iterable[List[Any]]) -> str:
+        for row in rows:
+            self._writer.writerow(row)
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+    
+    def start(self) -> str:
+        return self.rows([self.headers])
+
+
+class JiraCSVWriter(CSVExportWriter):
+    """Jira-compatible CSV with export-ready story fields"""
+    filename_suffix = "jira_export.csv"
+    # Jira CSV headers - enhanced for export-ready stories
+    headers = [
+        "Issue Type", "Summary", "Description", "Priority", 
+        "Acceptance Criteria", "Story Points", "Parent", "Labels",
+        "Dependencies", "Risks"
+    ]
+    
+    def epic_start(self, epic_data: Dict[str, Any]) -> str:
+        return self.rows([[
             "Epic",
             epic_data["title"],
             epic_data.get("problem_statement") or "",
@@ -289,90 +239,82 @@ class ExportService:
             "jarlpm-export",
             "",
             ""
-        ]
-        writer.writerow(epic_row)
-        
-        # Export Features as Stories
-        for feature in epic_data.get("features") or []:
-            feature_row = [
-                "Story",
-                feature["title"],
-                feature.get("description") or "",
-                MOSCOW_TO_JIRA_PRIORITY.get(feature.get("moscow_score"), "Medium"),
-                "\n".join(feature.get("acceptance_criteria") or []),
-                str(feature.get("rice_total", "")) if feature.get("rice_total") else "",
-                epic_data["title"],  # Parent epic
-                "jarlpm-export,feature",
+        ]])
+    
+    def feature(self, epic_data: Dict[str, Any], feature: Dict[str, Any]) -> str:
+        # Features are exported as Stories
+        rows = [[
+            "Story",
+            feature["title"],
+            feature.get("description") or "",
+            MOSCOW_TO_JIRA_PRIORITY.get(feature.get("moscow_score"), "Medium"),
+            "\n".join(feature.get("acceptance_criteria") or []),
+            str(feature.get("rice_total", "")) if feature.get("rice_total") else "",
+            epic_data["title"],  # Parent epic
+            "jarlpm-export,feature",
+            "",
+            ""
+        ]]
+        
+        # User Stories as Sub-tasks with full export-ready format
+        for story in feature.get("user_stories") or []:
+            # Build structured description
+            description_parts = [
+                f"**Title:** {story.get('title', '')}",
                 "",
-                ""
+                f"**User Story:**",
+                f"As {story.get('persona', '')}, I want to {story.get('action', '')} so that {story.get('benefit', '')}",
             ]
-            writer.writerow(feature_row)
             
-            # Export User Stories as Sub-tasks with full export-ready format
-            for story in feature.get("user_stories") or []:
-                # Build structured description
-                description_parts = [
-                    f"**Title:** {story.get('title', '')}",
-                    "",
-                    f"**User Story:**",
-                    f"As {story.get('persona', '')}, I want to {story.get('action', '')} so that {story.get('benefit', '')}",
-                ]
-                
-                story_labels = story.get("labels", [])
-                story_priority = story.get("story_priority", "should-have")
-                story_deps = story.get("dependencies", [])
-                story_risks = story.get("risks", [])
-                
-                # All labels including jarlpm markers
-                all_labels = ["jarlpm-export", "user-story", story_priority] + story_labels
-                
-                story_row = [
-                    "Sub-task",
-                    story.get('title', story["story_text"][:80]),  # Use title if available
-                    "\n".join(description_parts),
-                    MOSCOW_TO_JIRA_PRIORITY.get(story_priority, "Medium"),
-                    "\n".join(story.get("acceptance_criteria") or []),
-                    str(story.get("story_points", "")) if story.get("story_points") else "",
-                    feature["title"],  # Parent story/feature
-                    ",".join(all_labels),
-                    "\n".join(story_deps) if story_deps else "",
-                    "\n".join(story_risks) if story_risks else ""
-                ]
-                writer.writerow(story_row)
-        
-        # Export Bugs
-        for bug in bugs:
-            bug_row = [
-                "Bug",
-                bug["title"],
-                f"{bug.get('description') or ''}\n\nSteps to Reproduce:\n{bug.get('steps_to_reproduce') or ''}\n\nExpected: {bug.get('expected_behavior') or ''}\n\nActual: {bug.get('actual_behavior') or ''}",
-                MOSCOW_TO_JIRA_PRIORITY.get(bug.get("severity", "minor").lower(), "Medium"),
-                "",
-                "",
-                "",
-                "jarlpm-export,bug",
-                "",
-                ""
-            ]
-            writer.writerow(bug_row)
-        
-        return output.getvalue()
+            story_labels = story.get("labels", [])
+            story_priority = story.get("story_priority", "should-have")
+            story_deps = story.get("dependencies", [])
+            story_risks = story.get("risks", [])
+            
+            # All labels including jarlpm markers
+            all_labels = ["jarlpm-export", "user-story", story_priority] + story_labels
+            
+            rows.append([
+                "Sub-task",
+                story.get('title', story["story_text"][:80]),  # Use title if available
+                "\n".join(description_parts),
+                MOSCOW_TO_JIRA_PRIORITY.get(story_priority, "Medium"),
+                "\n".join(story.get("acceptance_criteria") or []),
+                str(story.get("story_points", "")) if story.get("story_points") else "",
+                feature["title"],  # Parent story/feature
+                ",".join(all_labels),
+                "\n".join(story_deps) if story_deps else "",
+                "\n".join(story_risks) if story_risks else ""
+            ])
+        return self.rows(rows)
     
-    def export_to_azure_devops_csv(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
-        """Export to Azure DevOps-compatible CSV format with export-ready story fields"""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Azure DevOps CSV headers - enhanced for export-ready stories
-        headers = [
-            "Work Item Type", "Title", "Description", "Priority", 
-            "Acceptance Criteria", "Story Points", "Area Path", "Tags",
-            "Dependencies", "Risks"
-        ]
-        writer.writerow(headers)
-        
-        # Export Epic
-        epic_row = [
+    def bug(self, bug: Dict[str, Any]) -> str:
+        return self.rows([[
+            "Bug",
+            bug["title"],
+            f"{bug.get('description') or ''}\n\nSteps to Reproduce:\n{bug.get('steps_to_reproduce') or ''}\n\nExpected: {bug.get('expected_behavior') or ''}\n\nActual: {bug.get('actual_behavior') or ''}",
+            MOSCOW_TO_JIRA_PRIORITY.get(bug.get("severity", "minor").lower(), "Medium"),
+            "",
+            "",
+            "",
+            "jarlpm-export,bug",
+            "",
+            ""
+        ]])
+
+
+class AzureDevOpsCSVWriter(CSVExportWriter):
+    """Azure DevOps-compatible CSV with export-ready story fields"""
+    filename_suffix = "azure_devops_export.csv"
+    # Azure DevOps CSV headers - enhanced for export-ready stories
+    headers = [
+        "Work Item Type", "Title", "Description", "Priority", 
+        "Acceptance Criteria", "Story Points", "Area Path", "Tags",
+        "Dependencies", "Risks"
+    ]
+    
+    def epic_start(self, epic_data: Dict[str, Any]) -> str:
+        return self.rows([[
             "Epic",
             epic_data["title"],
             epic_data.get("problem_statement") or "",
@@ -383,86 +325,134 @@ class ExportService:
             "jarlpm-export",
             "",
             ""
-        ]
-        writer.writerow(epic_row)
-        
-        # Export Features
-        for feature in epic_data.get("features") or []:
-            feature_row = [
-                "Feature",
-                feature["title"],
-                feature.get("description") or "",
-                MOSCOW_TO_PRIORITY.get(feature.get("moscow_score"), 3),
-                "\n".join(feature.get("acceptance_criteria") or []),
-                str(feature.get("rice_total", "")) if feature.get("rice_total") else "",
-                "",
-                "jarlpm-export;feature",
-                "",
-                ""
-            ]
-            writer.writerow(feature_row)
+        ]])
+    
+    def feature(self, epic_data: Dict[str, Any], feature: Dict[str, Any]) -> str:
+        rows = [[
+            "Feature",
+            feature["title"],
+            feature.get("description") or "",
+            MOSCOW_TO_PRIORITY.get(feature.get("moscow_score"), 3),
+            "\n".join(feature.get("acceptance_criteria") or []),
+            str(feature.get("rice_total", "")) if feature.get("rice_total") else "",
+            "",
+            "jarlpm-export;feature",
+            "",
+            ""
+        ]]
+        
+        # User Stories with full export-ready format
+        for story in feature.get("user_stories") or []:
+            # Build structured description
+            description = f"As {story.get('persona', '')}, I want to {story.get('action', '')} so that {story.get('benefit', '')}"
             
-            # Export User Stories with full export-ready format
-            for story in feature.get("user_stories") or []:
-                # Build structured description
-                description = f"As {story.get('persona', '')}, I want to {story.get('action', '')} so that {story.get('benefit', '')}"
-                
-                story_labels = story.get("labels", [])
-                story_priority = story.get("story_priority", "should-have")
-                story_deps = story.get("dependencies", [])
-                story_risks = story.get("risks", [])
-                
-                # All tags including jarlpm markers
-                all_tags = ["jarlpm-export", "user-story", story_priority] + story_labels
-                
-                story_row = [
-                    "User Story",
-                    story.get('title', story["story_text"][:80]),  # Use title if available
-                    description,
-                    MOSCOW_TO_PRIORITY.get(story_priority, 3),
-                    "\n".join(story.get("acceptance_criteria") or []),
-                    str(story.get("story_points", "")) if story.get("story_points") else "",
-                    "",
-                    ";".join(all_tags),
-                    "\n".join(story_deps) if story_deps else "",
-                    "\n".join(story_risks) if story_risks else ""
-                ]
-                writer.writerow(story_row)
-        
-        # Export Bugs
-        for bug in bugs:
-            bug_row = [
-                "Bug",
-                bug["title"],
-                f"{bug.get('description') or ''}\n\nSteps to Reproduce:\n{bug.get('steps_to_reproduce') or ''}\n\nExpected: {bug.get('expected_behavior') or ''}\n\nActual: {bug.get('actual_behavior') or ''}",
-                MOSCOW_TO_PRIORITY.get(bug.get("severity", "minor").lower(), 3),
-                "",
-                "",
-                "",
-                "jarlpm-export;bug",
+            story_labels = story.get("labels", [])
+            story_priority = story.get("story_priority", "should-have")
+            story_deps = story.get("dependencies", [])
+            story_risks = story.get("risks", [])
+            
+            # All tags including jarlpm markers
+            all_tags = ["jarlpm-export", "user-story", story_priority] + story_labels
+            
+            rows.append([
+                "User Story",
+                story.get('title', story["story_text"][:80]),  # Use title if available
+                description,
+                MOSCOW_TO_PRIORITY.get(story_priority, 3),
+                "\n".join(story.get("acceptance_criteria") or []),
+                str(story.get("story_points", "")) if story.get("story_points") else "",
                 "",
-                ""
-            ]
-            writer.writerow(bug_row)
-        
-        return output.getvalue()
+                ";".join(all_tags),
+                "\n".join(story_deps) if story_deps else "",
+                "\n".join(story_risks) if story_risks else ""
+            ])
+        return self.rows(rows)
     
-    def export_to_json(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
-        """Export to JSON format"""
-        export_data = {
-            "exported_at": datetime.now(timezone.utc).isoformat(),
-            "source": "JarlPM",
-            "epic": epic_data,
-            "bugs": bugs,
-            "field_mappings": {
-                "jira": JIRA_FIELD_MAPPING,
-                "azure_devops": AZURE_DEVOPS_FIELD_MAPPING,
-            }
-        }
-        return json.dumps(export_data, indent=2, default=str)
+    def bug(self, bug: Dict[str, Any]) -> str:
+        return self.rows([[
+            "Bug",
+            bug["title"],
+            f"{bug.get('description') or ''}\n\nSteps to Reproduce:\n{bug.get('steps_to_reproduce') or ''}\n\nExpected: {bug.get('expected_behavior') or ''}\n\nActual: {bug.get('actual_behavior') or ''}",
+            MOSCOW_TO_PRIORITY.get(bug.get("severity", "minor").lower(), 3),
+            "",
+            "",
+            "",
+            "jarlpm-export;bug",
+            "",
+            ""
+        ]])
+
+
+class JSONExportWriter(ExportWriter):
+    """
+    JSON document written element by element.
     
-    def export_to_markdown(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
-        """Export to Markdown format"""
+    Single epic: {"exported_at", "source", "epic": {..., "features": [...]},
+    "bugs", "field_mappings"}; portfolio: "epics": [...] instead of "epic".
+    """
+    media_type = "application/json"
+    filename_suffix = "export.json"
+    
+    def __init__(self, portfolio: bool = False):
+        self.portfolio = portfolio
+        self._epics = 0
+        self._features = 0
+        self._bugs = 0
+    
+    @staticmethod
+    def _dump(value: Any) -> str:
+        return json.dumps(value, default=str)
+    
+    def start(self) -> str:
+        head = f'{{"exported_at": {self._dump(datetime.now(timezone.utc).isoformat())}, "source": "JarlPM", '
+        return head + ('"epics": [\n' if self.portfolio else '"epic": ')
+    
+    def epic_start(self, epic_data: Dict[str, Any]) -> str:
+        self._features = 0
+        header = {key: value for key, value in epic_data.items() if key != "features"}
+        separator = ",\n" if self._epics else ""
+        self._epics += 1
+        return f'{separator}{self._dump(header)[:-1]}, "features": [\n'
+    
+    def feature(self, epic_data: Dict[str, Any], feature: Dict[str, Any]) -> str:
+        separator = ",\n" if self._features else ""
+        self._features += 1
+        return separator + self._dump(feature)
+    
+    def epic_end(self, epic_data: Dict[str, Any]) -> str:
+        return "\n]}"
+    
+    def bugs_start(self) -> str:
+        if self.portfolio:
+            return '\n], "bugs": [\n'
+        # The epic can vanish between the route's check and the stream
+        return ('' if self._epics else 'null') + ', "bugs": [\n'
+    
+    def bug(self, bug: Dict[str, Any]) -> str:
+        separator = ",\n" if self._bugs else ""
+        self._bugs += 1
+        return separator + self._dump(bug)
+    
+    def end(self) -> str:
+        field_mappings = {"jira": JIRA_FIELD_MAPPING, "azure_devops": AZURE_DEVOPS_FIELD_MAPPING}
+        return f'\n], "field_mappings": {self._dump(field_mappings)}}}\n'
+
+
+class MarkdownExportWriter(ExportWriter):
+    """Markdown document; section headings are written when their first item arrives"""
+    media_type = "text/markdown"
+    filename_suffix = "export.md"
+    
+    def __init__(self):
+        self._features = 0
+        self._bugs = 0
+    
+    @staticmethod
+    def _lines(lines: List[str]) -> str:
+        return "".join(f"{line}\n" for line in lines)
+    
+    def epic_start(self, epic_data: Dict[str, Any]) -> str:
+        self._features = 0
         lines = []
         
         # Epic Header
@@ -496,109 +486,418 @@ class ExportService:
                 lines.append(f"- {ac}")
             lines.append("")
         
-        # Features
-        if epic_data.get("features"):
+        return self._lines(lines)
+    
+    def feature(self, epic_data: Dict[str, Any], feature: Dict[str, Any]) -> str:
+        lines = []
+        if not self._features:
             lines.append("## Features")
             lines.append("")
-            
-            for i, feature in enumerate(epic_data["features"], 1):
-                lines.append(f"### {i}. {feature['title']}")
+        self._features += 1
+        
+        lines.append(f"### {self._features}. {feature['title']}")
+        lines.append("")
+        lines.append(f"**Stage:** {feature.get('current_stage', 'N/A')}")
+        if feature.get("moscow_score"):
+            lines.append(f"**Priority (MoSCoW):** {feature['moscow_score'].replace('_', ' ').title()}")
+        if feature.get("rice_total"):
+            lines.append(f"**RICE Score:** {feature['rice_total']:.1f}")
+        lines.append("")
+        
+        if feature.get("description"):
+            lines.append(feature["description"])
+            lines.append("")
+        
+        if feature.get("acceptance_criteria"):
+            lines.append("**Acceptance Criteria:**")
+            for ac in feature["acceptance_criteria"]:
+                lines.append(f"- {ac}")
+            lines.append("")
+        
+        # User Stories with export-ready format
+        if feature.get("user_stories"):
+            lines.append("**User Stories:**")
+            lines.append("")
+            for j, story in enumerate(feature["user_stories"], 1):
+                # Title and basic info
+                story_title = story.get('title', story['story_text'][:60])
+                lines.append(f"#### {j}. {story_title}")
                 lines.append("")
-                lines.append(f"**Stage:** {feature.get('current_stage', 'N/A')}")
-                if feature.get("moscow_score"):
-                    lines.append(f"**Priority (MoSCoW):** {feature['moscow_score'].replace('_', ' ').title()}")
-                if feature.get("rice_total"):
-                    lines.append(f"**RICE Score:** {feature['rice_total']:.1f}")
+                
+                # User story format
+                lines.append(f"> As {story.get('persona', 'a user')}, I want to {story.get('action', '')} so that {story.get('benefit', '')}")
                 lines.append("")
                 
-                if feature.get("description"):
-                    lines.append(feature["description"])
-                    lines.append("")
+                # Metadata table
+                story_priority = story.get('story_priority', 'should-have')
+                lines.append(f"| Priority | Points | Labels |")
+                lines.append(f"|----------|--------|--------|")
+                labels = ", ".join(story.get('labels', [])) or "—"
+                lines.append(f"| {story_priority} | {story.get('story_points', '—')} | {labels} |")
+                lines.append("")
                 
-                if feature.get("acceptance_criteria"):
+                # Acceptance Criteria (Gherkin)
+                if story.get("acceptance_criteria"):
                     lines.append("**Acceptance Criteria:**")
-                    for ac in feature["acceptance_criteria"]:
-                        lines.append(f"- {ac}")
+                    for ac in story["acceptance_criteria"]:
+                        lines.append(f"- [ ] {ac}")
                     lines.append("")
                 
-                # User Stories with export-ready format
-                if feature.get("user_stories"):
-                    lines.append("**User Stories:**")
+                # Dependencies
+                if story.get("dependencies"):
+                    lines.append("**Dependencies:**")
+                    for dep in story["dependencies"]:
+                        lines.append(f"- {dep}")
                     lines.append("")
-                    for j, story in enumerate(feature["user_stories"], 1):
-                        # Title and basic info
-                        story_title = story.get('title', story['story_text'][:60])
-                        lines.append(f"#### {j}. {story_title}")
-                        lines.append("")
-                        
-                        # User story format
-                        lines.append(f"> As {story.get('persona', 'a user')}, I want to {story.get('action', '')} so that {story.get('benefit', '')}")
-                        lines.append("")
-                        
-                        # Metadata table
-                        story_priority = story.get('story_priority', 'should-have')
-                        lines.append(f"| Priority | Points | Labels |")
-                        lines.append(f"|----------|--------|--------|")
-                        labels = ", ".join(story.get('labels', [])) or "—"
-                        lines.append(f"| {story_priority} | {story.get('story_points', '—')} | {labels} |")
-                        lines.append("")
-                        
-                        # Acceptance Criteria (Gherkin)
-                        if story.get("acceptance_criteria"):
-                            lines.append("**Acceptance Criteria:**")
-                            for ac in story["acceptance_criteria"]:
-                                lines.append(f"- [ ] {ac}")
-                            lines.append("")
-                        
-                        # Dependencies
-                        if story.get("dependencies"):
-                            lines.append("**Dependencies:**")
-                            for dep in story["dependencies"]:
-                                lines.append(f"- {dep}")
-                            lines.append("")
-                        
-                        # Risks
-                        if story.get("risks"):
-                            lines.append("**Risks:**")
-                            for risk in story["risks"]:
-                                lines.append(f"- ⚠️ {risk}")
-                            lines.append("")
-                        
-                        lines.append("---")
-                        lines.append("")
+                
+                # Risks
+                if story.get("risks"):
+                    lines.append("**Risks:**")
+                    for risk in story["risks"]:
+                        lines.append(f"- ⚠️ {risk}")
                     lines.append("")
+                
+                lines.append("---")
+                lines.append("")
+            lines.append("")
         
-        # Bugs
-        if bugs:
+        return self._lines(lines)
+    
+    def bug(self, bug: Dict[str, Any]) -> str:
+        lines = []
+        if not self._bugs:
             lines.append("## Bugs")
             lines.append("")
+        self._bugs += 1
+        
+        lines.append(f"### Bug {self._bugs}: {bug['title']}")
+        lines.append("")
+        lines.append(f"**Severity:** {bug.get('severity', 'N/A')}")
+        lines.append(f"**Status:** {bug.get('status', 'N/A')}")
+        if bug.get("rice_total"):
+            lines.append(f"**RICE Score:** {bug['rice_total']:.1f}")
+        lines.append("")
+        
+        if bug.get("description"):
+            lines.append(bug["description"])
+            lines.append("")
+        
+        if bug.get("steps_to_reproduce"):
+            lines.append("**Steps to Reproduce:**")
+            lines.append(bug["steps_to_reproduce"])
+            lines.append("")
+        
+        if bug.get("expected_behavior"):
+            lines.append(f"**Expected:** {bug['expected_behavior']}")
+        
+        if bug.get("actual_behavior"):
+            lines.append(f"**Actual:** {bug['actual_behavior']}")
+        lines.append("")
+        
+        return self._lines(lines)
+
+
+def get_export_writer(export_format: ExportFormat, portfolio: bool = False) -> ExportWriter:
+    """New writer for a file export format"""
+    if export_format == ExportFormat.JIRA_CSV:
+        return JiraCSVWriter()
+    if export_format == ExportFormat.AZURE_DEVOPS_CSV:
+        return AzureDevOpsCSVWriter()
+    if export_format == ExportFormat.JSON:
+        return JSONExportWriter(portfolio=portfolio)
+    if export_format == ExportFormat.MARKDOWN:
+        return MarkdownExportWriter()
+    raise ValueError(f"Unsupported export format: {export_format}")
+
+
+def render_export(writer: ExportWriter, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
+    """Render an already loaded epic tree in one string"""
+    parts = [writer.start(), writer.epic_start(epic_data)]
+    parts.extend(writer.feature(epic_data, feature) for feature in epic_data.get("features") or [])
+    parts.append(writer.epic_end(epic_data))
+    parts.append(writer.bugs_start())
+    parts.extend(writer.bug(bug) for bug in bugs)
+    parts.append(writer.end())
+    return "".join(parts)
+
+
+class ExportService:
+    """Service for exporting JarlPM data to external platforms and file formats"""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    # ============================================
+    # Data Retrieval
+    # ============================================
+    
+    @staticmethod
+    def _epic_dict(epic: Epic, snapshot: Optional[EpicSnapshot]) -> Dict[str, Any]:
+        return {
+            "epic_id": epic.epic_id,
+            "title": epic.title,
+            "current_stage": epic.current_stage,
+            "moscow_score": epic.moscow_score,
+            "problem_statement": snapshot.problem_statement if snapshot else None,
+            "desired_outcome": snapshot.desired_outcome if snapshot else None,
+            "acceptance_criteria": snapshot.acceptance_criteria if snapshot else [],
+            "created_at": epic.created_at.isoformat() if epic.created_at else None,
+            "features": [],
+        }
+    
+    @staticmethod
+    def _feature_dict(feature: Feature) -> Dict[str, Any]:
+        return {
+            "feature_id": feature.feature_id,
+            "title": feature.title,
+            "description": feature.description,
+            "current_stage": feature.current_stage,
+            "moscow_score": feature.moscow_score,
+            "rice_reach": feature.rice_reach,
+            "rice_impact": feature.rice_impact,
+            "rice_confidence": feature.rice_confidence,
+            "rice_effort": feature.rice_effort,
+            "rice_total": feature.rice_total,
+            "acceptance_criteria": feature.acceptance_criteria or [],
+            "user_stories": [],
+        }
+    
+    @staticmethod
+    def _story_dict(story: UserStory) -> Dict[str, Any]:
+        return {
+            "story_id": story.story_id,
+            "title": story.title,
+            "story_text": story.story_text,
+            "persona": story.persona,
+            "action": story.action,
+            "benefit": story.benefit,
+            "current_stage": story.current_stage,
+            "story_points": story.story_points,
+            "rice_reach": story.rice_reach,
+            "rice_impact": story.rice_impact,
+            "rice_confidence": story.rice_confidence,
+            "rice_effort": story.rice_effort,
+            "rice_total": story.rice_total,
+            "acceptance_criteria": story.acceptance_criteria or [],
+            # Export-ready fields
+            "labels": story.labels or [],
+            "story_priority": story.story_priority,
+            "dependencies": story.dependencies or [],
+            "risks": story.risks or [],
+        }
+    
+    @staticmethod
+    def _bug_dict(bug: Bug) -> Dict[str, Any]:
+        return {
+            "bug_id": bug.bug_id,
+            "title": bug.title,
+            "description": bug.description,
+            "severity": bug.severity,
+            "status": bug.status,
+            "steps_to_reproduce": bug.steps_to_reproduce,
+            "expected_behavior": bug.expected_behavior,
+            "actual_behavior": bug.actual_behavior,
+            "rice_reach": bug.rice_reach,
+            "rice_impact": bug.rice_impact,
+            "rice_confidence": bug.rice_confidence,
+            "rice_effort": bug.rice_effort,
+            "rice_total": bug.rice_total,
+            "created_at": bug.created_at.isoformat() if bug.created_at else None,
+        }
+    
+    async def get_epic_with_all_children(self, epic_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get an epic with all its features, stories, and bugs for export"""
+        result = await self.session.execute(
+            select(Epic)
+            .options(
+                selectinload(Epic.snapshot),
+                selectinload(Epic.features).selectinload(Feature.user_stories)
+            )
+            .where(Epic.epic_id == epic_id, Epic.user_id == user_id)
+        )
+        epic = result.scalar_one_or_none()
+        
+        if not epic:
+            return None
+        
+        # Convert to dict for export
+        epic_data = self._epic_dict(epic, epic.snapshot)
+        for feature in epic.features:
+            feature_data = self._feature_dict(feature)
+            feature_data["user_stories"] = [self._story_dict(story) for story in feature.user_stories]
+            epic_data["features"].append(feature_data)
+        
+        return epic_data
+    
+    async def get_bugs_for_export(self, user_id: str, epic_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get bugs for export, optionally filtered by epic (linked to it, its features or stories)"""
+        query = select(Bug).where(Bug.user_id == user_id, Bug.is_deleted.is_(False))
+        if epic_id:
+            query = query.where(Bug.bug_id.in_(epic_bug_ids(epic_id)))
+        
+        result = await self.session.execute(query.order_by(Bug.id))
+        return [self._bug_dict(bug) for bug in result.scalars().all()]
+    
+    # Streaming reads: keyset pages by primary key, converted to dicts and
+    # released before the next page, so only one page is held at a time.
+    
+    async def _release(self):
+        # Don't pin a pooled connection (or keep ORM objects) while a slow
+        # client downloads the page just read
+        await self.session.close()
+    
+    async def get_epic_title(self, epic_id: str, user_id: str) -> Optional[str]:
+        """Title of the user's epic, None if it doesn't exist"""
+        result = await self.session.execute(
+            select(Epic.title).where(Epic.epic_id == epic_id, Epic.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def iter_epics(
+        self,
+        user_id: str,
+        epic_id: Optional[str] = None,
+        page_size: int = EXPORT_PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Epic headers (no features) for one epic, or all non-archived epics of the user"""
+        last_id = 0
+        while True:
+            query = (
+                select(Epic, EpicSnapshot)
+                .outerjoin(EpicSnapshot, EpicSnapshot.epic_id == Epic.epic_id)
+                .where(Epic.user_id == user_id, Epic.id > last_id)
+            )
+            if epic_id:
+                query = query.where(Epic.epic_id == epic_id)
+            else:
+                query = query.where(Epic.is_archived.is_(False))
+            result = await self.session.execute(query.order_by(Epic.id).limit(page_size))
+            rows = result.all()
+            if not rows:
+                return
+            last_id = rows[-1][0].id
+            page = [self._epic_dict(epic, snapshot) for epic, snapshot in rows]
+            await self._release()
+            for epic_data in page:
+                yield epic_data
+            if len(rows) < page_size:
+                return
+    
+    async def iter_features(
+        self,
+        epic_id: str,
+        page_size: int = EXPORT_PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Features of an epic in creation order, each with its user stories"""
+        last_id = 0
+        while True:
+            result = await self.session.execute(
+                select(Feature)
+                .where(Feature.epic_id == epic_id, Feature.id > last_id)
+                .order_by(Feature.id)
+                .limit(page_size)
+            )
+            features = result.scalars().all()
+            if not features:
+                return
+            last_id = features[-1].id
+            page = {feature.feature_id: self._feature_dict(feature) for feature in features}
             
-            for i, bug in enumerate(bugs, 1):
-                lines.append(f"### Bug {i}: {bug['title']}")
-                lines.append("")
-                lines.append(f"**Severity:** {bug.get('severity', 'N/A')}")
-                lines.append(f"**Status:** {bug.get('status', 'N/A')}")
-                if bug.get("rice_total"):
-                    lines.append(f"**RICE Score:** {bug['rice_total']:.1f}")
-                lines.append("")
-                
-                if bug.get("description"):
-                    lines.append(bug["description"])
-                    lines.append("")
-                
-                if bug.get("steps_to_reproduce"):
-                    lines.append("**Steps to Reproduce:**")
-                    lines.append(bug["steps_to_reproduce"])
-                    lines.append("")
-                
-                if bug.get("expected_behavior"):
-                    lines.append(f"**Expected:** {bug['expected_behavior']}")
-                
-                if bug.get("actual_behavior"):
-                    lines.append(f"**Actual:** {bug['actual_behavior']}")
-                lines.append("")
+            # One query for the stories of the whole page
+            stories = await self.session.execute(
+                select(UserStory)
+                .where(UserStory.feature_id.in_(list(page)))
+                .order_by(UserStory.id)
+            )
+            for story in stories.scalars():
+                page[story.feature_id]["user_stories"].append(self._story_dict(story))
+            
+            await self._release()
+            for feature_data in page.values():
+                yield feature_data
+            if len(features) < page_size:
+                return
+    
+    async def iter_bugs(
+        self,
+        user_id: str,
+        epic_id: Optional[str] = None,
+        page_size: int = EXPORT_PAGE_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """The bugs of get_bugs_for_export, a page at a time"""
+        last_id = 0
+        while True:
+            query = select(Bug).where(Bug.user_id == user_id, Bug.is_deleted.is_(False), Bug.id > last_id)
+            if epic_id:
+                query = query.where(Bug.bug_id.in_(epic_bug_ids(epic_id)))
+            result = await self.session.execute(query.order_by(Bug.id).limit(page_size))
+            bugs = result.scalars().all()
+            if not bugs:
+                return
+            last_id = bugs[-1].id
+            page = [self._bug_dict(bug) for bug in bugs]
+            await self._release()
+            for bug_data in page:
+                yield bug_data
+            if len(bugs) < page_size:
+                return
+    
+    # ============================================
+    # File Export (CSV, JSON, Markdown)
+    # ============================================
+    
+    def export_to_jira_csv(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
+        """Export to Jira-compatible CSV format with export-ready story fields"""
+        return render_export(JiraCSVWriter(), epic_data, bugs)
+    
+    def export_to_azure_devops_csv(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
+        """Export to Azure DevOps-compatible CSV format with export-ready story fields"""
+        return render_export(AzureDevOpsCSVWriter(), epic_data, bugs)
+    
+    def export_to_json(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
+        """Export to JSON format"""
+        return render_export(JSONExportWriter(), epic_data, bugs)
+    
+    def export_to_markdown(self, epic_data: Dict[str, Any], bugs: List[Dict[str, Any]]) -> str:
+        """Export to Markdown format"""
+        return render_export(MarkdownExportWriter(), epic_data, bugs)
+    
+    async def stream_export(
+        self,
+        writer: ExportWriter,
+        user_id: str,
+        epic_id: Optional[str] = None,
+        include_bugs: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Stream a file export of one epic, or of all the user's epics (portfolio)
+        when epic_id is None. Holds one page of rows at a time.
+        """
+        async for chunk in self._stream_parts(writer, user_id, epic_id, include_bugs):
+            if chunk:
+                yield chunk
+    
+    async def _stream_parts(
+        self,
+        writer: ExportWriter,
+        user_id: str,
+        epic_id: Optional[str],
+        include_bugs: bool
+    ) -> AsyncIterator[str]:
+        yield writer.start()
         
-        return "\n".join(lines)
+        async for epic_data in self.iter_epics(user_id, epic_id):
+            yield writer.epic_start(epic_data)
+            async for feature in self.iter_features(epic_data["epic_id"]):
+                yield writer.feature(epic_data, feature)
+            yield writer.epic_end(epic_data)
+        
+        yield writer.bugs_start()
+        if include_bugs:
+            # A single epic exports only its bugs; a portfolio all of the user's
+            async for bug in self.iter_bugs(user_id, epic_id):
+                yield writer.bug(bug)
+        yield writer.end()
     
     # ============================================
     # Direct API Integration
@@ -635,11 +934,7 @@ class ExportService:
                     "project": {"key": project_key},
                     "issuetype": {"name": "Epic"},
                     "summary": epic_data["title"],
-                    "description": {
-                        "type": "doc",
-                        "version": 1,
-                        "content": [{"type": "paragraph", "content": [{"type": "text", "text": epic_data.get("problem_statement", "") or "No description"}]}]
-                    }
+                    "description": adf_paragraph(epic_data.get("problem_statement", "") or "No description")
                 }
             }
             
@@ -649,80 +944,95 @@ class ExportService:
                 epic_result = response.json()
                 epic_key = epic_result["key"]
                 results["created"].append({"type": "Epic", "key": epic_key, "title": epic_data["title"]})
-                
-                # Create Features as Stories linked to Epic
-                for feature in epic_data.get("features", []):
-                    feature_payload = {
-                        "fields": {
-                            "project": {"key": project_key},
-                            "issuetype": {"name": "Story"},
-                            "summary": feature["title"],
-                            "description": {
-                                "type": "doc",
-                                "version": 1,
-                                "content": [{"type": "paragraph", "content": [{"type": "text", "text": feature.get("description", "") or "No description"}]}]
-                            },
-                            "parent": {"key": epic_key}  # Link to epic
-                        }
-                    }
-                    
-                    try:
-                        resp = await client.post(f"{base_url}/rest/api/3/issue", headers=headers, json=feature_payload)
-                        resp.raise_for_status()
-                        feature_result = resp.json()
-                        feature_key = feature_result["key"]
-                        results["created"].append({"type": "Story", "key": feature_key, "title": feature["title"]})
-                        
-                        # Create User Stories as Sub-tasks
-                        for story in feature.get("user_stories", []):
-                            story_payload = {
-                                "fields": {
-                                    "project": {"key": project_key},
-                                    "issuetype": {"name": "Sub-task"},
-                                    "summary": story["story_text"][:255],
-                                    "parent": {"key": feature_key}
-                                }
-                            }
-                            
-                            try:
-                                sresp = await client.post(f"{base_url}/rest/api/3/issue", headers=headers, json=story_payload)
-                                sresp.raise_for_status()
-                                story_result = sresp.json()
-                                results["created"].append({"type": "Sub-task", "key": story_result["key"], "title": story["story_text"][:50]})
-                            except Exception as e:
-                                results["errors"].append({"type": "Sub-task", "title": story["story_text"][:50], "error": str(e)})
-                    
-                    except Exception as e:
-                        results["errors"].append({"type": "Story", "title": feature["title"], "error": str(e)})
-                
-                # Create Bugs
-                for bug in bugs:
-                    bug_payload = {
-                        "fields": {
-                            "project": {"key": project_key},
-                            "issuetype": {"name": "Bug"},
-                            "summary": bug["title"],
-                            "description": {
-                                "type": "doc",
-                                "version": 1,
-                                "content": [{"type": "paragraph", "content": [{"type": "text", "text": bug.get("description", "") or "No description"}]}]
-                            }
-                        }
-                    }
-                    
-                    try:
-                        bresp = await client.post(f"{base_url}/rest/api/3/issue", headers=headers, json=bug_payload)
-                        bresp.raise_for_status()
-                        bug_result = bresp.json()
-                        results["created"].append({"type": "Bug", "key": bug_result["key"], "title": bug["title"]})
-                    except Exception as e:
-                        results["errors"].append({"type": "Bug", "title": bug["title"], "error": str(e)})
-            
             except Exception as e:
                 results["errors"].append({"type": "Epic", "title": epic_data["title"], "error": str(e)})
+                return results
+            
+            # Create Features as Stories linked to Epic (bulk)
+            features = epic_data.get("features", [])
+            feature_keys = await self._jira_bulk_create(
+                client, base_url, headers, results, "Story",
+                [
+                    (feature["title"], {
+                        "project": {"key": project_key},
+                        "issuetype": {"name": "Story"},
+                        "summary": feature["title"],
+                        "description": adf_paragraph(feature.get("description", "") or "No description"),
+                        "parent": {"key": epic_key}  # Link to epic
+                    })
+                    for feature in features
+                ]
+            )
+            
+            # Create User Stories as Sub-tasks of their (successfully created) feature
+            await self._jira_bulk_create(
+                client, base_url, headers, results, "Sub-task",
+                [
+                    (story["story_text"][:50], {
+                        "project": {"key": project_key},
+                        "issuetype": {"name": "Sub-task"},
+                        "summary": story["story_text"][:255],
+                        "parent": {"key": feature_key}
+                    })
+                    for feature, feature_key in zip(features, feature_keys) if feature_key
+                    for story in feature.get("user_stories", [])
+                ]
+            )
+            
+            # Create Bugs
+            await self._jira_bulk_create(
+                client, base_url, headers, results, "Bug",
+                [
+                    (bug["title"], {
+                        "project": {"key": project_key},
+                        "issuetype": {"name": "Bug"},
+                        "summary": bug["title"],
+                        "description": adf_paragraph(bug.get("description", "") or "No description")
+                    })
+                    for bug in bugs
+                ]
+            )
         
         return results
     
+    async def _jira_bulk_create(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        headers: Dict[str, str],
+        results: Dict[str, Any],
+        issue_type: str,
+        issues: List[tuple]
+    ) -> List[Optional[str]]:
+        """
+        Create (title, fields) issues via /rest/api/3/issue/bulk, recording each
+        one in results["created"] or results["errors"].
+        Returns the created key (or None) per issue, in order.
+        """
+        keys: List[Optional[str]] = []
+        for chunk in chunked(issues):
+            try:
+                response = await client.post(
+                    f"{base_url}/rest/api/3/issue/bulk",
+                    headers=headers,
+                    json={"issueUpdates": [{"fields": fields} for _, fields in chunk]}
+                )
+                # 400 means some (or all) elements failed; the body says which
+                if response.status_code != 400:
+                    response.raise_for_status()
+                outcomes = parse_bulk_create_response(len(chunk), response.json())
+            except Exception as e:
+                outcomes = [{"error": str(e)}] * len(chunk)
+            
+            for (title, _), outcome in zip(chunk, outcomes):
+                if "error" in outcome:
+                    results["errors"].append({"type": issue_type, "title": title, "error": outcome["error"]})
+                    keys.append(None)
+                else:
+                    results["created"].append({"type": issue_type, "key": outcome["key"], "title": title})
+                    keys.append(outcome["key"])
+        return keys
+    
     async def export_to_azure_devops_api(
         self,
         epic_data: Dict[str, Any],
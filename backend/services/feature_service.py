@@ -13,6 +13,7 @@ from sqlalchemy.orm import selectinload
 
 from db.feature_models import Feature, FeatureStage, FeatureConversationEvent, FEATURE_STAGE_ORDER
 from db.models import Epic
+from services.conversation_history_service import load_conversation_history
 
 
 class FeatureService:
@@ -178,22 +179,22 @@ class FeatureService:
         await self.session.refresh(event)
         return event
     
-    async def get_conversation_history(self, feature_id: str, limit: int = 20) -> List[dict]:
-        """Get recent conversation history for LLM context"""
-        result = await self.session.execute(
-            select(FeatureConversationEvent)
-            .where(
-                and_(
-                    FeatureConversationEvent.feature_id == feature_id,
-                    FeatureConversationEvent.role.in_(['user', 'assistant'])
-                )
-            )
-            .order_by(FeatureConversationEvent.created_at.desc())
-            .limit(limit)
+    async def get_conversation_history(
+        self,
+        feature_id: str,
+        token_budget: Optional[int] = None,
+        config_data: Optional[dict] = None
+    ) -> List[dict]:
+        """Get recent conversation history for LLM context, windowed by token budget"""
+        return await load_conversation_history(
+            self.session,
+            FeatureConversationEvent,
+            FeatureConversationEvent.feature_id,
+            "feature",
+            feature_id,
+            token_budget=token_budget,
+            config_data=config_data,
         )
-        events = list(result.scalars().all())
-        events.reverse()  # Oldest first
-        return [{"role": e.role, "content": e.content} for e in events]
     
     def parse_feature_update(self, content: str) -> dict:
         """Parse AI response for feature updates"""
@@ -0,0 +1,159 @@
+"""
+Shared HTTP Client Registry for JarlPM
+
+Keeps one pooled, keep-alive httpx.AsyncClient per upstream origin so that
+LLM streaming, repair passes and key validation reuse TCP/TLS connections
+instead of paying a fresh handshake on every call.
+
+Lifecycle:
+- Clients for the well-known LLM providers are created in the startup hook
+- User-supplied origins (local/custom LLM endpoints) go through
+  open_http_client(), which hands out a short-lived client closed after use,
+  so arbitrary URLs can't grow the registry
+- All pooled clients are closed in the shutdown hook
+
+Clients are shared by every user, so they never store cookies: a cookie set
+on one user's response must not be sent with another user's request.
+
+HTTP/2 is enabled when the optional `h2` package is installed.
+"""
+import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Well-known LLM provider origins, warmed at startup
+OPENAI_BASE_URL = "https://api.openai.com"
+ANTHROPIC_BASE_URL = "https://api.anthropic.com"
+GOOGLE_BASE_URL = "https://generativelanguage.googleapis.com"
+
+LLM_PROVIDER_BASE_URLS = [OPENAI_BASE_URL, ANTHROPIC_BASE_URL, GOOGLE_BASE_URL]
+
+# Pool sizing (per origin)
+MAX_CONNECTIONS = int(os.environ.get("HTTP_POOL_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("HTTP_POOL_MAX_KEEPALIVE", "20"))
+KEEPALIVE_EXPIRY = float(os.environ.get("HTTP_POOL_KEEPALIVE_EXPIRY", "30"))
+
+# Default timeout; individual requests still pass their own timeout
+DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+
+def _origin(url: str) -> str:
+    """Normalize a URL to its scheme://host[:port] origin."""
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"Invalid base URL: {url}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+POOLED_ORIGINS = {_origin(url) for url in LLM_PROVIDER_BASE_URLS}
+
+
+def _no_cookie_jar() -> CookieJar:
+    """Cookie jar whose policy accepts no domain, so nothing is ever stored"""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _build_client(origin: str, limits: Optional[httpx.Limits] = None) -> httpx.AsyncClient:
+    # HTTP/2 only negotiates over TLS; plain http:// falls back to HTTP/1.1
+    use_http2 = HTTP2_AVAILABLE and origin.startswith("https://")
+    return httpx.AsyncClient(
+        limits=limits or httpx.Limits(),
+        timeout=DEFAULT_TIMEOUT,
+        http2=use_http2,
+        # Passed as a CookieJar (not httpx.Cookies) so the policy is kept
+        cookies=_no_cookie_jar(),
+    )
+
+
+class HTTPClientRegistry:
+    """Process-wide registry of pooled httpx clients keyed by origin."""
+
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._lock = asyncio.Lock()
+
+    def _create_client(self, origin: str) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        )
+        logger.info(f"Creating pooled HTTP client for {origin}")
+        return _build_client(origin, limits)
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """
+        Get the pooled client for the origin of `url`, creating it if needed.
+
+        Callers must NOT close the returned client; use absolute URLs when
+        issuing requests on it.
+        """
+        origin = _origin(url)
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = self._create_client(origin)
+            self._clients[origin] = client
+        return client
+
+    async def startup(self, base_urls: Optional[list] = None):
+        """Pre-create clients for the given origins (defaults to LLM providers)."""
+        async with self._lock:
+            for url in base_urls or LLM_PROVIDER_BASE_URLS:
+                self.get(url)
+
+    async def close(self):
+        """Close all pooled clients."""
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client: {e}")
+
+
+# Singleton instance
+_http_client_registry = None
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    global _http_client_registry
+    if _http_client_registry is None:
+        _http_client_registry = HTTPClientRegistry()
+    return _http_client_registry
+
+
+def get_http_client(url: str) -> httpx.AsyncClient:
+    """Shortcut for get_http_client_registry().get(url)."""
+    return get_http_client_registry().get(url)
+
+
+@asynccontextmanager
+async def open_http_client(url: str) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Client for a user-supplied URL: the pooled client for a well-known
+    provider origin, otherwise a short-lived client closed on exit.
+    """
+    origin = _origin(url)
+    if origin in POOLED_ORIGINS:
+        yield get_http_client(url)
+        return
+    client = _build_client(origin)
+    try:
+        yield client
+    finally:
+        await client.aclose()
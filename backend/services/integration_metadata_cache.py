@@ -0,0 +1,147 @@
+"""
+Integration Metadata Cache for JarlPM
+
+Caches slow-changing metadata fetched from Jira, Linear and Azure DevOps
+(projects, issue types, fields, teams, labels, workflow states, iterations,
+area paths) per connected integration, so settings pages and push
+preparation don't pay several external round trips on every request.
+
+- Storage goes through cache_service (Redis if configured, otherwise
+  in-process), grouped by integration_id
+- Entries older than INTEGRATION_METADATA_REFRESH_SECONDS are still served,
+  and refreshed in the background (at most one refresh per key at a time)
+- Entries expire after INTEGRATION_METADATA_TTL_SECONDS
+- Connect/configure/disconnect invalidate everything for the integration
+
+REST service methods opt in with @integration_metadata("kind"); caching only
+applies when the service was created with an integration_id.
+"""
+import os
+import time
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Optional, Set
+
+from services.cache_service import Cache, get_cache
+
+logger = logging.getLogger(__name__)
+
+INTEGRATION_METADATA_TTL_SECONDS = float(os.environ.get("INTEGRATION_METADATA_TTL_SECONDS", "86400"))
+INTEGRATION_METADATA_REFRESH_SECONDS = float(os.environ.get("INTEGRATION_METADATA_REFRESH_SECONDS", "600"))
+
+
+def metadata_key(kind: str, *args: Any) -> str:
+    return ":".join([kind] + [str(arg) for arg in args if arg is not None])
+
+
+class IntegrationMetadataCache:
+    """Stale-while-revalidate cache of provider metadata, keyed by integration."""
+
+    def __init__(
+        self,
+        cache: Cache,
+        refresh_after: float = INTEGRATION_METADATA_REFRESH_SECONDS,
+        enabled: bool = True,
+    ):
+        self.cache = cache
+        self.refresh_after = refresh_after
+        self.enabled = enabled
+        self._refreshing: Set[str] = set()
+        # Running refresh tasks; the loop only keeps weak references to tasks
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _key(self, integration_id: str, key: str) -> str:
+        return f"{integration_id}:{key}"
+
+    async def _store(self, integration_id: str, key: str, value: Any):
+        await self.cache.set(
+            self._key(integration_id, key),
+            {"fetched_at": time.time(), "value": value},
+            group=integration_id,
+        )
+
+    async def get_or_fetch(
+        self,
+        integration_id: str,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Cached value for key, fetching it on a miss."""
+        if not self.enabled:
+            return await fetch()
+
+        entry = await self.cache.get(self._key(integration_id, key))
+        if entry is not None:
+            if time.time() - entry["fetched_at"] > self.refresh_after:
+                self._schedule_refresh(integration_id, key, fetch)
+            return entry["value"]
+
+        value = await fetch()
+        await self._store(integration_id, key, value)
+        return value
+
+    def _schedule_refresh(self, integration_id: str, key: str, fetch: Callable[[], Awaitable[Any]]):
+        full_key = self._key(integration_id, key)
+        if full_key in self._refreshing:
+            return
+        self._refreshing.add(full_key)
+
+        async def run():
+            try:
+                await self._store(integration_id, key, await fetch())
+            except Exception as e:
+                # Keep serving the stale value; it still expires on the hard TTL
+                logger.warning(f"Integration metadata refresh failed for {full_key}: {e}")
+
+        def done(task: asyncio.Task):
+            # Also runs if the task was cancelled before it started
+            self._tasks.discard(task)
+            self._refreshing.discard(full_key)
+
+        task = asyncio.create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(done)
+
+    async def forget(self, integration_id: str, *keys: str):
+        """Drop specific entries (e.g. labels after creating one)."""
+        await self.cache.delete(*(self._key(integration_id, key) for key in keys))
+
+    async def invalidate(self, integration_id: Optional[str]):
+        """Drop everything cached for an integration (reconnect/configure/disconnect)."""
+        if integration_id:
+            await self.cache.invalidate_group(integration_id)
+
+
+def integration_metadata(kind: str):
+    """
+    Cache a REST service method's result per integration.
+
+    The key is kind plus the method's arguments; the decorated method's
+    instance must expose integration_id (None disables caching).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            integration_id = getattr(self, "integration_id", None)
+            if not integration_id:
+                return await method(self, *args, **kwargs)
+            key = metadata_key(kind, *args, *(kwargs[name] for name in sorted(kwargs)))
+            return await get_integration_metadata_cache().get_or_fetch(
+                integration_id, key, lambda: method(self, *args, **kwargs)
+            )
+        return wrapper
+    return decorator
+
+
+# Singleton instance
+_integration_metadata_cache = None
+
+def get_integration_metadata_cache() -> IntegrationMetadataCache:
+    global _integration_metadata_cache
+    if _integration_metadata_cache is None:
+        _integration_metadata_cache = IntegrationMetadataCache(
+            get_cache("integration_metadata", default_ttl=INTEGRATION_METADATA_TTL_SECONDS),
+            enabled=INTEGRATION_METADATA_TTL_SECONDS > 0,
+        )
+    return _integration_metadata_cache
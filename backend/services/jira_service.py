@@ -13,9 +13,13 @@ from urllib.parse import urlencode
 import logging
 
 from services.encryption import get_encryption_service
+from services.integration_metadata_cache import integration_metadata
 
 logger = logging.getLogger(__name__)
 
+# Jira Cloud's /issue/bulk accepts at most 50 issues per request
+JIRA_BULK_CREATE_LIMIT = 50
+
 
 class JiraAPIError(Exception):
     """Base exception for Jira API errors"""
@@ -130,9 +134,10 @@ class JiraOAuthService:
 class JiraRESTService:
     """Handles Jira Cloud REST API v3 operations"""
     
-    def __init__(self, access_token: str, cloud_id: str):
+    def __init__(self, access_token: str, cloud_id: str, integration_id: Optional[str] = None):
         self.access_token = access_token
         self.cloud_id = cloud_id
+        self.integration_id = integration_id  # Enables the integration metadata cache
         self.base_url = f"https://api.atlassian.com/ex/jira/{cloud_id}/rest/api/3"
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
@@ -144,9 +149,15 @@ class JiraRESTService:
         self,
         method: str,
         endpoint: str,
+        partial_ok: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
-        """Make authenticated request to Jira REST API"""
+        """
+        Make authenticated request to Jira REST API.
+        
+        partial_ok: return the body of a 400 response instead of raising
+        (bulk endpoints report per-item failures that way).
+        """
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.request(
@@ -168,6 +179,9 @@ class JiraRESTService:
                 if response.status_code == 401:
                     raise AuthenticationError("Jira authentication failed. Please reconnect.")
                 
+                if response.status_code == 400 and partial_ok and response.content:
+                    return response.json()
+                
                 if response.status_code >= 400:
                     logger.error(f"Jira API error: {response.status_code} - {response.text}")
                     raise JiraAPIError(f"Jira API error: {response.text}")
@@ -188,6 +202,7 @@ class JiraRESTService:
         """Get Jira server info"""
         return await self._request("GET", "/serverInfo")
     
+    @integration_metadata("projects")
     async def get_projects(self) -> List[Dict]:
         """Fetch all projects accessible to the user"""
         result = await self._request("GET", "/project/search?maxResults=100")
@@ -197,6 +212,7 @@ class JiraRESTService:
         """Get a specific project by key"""
         return await self._request("GET", f"/project/{project_key}")
     
+    @integration_metadata("issue_types")
     async def get_issue_types_for_project(self, project_id_or_key: str) -> List[Dict]:
         """Get issue types available for a project"""
         result = await self._request(
@@ -205,6 +221,7 @@ class JiraRESTService:
         )
         return result.get("values", [])
     
+    @integration_metadata("fields")
     async def get_fields(self) -> List[Dict]:
         """Get all fields including custom fields"""
         result = await self._request("GET", "/field")
@@ -224,6 +241,22 @@ class JiraRESTService:
             json={"fields": fields}
         )
     
+    async def create_issues_bulk(self, fields_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create issues via /issue/bulk, JIRA_BULK_CREATE_LIMIT per request.
+        Returns one {"id", "key"} or {"error"} entry per input, in order.
+        """
+        results = []
+        for chunk in chunked(fields_list):
+            body = await self._request(
+                "POST",
+                "/issue/bulk",
+                json={"issueUpdates": [{"fields": fields} for fields in chunk]},
+                partial_ok=True
+            )
+            results.extend(parse_bulk_create_response(len(chunk), body))
+        return results
+    
     async def update_issue(
         self,
         issue_key: str,
@@ -290,6 +323,59 @@ class JiraRESTService:
         return result.get("issues", [])
 
 
+def adf_paragraph(text: str) -> Dict[str, Any]:
+    """Wrap plain text in a single-paragraph Atlassian Document Format doc"""
+    return {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": text
+                    }
+                ]
+            }
+        ]
+    }
+
+
+def chunked(items: List[Any], size: int = JIRA_BULK_CREATE_LIMIT) -> List[List[Any]]:
+    """Split items into bulk-request sized chunks"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def parse_bulk_create_response(count: int, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Map a /issue/bulk response back onto the request's issueUpdates.
+    
+    Jira lists created issues in request order, skipping failed elements, and
+    reports failures by failedElementNumber. Returns one entry per requested
+    issue: {"id", "key"} or {"error"}.
+    """
+    errors = {}
+    for error in body.get("errors", []):
+        element_errors = error.get("elementErrors", {})
+        messages = list(element_errors.get("errorMessages", []))
+        messages += [f"{field}: {msg}" for field, msg in element_errors.get("errors", {}).items()]
+        errors[error.get("failedElementNumber")] = "; ".join(messages) or f"Jira bulk create failed (status {error.get('status')})"
+    
+    created = iter(body.get("issues", []))
+    results = []
+    for index in range(count):
+        if index in errors:
+            results.append({"error": errors[index]})
+            continue
+        issue = next(created, None)
+        if issue is None:
+            results.append({"error": "Jira bulk create returned no issue for this item"})
+        else:
+            results.append({"id": issue.get("id"), "key": issue.get("key")})
+    return results
+
+
 def compute_payload_hash(payload: Dict) -> str:
     """Compute SHA256 hash of payload for idempotency checking"""
     payload_str = json.dumps(payload, sort_keys=True, default=str)
@@ -386,52 +472,44 @@ class JiraPushService:
         
         return "\n".join(parts)
     
-    async def push_item(
+    def _payload_hash(
         self,
-        project_key: str,
-        issue_type: str,
         title: str,
         description: str,
         entity_type: str,
         entity_id: str,
-        existing_issue_key: Optional[str] = None,
+        labels: Optional[List[str]] = None,
+        story_points: Optional[int] = None
+    ) -> str:
+        return compute_payload_hash({
+            "title": title,
+            "description": description,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "labels": labels,
+            "story_points": story_points
+        })
+    
+    def _issue_url(self, issue_key: str) -> str:
+        return f"https://{self.jira.cloud_id}.atlassian.net/browse/{issue_key}"
+    
+    def build_create_fields(
+        self,
+        project_key: str,
+        issue_type: str,
+        title: str,
+        description: str,
         epic_link_key: Optional[str] = None,
         story_points: Optional[int] = None,
         labels: Optional[List[str]] = None,
         field_mappings: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
-        """
-        Push a single item to Jira (create or update).
-        Returns the issue data with key and URL.
-        """
-        payload = {
-            "title": title,
-            "description": description,
-            "entity_type": entity_type,
-            "entity_id": entity_id
-        }
-        payload_hash = compute_payload_hash(payload)
-        
-        # Build fields
+        """Issue fields for a create request"""
         fields = {
             "project": {"key": project_key},
             "issuetype": {"name": issue_type},
             "summary": title,
-            "description": {
-                "type": "doc",
-                "version": 1,
-                "content": [
-                    {
-                        "type": "paragraph",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": description
-                            }
-                        ]
-                    }
-                ]
-            }
+            "description": adf_paragraph(description)
         }
         
         # Add labels if provided
@@ -446,11 +524,47 @@ class JiraPushService:
         if epic_link_key and field_mappings and field_mappings.get("epic_link_field"):
             fields[field_mappings["epic_link_field"]] = epic_link_key
         
+        return fields
+    
+    async def push_item(
+        self,
+        project_key: str,
+        issue_type: str,
+        title: str,
+        description: str,
+        entity_type: str,
+        entity_id: str,
+        existing_issue_key: Optional[str] = None,
+        epic_link_key: Optional[str] = None,
+        story_points: Optional[int] = None,
+        labels: Optional[List[str]] = None,
+        field_mappings: Optional[Dict[str, str]] = None,
+        last_push_hash: Optional[str] = None,
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Push a single item to Jira (create or update).
+        Returns the issue data with key and URL.
+        
+        Existing issues whose payload hash matches last_push_hash are not
+        touched (action "skipped") unless force is set.
+        """
+        payload_hash = self._payload_hash(title, description, entity_type, entity_id, labels, story_points)
+        
+        if existing_issue_key and not force and payload_hash == last_push_hash:
+            return {
+                "action": "skipped",
+                "key": existing_issue_key,
+                "id": None,
+                "url": self._issue_url(existing_issue_key),
+                "payload_hash": payload_hash
+            }
+        
         if existing_issue_key:
             # Update existing issue
             update_fields = {
                 "summary": title,
-                "description": fields["description"]
+                "description": adf_paragraph(description)
             }
             if labels:
                 update_fields["labels"] = labels
@@ -464,11 +578,15 @@ class JiraPushService:
                 "action": "updated",
                 "key": existing_issue_key,
                 "id": issue.get("id"),
-                "url": f"https://{self.jira.cloud_id}.atlassian.net/browse/{existing_issue_key}",
+                "url": self._issue_url(existing_issue_key),
                 "payload_hash": payload_hash
             }
         else:
             # Create new issue
+            fields = self.build_create_fields(
+                project_key, issue_type, title, description,
+                epic_link_key, story_points, labels, field_mappings
+            )
             result = await self.jira.create_issue(fields)
             issue_key = result.get("key")
             issue_id = result.get("id")
@@ -477,6 +595,52 @@ class JiraPushService:
                 "action": "created",
                 "key": issue_key,
                 "id": issue_id,
-                "url": f"https://{self.jira.cloud_id}.atlassian.net/browse/{issue_key}",
+                "url": self._issue_url(issue_key),
                 "payload_hash": payload_hash
             }
+    
+    async def create_items_bulk(
+        self,
+        project_key: str,
+        items: List[Dict[str, Any]],
+        field_mappings: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create new issues via the bulk endpoint (up to JIRA_BULK_CREATE_LIMIT per call).
+        
+        Each item holds the create arguments of push_item (issue_type, title,
+        description, entity_type, entity_id, epic_link_key, story_points, labels).
+        Returns entity_id -> push_item-style result, or a JiraAPIError for
+        items Jira rejected.
+        """
+        fields_list = [
+            self.build_create_fields(
+                project_key,
+                item["issue_type"],
+                item["title"],
+                item["description"],
+                item.get("epic_link_key"),
+                item.get("story_points"),
+                item.get("labels"),
+                field_mappings
+            )
+            for item in items
+        ]
+        created = await self.jira.create_issues_bulk(fields_list)
+        
+        results: Dict[str, Any] = {}
+        for item, outcome in zip(items, created):
+            if "error" in outcome:
+                results[item["entity_id"]] = JiraAPIError(outcome["error"])
+                continue
+            results[item["entity_id"]] = {
+                "action": "created",
+                "key": outcome["key"],
+                "id": outcome["id"],
+                "url": self._issue_url(outcome["key"]),
+                "payload_hash": self._payload_hash(
+                    item["title"], item["description"], item["entity_type"], item["entity_id"],
+                    item.get("labels"), item.get("story_points")
+                )
+            }
+        return results
@@ -0,0 +1,108 @@
+"""
+JSON Stream Parser for JarlPM
+Pulls completed elements out of a JSON array while the LLM is still writing it.
+
+Generation endpoints ask the model for a JSON array of objects (features,
+user stories). Instead of waiting for the whole response and regex-matching
+the array, feed() each streamed chunk to a JSONArrayStreamParser and it
+returns every element whose closing brace has arrived (with its position in
+the array), so the route can send it to the client immediately.
+
+- Text before the first '[' (prose, a ```json fence, a wrapping object key)
+  is skipped; everything after the matching ']' is ignored
+- Brackets and braces inside strings (including escaped quotes) don't count
+- An element that isn't valid JSON is returned with its error (and recorded
+  in errors); the rest of the array still streams
+"""
+import json
+import logging
+from typing import Any, List, NamedTuple, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+class StreamedElement(NamedTuple):
+    """One completed array element; value is None and error set if it wasn't valid JSON"""
+    index: int
+    value: Any
+    error: Optional[str] = None
+
+
+class JSONArrayStreamParser:
+    """Incremental parser for the elements of one top-level JSON array"""
+
+    def __init__(self):
+        self.started = False
+        self.finished = False
+        self.count = 0  # Elements completed (valid or not)
+        self.errors: List[str] = []
+        self._depth = 0  # Nesting inside the array; 0 = between elements
+        self._in_string = False
+        self._escaped = False
+        self._element: List[str] = []
+
+    def feed(self, text: str) -> List[StreamedElement]:
+        """Consume a chunk; returns the elements completed by it"""
+        completed = []
+        for char in text:
+            if self.finished:
+                break
+
+            if not self.started:
+                if char == "[":
+                    self.started = True
+                continue
+
+            if self._depth == 0:
+                # Between elements: only separators, the end, or a new element
+                if char == "]":
+                    self.finished = True
+                elif char in "{[":
+                    self._depth = 1
+                    self._element = [char]
+                continue
+
+            self._element.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    completed.append(self._finish_element())
+        return completed
+
+    def _finish_element(self) -> StreamedElement:
+        raw = "".join(self._element)
+        self._element = []
+        index = self.count
+        self.count += 1
+        try:
+            return StreamedElement(index, json.loads(raw))
+        except json.JSONDecodeError as e:
+            logger.warning(f"Skipping malformed streamed JSON element {self.count}: {e}")
+            error = f"Item {self.count}: {e}"
+            self.errors.append(error)
+            return StreamedElement(index, None, error)
+
+
+def validate_item(model: Type[BaseModel], value: Any) -> Tuple[Optional[dict], Optional[str]]:
+    """Validate one streamed element; returns (item, None) or (None, error message)"""
+    try:
+        return model.model_validate(value).model_dump(), None
+    except ValidationError as e:
+        problems = "; ".join(
+            f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+            for error in e.errors()
+        )
+        return None, problems
@@ -7,15 +7,19 @@ import os
 import secrets
 import hashlib
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urlencode
 import logging
 
 from services.encryption import get_encryption_service
+from services.integration_metadata_cache import integration_metadata, get_integration_metadata_cache, metadata_key
 
 logger = logging.getLogger(__name__)
 
+# Aliased mutations per GraphQL request when batching pushes
+LINEAR_MUTATION_BATCH_SIZE = int(os.environ.get("LINEAR_MUTATION_BATCH_SIZE", "20"))
+
 
 class LinearAPIError(Exception):
     """Base exception for Linear API errors"""
@@ -24,7 +28,9 @@ class LinearAPIError(Exception):
 
 class RateLimitError(LinearAPIError):
     """Raised when API rate limit is exceeded"""
-    pass
+    def __init__(self, message: str, retry_after: int = 60):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class GraphQLError(LinearAPIError):
@@ -131,16 +137,17 @@ class LinearOAuthService:
 class LinearGraphQLService:
     """Handles Linear GraphQL API operations"""
     
-    def __init__(self, access_token: str):
+    def __init__(self, access_token: str, integration_id: Optional[str] = None):
         self.access_token = access_token
+        self.integration_id = integration_id  # Enables the integration metadata cache
         self.endpoint = "https://api.linear.app/graphql"
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json"
         }
     
-    async def execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
-        """Execute a GraphQL query against the Linear API"""
+    async def _post(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        """POST a GraphQL document; returns the raw {"data", "errors"} body"""
         async with httpx.AsyncClient() as client:
             try:
                 response = await client.post(
@@ -151,8 +158,12 @@ class LinearGraphQLService:
                 )
                 
                 if response.status_code == 429:
-                    logger.warning("Rate limit exceeded on Linear API")
-                    raise RateLimitError("Linear API rate limit exceeded. Please try again later.")
+                    retry_after = int(response.headers.get("Retry-After", "60"))
+                    logger.warning(f"Rate limit exceeded on Linear API. Retry after {retry_after}s")
+                    raise RateLimitError(
+                        "Linear API rate limit exceeded. Please try again later.",
+                        retry_after=retry_after
+                    )
                 
                 if response.status_code == 401:
                     raise AuthenticationError("Linear authentication failed. Please reconnect.")
@@ -161,20 +172,36 @@ class LinearGraphQLService:
                     logger.error(f"GraphQL error: {response.text}")
                     raise LinearAPIError(f"Linear API error: {response.text}")
                 
-                result = response.json()
-                
-                if "errors" in result:
-                    error_messages = [error.get("message", "Unknown error") 
-                                     for error in result["errors"]]
-                    logger.error(f"GraphQL errors: {error_messages}")
-                    raise GraphQLError(f"GraphQL errors: {', '.join(error_messages)}")
-                
-                return result.get("data", {})
+                return response.json()
             
             except httpx.TimeoutException:
                 logger.error("Timeout connecting to Linear API")
                 raise LinearAPIError("Linear API request timed out")
     
+    async def execute_query(self, query: str, variables: Optional[Dict] = None) -> Dict[str, Any]:
+        """Execute a GraphQL query against the Linear API"""
+        result = await self._post(query, variables)
+        
+        if "errors" in result:
+            error_messages = [error.get("message", "Unknown error") 
+                             for error in result["errors"]]
+            logger.error(f"GraphQL errors: {error_messages}")
+            raise GraphQLError(f"GraphQL errors: {', '.join(error_messages)}")
+        
+        return result.get("data", {})
+    
+    async def execute_partial(
+        self,
+        query: str,
+        variables: Optional[Dict] = None
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Execute a GraphQL document that may partially fail.
+        Returns (data, errors) instead of raising on GraphQL errors.
+        """
+        result = await self._post(query, variables)
+        return result.get("data") or {}, result.get("errors") or []
+    
     async def get_viewer(self) -> Dict[str, Any]:
         """Get the authenticated user info"""
         query = """
@@ -203,6 +230,7 @@ class LinearGraphQLService:
         result = await self.execute_query(query)
         return result.get("organization", {})
     
+    @integration_metadata("teams")
     async def get_teams(self) -> List[Dict]:
         """Fetch all teams in the workspace"""
         query = """
@@ -220,6 +248,7 @@ class LinearGraphQLService:
         result = await self.execute_query(query)
         return result.get("teams", {}).get("nodes", [])
     
+    @integration_metadata("team_projects")
     async def get_team_projects(self, team_id: str) -> List[Dict]:
         """Fetch projects for a specific team"""
         query = """
@@ -242,6 +271,7 @@ class LinearGraphQLService:
         team_data = result.get("team", {})
         return team_data.get("projects", {}).get("nodes", [])
     
+    @integration_metadata("team_labels")
     async def get_team_labels(self, team_id: str) -> List[Dict]:
         """Fetch all labels defined for a team"""
         query = """
@@ -261,6 +291,7 @@ class LinearGraphQLService:
         result = await self.execute_query(query, {"teamId": team_id})
         return result.get("team", {}).get("labels", {}).get("nodes", [])
     
+    @integration_metadata("workflow_states")
     async def get_workflow_states(self, team_id: str) -> List[Dict]:
         """Fetch workflow states for a team"""
         query = """
@@ -282,8 +313,8 @@ class LinearGraphQLService:
         result = await self.execute_query(query, {"teamId": team_id})
         return result.get("team", {}).get("states", {}).get("nodes", [])
     
-    async def create_issue(
-        self,
+    @staticmethod
+    def build_issue_create_input(
         team_id: str,
         title: str,
         description: Optional[str] = None,
@@ -294,7 +325,7 @@ class LinearGraphQLService:
         project_id: Optional[str] = None,
         parent_id: Optional[str] = None
     ) -> Dict[str, Any]:
-        """Create a new issue in Linear"""
+        """IssueCreateInput for issueCreate"""
         input_data = {
             "title": title,
             "teamId": team_id,
@@ -315,6 +346,53 @@ class LinearGraphQLService:
         if parent_id:
             input_data["parentId"] = parent_id
         
+        return input_data
+    
+    @staticmethod
+    def build_issue_update_input(
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        state_id: Optional[str] = None,
+        priority: Optional[int] = None,
+        estimate: Optional[int] = None,
+        label_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """IssueUpdateInput for issueUpdate"""
+        input_data = {}
+        
+        if title:
+            input_data["title"] = title
+        if description:
+            input_data["description"] = description
+        if state_id:
+            input_data["stateId"] = state_id
+        if priority is not None:
+            input_data["priority"] = priority
+        if estimate is not None:
+            input_data["estimate"] = estimate
+        if label_ids:
+            input_data["labelIds"] = label_ids
+        
+        return input_data
+    
+    async def create_issue(
+        self,
+        team_id: str,
+        title: str,
+        description: Optional[str] = None,
+        priority: Optional[int] = None,
+        estimate: Optional[int] = None,
+        assignee_id: Optional[str] = None,
+        label_ids: Optional[List[str]] = None,
+        project_id: Optional[str] = None,
+        parent_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new issue in Linear"""
+        input_data = self.build_issue_create_input(
+            team_id, title, description, priority, estimate,
+            assignee_id, label_ids, project_id, parent_id
+        )
+        
         mutation = """
         mutation CreateIssue($input: IssueCreateInput!) {
             issueCreate(input: $input) {
@@ -349,20 +427,9 @@ class LinearGraphQLService:
         label_ids: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """Update an existing issue in Linear"""
-        input_data = {}
-        
-        if title:
-            input_data["title"] = title
-        if description:
-            input_data["description"] = description
-        if state_id:
-            input_data["stateId"] = state_id
-        if priority is not None:
-            input_data["priority"] = priority
-        if estimate is not None:
-            input_data["estimate"] = estimate
-        if label_ids:
-            input_data["labelIds"] = label_ids
+        input_data = self.build_issue_update_input(
+            title, description, state_id, priority, estimate, label_ids
+        )
         
         mutation = """
         mutation UpdateIssue($id: String!, $input: IssueUpdateInput!) {
@@ -503,6 +570,7 @@ class LinearGraphQLService:
         
         return project_data.get("project", {})
 
+    @integration_metadata("organization_labels")
     async def get_organization_labels(self) -> List[Dict]:
         """Fetch all labels in the organization"""
         query = """
@@ -526,6 +594,88 @@ def compute_payload_hash(payload: Dict) -> str:
     return hashlib.sha256(payload_str.encode()).hexdigest()
 
 
+class LinearMutationBatcher:
+    """
+    Coalesces mutations into aliased GraphQL documents.
+    
+    Up to batch_size mutations share one request (m0: issueCreate(...),
+    m1: issueUpdate(...), ...). Errors are mapped back to their mutation by
+    the alias at the head of the GraphQL error path, so one rejected issue
+    doesn't fail its siblings. A failure of the request itself (rate limit,
+    auth, timeout) still raises.
+    """
+    
+    # mutation -> (argument types, payload field, selected fields)
+    MUTATIONS = {
+        "issueCreate": ({"input": "IssueCreateInput!"}, "issue", "id identifier title url"),
+        "issueUpdate": ({"id": "String!", "input": "IssueUpdateInput!"}, "issue", "id identifier title url"),
+        "issueLabelCreate": ({"input": "IssueLabelCreateInput!"}, "issueLabel", "id name color"),
+    }
+    
+    def __init__(self, graphql_service: "LinearGraphQLService", batch_size: int = LINEAR_MUTATION_BATCH_SIZE):
+        self.graphql = graphql_service
+        self.batch_size = max(1, batch_size)
+        self._pending: List[Tuple[str, str, Dict[str, Any]]] = []
+    
+    def add(self, key: str, mutation: str, arguments: Dict[str, Any]):
+        """Queue a mutation; its result is returned under key by execute()"""
+        if mutation not in self.MUTATIONS:
+            raise ValueError(f"Unsupported Linear mutation: {mutation}")
+        self._pending.append((key, mutation, arguments))
+    
+    def build_document(self, mutations: List[Tuple[str, str, Dict[str, Any]]]) -> Tuple[str, Dict[str, Any]]:
+        """Aliased mutation document and variables for one request"""
+        declarations = []
+        fields = []
+        variables = {}
+        for index, (_, mutation, arguments) in enumerate(mutations):
+            alias = f"m{index}"
+            argument_types, payload_field, selection = self.MUTATIONS[mutation]
+            call_args = []
+            for name, type_name in argument_types.items():
+                variable = f"{alias}_{name}"
+                declarations.append(f"${variable}: {type_name}")
+                call_args.append(f"{name}: ${variable}")
+                variables[variable] = arguments[name]
+            fields.append(
+                f"{alias}: {mutation}({', '.join(call_args)}) {{ success {payload_field} {{ {selection} }} }}"
+            )
+        query = f"mutation Batch({', '.join(declarations)}) {{\n" + "\n".join(fields) + "\n}"
+        return query, variables
+    
+    async def execute(self) -> Dict[str, Any]:
+        """
+        Send all queued mutations.
+        Returns key -> payload entity (e.g. the issue), or a LinearAPIError.
+        A failed request raises and drops the results of earlier requests, so
+        callers that retry should queue at most batch_size mutations.
+        """
+        pending, self._pending = self._pending, []
+        results: Dict[str, Any] = {}
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            query, variables = self.build_document(chunk)
+            data, errors = await self.graphql.execute_partial(query, variables)
+            
+            errors_by_alias: Dict[Optional[str], List[str]] = {}
+            for error in errors:
+                path = error.get("path") or [None]
+                errors_by_alias.setdefault(path[0], []).append(error.get("message", "Unknown error"))
+            
+            for index, (key, mutation, _) in enumerate(chunk):
+                alias = f"m{index}"
+                payload = data.get(alias)
+                payload_field = self.MUTATIONS[mutation][1]
+                if alias in errors_by_alias:
+                    results[key] = GraphQLError(f"GraphQL errors: {', '.join(errors_by_alias[alias])}")
+                elif not payload or not payload.get("success"):
+                    messages = errors_by_alias.get(None) or [f"{mutation} was not successful"]
+                    results[key] = LinearAPIError(", ".join(messages))
+                else:
+                    results[key] = payload.get(payload_field) or {}
+        return results
+
+
 class LinearPushService:
     """
     Service for pushing JarlPM items to Linear.
@@ -563,23 +713,29 @@ class LinearPushService:
             existing_labels = await self.graphql.get_team_labels(team_id)
             self._label_cache = {l["name"].lower(): l["id"] for l in existing_labels}
         
-        label_ids = []
-        for name in label_names:
-            name_lower = name.lower()
+        # Create all missing labels in one batched request
+        if label_policy == "create-missing":
+            batcher = LinearMutationBatcher(self.graphql)
+            for name in label_names:
+                if name.lower() not in self._label_cache:
+                    batcher.add(name, "issueLabelCreate", {"input": {"teamId": team_id, "name": name}})
+            created = await batcher.execute()
+            for name, new_label in created.items():
+                if isinstance(new_label, LinearAPIError):
+                    logger.warning(f"Failed to create label '{name}': {new_label}")
+                    continue
+                self._label_cache[name.lower()] = new_label["id"]
+                logger.info(f"Created new label '{name}' in Linear")
             
-            if name_lower in self._label_cache:
-                label_ids.append(self._label_cache[name_lower])
-            elif label_policy == "create-missing":
-                try:
-                    new_label = await self.graphql.create_label(team_id, name)
-                    self._label_cache[name_lower] = new_label["id"]
-                    label_ids.append(new_label["id"])
-                    logger.info(f"Created new label '{name}' in Linear")
-                except LinearAPIError as e:
-                    logger.warning(f"Failed to create label '{name}': {e}")
-            # If "only-existing", skip labels that don't exist
-        
-        return label_ids
+            if created and self.graphql.integration_id:
+                await get_integration_metadata_cache().forget(
+                    self.graphql.integration_id,
+                    metadata_key("team_labels", team_id),
+                    metadata_key("organization_labels")
+                )
+        
+        # If "only-existing", skip labels that don't exist
+        return [self._label_cache[name.lower()] for name in label_names if name.lower() in self._label_cache]
     
     def map_priority(
         self,
@@ -658,19 +814,21 @@ class LinearPushService:
         estimate: Optional[int] = None,
         priority: Optional[int] = None,
         project_id: Optional[str] = None,
-        label_ids: Optional[List[str]] = None
+        label_ids: Optional[List[str]] = None,
+        last_push_hash: Optional[str] = None,
+        force: bool = False
     ) -> Dict[str, Any]:
         """
         Push a single item to Linear (create or update).
         Returns the issue data with external_id, external_key, and external_url.
+        
+        Existing issues whose payload hash matches last_push_hash are not
+        touched (action "skipped") unless force is set.
         """
-        payload = {
-            "title": title,
-            "description": description,
-            "entity_type": entity_type,
-            "entity_id": entity_id
-        }
-        payload_hash = compute_payload_hash(payload)
+        payload_hash = self._payload_hash(title, description, entity_type, entity_id, estimate, priority, label_ids)
+        
+        if existing_external_id and not force and payload_hash == last_push_hash:
+            return self._skipped_result(existing_external_id, payload_hash)
         
         if existing_external_id:
             # Update existing issue
@@ -704,6 +862,105 @@ class LinearPushService:
             "external_url": issue.get("url"),
             "payload_hash": payload_hash
         }
+    
+    async def push_items_batch(
+        self,
+        team_id: str,
+        items: List[Dict[str, Any]],
+        force: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Create/update sibling issues with batched, aliased mutations.
+        
+        Each item holds push_item's per-item arguments (title, description,
+        entity_type, entity_id, existing_external_id, parent_external_id,
+        estimate, priority, project_id, label_ids, last_push_hash).
+        Returns entity_id -> push_item-style result, or a LinearAPIError for
+        items Linear rejected.
+        """
+        results: Dict[str, Any] = {}
+        hashes: Dict[str, str] = {}
+        batcher = LinearMutationBatcher(self.graphql)
+        
+        for item in items:
+            entity_id = item["entity_id"]
+            existing_id = item.get("existing_external_id")
+            payload_hash = self._payload_hash(
+                item["title"], item["description"], item["entity_type"], entity_id,
+                item.get("estimate"), item.get("priority"), item.get("label_ids")
+            )
+            if existing_id and not force and payload_hash == item.get("last_push_hash"):
+                results[entity_id] = self._skipped_result(existing_id, payload_hash)
+                continue
+            
+            hashes[entity_id] = payload_hash
+            if existing_id:
+                batcher.add(entity_id, "issueUpdate", {
+                    "id": existing_id,
+                    "input": self.graphql.build_issue_update_input(
+                        title=item["title"],
+                        description=item["description"],
+                        priority=item.get("priority"),
+                        estimate=item.get("estimate"),
+                        label_ids=item.get("label_ids")
+                    )
+                })
+            else:
+                batcher.add(entity_id, "issueCreate", {
+                    "input": self.graphql.build_issue_create_input(
+                        team_id=team_id,
+                        title=item["title"],
+                        description=item["description"],
+                        priority=item.get("priority"),
+                        estimate=item.get("estimate"),
+                        label_ids=item.get("label_ids"),
+                        project_id=item.get("project_id"),
+                        parent_id=item.get("parent_external_id")
+                    )
+                })
+        
+        existing_ids = {item["entity_id"]: item.get("existing_external_id") for item in items}
+        for entity_id, issue in (await batcher.execute()).items():
+            if isinstance(issue, LinearAPIError):
+                results[entity_id] = issue
+                continue
+            results[entity_id] = {
+                "action": "updated" if existing_ids[entity_id] else "created",
+                "external_id": issue.get("id"),
+                "external_key": issue.get("identifier"),
+                "external_url": issue.get("url"),
+                "payload_hash": hashes[entity_id]
+            }
+        return results
+    
+    def _payload_hash(
+        self,
+        title: str,
+        description: str,
+        entity_type: str,
+        entity_id: str,
+        estimate: Optional[int],
+        priority: Optional[int],
+        label_ids: Optional[List[str]]
+    ) -> str:
+        return compute_payload_hash({
+            "title": title,
+            "description": description,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "estimate": estimate,
+            "priority": priority,
+            "label_ids": sorted(label_ids) if label_ids else None
+        })
+    
+    def _skipped_result(self, external_id: str, payload_hash: str) -> Dict[str, Any]:
+        return {
+            "action": "skipped",
+            "external_id": external_id,
+            "external_key": None,
+            "external_url": None,
+            "payload_hash": payload_hash
+        }
 
     async def create_or_get_epic_project(
         self,
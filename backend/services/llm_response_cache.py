@@ -0,0 +1,114 @@
+"""
+LLM Response Cache for JarlPM
+
+Content-addressed cache for AI suggestion endpoints that are re-requested
+with identical inputs (page reloads, re-opening a dialog). The key is a hash
+of (LLM config id, provider, model, base_url, temperature, system prompt,
+user prompt), so any change to the underlying data changes the prompt and
+misses the cache. LLM configs belong to one user, so the config id keeps
+responses from being replayed to other users (or skipping their own key).
+
+Storage goes through cache_service (Redis if configured, otherwise an
+in-process LRU sized by LLM_RESPONSE_CACHE_MAX_ENTRIES), with a TTL of
+LLM_RESPONSE_CACHE_TTL_SECONDS. Set the TTL to 0 to disable caching.
+
+Endpoints expose a `regenerate` flag that skips the lookup; the fresh
+response then replaces the cached one.
+"""
+import os
+import json
+import hashlib
+import logging
+from typing import Optional
+
+from services.cache_service import Cache, get_cache
+from services.metrics_service import record_llm_cache_lookup
+
+logger = logging.getLogger(__name__)
+
+LLM_RESPONSE_CACHE_TTL_SECONDS = float(os.environ.get("LLM_RESPONSE_CACHE_TTL_SECONDS", "3600"))
+LLM_RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("LLM_RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+
+
+def llm_response_cache_key(
+    config_data: dict,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: Optional[float] = None,
+) -> str:
+    """Hash of everything that determines the model's output (never the API key)."""
+    material = json.dumps(
+        [
+            config_data.get("config_id"),
+            config_data.get("provider"),
+            config_data.get("model_name"),
+            config_data.get("base_url"),
+            temperature,
+            system_prompt,
+            user_prompt,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class LLMResponseCache:
+    """Stores full LLM responses by content-addressed key."""
+
+    def __init__(self, cache: Cache, enabled: bool = True):
+        self.cache = cache
+        self.enabled = enabled
+
+    async def get(
+        self,
+        config_data: dict,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        regenerate: bool = False,
+    ) -> Optional[str]:
+        """Cached response, or None on a miss (always None when regenerating)."""
+        if not self.enabled:
+            return None
+        if regenerate:
+            record_llm_cache_lookup("bypass")
+            return None
+
+        response = await self.cache.get(
+            llm_response_cache_key(config_data, system_prompt, user_prompt, temperature)
+        )
+        record_llm_cache_lookup("hit" if response is not None else "miss")
+        return response
+
+    async def set(
+        self,
+        config_data: dict,
+        system_prompt: str,
+        user_prompt: str,
+        response: str,
+        temperature: Optional[float] = None,
+    ):
+        """Store a response. Callers should only store responses they accepted."""
+        if not self.enabled or not response:
+            return
+        await self.cache.set(
+            llm_response_cache_key(config_data, system_prompt, user_prompt, temperature),
+            response,
+        )
+
+
+# Singleton instance
+_llm_response_cache = None
+
+def get_llm_response_cache() -> LLMResponseCache:
+    global _llm_response_cache
+    if _llm_response_cache is None:
+        _llm_response_cache = LLMResponseCache(
+            get_cache(
+                "llm_responses",
+                default_ttl=LLM_RESPONSE_CACHE_TTL_SECONDS,
+                max_entries=LLM_RESPONSE_CACHE_MAX_ENTRIES,
+            ),
+            enabled=LLM_RESPONSE_CACHE_TTL_SECONDS > 0,
+        )
+    return _llm_response_cache
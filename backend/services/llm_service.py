@@ -1,13 +1,21 @@
-from typing import AsyncGenerator, Optional
-import httpx
+from typing import AsyncGenerator, Callable, Optional, Union
 import json
 import re
 
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.models import LLMProvider, LLMProviderConfig, EpicStage
 from services.encryption import get_encryption_service
+from services.ai_entitlement_service import get_ai_entitlements, ResolvedLLMConfig
+from services.metrics_service import instrument_llm_stream
+from services.llm_response_cache import get_llm_response_cache
+from services.http_client import (
+    get_http_client,
+    open_http_client,
+    OPENAI_BASE_URL,
+    ANTHROPIC_BASE_URL,
+    GOOGLE_BASE_URL,
+)
 
 
 class LLMService:
@@ -17,29 +25,29 @@ class LLMService:
         self.session = session
         self.encryption = get_encryption_service()
     
-    async def get_user_llm_config(self, user_id: str) -> Optional[LLMProviderConfig]:
-        """Get the active LLM configuration for a user"""
+    async def get_user_llm_config(self, user_id: str) -> Optional[ResolvedLLMConfig]:
+        """Get the active LLM configuration for a user (cached, key already decrypted)"""
         if not self.session:
             raise ValueError("Session required to fetch LLM config")
-        result = await self.session.execute(
-            select(LLMProviderConfig)
-            .where(LLMProviderConfig.user_id == user_id, LLMProviderConfig.is_active.is_(True))
-        )
-        return result.scalar_one_or_none()
+        entitlements = await get_ai_entitlements(self.session, user_id)
+        return entitlements.llm_config
     
-    def _decrypt_api_key(self, config: LLMProviderConfig) -> str:
+    def _decrypt_api_key(self, config: Union[ResolvedLLMConfig, LLMProviderConfig]) -> str:
         """Decrypt the API key for use"""
+        if isinstance(config, ResolvedLLMConfig):
+            return config.api_key
         return self.encryption.decrypt(config.encrypted_api_key)
     
-    def prepare_for_streaming(self, config: LLMProviderConfig) -> dict:
+    def prepare_for_streaming(self, config: Union[ResolvedLLMConfig, LLMProviderConfig]) -> dict:
         """
         Prepare all data needed for streaming WITHOUT holding the session.
         Call this before releasing the DB session, then use stream_with_config().
         
-        Returns a dict with provider, model, api_key, base_url that can be used
-        after the session is closed.
+        Returns a dict with config_id, provider, model, api_key, base_url that
+        can be used after the session is closed.
         """
         return {
+            "config_id": config.config_id,
             "provider": config.provider,
             "model_name": config.model_name,
             "api_key": self._decrypt_api_key(config),
@@ -66,19 +74,51 @@ class LLMService:
         base_url = config_data.get("base_url")
         
         if provider == LLMProvider.OPENAI.value:
-            async for chunk in self._openai_stream(api_key, model, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
+            stream = self._openai_stream(api_key, model, system_prompt, user_prompt, conversation_history, temperature)
         elif provider == LLMProvider.ANTHROPIC.value:
-            async for chunk in self._anthropic_stream(api_key, model, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
+            stream = self._anthropic_stream(api_key, model, system_prompt, user_prompt, conversation_history, temperature)
         elif provider == LLMProvider.GOOGLE.value:
-            async for chunk in self._google_stream(api_key, model, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
+            stream = self._google_stream(api_key, model, system_prompt, user_prompt, conversation_history, temperature)
         elif provider == LLMProvider.LOCAL.value:
-            async for chunk in self._local_stream(api_key, base_url, model, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
+            stream = self._local_stream(api_key, base_url, model, system_prompt, user_prompt, conversation_history, temperature)
         else:
             raise ValueError(f"Unsupported LLM provider: {provider}")
+        
+        async for chunk in instrument_llm_stream(stream, provider, model):
+            yield chunk
+    
+    async def stream_cached(
+        self,
+        config_data: dict,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = None,
+        regenerate: bool = False,
+        should_cache: Callable[[str], bool] = None
+    ) -> AsyncGenerator[str, None]:
+        """
+        stream_with_config() through the LLM response cache.
+        
+        A hit is replayed as a single chunk. On a miss the full response is
+        stored once the stream completes, if should_cache(full_response)
+        accepts it (e.g. the suggestion block parsed). regenerate=True skips
+        the lookup and replaces the cached response.
+        """
+        response_cache = get_llm_response_cache()
+        cached = await response_cache.get(config_data, system_prompt, user_prompt, temperature, regenerate=regenerate)
+        if cached is not None:
+            yield cached
+            return
+        
+        full_response = ""
+        async for chunk in self.stream_with_config(
+            config_data, system_prompt, user_prompt, temperature=temperature
+        ):
+            full_response += chunk
+            yield chunk
+        
+        if should_cache is None or should_cache(full_response):
+            await response_cache.set(config_data, system_prompt, user_prompt, full_response, temperature)
     
     async def generate_stream(
         self,
@@ -103,23 +143,11 @@ class LLMService:
         if not config:
             raise ValueError("No LLM provider configured. Please add your API key in settings.")
         
-        api_key = self._decrypt_api_key(config)
-        
-        # Compare with string values since provider is now stored as string
-        if config.provider == LLMProvider.OPENAI.value:
-            async for chunk in self._openai_stream(api_key, config.model_name, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
-        elif config.provider == LLMProvider.ANTHROPIC.value:
-            async for chunk in self._anthropic_stream(api_key, config.model_name, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
-        elif config.provider == LLMProvider.GOOGLE.value:
-            async for chunk in self._google_stream(api_key, config.model_name, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
-        elif config.provider == LLMProvider.LOCAL.value:
-            async for chunk in self._local_stream(api_key, config.base_url, config.model_name, system_prompt, user_prompt, conversation_history, temperature):
-                yield chunk
-        else:
-            raise ValueError(f"Unsupported LLM provider: {config.provider}")
+        config_data = self.prepare_for_streaming(config)
+        async for chunk in self.stream_with_config(
+            config_data, system_prompt, user_prompt, conversation_history, temperature
+        ):
+            yield chunk
     
     async def _openai_stream(
         self,
@@ -147,33 +175,33 @@ class LLMService:
         if temperature is not None:
             request_body["temperature"] = temperature
         
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST",
-                "https://api.openai.com/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json=request_body,
-                timeout=120.0
-            ) as response:
-                if response.status_code != 200:
-                    error_text = await response.aread()
-                    raise ValueError(f"OpenAI API error: {error_text.decode()}")
+        client = get_http_client(OPENAI_BASE_URL)
+        async with client.stream(
+            "POST",
+            f"{OPENAI_BASE_URL}/v1/chat/completions",
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json"
+            },
+            json=request_body,
+            timeout=120.0
+        ) as response:
+            if response.status_code != 200:
+                error_text = await response.aread()
+                raise ValueError(f"OpenAI API error: {error_text.decode()}")
                 
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        if data == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(data)
-                            content = chunk.get("choices", [{}])[0].get("delta", {}).get("content", "")
-                            if content:
-                                yield content
-                        except json.JSONDecodeError:
-                            continue
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                        content = chunk.get("choices", [{}])[0].get("delta", {}).get("content", "")
+                        if content:
+                            yield content
+                    except json.JSONDecodeError:
+                        continue
     
     async def _anthropic_stream(
         self,
@@ -206,33 +234,33 @@ class LLMService:
         if temperature is not None:
             request_body["temperature"] = temperature
         
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST",
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": api_key,
-                    "anthropic-version": "2023-06-01",
-                    "Content-Type": "application/json"
-                },
-                json=request_body,
-                timeout=120.0
-            ) as response:
-                if response.status_code != 200:
-                    error_text = await response.aread()
-                    raise ValueError(f"Anthropic API error: {error_text.decode()}")
+        client = get_http_client(ANTHROPIC_BASE_URL)
+        async with client.stream(
+            "POST",
+            f"{ANTHROPIC_BASE_URL}/v1/messages",
+            headers={
+                "x-api-key": api_key,
+                "anthropic-version": "2023-06-01",
+                "Content-Type": "application/json"
+            },
+            json=request_body,
+            timeout=120.0
+        ) as response:
+            if response.status_code != 200:
+                error_text = await response.aread()
+                raise ValueError(f"Anthropic API error: {error_text.decode()}")
                 
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        try:
-                            chunk = json.loads(data)
-                            if chunk.get("type") == "content_block_delta":
-                                content = chunk.get("delta", {}).get("text", "")
-                                if content:
-                                    yield content
-                        except json.JSONDecodeError:
-                            continue
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
+                    try:
+                        chunk = json.loads(data)
+                        if chunk.get("type") == "content_block_delta":
+                            content = chunk.get("delta", {}).get("text", "")
+                            if content:
+                                yield content
+                    except json.JSONDecodeError:
+                        continue
     
     async def _google_stream(
         self,
@@ -275,35 +303,35 @@ class LLMService:
         if temperature is not None:
             request_body["generationConfig"]["temperature"] = temperature
         
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent?key={api_key}&alt=sse"
+        url = f"{GOOGLE_BASE_URL}/v1beta/models/{model}:streamGenerateContent?key={api_key}&alt=sse"
         
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST",
-                url,
-                headers={"Content-Type": "application/json"},
-                json=request_body,
-                timeout=120.0
-            ) as response:
-                if response.status_code != 200:
-                    error_text = await response.aread()
-                    raise ValueError(f"Google Gemini API error: {error_text.decode()}")
+        client = get_http_client(GOOGLE_BASE_URL)
+        async with client.stream(
+            "POST",
+            url,
+            headers={"Content-Type": "application/json"},
+            json=request_body,
+            timeout=120.0
+        ) as response:
+            if response.status_code != 200:
+                error_text = await response.aread()
+                raise ValueError(f"Google Gemini API error: {error_text.decode()}")
                 
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = line[6:]
-                        try:
-                            chunk = json.loads(data)
-                            candidates = chunk.get("candidates", [])
-                            if candidates:
-                                content = candidates[0].get("content", {})
-                                parts = content.get("parts", [])
-                                for part in parts:
-                                    text = part.get("text", "")
-                                    if text:
-                                        yield text
-                        except json.JSONDecodeError:
-                            continue
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    data = line[6:]
+                    try:
+                        chunk = json.loads(data)
+                        candidates = chunk.get("candidates", [])
+                        if candidates:
+                            content = candidates[0].get("content", {})
+                            parts = content.get("parts", [])
+                            for part in parts:
+                                text = part.get("text", "")
+                                if text:
+                                    yield text
+                    except json.JSONDecodeError:
+                        continue
     
     async def _local_stream(
         self,
@@ -337,7 +365,8 @@ class LLMService:
         if temperature is not None:
             request_body["temperature"] = temperature
         
-        async with httpx.AsyncClient() as client:
+        # User-supplied origin: short-lived client, not a pooled one
+        async with open_http_client(base_url) as client:
             async with client.stream(
                 "POST",
                 f"{base_url.rstrip('/')}/v1/chat/completions",
@@ -384,54 +413,54 @@ class LLMService:
         
         try:
             if provider_value == LLMProvider.OPENAI.value:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        "https://api.openai.com/v1/models",
-                        headers={"Authorization": f"Bearer {api_key}"},
-                        timeout=10.0
-                    )
-                    return response.status_code == 200
+                client = get_http_client(OPENAI_BASE_URL)
+                response = await client.get(
+                    f"{OPENAI_BASE_URL}/v1/models",
+                    headers={"Authorization": f"Bearer {api_key}"},
+                    timeout=10.0
+                )
+                return response.status_code == 200
             
             elif provider_value == LLMProvider.ANTHROPIC.value:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        "https://api.anthropic.com/v1/messages",
-                        headers={
-                            "x-api-key": api_key,
-                            "anthropic-version": "2023-06-01",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": model or "claude-sonnet-4-20250514",
-                            "max_tokens": 10,
-                            "messages": [{"role": "user", "content": "Hi"}]
-                        },
-                        timeout=10.0
-                    )
-                    return response.status_code == 200
+                client = get_http_client(ANTHROPIC_BASE_URL)
+                response = await client.post(
+                    f"{ANTHROPIC_BASE_URL}/v1/messages",
+                    headers={
+                        "x-api-key": api_key,
+                        "anthropic-version": "2023-06-01",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "model": model or "claude-sonnet-4-20250514",
+                        "max_tokens": 10,
+                        "messages": [{"role": "user", "content": "Hi"}]
+                    },
+                    timeout=10.0
+                )
+                return response.status_code == 200
             
             elif provider_value == LLMProvider.GOOGLE.value:
                 # Validate Google Gemini API key by listing models
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        f"https://generativelanguage.googleapis.com/v1beta/models?key={api_key}",
-                        timeout=10.0
-                    )
-                    return response.status_code == 200
+                client = get_http_client(GOOGLE_BASE_URL)
+                response = await client.get(
+                    f"{GOOGLE_BASE_URL}/v1beta/models?key={api_key}",
+                    timeout=10.0
+                )
+                return response.status_code == 200
             
             elif provider_value == LLMProvider.LOCAL.value:
                 if not base_url:
                     return False
-                async with httpx.AsyncClient() as client:
-                    headers = {"Content-Type": "application/json"}
-                    if api_key:
-                        headers["Authorization"] = f"Bearer {api_key}"
+                headers = {"Content-Type": "application/json"}
+                if api_key:
+                    headers["Authorization"] = f"Bearer {api_key}"
+                async with open_http_client(base_url) as client:
                     response = await client.get(
                         f"{base_url.rstrip('/')}/v1/models",
                         headers=headers,
                         timeout=10.0
                     )
-                    return response.status_code == 200
+                return response.status_code == 200
             
             return False
         except Exception:
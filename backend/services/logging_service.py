@@ -328,58 +328,3 @@ def setup_logging(
     logging.getLogger("asyncio").setLevel(logging.WARNING)
     
     return root_logger
-
-
-# Metric collection helpers
-class MetricsCollector:
-    """Simple in-memory metrics collector for monitoring."""
-    
-    def __init__(self):
-        self.counters: Dict[str, int] = {}
-        self.gauges: Dict[str, float] = {}
-        self.histograms: Dict[str, list] = {}
-    
-    def increment(self, name: str, value: int = 1):
-        """Increment a counter."""
-        self.counters[name] = self.counters.get(name, 0) + value
-    
-    def gauge(self, name: str, value: float):
-        """Set a gauge value."""
-        self.gauges[name] = value
-    
-    def histogram(self, name: str, value: float):
-        """Record a histogram value."""
-        if name not in self.histograms:
-            self.histograms[name] = []
-        # Keep last 1000 values
-        if len(self.histograms[name]) >= 1000:
-            self.histograms[name] = self.histograms[name][-999:]
-        self.histograms[name].append(value)
-    
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get all collected metrics."""
-        result = {
-            "counters": self.counters.copy(),
-            "gauges": self.gauges.copy(),
-            "histograms": {}
-        }
-        
-        for name, values in self.histograms.items():
-            if values:
-                sorted_values = sorted(values)
-                n = len(sorted_values)
-                result["histograms"][name] = {
-                    "count": n,
-                    "min": sorted_values[0],
-                    "max": sorted_values[-1],
-                    "mean": sum(sorted_values) / n,
-                    "p50": sorted_values[int(n * 0.5)],
-                    "p95": sorted_values[int(n * 0.95)],
-                    "p99": sorted_values[int(n * 0.99)] if n > 100 else sorted_values[-1],
-                }
-        
-        return result
-
-
-# Global metrics collector instance
-metrics = MetricsCollector()
@@ -0,0 +1,340 @@
+"""
+Metrics Service for JarlPM
+
+Prometheus metrics for the places latency actually goes:
+- HTTP route latency and request counts (by route template, not raw path)
+- LLM time-to-first-token, stream duration and tokens streamed
+- DB connection pool wait time
+- Integration push durations
+- LLM response cache hit rate
+
+Exposed in Prometheus text format at /metrics, and summarized as JSON at
+/api/admin/metrics.
+
+Multiple workers:
+- Set PROMETHEUS_MULTIPROC_DIR (scripts/start.sh does this when WORKERS>1)
+  and every worker writes its samples there; /metrics aggregates them, so
+  the numbers are the same whichever worker serves the scrape
+- Without it, metrics are per-process (fine for a single worker)
+
+If `prometheus_client` is not installed, all recording calls are no-ops.
+"""
+import os
+import time
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import (
+        CollectorRegistry,
+        Counter,
+        Histogram,
+        REGISTRY,
+        CONTENT_TYPE_LATEST,
+        generate_latest,
+    )
+    from prometheus_client import multiprocess
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+# Bucket layouts (seconds)
+HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+LLM_TTFT_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+LLM_STREAM_BUCKETS = (1, 2.5, 5, 10, 20, 30, 45, 60, 90, 120, 180, 300)
+DB_POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+PUSH_DURATION_BUCKETS = (0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class _NoopMetric:
+    """Stand-in used when prometheus_client is not installed."""
+
+    def labels(self, *args, **kwargs) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1):
+        pass
+
+    def observe(self, amount: float):
+        pass
+
+
+if PROMETHEUS_AVAILABLE:
+    HTTP_REQUESTS = Counter(
+        "jarlpm_http_requests_total",
+        "HTTP requests by route template and status",
+        ["method", "route", "status"],
+    )
+    HTTP_REQUEST_DURATION = Histogram(
+        "jarlpm_http_request_duration_seconds",
+        "HTTP request latency (streaming responses: until the last byte)",
+        ["method", "route"],
+        buckets=HTTP_LATENCY_BUCKETS,
+    )
+    LLM_TIME_TO_FIRST_TOKEN = Histogram(
+        "jarlpm_llm_time_to_first_token_seconds",
+        "Time from starting an LLM stream to its first chunk",
+        ["provider", "model"],
+        buckets=LLM_TTFT_BUCKETS,
+    )
+    LLM_STREAM_DURATION = Histogram(
+        "jarlpm_llm_stream_duration_seconds",
+        "Total LLM stream duration",
+        ["provider", "model", "outcome"],
+        buckets=LLM_STREAM_BUCKETS,
+    )
+    LLM_TOKENS_STREAMED = Counter(
+        "jarlpm_llm_tokens_streamed_total",
+        "Estimated output tokens streamed from LLM providers (chars / 4)",
+        ["provider", "model"],
+    )
+    DB_POOL_WAIT = Histogram(
+        "jarlpm_db_pool_wait_seconds",
+        "Time spent waiting to check a connection out of the DB pool",
+        buckets=DB_POOL_WAIT_BUCKETS,
+    )
+    DB_CONNECT_DURATION = Histogram(
+        "jarlpm_db_connect_seconds",
+        "Time spent opening a new DB connection (pool growth or overflow)",
+        buckets=DB_POOL_WAIT_BUCKETS,
+    )
+    INTEGRATION_PUSH_DURATION = Histogram(
+        "jarlpm_integration_push_duration_seconds",
+        "Integration push duration by provider and final run status",
+        ["provider", "status"],
+        buckets=PUSH_DURATION_BUCKETS,
+    )
+    LLM_RESPONSE_CACHE_LOOKUPS = Counter(
+        "jarlpm_llm_response_cache_lookups_total",
+        "LLM response cache lookups (hit, miss, bypass = regenerate)",
+        ["result"],
+    )
+else:
+    HTTP_REQUESTS = HTTP_REQUEST_DURATION = _NoopMetric()
+    LLM_TIME_TO_FIRST_TOKEN = LLM_STREAM_DURATION = LLM_TOKENS_STREAMED = _NoopMetric()
+    DB_POOL_WAIT = DB_CONNECT_DURATION = _NoopMetric()
+    INTEGRATION_PUSH_DURATION = LLM_RESPONSE_CACHE_LOOKUPS = _NoopMetric()
+
+
+# ============================================
+# Recording helpers
+# ============================================
+
+def observe_db_pool_wait(seconds: float):
+    DB_POOL_WAIT.observe(seconds)
+
+
+def observe_db_connect(seconds: float):
+    DB_CONNECT_DURATION.observe(seconds)
+
+
+def observe_integration_push(provider: str, status: str, seconds: float):
+    INTEGRATION_PUSH_DURATION.labels(provider=provider, status=status).observe(seconds)
+
+
+def record_llm_cache_lookup(result: str):
+    LLM_RESPONSE_CACHE_LOOKUPS.labels(result=result).inc()
+
+
+async def instrument_llm_stream(
+    stream: AsyncIterator[str],
+    provider: str,
+    model: Optional[str],
+) -> AsyncIterator[str]:
+    """Wrap an LLM chunk stream, recording TTFT, duration and tokens streamed."""
+    model = model or "default"
+    start = time.perf_counter()
+    first_chunk = True
+    chars = 0
+    outcome = "error"
+    try:
+        async for chunk in stream:
+            if first_chunk:
+                LLM_TIME_TO_FIRST_TOKEN.labels(provider=provider, model=model).observe(
+                    time.perf_counter() - start
+                )
+                first_chunk = False
+            chars += len(chunk)
+            yield chunk
+        outcome = "ok"
+    except (GeneratorExit, asyncio.CancelledError):
+        # Client disconnected / consumer stopped early / consuming task cancelled
+        outcome = "cancelled"
+        raise
+    finally:
+        if hasattr(stream, "aclose"):
+            await stream.aclose()
+        LLM_STREAM_DURATION.labels(provider=provider, model=model, outcome=outcome).observe(
+            time.perf_counter() - start
+        )
+        if chars:
+            LLM_TOKENS_STREAMED.labels(provider=provider, model=model).inc(chars // 4)
+
+
+# ============================================
+# HTTP middleware
+# ============================================
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request counts and latency per route template.
+
+    Pure ASGI (not BaseHTTPMiddleware) so SSE responses are not buffered;
+    latency for streaming responses is measured until the final body chunk.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        recorded = False
+
+        def record():
+            nonlocal recorded
+            if recorded:
+                return
+            recorded = True
+            method = scope.get("method", "GET")
+            route = _route_template(scope)
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status_code)).inc()
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(time.perf_counter() - start)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                record()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            record()
+
+
+# ============================================
+# Export
+# ============================================
+
+def _collect_registry():
+    if MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Render all metrics (aggregated across workers) in Prometheus text format."""
+    if not PROMETHEUS_AVAILABLE:
+        return b"# prometheus_client is not installed\n", CONTENT_TYPE_LATEST
+    return generate_latest(_collect_registry()), CONTENT_TYPE_LATEST
+
+
+def histogram_quantile(q: float, buckets: List[Tuple[float, float]]) -> Optional[float]:
+    """
+    Estimate a quantile from cumulative (upper_bound, count) buckets, the same
+    way PromQL's histogram_quantile() does (linear interpolation in a bucket).
+    """
+    if not buckets:
+        return None
+    buckets = sorted(buckets)
+    total = buckets[-1][1]
+    if total == 0:
+        return None
+
+    rank = q * total
+    prev_bound, prev_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                # Quantile falls in the overflow bucket; best answer is the last finite bound
+                return prev_bound
+            if count == prev_count:
+                return bound
+            return prev_bound + (bound - prev_bound) * (rank - prev_count) / (count - prev_count)
+        prev_bound, prev_count = bound, count
+    return prev_bound
+
+
+def get_metrics_summary() -> Dict[str, Any]:
+    """
+    JSON-friendly summary of counters and histograms (count/sum/mean/p50/p95/p99),
+    aggregated across workers. Used by /api/admin/metrics.
+    """
+    summary: Dict[str, Any] = {"counters": {}, "histograms": {}}
+    if not PROMETHEUS_AVAILABLE:
+        summary["error"] = "prometheus_client is not installed"
+        return summary
+
+    for family in _collect_registry().collect():
+        if not family.name.startswith("jarlpm_"):
+            continue
+
+        if family.type == "counter":
+            series = {}
+            for sample in family.samples:
+                if sample.name.endswith("_total"):
+                    series[_label_key(sample.labels)] = sample.value
+            summary["counters"][family.name] = series
+
+        elif family.type == "histogram":
+            series: Dict[str, Dict[str, Any]] = {}
+            for sample in family.samples:
+                labels = {k: v for k, v in sample.labels.items() if k != "le"}
+                entry = series.setdefault(_label_key(labels), {"buckets": [], "count": 0, "sum": 0.0})
+                if sample.name.endswith("_bucket"):
+                    entry["buckets"].append((float(sample.labels["le"]), sample.value))
+                elif sample.name.endswith("_count"):
+                    entry["count"] = sample.value
+                elif sample.name.endswith("_sum"):
+                    entry["sum"] = sample.value
+
+            result = {}
+            for key, entry in series.items():
+                count = entry["count"]
+                if not count:
+                    continue
+                result[key] = {
+                    "count": count,
+                    "sum": round(entry["sum"], 6),
+                    "mean": round(entry["sum"] / count, 6),
+                    "p50": histogram_quantile(0.5, entry["buckets"]),
+                    "p95": histogram_quantile(0.95, entry["buckets"]),
+                    "p99": histogram_quantile(0.99, entry["buckets"]),
+                }
+            summary["histograms"][family.name] = result
+
+    return summary
+
+
+def _label_key(labels: Dict[str, str]) -> str:
+    if not labels:
+        return "all"
+    return ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+
+
+def mark_worker_dead():
+    """Clean up this worker's live multiprocess files (call on shutdown)."""
+    if PROMETHEUS_AVAILABLE and MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
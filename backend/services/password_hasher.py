@@ -0,0 +1,120 @@
+"""
+Password Hasher for JarlPM
+Runs bcrypt hashing and verification off the event loop.
+
+A bcrypt call takes ~100-300 ms of CPU at the default cost; done inline in an
+async handler it freezes every other request and SSE stream on the worker.
+
+- Calls run on a dedicated pool of PASSWORD_HASH_WORKERS threads (bcrypt
+  releases the GIL while hashing, so threads run truly in parallel and the
+  loop stays free)
+- At most PASSWORD_HASH_QUEUE_LIMIT calls may be running or queued; further
+  callers wait up to PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS for a slot, then get
+  PasswordHasherBusy (the routes answer 503 + Retry-After), so a login storm
+  can't pile up unbounded work
+- New hashes use BCRYPT_ROUNDS; needs_rehash() tells login when a stored hash
+  was made with a different cost so it can be upgraded transparently
+"""
+import os
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import bcrypt
+
+logger = logging.getLogger(__name__)
+
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.environ.get("PASSWORD_HASH_QUEUE_LIMIT", "32"))
+PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = float(os.environ.get("PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS", "5"))
+
+
+class PasswordHasherBusy(Exception):
+    """Too many password hashes are already queued."""
+    pass
+
+
+def hash_password_sync(password: str, rounds: int = BCRYPT_ROUNDS) -> str:
+    """Hash a password using bcrypt (blocking)"""
+    salt = bcrypt.gensalt(rounds=rounds)
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def verify_password_sync(password: str, hashed: str) -> bool:
+    """Verify a password against its hash (blocking)"""
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+    except ValueError:
+        # Not a bcrypt hash
+        return False
+
+
+def hash_rounds(hashed: str) -> Optional[int]:
+    """Cost factor of a bcrypt hash ($2b$12$...), None if it isn't one"""
+    parts = hashed.split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    """Bounded pool for bcrypt work."""
+
+    def __init__(
+        self,
+        rounds: int = BCRYPT_ROUNDS,
+        workers: int = PASSWORD_HASH_WORKERS,
+        queue_limit: int = PASSWORD_HASH_QUEUE_LIMIT,
+        queue_timeout: float = PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+    ):
+        self.rounds = rounds
+        self.workers = max(1, workers)
+        self.queue_limit = max(self.workers, queue_limit)
+        self.queue_timeout = queue_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+        return self._executor
+
+    async def _run(self, fn, *args):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.queue_limit)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Password hashing queue full; rejecting request")
+            raise PasswordHasherBusy()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool(), fn, *args)
+        finally:
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password_sync, password, self.rounds)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(verify_password_sync, password, hashed)
+
+    def needs_rehash(self, hashed: str) -> bool:
+        """True if the hash wasn't made with the configured cost"""
+        return hash_rounds(hashed) != self.rounds
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# Singleton instance
+_password_hasher = None
+
+def get_password_hasher() -> PasswordHasher:
+    global _password_hasher
+    if _password_hasher is None:
+        _password_hasher = PasswordHasher()
+    return _password_hasher
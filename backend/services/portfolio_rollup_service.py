@@ -0,0 +1,109 @@
+"""
+Portfolio Rollup Service for JarlPM
+
+Reads per-initiative story point rollups for a whole portfolio from the
+materialized epic_point_rollups table (O(epics) rows instead of scanning
+every story).
+
+The table is maintained incrementally by database triggers on user_stories
+and features (see db.database.init_db). rebuild_epic_point_rollups() repairs
+it if it ever drifts.
+
+Used by the dashboard, delivery reality and the initiatives list.
+"""
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import Epic, EpicPointRollup
+
+
+ROLLUP_FIELDS = (
+    "total_points",
+    "must_have_points",
+    "should_have_points",
+    "nice_to_have_points",
+    "stories_count",
+    "scored_count",
+)
+
+
+def empty_rollup() -> dict:
+    """Rollup for an initiative with no stories."""
+    return {field: 0 for field in ROLLUP_FIELDS}
+
+
+async def get_epic_point_rollups(
+    session: AsyncSession,
+    user_id: str,
+    epic_ids: Optional[List[str]] = None,
+    include_archived: bool = False,
+) -> Dict[str, dict]:
+    """
+    Get story point rollups for all of a user's initiatives in one query.
+
+    Priority buckets match delivery reality semantics: anything that is not
+    must-have or nice-to-have (including unset) counts as should-have.
+
+    Args:
+        session: Database session
+        user_id: Owner of the initiatives
+        epic_ids: Optional subset of epic IDs to restrict the rollup to
+        include_archived: Include archived initiatives
+
+    Returns:
+        Dict mapping epic_id -> rollup dict (see ROLLUP_FIELDS for keys).
+        Every matching epic is present, including those with no stories.
+    """
+    query = (
+        select(Epic.epic_id, EpicPointRollup)
+        .select_from(Epic)
+        .outerjoin(EpicPointRollup, EpicPointRollup.epic_id == Epic.epic_id)
+        .where(Epic.user_id == user_id)
+    )
+
+    if not include_archived:
+        query = query.where(Epic.is_archived.is_(False))
+    if epic_ids is not None:
+        if not epic_ids:
+            return {}
+        query = query.where(Epic.epic_id.in_(epic_ids))
+
+    result = await session.execute(query)
+
+    rollups = {}
+    for epic_id, rollup in result.all():
+        if rollup is None:
+            # Initiative has never had a story
+            rollups[epic_id] = empty_rollup()
+        else:
+            rollups[epic_id] = {field: getattr(rollup, field) or 0 for field in ROLLUP_FIELDS}
+
+    return rollups
+
+
+async def rebuild_epic_point_rollups(
+    session: AsyncSession,
+    user_id: Optional[str] = None,
+) -> int:
+    """
+    Recompute rollup rows from user_stories/features.
+
+    Args:
+        session: Database session
+        user_id: Restrict the rebuild to one user's initiatives (default: all)
+
+    Returns:
+        Number of initiatives rebuilt
+    """
+    query = "SELECT refresh_epic_point_rollup(epic_id) FROM epics"
+    params = {}
+    if user_id:
+        query += " WHERE user_id = :user_id"
+        params["user_id"] = user_id
+
+    result = await session.execute(text(query), params)
+    rebuilt = len(result.all())
+    await session.commit()
+    return rebuilt
@@ -0,0 +1,438 @@
+"""
+Integration Push Executor for JarlPM
+
+Runs the items of an integration push (epic -> features -> stories) as a
+dependency DAG instead of nested sequential loops: every item starts as soon
+as its parent has been pushed, so a full initiative takes roughly
+depth x latency instead of item count x latency.
+
+Per provider account (one limiter shared by all concurrent pushes in this
+process):
+- a concurrency cap (INTEGRATION_PUSH_CONCURRENCY_<PROVIDER>)
+- a token bucket (INTEGRATION_PUSH_RATE_PER_SECOND_<PROVIDER>)
+- a RateLimitError carrying retry_after pauses the whole bucket for that
+  long, then the item is retried (up to INTEGRATION_PUSH_MAX_RETRIES)
+
+Sibling creates can be queued as one PushBatch (e.g. a Jira bulk create);
+per-item errors from the batch are recorded individually. A batch may also
+name a parent per member, so one request can cover a whole hierarchy level
+(e.g. an Azure DevOps $batch of stories under several features).
+
+Outcomes are recorded into a PushResult; finalize_push_run() copies them
+onto the ExternalPushRun.
+
+For background runs (services/push_jobs.py), restore() replays the outcomes
+of items finished by an earlier attempt so only the rest are pushed, and
+on_progress is awaited after each item or batch finishes.
+"""
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from services.retry_service import PushResult, is_retryable_error
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PUSH_CONCURRENCY = {"jira": 5, "linear": 4, "azure_devops": 5}
+DEFAULT_PUSH_RATE_PER_SECOND = {"jira": 10.0, "linear": 5.0, "azure_devops": 10.0}
+
+PUSH_MAX_RETRIES = int(os.environ.get("INTEGRATION_PUSH_MAX_RETRIES", "3"))
+# Longer Retry-After values fail the item instead of holding the request open
+PUSH_MAX_RETRY_WAIT_SECONDS = float(os.environ.get("INTEGRATION_PUSH_MAX_RETRY_WAIT_SECONDS", "30"))
+
+PARENT_FAILED = "parent_failed"
+
+
+def _provider_setting(name: str, provider: str, defaults: Dict[str, float], cast):
+    override = os.environ.get(f"{name}_{provider.upper()}")
+    if override:
+        return cast(override)
+    return cast(defaults.get(provider, min(defaults.values())))
+
+
+class TokenBucket:
+    """Async token bucket; pause() empties it and blocks refills for a while."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Honor a Retry-After: no requests until it has elapsed."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+        self.updated = self.paused_until
+
+
+class ProviderLimiter:
+    """Concurrency cap plus token bucket for one provider account."""
+
+    def __init__(self, concurrency: int, rate_per_second: float):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.bucket = TokenBucket(rate_per_second)
+
+
+# Singletons, keyed by "<provider>:<account>"
+_limiters: Dict[str, ProviderLimiter] = {}
+
+
+def get_push_limiter(provider: str, account_key: str) -> ProviderLimiter:
+    """Shared limiter for a provider account (e.g. one integration_id)."""
+    key = f"{provider}:{account_key}"
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = ProviderLimiter(
+            concurrency=_provider_setting("INTEGRATION_PUSH_CONCURRENCY", provider, DEFAULT_PUSH_CONCURRENCY, int),
+            rate_per_second=_provider_setting("INTEGRATION_PUSH_RATE_PER_SECOND", provider, DEFAULT_PUSH_RATE_PER_SECOND, float),
+        )
+        _limiters[key] = limiter
+    return limiter
+
+
+@dataclass
+class PushTask:
+    """
+    One item to push.
+
+    push receives the parent task's outcome (None for roots) and returns an
+    outcome dict: {"action": "created" | "updated" | "skipped",
+    "external_id", "external_key", "url"}.
+    """
+    entity_type: str
+    entity_id: str
+    push: Callable[[Optional[Dict[str, Any]]], Awaitable[Dict[str, Any]]]
+    depends_on: Optional[str] = None
+
+
+@dataclass
+class PushBatch:
+    """
+    Sibling items pushed in one request (e.g. a Jira bulk create).
+
+    push receives the parent outcome and returns entity_id -> outcome dict,
+    or an Exception for items the provider rejected. Only a failure of the
+    whole request is retried.
+
+    With parents (member entity_id -> parent entity_id) instead of
+    depends_on, push receives parent entity_id -> outcome for the parents
+    that succeeded; members under a failed parent are skipped and must be
+    left out of the request.
+    """
+    members: List[Tuple[str, str]]  # (entity_type, entity_id)
+    push: Callable[[Optional[Dict[str, Any]]], Awaitable[Dict[str, Any]]]
+    depends_on: Optional[str] = None
+    parents: Optional[Dict[str, str]] = None
+
+
+class _PushFailed(Exception):
+    def __init__(self, error: Exception, attempts: int):
+        super().__init__(str(error))
+        self.error = error
+        self.attempts = attempts
+
+
+class PushExecutor:
+    """Runs PushTasks and PushBatches concurrently in dependency order."""
+
+    def __init__(
+        self,
+        limiter: ProviderLimiter,
+        result: Optional[PushResult] = None,
+        max_retries: int = PUSH_MAX_RETRIES,
+        max_retry_wait: float = PUSH_MAX_RETRY_WAIT_SECONDS,
+        on_progress: Optional[Callable[[], Awaitable[None]]] = None,
+    ):
+        self.limiter = limiter
+        self.result = result or PushResult()
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+        self.units: List[Union[PushTask, PushBatch]] = []
+        self.entity_ids: set = set()
+        self.outcomes: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.links: List[str] = []
+        self.on_progress = on_progress
+        # entity_id -> {"entity_type", **outcome} for every item pushed (or restored)
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.restored: Dict[str, Dict[str, Any]] = {}
+        # Longest Retry-After that made an item give up instead of waiting
+        self.rate_limited_for: Optional[float] = None
+
+    def restore(self, completed: Dict[str, Dict[str, Any]]):
+        """
+        Seed outcomes of items finished by an earlier attempt of the same run.
+
+        Call before adding items. Restored items are recorded into the result
+        again and not pushed; they still satisfy depends_on. Batch push
+        callables should leave out members found in self.restored.
+        """
+        for entity_id, entry in completed.items():
+            outcome = {key: value for key, value in entry.items() if key != "entity_type"}
+            self.restored[entity_id] = entry
+            self.entity_ids.add(entity_id)
+            self._record(entry["entity_type"], entity_id, outcome)
+
+    def _check_dependency(self, depends_on: Optional[str], label: str):
+        if depends_on is not None and depends_on not in self.entity_ids:
+            raise ValueError(f"Unknown dependency {depends_on} for {label}")
+
+    def add(
+        self,
+        entity_type: str,
+        entity_id: str,
+        push: Callable[[Optional[Dict[str, Any]]], Awaitable[Dict[str, Any]]],
+        depends_on: Optional[str] = None,
+    ):
+        """Add an item; depends_on is the entity_id of an item added earlier."""
+        self._check_dependency(depends_on, f"{entity_type} {entity_id}")
+        self.entity_ids.add(entity_id)
+        if entity_id in self.restored:
+            return
+        self.units.append(PushTask(entity_type, entity_id, push, depends_on))
+
+    def add_batch(
+        self,
+        members: List[Tuple[str, str]],
+        push: Callable[[Optional[Dict[str, Any]]], Awaitable[Dict[str, Any]]],
+        depends_on: Optional[str] = None,
+        parents: Optional[Dict[str, str]] = None,
+    ):
+        """Add (entity_type, entity_id) items pushed by a single call (see PushBatch)."""
+        self.entity_ids.update(entity_id for _, entity_id in members)
+        members = [member for member in members if member[1] not in self.restored]
+        if not members:
+            return
+        self._check_dependency(depends_on, f"batch of {len(members)}")
+        if parents is not None:
+            parents = {entity_id: parents[entity_id] for _, entity_id in members}
+            for parent_id in set(parents.values()):
+                self._check_dependency(parent_id, f"batch of {len(members)}")
+        self.units.append(PushBatch(members, push, depends_on, parents))
+
+    async def run(self) -> PushResult:
+        """Push everything; a failed item's dependents are skipped, not attempted."""
+        running: Dict[str, asyncio.Task] = {
+            entity_id: asyncio.create_task(self._restored_outcome(entity_id)) for entity_id in self.restored
+        }
+        for unit in self.units:
+            parent = running.get(unit.depends_on) if unit.depends_on else None
+            if isinstance(unit, PushTask):
+                running[unit.entity_id] = asyncio.create_task(self._run_task(unit, parent))
+            else:
+                if unit.parents is not None:
+                    parent = {parent_id: running[parent_id] for parent_id in set(unit.parents.values())}
+                batch_task = asyncio.create_task(self._run_batch(unit, parent))
+                for _, entity_id in unit.members:
+                    running[entity_id] = asyncio.create_task(self._batch_member(batch_task, entity_id))
+
+        if running:
+            await asyncio.gather(*running.values())
+        return self.result
+
+    async def _restored_outcome(self, entity_id: str) -> Dict[str, Any]:
+        return self.outcomes[entity_id]
+
+    async def _progress(self):
+        if self.on_progress is not None:
+            try:
+                await self.on_progress()
+            except Exception as e:
+                logger.warning(f"Push progress callback failed: {e}")
+
+    async def _parent_outcome(self, members: List[Tuple[str, str]], parent: Optional[asyncio.Task]):
+        """(ok, outcome); records dependents as skipped if the parent failed."""
+        if parent is None:
+            return True, None
+        outcome = await parent
+        if outcome is None:
+            for entity_type, entity_id in members:
+                self.result.add_skipped(entity_type, entity_id, PARENT_FAILED)
+            return False, None
+        return True, outcome
+
+    async def _call(self, label: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run one provider call under the limiter, retrying rate limits and transient errors."""
+        attempt = 0
+        while True:
+            try:
+                async with self.limiter.semaphore:
+                    await self.limiter.bucket.acquire()
+                    return await call()
+            except Exception as e:
+                wait = self._retry_wait(e, attempt)
+                if wait is None:
+                    logger.error(f"Error pushing {label}: {e}")
+                    raise _PushFailed(e, attempt)
+                attempt += 1
+                logger.warning(f"Retrying {label} in {wait:.1f}s (attempt {attempt}/{self.max_retries}): {e}")
+                await asyncio.sleep(wait)
+
+    async def _run_task(self, task: PushTask, parent: Optional[asyncio.Task]):
+        ok, parent_outcome = await self._parent_outcome([(task.entity_type, task.entity_id)], parent)
+        if not ok:
+            return None
+
+        try:
+            outcome = await self._call(
+                f"{task.entity_type} {task.entity_id}", lambda: task.push(parent_outcome)
+            )
+        except _PushFailed as failure:
+            self._record_failure(task.entity_type, task.entity_id, failure.error, failure.attempts)
+            await self._progress()
+            return None
+
+        self._record(task.entity_type, task.entity_id, outcome)
+        await self._progress()
+        return outcome
+
+    async def _run_batch(
+        self,
+        batch: PushBatch,
+        parent: Union[None, asyncio.Task, Dict[str, asyncio.Task]],
+    ) -> Dict[str, Any]:
+        members = batch.members
+        if batch.parents is None:
+            ok, parent_outcome = await self._parent_outcome(members, parent)
+            if not ok:
+                return {}
+        else:
+            outcomes_by_parent = {parent_id: await task for parent_id, task in parent.items()}
+            parent_outcome = {
+                parent_id: outcome for parent_id, outcome in outcomes_by_parent.items() if outcome is not None
+            }
+            members = []
+            for entity_type, entity_id in batch.members:
+                if batch.parents[entity_id] in parent_outcome:
+                    members.append((entity_type, entity_id))
+                else:
+                    self.result.add_skipped(entity_type, entity_id, PARENT_FAILED)
+            if not members:
+                return {}
+
+        try:
+            outcomes = await self._call(
+                f"batch of {len(members)}", lambda: batch.push(parent_outcome)
+            )
+        except _PushFailed as failure:
+            for entity_type, entity_id in members:
+                self._record_failure(entity_type, entity_id, failure.error, failure.attempts)
+            await self._progress()
+            return {}
+
+        recorded = {}
+        for entity_type, entity_id in members:
+            outcome = outcomes.get(entity_id)
+            if outcome is None:
+                outcome = RuntimeError("No result returned for this item")
+            if isinstance(outcome, Exception):
+                self._record_failure(entity_type, entity_id, outcome, 0)
+                continue
+            self._record(entity_type, entity_id, outcome)
+            recorded[entity_id] = outcome
+        await self._progress()
+        return recorded
+
+    @staticmethod
+    async def _batch_member(batch_task: asyncio.Task, entity_id: str):
+        return (await batch_task).get(entity_id)
+
+    def _retry_wait(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None to give up."""
+        if attempt >= self.max_retries:
+            retry_after = getattr(error, "retry_after", None)
+            if retry_after is not None:
+                self.rate_limited_for = max(self.rate_limited_for or 0.0, float(retry_after))
+            return None
+
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            if retry_after > self.max_retry_wait:
+                self.rate_limited_for = max(self.rate_limited_for or 0.0, float(retry_after))
+                return None
+            self.limiter.bucket.pause(retry_after)
+            return float(retry_after)
+
+        if is_retryable_error(error):
+            return float(2 ** attempt)
+        return None
+
+    def _record_failure(self, entity_type: str, entity_id: str, error: Exception, attempts: int):
+        self.result.add_failed(entity_type, entity_id, str(error), retried=attempts > 0, retry_count=attempts)
+
+    def _record(self, entity_type: str, entity_id: str, outcome: Dict[str, Any]):
+        self.outcomes[entity_id] = outcome
+        self.completed[entity_id] = {"entity_type": entity_type, **outcome}
+        action = outcome.get("action")
+        if action == "skipped":
+            self.result.add_skipped(entity_type, entity_id, "unchanged")
+            return
+
+        record = self.result.add_created if action == "created" else self.result.add_updated
+        record(
+            entity_type,
+            entity_id,
+            outcome.get("external_id"),
+            external_key=outcome.get("external_key"),
+            url=outcome.get("url"),
+        )
+        if outcome.get("url"):
+            self.links.append(outcome["url"])
+
+
+def finalize_push_run(push_run, result: PushResult, links: List[str]):
+    """Copy a finished PushResult onto its ExternalPushRun."""
+    from db.integration_models import PushStatus
+
+    result.finalize()
+    push_run.ended_at = result.ended_at
+    # Items skipped because their parent failed are failures too; only
+    # "unchanged" skips count as work that went through.
+    unchanged = [s for s in result.skipped if s["reason"] != PARENT_FAILED]
+    if result.is_success:
+        push_run.status = PushStatus.SUCCESS.value
+    elif result.is_failure and not unchanged:
+        push_run.status = PushStatus.FAILED.value
+    else:
+        push_run.status = PushStatus.PARTIAL.value
+    push_run.summary_json = {
+        "created": len(result.created),
+        "updated": len(result.updated),
+        "skipped": len(result.skipped),
+        "errors": len(result.failed),
+        "links": links[:10]
+    }
+    if result.failed:
+        push_run.error_json = {"errors": result.failed}
+
+
+def push_response(run_id: str, result: PushResult, links: List[str]) -> Dict[str, Any]:
+    """Response body shared by the provider push routes."""
+    return {
+        "run_id": run_id,
+        "created": result.created,
+        "updated": result.updated,
+        "skipped": result.skipped,
+        "errors": result.failed,
+        "links": links
+    }
@@ -0,0 +1,286 @@
+"""
+Integration Push Jobs for JarlPM
+
+Runs integration pushes in the background instead of inside the request:
+the push route stores the request on a PENDING ExternalPushRun and returns
+its run_id; a pool of workers claims runs from Postgres and executes them,
+and the client polls GET /api/integrations/push-runs/{run_id}.
+
+The queue is the external_push_runs table itself (no broker):
+- Workers claim with SELECT ... FOR UPDATE SKIP LOCKED, so any number of
+  processes can run workers against the same database
+- A local enqueue wakes this process's workers immediately; other processes
+  pick the run up within PUSH_JOB_POLL_SECONDS
+- After every finished item (or batch) the run's progress and the push
+  mappings written so far are committed together
+- A RUNNING run whose heartbeat is older than PUSH_JOB_STALE_SECONDS (worker
+  crashed or was restarted) is claimed again and resumed: items recorded in
+  progress_json are restored, not pushed again
+- A provider Retry-After longer than the executor will wait puts the run
+  back to PENDING until it has elapsed, then it resumes the same way
+- A run is given up after PUSH_JOB_MAX_ATTEMPTS claims
+
+Providers register a handler with register_push_handler(); it loads the push
+tree and adds items to the executor (see routes/integrations/*.py).
+"""
+import os
+import time
+import asyncio
+import logging
+from datetime import datetime, timezone, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import select, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.integration_models import ExternalPushRun, PushStatus
+from services.metrics_service import observe_integration_push
+from services.push_executor import PushExecutor, get_push_limiter, finalize_push_run, push_response
+
+logger = logging.getLogger(__name__)
+
+PUSH_WORKERS = int(os.environ.get("PUSH_WORKERS", "2"))
+PUSH_JOB_POLL_SECONDS = float(os.environ.get("PUSH_JOB_POLL_SECONDS", "5"))
+PUSH_JOB_STALE_SECONDS = float(os.environ.get("PUSH_JOB_STALE_SECONDS", "120"))
+PUSH_JOB_MAX_ATTEMPTS = int(os.environ.get("PUSH_JOB_MAX_ATTEMPTS", "5"))
+
+FINISHED_STATUSES = (PushStatus.SUCCESS.value, PushStatus.PARTIAL.value, PushStatus.FAILED.value)
+
+
+class PushJobError(Exception):
+    """A push run that cannot be executed (integration disconnected, epic deleted, ...)."""
+    pass
+
+
+PushHandler = Callable[[AsyncSession, ExternalPushRun, PushExecutor, "PushCheckpoint"], Awaitable[None]]
+
+_push_handlers: Dict[str, PushHandler] = {}
+
+
+def register_push_handler(provider: str, handler: PushHandler):
+    """
+    Register the function that prepares a provider's push.
+
+    handler(session, push_run, executor, checkpoint) reads push_run.request_json,
+    loads everything it needs and adds items to executor; it must not run it.
+    Push callables must write to the session only through checkpoint.record()
+    or under checkpoint.lock, since progress is committed concurrently.
+    """
+    _push_handlers[provider] = handler
+
+
+def error_message(error: Exception) -> str:
+    # HTTPException from the shared service helpers carries its message in detail
+    return str(getattr(error, "detail", None) or error)
+
+
+class PushCheckpoint:
+    """Commits a running push's progress (and the mappings recorded with it)."""
+
+    def __init__(self, session: AsyncSession, push_run: ExternalPushRun, executor: PushExecutor):
+        self.session = session
+        self.push_run = push_run
+        self.executor = executor
+        self.lock = asyncio.Lock()
+
+    async def record(self, record_push: Callable[..., Any], *args: Any) -> Any:
+        """Call a route's record_push without racing a commit."""
+        async with self.lock:
+            return record_push(*args)
+
+    def write_progress(self):
+        self.push_run.progress_json = {
+            "total": len(self.executor.entity_ids),
+            "done": len(self.executor.completed),
+            "failed": len(self.executor.result.failed),
+            "completed": dict(self.executor.completed),
+        }
+        self.push_run.heartbeat_at = datetime.now(timezone.utc)
+
+    async def save(self):
+        async with self.lock:
+            self.write_progress()
+            await self.session.commit()
+
+    async def beat(self, interval: float):
+        """Keep the heartbeat fresh while long retries produce no progress."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.save()
+            except Exception as e:
+                logger.warning(f"Push run {self.push_run.run_id} heartbeat failed: {e}")
+
+
+async def enqueue_push_run(session: AsyncSession, push_run: ExternalPushRun, request: Dict[str, Any]) -> Dict[str, Any]:
+    """Store a push run for the workers; returns the route response."""
+    push_run.status = PushStatus.PENDING.value
+    push_run.request_json = request
+    session.add(push_run)
+    await session.commit()
+    get_push_job_queue().notify()
+    return {"run_id": push_run.run_id, "status": push_run.status}
+
+
+class PushJobQueue:
+    """Pool of workers executing queued ExternalPushRuns."""
+
+    def __init__(
+        self,
+        workers: int = PUSH_WORKERS,
+        poll_interval: float = PUSH_JOB_POLL_SECONDS,
+        stale_after: float = PUSH_JOB_STALE_SECONDS,
+        max_attempts: int = PUSH_JOB_MAX_ATTEMPTS,
+        session_factory=None,
+    ):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self.session_factory = session_factory
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+
+    def _sessions(self):
+        if self.session_factory is None:
+            from db.database import AsyncSessionLocal
+            self.session_factory = AsyncSessionLocal
+        return self.session_factory()
+
+    async def start(self):
+        if self._tasks or self.workers <= 0:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker(n)) for n in range(self.workers)]
+        logger.info(f"Started {self.workers} push workers")
+
+    async def stop(self):
+        """Stop the workers; runs they were executing resume once their heartbeat goes stale."""
+        self._stopping = True
+        self._wakeup.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self):
+        self._wakeup.set()
+
+    async def _worker(self, number: int):
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                run_id = await self.claim()
+            except Exception as e:
+                logger.error(f"Push worker {number} could not claim a run: {e}")
+                run_id = None
+
+            if run_id:
+                try:
+                    await self.execute(run_id)
+                except Exception as e:
+                    # The run stays RUNNING and is resumed once its heartbeat goes stale
+                    logger.error(f"Push worker {number} failed executing run {run_id}: {e}")
+                continue
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def claim(self) -> Optional[str]:
+        """Mark the next due run RUNNING and return its run_id."""
+        now = datetime.now(timezone.utc)
+        stale = now - timedelta(seconds=self.stale_after)
+        async with self._sessions() as session:
+            result = await session.execute(
+                select(ExternalPushRun)
+                .where(or_(
+                    and_(
+                        ExternalPushRun.status == PushStatus.PENDING.value,
+                        or_(ExternalPushRun.next_attempt_at.is_(None), ExternalPushRun.next_attempt_at <= now)
+                    ),
+                    and_(
+                        ExternalPushRun.status == PushStatus.RUNNING.value,
+                        or_(ExternalPushRun.heartbeat_at.is_(None), ExternalPushRun.heartbeat_at < stale)
+                    )
+                ))
+                .order_by(ExternalPushRun.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            push_run = result.scalar_one_or_none()
+            if push_run is None:
+                return None
+
+            push_run.status = PushStatus.RUNNING.value
+            push_run.heartbeat_at = now
+            push_run.next_attempt_at = None
+            push_run.attempts = (push_run.attempts or 0) + 1
+            await session.commit()
+            return push_run.run_id
+
+    async def execute(self, run_id: str):
+        """Run (or resume) one claimed push."""
+        started = time.monotonic()
+        async with self._sessions() as session:
+            result = await session.execute(select(ExternalPushRun).where(ExternalPushRun.run_id == run_id))
+            push_run = result.scalar_one()
+            provider = push_run.provider
+
+            executor = PushExecutor(get_push_limiter(push_run.provider, push_run.integration_id))
+            executor.restore((push_run.progress_json or {}).get("completed", {}))
+            checkpoint = PushCheckpoint(session, push_run, executor)
+            executor.on_progress = checkpoint.save
+
+            try:
+                if push_run.attempts > self.max_attempts:
+                    raise PushJobError(f"Gave up after {self.max_attempts} attempts")
+                handler = _push_handlers.get(push_run.provider)
+                if handler is None:
+                    raise PushJobError(f"No push handler for {push_run.provider}")
+                await handler(session, push_run, executor, checkpoint)
+
+                heartbeat = asyncio.create_task(checkpoint.beat(self.stale_after / 4))
+                try:
+                    await executor.run()
+                finally:
+                    heartbeat.cancel()
+            except Exception as e:
+                logger.error(f"Push run {run_id} failed: {e}")
+                async with checkpoint.lock:
+                    # A failed flush leaves the transaction aborted; start clean
+                    await session.rollback()
+                    push_run.ended_at = datetime.now(timezone.utc)
+                    push_run.status = PushStatus.FAILED.value
+                    push_run.error_json = {"error": error_message(e)}
+                    await session.commit()
+                observe_integration_push(provider, PushStatus.FAILED.value, time.monotonic() - started)
+                return
+
+            async with checkpoint.lock:
+                checkpoint.write_progress()
+                if executor.rate_limited_for is not None and push_run.attempts < self.max_attempts:
+                    # Pushed items are kept in progress_json; the rest go out after the pause
+                    push_run.status = PushStatus.PENDING.value
+                    push_run.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=executor.rate_limited_for)
+                    await session.commit()
+                    logger.info(f"Push run {run_id} rate limited; resuming in {executor.rate_limited_for:.0f}s")
+                    return
+
+                finalize_push_run(push_run, executor.result, executor.links)
+                push_run.result_json = push_response(push_run.run_id, executor.result, executor.links)
+                await session.commit()
+            observe_integration_push(push_run.provider, push_run.status, time.monotonic() - started)
+
+
+# Singleton instance
+_push_job_queue = None
+
+def get_push_job_queue() -> PushJobQueue:
+    global _push_job_queue
+    if _push_job_queue is None:
+        _push_job_queue = PushJobQueue()
+    return _push_job_queue
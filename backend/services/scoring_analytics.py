@@ -0,0 +1,252 @@
+"""
+Scoring Analytics for JarlPM
+Ranks and summarizes RICE/MoSCoW scores across many items at once.
+
+Prioritization views used to assemble scores item by item (a story query per
+feature, a link query per bug). Analytics instead:
+
+- Loads the scored features, stories and bugs of a user or an epic with one
+  column-only query per item type (no ORM objects)
+- Holds them as a ScoreTable of numpy columns
+- Computes ranks, percentiles, distributions and "top N by RICE per effort"
+  in one vectorized pass over the table
+"""
+import logging
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, List
+
+import numpy as np
+from sqlalchemy import select, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import Epic, Bug
+from db.feature_models import Feature
+from db.user_story_models import UserStory
+from db.scoring_models import MoSCoWScore
+from services.bug_service import epic_bug_ids
+
+logger = logging.getLogger(__name__)
+
+# RICE totals range from 0.0125 (1 * 0.25 * 0.5 / 10) to 60 (10 * 3 * 1 / 0.5)
+RICE_HISTOGRAM_BINS = [0, 1, 2, 5, 10, 20, 30, 60]
+
+PERCENTILES = (25, 50, 75, 90)
+
+
+def rice_totals(reach: np.ndarray, impact: np.ndarray, confidence: np.ndarray, effort: np.ndarray) -> np.ndarray:
+    """Vectorized ScoringService.calculate_rice_total (NaN where a component is missing)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        totals = np.round(reach * impact * confidence / effort, 2)
+    return np.where(effort <= 0, 0.0, totals)
+
+
+@dataclass
+class ScoreTable:
+    """Scored items as parallel columns; missing scores are NaN / None"""
+    item_type: np.ndarray
+    item_id: np.ndarray
+    title: np.ndarray
+    parent_id: np.ndarray
+    moscow: np.ndarray
+    reach: np.ndarray
+    impact: np.ndarray
+    confidence: np.ndarray
+    effort: np.ndarray
+    total: np.ndarray
+
+    COLUMNS = ("item_type", "item_id", "title", "parent_id", "moscow",
+               "reach", "impact", "confidence", "effort", "total")
+    NUMERIC = ("reach", "impact", "confidence", "effort", "total")
+
+    @classmethod
+    def from_rows(cls, rows: List[tuple]) -> "ScoreTable":
+        """Build the table from (item_type, item_id, title, parent_id, moscow, reach, impact, confidence, effort, total) rows"""
+        columns = list(zip(*rows)) if rows else [()] * len(cls.COLUMNS)
+        values = {}
+        for name, column in zip(cls.COLUMNS, columns):
+            # None becomes NaN in the float columns
+            values[name] = np.array(column, dtype=float if name in cls.NUMERIC else object)
+
+        # Fill totals that weren't stored but can be computed from components
+        missing = np.isnan(values["total"])
+        if missing.any():
+            computed = rice_totals(values["reach"], values["impact"], values["confidence"], values["effort"])
+            values["total"] = np.where(missing, computed, values["total"])
+        return cls(**values)
+
+    def __len__(self) -> int:
+        return len(self.item_id)
+
+
+class ScoringAnalyticsService:
+    """Bulk loading and vectorized analytics over scored items"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    # ============================================
+    # Loading
+    # ============================================
+
+    async def load_scores(self, user_id: str, epic_id: Optional[str] = None) -> ScoreTable:
+        """
+        Scored items of one epic, or of all the user's active epics plus their
+        standalone stories and bugs.
+        """
+        if epic_id:
+            feature_ids = select(Feature.feature_id).where(Feature.epic_id == epic_id)
+            feature_scope = Feature.epic_id == epic_id
+            story_scope = UserStory.feature_id.in_(feature_ids)
+            bug_scope = Bug.bug_id.in_(epic_bug_ids(epic_id))
+        else:
+            epic_ids = select(Epic.epic_id).where(Epic.user_id == user_id, Epic.is_archived.is_(False))
+            feature_ids = select(Feature.feature_id).where(Feature.epic_id.in_(epic_ids))
+            feature_scope = Feature.epic_id.in_(epic_ids)
+            story_scope = or_(
+                UserStory.feature_id.in_(feature_ids),
+                and_(UserStory.user_id == user_id, UserStory.is_standalone.is_(True)),
+            )
+            bug_scope = Bug.user_id == user_id
+
+        features = await self.session.execute(
+            select(
+                Feature.feature_id, Feature.title, Feature.epic_id, Feature.moscow_score,
+                Feature.rice_reach, Feature.rice_impact, Feature.rice_confidence,
+                Feature.rice_effort, Feature.rice_total,
+            ).where(
+                feature_scope,
+                or_(Feature.moscow_score.isnot(None), Feature.rice_total.isnot(None)),
+            )
+        )
+        stories = await self.session.execute(
+            select(
+                UserStory.story_id, UserStory.title, UserStory.story_text, UserStory.feature_id,
+                UserStory.rice_reach, UserStory.rice_impact, UserStory.rice_confidence,
+                UserStory.rice_effort, UserStory.rice_total,
+            ).where(story_scope, UserStory.rice_total.isnot(None))
+        )
+        bugs = await self.session.execute(
+            select(
+                Bug.bug_id, Bug.title,
+                Bug.rice_reach, Bug.rice_impact, Bug.rice_confidence,
+                Bug.rice_effort, Bug.rice_total,
+            ).where(bug_scope, Bug.is_deleted.is_(False), Bug.rice_total.isnot(None))
+        )
+
+        rows = [("feature", feature_id, title, parent, moscow, *rice)
+                for feature_id, title, parent, moscow, *rice in features.all()]
+        rows += [("story", story_id, title or (story_text or "")[:100], parent, None, *rice)
+                 for story_id, title, story_text, parent, *rice in stories.all()]
+        rows += [("bug", bug_id, title, None, None, *rice)
+                 for bug_id, title, *rice in bugs.all()]
+        return ScoreTable.from_rows(rows)
+
+    # ============================================
+    # Analytics
+    # ============================================
+
+    @staticmethod
+    def summarize(values: np.ndarray) -> Optional[Dict[str, float]]:
+        """min/max/mean and percentiles of the non-NaN values, None if there are none"""
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return None
+        summary = {
+            "count": int(len(values)),
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "mean": round(float(values.mean()), 2),
+        }
+        for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            summary[f"p{p}"] = round(float(value), 2)
+        return summary
+
+    @staticmethod
+    def compute(table: ScoreTable, top_n: int = 10) -> Dict[str, Any]:
+        """
+        Ranks, percentiles, distributions and top N by RICE per effort.
+        
+        RICE already is value per effort (R * I * C / E), so "RICE per effort"
+        is that ratio recomputed unrounded from the components (the stored,
+        rounded total when they are missing). The top N ranks by it and, on
+        ties, prefers the item with less effort (quick wins).
+        """
+        rice_scored = ~np.isnan(table.total)
+        scored_idx = np.flatnonzero(rice_scored)
+        totals = table.total[scored_idx]
+
+        # Competition ranking (1, 2, 2, 4) by RICE total, highest first
+        order = np.argsort(-totals, kind="stable")
+        descending = -totals[order]
+        ranks = np.searchsorted(descending, descending, side="left") + 1
+        # Share of RICE-scored items scoring at or below each item
+        ascending = np.sort(totals)
+        percentiles = np.round(
+            np.searchsorted(ascending, totals[order], side="right") / max(len(totals), 1) * 100, 1
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            per_effort = table.reach * table.impact * table.confidence / table.effort
+        per_effort = np.where(np.isfinite(per_effort), per_effort, table.total)
+
+        ranked = scored_idx[order]
+        ranking = [
+            {
+                "item_type": item_type,
+                "item_id": item_id,
+                "title": title,
+                "parent_id": parent_id,
+                "moscow_score": moscow,
+                "rice_total": total,
+                "rice_per_effort": None if np.isnan(value) else round(value, 2),
+                "rank": rank,
+                "percentile": percentile,
+            }
+            for item_type, item_id, title, parent_id, moscow, total, value, rank, percentile in zip(
+                table.item_type[ranked].tolist(), table.item_id[ranked].tolist(),
+                table.title[ranked].tolist(), table.parent_id[ranked].tolist(),
+                table.moscow[ranked].tolist(), table.total[ranked].tolist(),
+                per_effort[ranked].tolist(), ranks.tolist(), percentiles.tolist(),
+            )
+        ]
+
+        # Top N by RICE per effort, less effort first on ties
+        efficient = np.flatnonzero(~np.isnan(per_effort[ranked]))
+        efficient = efficient[np.lexsort((table.effort[ranked][efficient], -per_effort[ranked][efficient]))][:top_n]
+        top_by_rice_per_effort = [ranking[i] for i in efficient.tolist()]
+
+        counts, edges = np.histogram(totals, bins=RICE_HISTOGRAM_BINS)
+        histogram = [
+            {"from": float(low), "to": float(high), "count": int(count)}
+            for low, high, count in zip(edges[:-1], edges[1:], counts)
+        ]
+
+        features = table.item_type == "feature"
+        has_moscow = features & table.moscow.astype(bool)
+        moscow_values, moscow_counts = np.unique(table.moscow[has_moscow].astype(str), return_counts=True)
+        moscow = {score.value: 0 for score in MoSCoWScore}
+        moscow.update(zip(moscow_values.tolist(), moscow_counts.tolist()))
+        moscow["unscored"] = int(features.sum()) - int(moscow_counts.sum())
+
+        by_type = {
+            item_type: ScoringAnalyticsService.summarize(table.total[table.item_type == item_type])
+            for item_type in ("feature", "story", "bug")
+        }
+
+        return {
+            "counts": {
+                "features": int(features.sum()),
+                "stories": int((table.item_type == "story").sum()),
+                "bugs": int((table.item_type == "bug").sum()),
+                "rice_scored": int(rice_scored.sum()),
+                "moscow_scored": int(moscow_counts.sum()),
+            },
+            "rice": ScoringAnalyticsService.summarize(table.total),
+            "distribution": {
+                "rice_histogram": histogram,
+                "moscow": moscow,
+                "by_type": by_type,
+            },
+            "ranking": ranking,
+            "top_by_rice_per_effort": top_by_rice_per_effort,
+        }
@@ -2,8 +2,9 @@
 Scoring Service for JarlPM
 Handles RICE and MoSCoW scoring with AI assistance
 """
-from typing import Optional, Dict, Any
-from sqlalchemy import select
+from typing import Optional, Dict, Any, List
+from datetime import datetime, timezone
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 import logging
@@ -202,6 +203,122 @@ class ScoringService:
         await self.session.refresh(bug)
         return bug
     
+    # ============================================
+    # Bulk Score Application
+    # ============================================
+    
+    RICE_KEYS = ("reach", "impact", "confidence", "effort")
+    
+    def build_score_values(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Column values for one bulk item, validated in memory.
+        
+        item: {"item_type", "item_id", "moscow_score"?, "moscow_reasoning"?,
+        "rice"?: {reach, impact, confidence, effort}, "rice_reasoning"?}.
+        Raises ValueError like the single-item updates.
+        """
+        values = {}
+        
+        if item.get("moscow_score"):
+            if item["item_type"] != "feature":
+                raise ValueError("MoSCoW scores apply to features only")
+            is_valid, error = self.validate_moscow_value(item["moscow_score"])
+            if not is_valid:
+                raise ValueError(error)
+            values["moscow_score"] = item["moscow_score"]
+            if item.get("moscow_reasoning"):
+                values["moscow_reasoning"] = item["moscow_reasoning"]
+        
+        rice = item.get("rice")
+        if rice:
+            reach, impact, confidence, effort = (rice[key] for key in self.RICE_KEYS)
+            is_valid, error = self.validate_rice_values(reach, impact, confidence, effort)
+            if not is_valid:
+                raise ValueError(error)
+            values.update(
+                rice_reach=reach,
+                rice_impact=impact,
+                rice_confidence=confidence,
+                rice_effort=effort,
+                rice_total=self.calculate_rice_total(reach, impact, confidence, effort),
+            )
+            if item.get("rice_reasoning"):
+                values["rice_reasoning"] = item["rice_reasoning"]
+        
+        return values
+    
+    async def _bulk_targets(self, item_type: str, item_ids: List[str], epic_id: str, user_id: str) -> Dict[str, int]:
+        """item_id -> primary key of the items that belong to the epic (bugs: to the user)"""
+        if item_type == "feature":
+            query = select(Feature.feature_id, Feature.id).where(
+                Feature.epic_id == epic_id, Feature.feature_id.in_(item_ids)
+            )
+        elif item_type == "story":
+            query = (
+                select(UserStory.story_id, UserStory.id)
+                .join(Feature, UserStory.feature_id == Feature.feature_id)
+                .where(Feature.epic_id == epic_id, UserStory.story_id.in_(item_ids))
+            )
+        else:
+            query = select(Bug.bug_id, Bug.id).where(
+                Bug.user_id == user_id, Bug.is_deleted == False, Bug.bug_id.in_(item_ids)
+            )
+        result = await self.session.execute(query)
+        return {item_id: pk for item_id, pk in result.all()}
+    
+    async def apply_bulk_scores(self, epic_id: str, user_id: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Apply many scores in one transaction: validate everything in memory,
+        resolve targets with one query per item type, then one executemany
+        UPDATE per item type. Returns one result per item, in order, with
+        status applied / skipped (nothing to apply) / not_found / invalid.
+        """
+        models = {"feature": Feature, "story": UserStory, "bug": Bug}
+        results: List[Dict[str, Any]] = []
+        pending: Dict[str, List[tuple]] = {item_type: [] for item_type in models}
+        
+        for item in items:
+            result = {"item_id": item["item_id"], "item_type": item["item_type"]}
+            results.append(result)
+            if item["item_type"] not in models:
+                result.update(status="invalid", error=f"Unknown item type: {item['item_type']}")
+                continue
+            try:
+                values = self.build_score_values(item)
+            except (ValueError, TypeError, KeyError) as e:
+                result.update(status="invalid", error=str(e))
+                continue
+            if not values:
+                result["status"] = "skipped"
+                continue
+            pending[item["item_type"]].append((result, values))
+        
+        now = datetime.now(timezone.utc)
+        for item_type, entries in pending.items():
+            if not entries:
+                continue
+            targets = await self._bulk_targets(
+                item_type, list({result["item_id"] for result, _ in entries}), epic_id, user_id
+            )
+            
+            rows = []
+            for result, values in entries:
+                pk = targets.get(result["item_id"])
+                if pk is None:
+                    result.update(status="not_found", error=f"{item_type.capitalize()} not found")
+                    continue
+                rows.append({"id": pk, **values, "updated_at": now})
+                result["status"] = "applied"
+                if "rice_total" in values:
+                    result["rice_total"] = values["rice_total"]
+            
+            if rows:
+                # ORM bulk UPDATE by primary key: executemany, grouped by column set
+                await self.session.execute(update(models[item_type]), rows)
+        
+        await self.session.commit()
+        return results
+    
     # ============================================
     # Helper Methods for AI Prompts
     # ============================================
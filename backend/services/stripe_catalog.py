@@ -0,0 +1,168 @@
+"""
+Stripe Price Catalog for JarlPM
+Resolves the Stripe price for each billing cycle once, not on every checkout.
+
+Without configured STRIPE_MONTHLY_PRICE_ID / STRIPE_ANNUAL_PRICE_ID, finding
+the price means listing products, maybe creating the JarlPM product, listing
+its prices and maybe creating one - up to four serial Stripe calls. The
+catalog does that once per billing cycle:
+
+- Resolved price IDs are kept in memory and in cache_service (shared by all
+  workers when Redis is configured) for STRIPE_CATALOG_TTL_SECONDS
+- warm() resolves both cycles at startup, in the background
+- Concurrent misses for the same cycle share one lookup, so parallel first
+  checkouts can't create duplicate products or prices
+- invalidate() drops a cycle whose price Stripe rejected (e.g. archived)
+
+All Stripe calls use the SDK's async methods, which go through httpx and
+never block the event loop.
+"""
+import os
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import stripe
+
+from services.cache_service import Cache, get_cache
+
+logger = logging.getLogger(__name__)
+
+# Subscription pricing configuration
+MONTHLY_PRICE = 45.00  # $45/month
+ANNUAL_PRICE = 432.00  # $432/year ($36/mo, 2 months free)
+SUBSCRIPTION_CURRENCY = "usd"
+
+# Stripe Price IDs - set in .env or create dynamically
+STRIPE_MONTHLY_PRICE_ID = os.environ.get("STRIPE_MONTHLY_PRICE_ID")
+STRIPE_ANNUAL_PRICE_ID = os.environ.get("STRIPE_ANNUAL_PRICE_ID")
+
+STRIPE_CATALOG_TTL_SECONDS = float(os.environ.get("STRIPE_CATALOG_TTL_SECONDS", "86400"))
+
+BILLING_CYCLES = ("monthly", "annual")
+
+
+def configure_stripe() -> bool:
+    """Set the Stripe API key from the environment; False if it isn't configured"""
+    api_key = os.environ.get("STRIPE_API_KEY")
+    if not api_key or api_key == "your-stripe-api-key-here":
+        return False
+    stripe.api_key = api_key
+    return True
+
+
+class StripePriceCatalog:
+    """Cached billing cycle -> Stripe price ID."""
+
+    def __init__(self, cache: Cache, configured: Optional[Dict[str, str]] = None):
+        self.cache = cache
+        self.configured = {cycle: price_id for cycle, price_id in (configured or {}).items() if price_id}
+        self._prices: Dict[str, str] = {}
+        self._lookups: Dict[str, asyncio.Task] = {}
+        self._product_lock = asyncio.Lock()
+        self._product_id: Optional[str] = None
+
+    async def get_price_id(self, billing_cycle: str = "monthly") -> str:
+        """Price ID for the billing cycle, resolving it on first use"""
+        if billing_cycle in self.configured:
+            return self.configured[billing_cycle]
+        if billing_cycle in self._prices:
+            return self._prices[billing_cycle]
+
+        cached = await self.cache.get(billing_cycle)
+        if cached:
+            self._prices[billing_cycle] = cached
+            return cached
+
+        # Share one lookup between concurrent first checkouts
+        lookup = self._lookups.get(billing_cycle)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._resolve(billing_cycle))
+            self._lookups[billing_cycle] = lookup
+            lookup.add_done_callback(lambda _: self._lookups.pop(billing_cycle, None))
+        return await asyncio.shield(lookup)
+
+    async def _resolve(self, billing_cycle: str) -> str:
+        price_id = await self._find_or_create_price(billing_cycle)
+        self._prices[billing_cycle] = price_id
+        await self.cache.set(billing_cycle, price_id)
+        return price_id
+
+    async def _get_product_id(self) -> str:
+        async with self._product_lock:
+            if self._product_id:
+                return self._product_id
+
+            # Check for existing JarlPM product
+            products = await stripe.Product.list_async(limit=10)
+            jarlpm_product = None
+            for product in products.data:
+                if product.metadata.get("app") == "jarlpm":
+                    jarlpm_product = product
+                    break
+
+            # Create product if not exists
+            if not jarlpm_product:
+                jarlpm_product = await stripe.Product.create_async(
+                    name="JarlPM Pro",
+                    description="AI-agnostic Product Management - Turn ideas into plans",
+                    metadata={"app": "jarlpm"}
+                )
+                logger.info(f"Created Stripe product: {jarlpm_product.id}")
+
+            self._product_id = jarlpm_product.id
+            return self._product_id
+
+    async def _find_or_create_price(self, billing_cycle: str) -> str:
+        is_annual = billing_cycle == "annual"
+        product_id = await self._get_product_id()
+
+        # Check for existing price on this product
+        prices = await stripe.Price.list_async(product=product_id, active=True, limit=10)
+
+        target_amount = int(ANNUAL_PRICE * 100) if is_annual else int(MONTHLY_PRICE * 100)
+        target_interval = "year" if is_annual else "month"
+
+        for price in prices.data:
+            if (price.recurring and
+                price.recurring.interval == target_interval and
+                price.unit_amount == target_amount):
+                return price.id
+
+        # Create new recurring price
+        price = await stripe.Price.create_async(
+            product=product_id,
+            unit_amount=target_amount,
+            currency=SUBSCRIPTION_CURRENCY,
+            recurring={"interval": target_interval},
+            metadata={"app": "jarlpm", "billing_cycle": billing_cycle}
+        )
+        logger.info(f"Created Stripe {billing_cycle} price: {price.id}")
+        return price.id
+
+    async def warm(self):
+        """Resolve every billing cycle (startup); failures are retried on demand"""
+        for billing_cycle in BILLING_CYCLES:
+            try:
+                await self.get_price_id(billing_cycle)
+            except Exception as e:
+                logger.warning(f"Could not warm Stripe {billing_cycle} price: {e}")
+
+    async def invalidate(self, billing_cycle: str):
+        """Forget a cycle's price (and the product) so the next checkout looks it up again"""
+        self._prices.pop(billing_cycle, None)
+        self._product_id = None
+        await self.cache.delete(billing_cycle)
+
+
+# Singleton instance
+_stripe_price_catalog = None
+
+def get_stripe_price_catalog() -> StripePriceCatalog:
+    global _stripe_price_catalog
+    if _stripe_price_catalog is None:
+        _stripe_price_catalog = StripePriceCatalog(
+            get_cache("stripe_catalog", default_ttl=STRIPE_CATALOG_TTL_SECONDS),
+            configured={"monthly": STRIPE_MONTHLY_PRICE_ID, "annual": STRIPE_ANNUAL_PRICE_ID},
+        )
+    return _stripe_price_catalog
@@ -15,6 +15,7 @@ from sqlalchemy.orm import selectinload
 from db.user_story_models import UserStory, UserStoryStage, UserStoryConversationEvent
 from db.feature_models import Feature, FeatureStage
 from db.models import Epic
+from services.conversation_history_service import load_conversation_history
 
 
 class UserStoryService:
@@ -303,19 +304,19 @@ class UserStoryService:
         await self.session.refresh(event)
         return event
     
-    async def get_conversation_history(self, story_id: str, limit: int = 20) -> List[dict]:
-        """Get recent conversation history for LLM context"""
-        result = await self.session.execute(
-            select(UserStoryConversationEvent)
-            .where(
-                and_(
-                    UserStoryConversationEvent.story_id == story_id,
-                    UserStoryConversationEvent.role.in_(['user', 'assistant'])
-                )
-            )
-            .order_by(UserStoryConversationEvent.created_at.desc())
-            .limit(limit)
+    async def get_conversation_history(
+        self,
+        story_id: str,
+        token_budget: Optional[int] = None,
+        config_data: Optional[dict] = None
+    ) -> List[dict]:
+        """Get recent conversation history for LLM context, windowed by token budget"""
+        return await load_conversation_history(
+            self.session,
+            UserStoryConversationEvent,
+            UserStoryConversationEvent.story_id,
+            "story",
+            story_id,
+            token_budget=token_budget,
+            config_data=config_data,
         )
-        events = list(result.scalars().all())
-        events.reverse()  # Oldest first
-        return [{"role": e.role, "content": e.content} for e in events]
@@ -0,0 +1,120 @@
+"""
+Azure DevOps Batch Push Tests for JarlPM
+
+Tests $batch request building, parent links and per-item error mapping
+for AzureDevOpsPushService.push_items_batch.
+"""
+import asyncio
+import json
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import azure_devops_service
+from services.azure_devops_service import (
+    AzureDevOpsRESTService, AzureDevOpsPushService, AzureDevOpsAPIError
+)
+
+
+class FakeBatchREST(AzureDevOpsRESTService):
+    """Answers $batch calls locally; titles starting with "bad" are rejected"""
+
+    def __init__(self):
+        super().__init__("https://dev.azure.com/example", "pat")
+        self.batches = []
+        self.next_id = 100
+
+    async def _request(self, method, url, **kwargs):
+        assert url.endswith("/_apis/wit/$batch")
+        requests = kwargs["json"]
+        self.batches.append(requests)
+        values = []
+        for request in requests:
+            title = next(op["value"] for op in request["body"] if op["path"] == "/fields/System.Title")
+            if title.startswith("bad"):
+                values.append({"code": 400, "body": json.dumps({"message": "TF401320: invalid field"})})
+                continue
+            work_item_id = int(request["uri"].split("?")[0].rsplit("/", 1)[-1]) if "$" not in request["uri"] else None
+            if work_item_id is None:
+                self.next_id += 1
+                work_item_id = self.next_id
+            values.append({"code": 200, "body": json.dumps({"id": work_item_id})})
+        return {"count": len(values), "value": values}
+
+
+def item(entity_type, entity_id, title, **extra):
+    return {
+        "work_item_type": "Feature" if entity_type == "feature" else "User Story",
+        "title": title,
+        "description": "Synced from JarlPM",
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        **extra,
+    }
+
+
+def relation_targets(request):
+    return [op["value"]["url"].rsplit("/", 1)[-1] for op in request["body"] if op["path"] == "/relations/-"]
+
+
+class TestPushItemsBatch:
+    """push_items_batch"""
+
+    def test_level_in_one_request_linked_to_parents(self):
+        rest = FakeBatchREST()
+        service = AzureDevOpsPushService(rest)
+        results = asyncio.run(service.push_items_batch("Proj", [
+            item("story", "s1", "Pay by card", parent_work_item_id=7),
+            item("story", "s2", "Pay by invoice", parent_work_item_id=8),
+        ]))
+
+        assert len(rest.batches) == 1
+        first, second = rest.batches[0]
+        assert first["body"][0] == {"op": "add", "path": "/id", "value": -1}
+        assert second["body"][0] == {"op": "add", "path": "/id", "value": -2}
+        assert [relation_targets(r) for r in rest.batches[0]] == [["7"], ["8"]]
+        assert {r["action"] for r in results.values()} == {"created"}
+
+    def test_unchanged_items_are_not_sent(self):
+        rest = FakeBatchREST()
+        service = AzureDevOpsPushService(rest)
+        first = asyncio.run(service.push_items_batch("Proj", [item("feature", "f1", "Checkout")]))["f1"]
+
+        results = asyncio.run(service.push_items_batch("Proj", [
+            item("feature", "f1", "Checkout", existing_work_item_id=first["id"], last_push_hash=first["payload_hash"]),
+            item("feature", "f2", "Refunds"),
+        ]))
+
+        assert results["f1"]["action"] == "skipped"
+        assert len(rest.batches[-1]) == 1
+        assert results["f2"]["action"] == "created"
+
+    def test_per_item_errors(self):
+        rest = FakeBatchREST()
+        service = AzureDevOpsPushService(rest)
+        results = asyncio.run(service.push_items_batch("Proj", [
+            item("feature", "f1", "bad feature"),
+            item("feature", "f2", "Refunds", existing_work_item_id=55),
+        ]))
+
+        assert isinstance(results["f1"], AzureDevOpsAPIError)
+        assert "TF401320" in str(results["f1"])
+        assert results["f2"]["action"] == "updated"
+        assert results["f2"]["id"] == 55
+
+    def test_missing_responses_are_per_item_errors(self):
+        class TruncatingREST(FakeBatchREST):
+            async def _request(self, method, url, **kwargs):
+                reply = await super()._request(method, url, **kwargs)
+                return {"count": 1, "value": reply["value"][:1]}
+
+        service = AzureDevOpsPushService(TruncatingREST())
+        results = asyncio.run(service.push_items_batch("Proj", [
+            item("feature", "f1", "Checkout"),
+            item("feature", "f2", "Refunds"),
+        ]))
+
+        assert results["f1"]["action"] == "created"
+        assert isinstance(results["f2"], AzureDevOpsAPIError)
@@ -0,0 +1,141 @@
+"""
+Bulk Scoring Tests for JarlPM
+
+Tests that bulk score application validates every item in memory, resolves
+targets with one query per item type and writes them in a single transaction.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy.sql import Select, Update
+
+from services.scoring_service import ScoringService
+from routes.scoring import bulk_score_item
+
+
+RICE = {"reach": 5, "impact": 2.0, "confidence": 0.8, "effort": 2.0}
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Answers target lookups from a table and records writes"""
+
+    def __init__(self, existing):
+        self.existing = existing  # table name -> {item_id: pk}
+        self.selects = []
+        self.updates = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        if isinstance(statement, Update):
+            self.updates.append((statement.table.name, params))
+            return FakeResult([])
+        assert isinstance(statement, Select)
+        table = statement.selected_columns[0].table.name
+        self.selects.append(table)
+        return FakeResult(list(self.existing.get(table, {}).items()))
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestBuildScoreValues:
+    """ScoringService.build_score_values"""
+
+    def test_moscow_and_rice_values(self):
+        values = ScoringService(None).build_score_values({
+            "item_type": "feature", "item_id": "feat_1",
+            "moscow_score": "must_have", "moscow_reasoning": "Core flow",
+            "rice": RICE, "rice_reasoning": "Most users",
+        })
+        assert values["moscow_score"] == "must_have"
+        assert values["moscow_reasoning"] == "Core flow"
+        assert values["rice_total"] == 4.0
+        assert values["rice_reasoning"] == "Most users"
+
+    def test_invalid_values_rejected(self):
+        service = ScoringService(None)
+        with pytest.raises(ValueError):
+            service.build_score_values({"item_type": "feature", "item_id": "f", "moscow_score": "maybe"})
+        with pytest.raises(ValueError):
+            service.build_score_values({"item_type": "story", "item_id": "s", "rice": {**RICE, "impact": 7}})
+        with pytest.raises(ValueError):
+            service.build_score_values({"item_type": "bug", "item_id": "b", "moscow_score": "must_have"})
+
+    def test_nothing_to_apply(self):
+        assert ScoringService(None).build_score_values({"item_type": "story", "item_id": "s"}) == {}
+
+
+class TestApplyBulkScores:
+    """ScoringService.apply_bulk_scores"""
+
+    def test_one_query_and_one_update_per_type_and_one_commit(self):
+        session = FakeSession({
+            "features": {"feat_1": 1, "feat_2": 2},
+            "user_stories": {"story_1": 10},
+            "bugs": {"bug_1": 20},
+        })
+        items = [
+            {"item_type": "feature", "item_id": "feat_1", "moscow_score": "must_have", "rice": RICE},
+            {"item_type": "feature", "item_id": "feat_2", "moscow_score": "could_have"},
+            {"item_type": "story", "item_id": "story_1", "rice": RICE},
+            {"item_type": "bug", "item_id": "bug_1", "rice": RICE},
+        ]
+
+        results = asyncio.run(ScoringService(session).apply_bulk_scores("epic_1", "user_1", items))
+
+        assert [r["status"] for r in results] == ["applied"] * 4
+        assert results[0]["rice_total"] == 4.0
+        assert session.selects == ["features", "user_stories", "bugs"]
+        assert [table for table, _ in session.updates] == ["features", "user_stories", "bugs"]
+        feature_rows = session.updates[0][1]
+        assert [row["id"] for row in feature_rows] == [1, 2]
+        assert all("updated_at" in row for row in feature_rows)
+        assert session.commits == 1
+
+    def test_per_item_statuses(self):
+        session = FakeSession({"features": {"feat_1": 1}})
+        items = [
+            {"item_type": "feature", "item_id": "feat_1", "moscow_score": "wont_have"},
+            {"item_type": "feature", "item_id": "feat_other_epic", "moscow_score": "must_have"},
+            {"item_type": "feature", "item_id": "feat_bad", "moscow_score": "maybe"},
+            {"item_type": "story", "item_id": "story_1"},
+            {"item_type": "epic", "item_id": "epic_1"},
+        ]
+
+        results = asyncio.run(ScoringService(session).apply_bulk_scores("epic_1", "user_1", items))
+
+        assert [r["status"] for r in results] == ["applied", "not_found", "invalid", "skipped", "invalid"]
+        # Invalid and empty items never reach the database
+        assert session.selects == ["features"]
+        assert session.updates == [("features", [session.updates[0][1][0]])]
+        assert session.commits == 1
+
+
+class TestBulkScoreItem:
+    """routes.scoring.bulk_score_item"""
+
+    def test_normalizes_rice_and_drops_incomplete(self):
+        item = bulk_score_item("story", "story_1", {"score": "must_have"}, {**RICE, "impact": 2.4, "reasoning": "r"})
+        assert "moscow_score" not in item
+        assert item["rice"]["impact"] == 2.0
+        assert item["rice_reasoning"] == "r"
+
+        assert "rice" not in bulk_score_item("bug", "bug_1", None, {"reach": 5})
+
+    def test_feature_without_reasoning(self):
+        item = bulk_score_item("feature", "feat_1", {"score": "must_have", "reasoning": "r"}, RICE, with_reasoning=False)
+        assert item["moscow_score"] == "must_have"
+        assert "moscow_reasoning" not in item and "rice_reasoning" not in item
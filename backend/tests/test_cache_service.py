@@ -0,0 +1,85 @@
+"""
+Cache Service Tests for JarlPM
+
+Tests the in-process cache backend used when REDIS_URL is not set.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import Cache, MemoryCacheBackend
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class TestMemoryCache:
+    """TTL, LRU eviction and group invalidation"""
+    
+    def test_set_and_get(self):
+        cache = Cache("test", MemoryCacheBackend(), default_ttl=60)
+        run(cache.set("a", {"user_id": "user_1"}))
+        assert run(cache.get("a")) == {"user_id": "user_1"}
+        assert run(cache.get("missing")) is None
+    
+    def test_expired_entries_are_misses(self):
+        cache = Cache("test", MemoryCacheBackend(), default_ttl=60)
+        run(cache.set("a", 1, ttl=-1))
+        assert run(cache.get("a")) is None
+    
+    def test_lru_eviction(self):
+        cache = Cache("test", MemoryCacheBackend(max_entries=2), default_ttl=60)
+        run(cache.set("a", 1))
+        run(cache.set("b", 2))
+        run(cache.get("a"))  # a is now most recently used
+        run(cache.set("c", 3))
+        
+        assert run(cache.get("a")) == 1
+        assert run(cache.get("b")) is None
+        assert run(cache.get("c")) == 3
+    
+    def test_delete(self):
+        cache = Cache("test", MemoryCacheBackend(), default_ttl=60)
+        run(cache.set("a", 1))
+        run(cache.delete("a"))
+        assert run(cache.get("a")) is None
+    
+    def test_invalidate_group(self):
+        cache = Cache("test", MemoryCacheBackend(), default_ttl=60)
+        run(cache.set("token_1", 1, group="user_1"))
+        run(cache.set("token_2", 2, group="user_1"))
+        run(cache.set("token_3", 3, group="user_2"))
+        
+        run(cache.invalidate_group("user_1"))
+        
+        assert run(cache.get("token_1")) is None
+        assert run(cache.get("token_2")) is None
+        assert run(cache.get("token_3")) == 3
+    
+    def test_evicted_keys_leave_their_groups(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        cache = Cache("test", backend, default_ttl=60)
+        run(cache.set("token_1", 1, group="user_1"))
+        run(cache.set("token_2", 2, group="user_1"))
+        run(cache.set("token_3", 3, group="user_2"))  # evicts token_1
+        run(cache.delete("token_2"))
+        
+        assert backend._groups == {cache._group_key("user_2"): {cache._key("token_3")}}
+        assert set(backend._key_groups) == {cache._key("token_3")}
+        
+        run(cache.invalidate_group("user_2"))
+        assert backend._groups == {} and backend._key_groups == {}
+    
+    def test_namespaces_do_not_collide(self):
+        backend = MemoryCacheBackend()
+        sessions = Cache("sessions", backend, default_ttl=60)
+        other = Cache("other", backend, default_ttl=60)
+        run(sessions.set("k", "session"))
+        run(other.set("k", "other"))
+        
+        assert run(sessions.get("k")) == "session"
+        assert run(other.get("k")) == "other"
@@ -0,0 +1,195 @@
+"""
+Conversation History Tests for JarlPM
+
+Tests token-budgeted windowing of conversation history, per-provider
+budget selection and the background rolling-summary refresh.
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db.models import ConversationSummary, EpicTranscriptEvent
+from services import conversation_history_service
+from services.conversation_history_service import (
+    SUMMARY_PREFIX,
+    get_history_token_budget,
+    load_conversation_history,
+    message_tokens,
+    refresh_conversation_summary,
+    schedule_summary_refresh,
+    window_messages,
+)
+
+
+def turn(role: str, chars: int) -> dict:
+    return {"role": role, "content": "x" * chars}
+
+
+class TestWindowMessages:
+    """Newest-first selection within the budget"""
+
+    def test_everything_fits(self):
+        messages = [turn("user", 40), turn("assistant", 40), turn("user", 40)]
+        window, dropped = window_messages(messages, token_budget=1000)
+        assert window == messages
+        assert dropped == 0
+
+    def test_drops_oldest_when_over_budget(self):
+        messages = [turn("user", 400), turn("assistant", 400), turn("user", 40), turn("assistant", 40), turn("user", 40)]
+        budget = sum(message_tokens(m) for m in messages[2:])
+        window, dropped = window_messages(messages, token_budget=budget)
+        assert window == messages[2:]
+        assert dropped == 2
+
+    def test_long_single_message_costs_more_than_short_turns(self):
+        short = [turn("user", 20), turn("assistant", 20)] * 5 + [turn("user", 20)]
+        long = [turn("user", 4000), turn("assistant", 20), turn("user", 20)]
+        assert len(window_messages(short, 100)[0]) > len(window_messages(long, 100)[0])
+
+    def test_keeps_minimum_even_if_over_budget(self):
+        messages = [turn("user", 4000), turn("assistant", 4000), turn("user", 4000)]
+        window, dropped = window_messages(messages, token_budget=10, min_messages=2)
+        # Two newest kept, then the leading assistant turn is trimmed
+        assert window == messages[2:]
+        assert dropped == 2
+
+    def test_window_starts_with_user_turn(self):
+        messages = [turn("user", 400), turn("assistant", 40), turn("user", 40)]
+        budget = message_tokens(messages[1]) + message_tokens(messages[2])
+        window, dropped = window_messages(messages, token_budget=budget)
+        assert window[0]["role"] == "user"
+        assert dropped == 2
+
+    def test_empty_history(self):
+        assert window_messages([], 1000) == ([], 0)
+
+
+class TestHistoryTokenBudget:
+    """Budget by provider, with model overrides"""
+
+    def test_provider_defaults(self):
+        assert get_history_token_budget({"provider": "local", "model_name": None}) < \
+            get_history_token_budget({"provider": "anthropic", "model_name": None})
+
+    def test_model_override(self):
+        assert get_history_token_budget({"provider": "openai", "model_name": "gpt-3.5-turbo"}) < \
+            get_history_token_budget({"provider": "openai", "model_name": "gpt-4o"})
+
+    def test_no_config_uses_fallback(self):
+        assert get_history_token_budget(None) > 0
+
+
+class FakeSummarySession:
+    """No stored summary; returns the given turn rows; records added rows"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.added = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        rows = self.rows
+        return SimpleNamespace(scalar_one_or_none=lambda: None, all=lambda: rows)
+
+    def add(self, row):
+        self.added.append(row)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class FakeHistorySession:
+    """Returns the given turn rows, then the given stored summary"""
+
+    def __init__(self, rows, summary):
+        self.results = [
+            SimpleNamespace(all=lambda: list(reversed(rows))),
+            SimpleNamespace(scalar_one_or_none=lambda: summary),
+        ]
+
+    async def execute(self, statement):
+        return self.results.pop(0)
+
+
+class TestLoadConversationHistory:
+    """load_conversation_history with a rolling summary"""
+
+    def test_turns_covered_by_summary_not_repeated(self, monkeypatch):
+        monkeypatch.setattr(conversation_history_service, "CONVERSATION_SUMMARY_ENABLED", True)
+        rows = [
+            SimpleNamespace(id=i, role="user" if i % 2 else "assistant", content=f"turn {i}")
+            for i in range(1, 7)
+        ]
+        summary = ConversationSummary(
+            parent_type="epic", parent_id="epic_1", summary="Earlier turns.", covers_through_id=4
+        )
+        session = FakeHistorySession(rows, summary)
+
+        history = asyncio.run(load_conversation_history(
+            session, EpicTranscriptEvent, EpicTranscriptEvent.epic_id, "epic", "epic_1", token_budget=10000
+        ))
+
+        assert history[0]["content"].startswith(SUMMARY_PREFIX)
+        assert [m["content"] for m in history[2:]] == ["turn 5", "turn 6"]
+
+
+class TestSummaryRefresh:
+    """refresh_conversation_summary / schedule_summary_refresh"""
+
+    def install(self, monkeypatch, session):
+        import db.database
+        from services.llm_service import LLMService
+
+        async def fake_stream(self, **kwargs):
+            yield "Summary."
+
+        monkeypatch.setattr(db.database, "AsyncSessionLocal", lambda: session)
+        monkeypatch.setattr(LLMService, "stream_with_config", fake_stream)
+
+    def test_covers_only_the_turns_read(self, monkeypatch):
+        # The query stops at HISTORY_MAX_EVENTS rows, short of through_id
+        rows = [SimpleNamespace(id=i, role="user", content=f"turn {i}") for i in range(1, 4)]
+        session = FakeSummarySession(rows)
+        self.install(monkeypatch, session)
+
+        asyncio.run(refresh_conversation_summary(
+            EpicTranscriptEvent, EpicTranscriptEvent.epic_id, "epic", "epic_1", 500, {"provider": "openai"}
+        ))
+
+        assert session.commits == 1
+        (summary,) = session.added
+        assert isinstance(summary, ConversationSummary)
+        assert summary.covers_through_id == 3
+
+    def test_scheduled_task_is_referenced_until_done(self, monkeypatch):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def fake_refresh(*args):
+            started.set()
+            await release.wait()
+
+        monkeypatch.setattr(conversation_history_service, "refresh_conversation_summary", fake_refresh)
+
+        async def scenario():
+            schedule_summary_refresh(
+                EpicTranscriptEvent, EpicTranscriptEvent.epic_id, "epic", "epic_2", 10, {"provider": "openai"}
+            )
+            await started.wait()
+            running = len(conversation_history_service._refresh_tasks)
+            release.set()
+            for _ in range(3):
+                await asyncio.sleep(0)
+            return running, len(conversation_history_service._refresh_tasks)
+
+        assert asyncio.run(scenario()) == (1, 0)
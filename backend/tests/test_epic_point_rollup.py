@@ -0,0 +1,195 @@
+"""
+Epic Point Rollup Trigger Tests for JarlPM
+
+Runs random story/feature changes against a real PostgreSQL database and,
+after every change, checks the incrementally maintained epic_point_rollups
+rows against a full recompute (rebuild_epic_point_rollups, the same path as
+POST /api/admin/rollups/rebuild).
+
+Needs TEST_DATABASE_URL (postgresql+asyncpg://...); skipped otherwise. The
+tests work in their own schema and drop it afterwards.
+"""
+import asyncio
+import os
+import random
+import sys
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from db.database import install_epic_point_rollup_triggers
+from db.models import Base, Epic, User
+from db.feature_models import Feature
+from db.user_story_models import UserStory
+import db.persona_models  # noqa: F401 - register tables for create_all
+import db.analytics_models  # noqa: F401
+from services.portfolio_rollup_service import ROLLUP_FIELDS, rebuild_epic_point_rollups
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+SCHEMA = "jarlpm_rollup_test"
+
+POINTS = [None, 1, 2, 3, 5, 8]
+PRIORITIES = [None, "must-have", "should-have", "nice-to-have"]
+
+
+async def snapshot(session: AsyncSession) -> dict:
+    """epic_id -> rollup fields; epics without a row count as all zeros"""
+    result = await session.execute(text(f"""
+        SELECT e.epic_id, {", ".join(f"COALESCE(r.{field}, 0)" for field in ROLLUP_FIELDS)}
+        FROM epics e LEFT JOIN epic_point_rollups r ON r.epic_id = e.epic_id
+        ORDER BY e.epic_id
+    """))
+    return {row[0]: tuple(row[1:]) for row in result.all()}
+
+
+class RollupScenario:
+    """Random story/feature changes, checked against a full recompute after each"""
+
+    def __init__(self, session: AsyncSession, seed: int):
+        self.session = session
+        self.rng = random.Random(seed)
+        self.user_id = None
+        self.epic_ids = []
+        self.feature_ids = []
+        self.story_ids = []
+
+    async def setup(self):
+        user = User(email="rollup@example.test", name="Rollup")
+        self.session.add(user)
+        await self.session.flush()
+        self.user_id = user.user_id
+        for i in range(3):
+            epic = Epic(user_id=self.user_id, title=f"Epic {i}")
+            self.session.add(epic)
+            await self.session.flush()
+            self.epic_ids.append(epic.epic_id)
+        for _ in range(6):
+            await self.add_feature()
+
+    async def add_feature(self):
+        feature = Feature(epic_id=self.rng.choice(self.epic_ids), title="Feature", description="Feature")
+        self.session.add(feature)
+        await self.session.flush()
+        self.feature_ids.append(feature.feature_id)
+
+    async def add_story(self):
+        # Some stories are standalone and never roll up
+        feature_id = self.rng.choice(self.feature_ids + [None]) if self.feature_ids else None
+        story = UserStory(
+            feature_id=feature_id,
+            user_id=self.user_id,
+            persona="user",
+            action="do it",
+            benefit="value",
+            story_text="As a user I want to do it so that I get value",
+            story_points=self.rng.choice(POINTS),
+            story_priority=self.rng.choice(PRIORITIES),
+        )
+        self.session.add(story)
+        await self.session.flush()
+        self.session.expunge(story)
+        self.story_ids.append(story.story_id)
+
+    async def execute(self, sql: str, **params):
+        await self.session.execute(text(sql), params)
+
+    async def step(self):
+        ops = ["add_story"] * 4
+        if self.story_ids:
+            ops += ["points", "priority", "both", "move_story", "delete_story"]
+        if self.feature_ids:
+            ops += ["move_feature"]
+        if len(self.feature_ids) > 2:
+            ops += ["delete_feature"]
+        op = self.rng.choice(ops)
+
+        if op == "add_story":
+            await self.add_story()
+        elif op == "points":
+            await self.execute(
+                "UPDATE user_stories SET story_points = :points WHERE story_id = :id",
+                points=self.rng.choice(POINTS), id=self.rng.choice(self.story_ids),
+            )
+        elif op == "priority":
+            await self.execute(
+                "UPDATE user_stories SET story_priority = :priority WHERE story_id = :id",
+                priority=self.rng.choice(PRIORITIES), id=self.rng.choice(self.story_ids),
+            )
+        elif op == "both":
+            await self.execute(
+                "UPDATE user_stories SET story_points = :points, story_priority = :priority WHERE story_id = :id",
+                points=self.rng.choice(POINTS), priority=self.rng.choice(PRIORITIES),
+                id=self.rng.choice(self.story_ids),
+            )
+        elif op == "move_story":
+            await self.execute(
+                "UPDATE user_stories SET feature_id = :feature_id WHERE story_id = :id",
+                feature_id=self.rng.choice(self.feature_ids + [None]), id=self.rng.choice(self.story_ids),
+            )
+        elif op == "delete_story":
+            story_id = self.rng.choice(self.story_ids)
+            await self.execute("DELETE FROM user_stories WHERE story_id = :id", id=story_id)
+            self.story_ids.remove(story_id)
+        elif op == "move_feature":
+            await self.execute(
+                "UPDATE features SET epic_id = :epic_id WHERE feature_id = :id",
+                epic_id=self.rng.choice(self.epic_ids), id=self.rng.choice(self.feature_ids),
+            )
+        elif op == "delete_feature":
+            # Stories go with it through ON DELETE CASCADE
+            feature_id = self.rng.choice(self.feature_ids)
+            result = await self.session.execute(
+                text("SELECT story_id FROM user_stories WHERE feature_id = :id"), {"id": feature_id}
+            )
+            gone = {row.story_id for row in result.all()}
+            await self.execute("DELETE FROM features WHERE feature_id = :id", id=feature_id)
+            self.feature_ids.remove(feature_id)
+            self.story_ids = [story_id for story_id in self.story_ids if story_id not in gone]
+            await self.add_feature()
+        return op
+
+
+async def run_scenario(seed: int, steps: int) -> set:
+    engine = create_async_engine(TEST_DATABASE_URL, connect_args={"server_settings": {"search_path": SCHEMA}})
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            await conn.run_sync(Base.metadata.create_all)
+            await install_epic_point_rollup_triggers(conn)
+
+        ops_seen = set()
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            scenario = RollupScenario(session, seed)
+            await scenario.setup()
+            await rebuild_epic_point_rollups(session)
+
+            for i in range(steps):
+                op = await scenario.step()
+                ops_seen.add(op)
+                incremental = await snapshot(session)
+                await rebuild_epic_point_rollups(session)
+                recomputed = await snapshot(session)
+                assert incremental == recomputed, f"step {i} ({op}) drifted from the full recompute"
+        return ops_seen
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL not set")
+class TestEpicPointRollupTriggers:
+    """Incremental rollup triggers vs refresh_epic_point_rollup"""
+
+    def test_random_changes_match_full_recompute(self):
+        ops_seen = asyncio.run(run_scenario(seed=7, steps=300))
+        assert ops_seen == {
+            "add_story", "points", "priority", "both", "move_story", "delete_story",
+            "move_feature", "delete_feature",
+        }
@@ -0,0 +1,113 @@
+"""
+Epic Tree Loader Tests for JarlPM
+
+Tests that epic trees load in a fixed number of queries whatever the number
+of features and stories, and that linked bugs are attached to the right epic.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.dialects import postgresql
+
+from db.models import Epic, Bug
+from db.feature_models import Feature
+from db.user_story_models import UserStory
+from services.epic_tree_loader import EpicTreeLoader
+
+
+def make_epic(epic_id, feature_count, stories_per_feature):
+    epic = Epic(epic_id=epic_id, user_id="user_1", title=epic_id)
+    epic.features = []
+    for f in range(feature_count):
+        feature = Feature(feature_id=f"{epic_id}_feat_{f}", epic_id=epic_id, title=f"Feature {f}")
+        feature.user_stories = [
+            UserStory(story_id=f"{feature.feature_id}_story_{s}", feature_id=feature.feature_id, story_text="As a user")
+            for s in range(stories_per_feature)
+        ]
+        epic.features.append(feature)
+    return epic
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Returns prepared epics, then prepared bug link rows; records statements"""
+
+    def __init__(self, epics, bug_rows=()):
+        self.epics = epics
+        self.bug_rows = list(bug_rows)
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self.epics if len(self.statements) == 1 else self.bug_rows)
+
+
+class TestEpicTreeLoader:
+    """EpicTreeLoader.load"""
+
+    def test_features_and_stories_loaded_with_selectin(self):
+        session = FakeSession([make_epic("epic_1", 2, 2)])
+        asyncio.run(EpicTreeLoader(session).load("user_1", Epic.epic_id == "epic_1", include_snapshot=True))
+
+        statement = session.statements[0]
+        strategies = {
+            tuple(str(key) for key in load.path.natural_path[1::2]): dict(load.strategy)
+            for option in statement._with_options
+            for load in option.context
+        }
+        # selectin loads each level with one IN query for all parents, so the
+        # query count doesn't grow with the number of features or stories
+        assert strategies == {
+            ("Epic.features",): {"lazy": "selectin"},
+            ("Epic.features", "Feature.user_stories"): {"lazy": "selectin"},
+            ("Epic.snapshot",): {"lazy": "selectin"},
+        }
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "epics.user_id" in sql and "epics.epic_id" in sql
+
+    def test_bug_query_count_independent_of_tree_size(self):
+        for feature_count in (1, 50):
+            session = FakeSession([make_epic("epic_1", feature_count, 5)])
+            trees = asyncio.run(EpicTreeLoader(session).load("user_1", include_bugs=True))
+
+            # One epic query, one bug query; stories come from the loaded tree
+            assert len(session.statements) == 2
+            assert len(trees[0].stories) == feature_count * 5
+
+    def test_bugs_attached_once_to_owning_epic(self):
+        epic_1, epic_2 = make_epic("epic_1", 1, 1), make_epic("epic_2", 1, 0)
+        linked = Bug(bug_id="bug_1", user_id="user_1", title="Crash")
+        other = Bug(bug_id="bug_2", user_id="user_1", title="Typo")
+        stray = Bug(bug_id="bug_3", user_id="user_1", title="Elsewhere")
+        session = FakeSession([epic_1, epic_2], [
+            ("epic", "epic_1", linked),
+            ("story", "epic_1_feat_0_story_0", linked),  # Same bug via a story
+            ("feature", "epic_2_feat_0", other),
+            ("epic", "epic_9", stray),
+        ])
+
+        trees = asyncio.run(EpicTreeLoader(session).load("user_1", include_bugs=True))
+
+        assert [bug.bug_id for bug in trees[0].bugs] == ["bug_1"]
+        assert [bug.bug_id for bug in trees[1].bugs] == ["bug_2"]
+        sql = str(session.statements[1].compile(dialect=postgresql.dialect()))
+        assert "bug_links" in sql and "bugs.is_deleted" in sql
+
+    def test_no_epics_skips_bug_query(self):
+        session = FakeSession([])
+        assert asyncio.run(EpicTreeLoader(session).load("user_1", include_bugs=True)) == []
+        assert len(session.statements) == 1
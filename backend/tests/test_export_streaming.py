@@ -0,0 +1,172 @@
+"""
+Export Streaming Tests for JarlPM
+
+Tests the incremental export writers and stream_export: streamed documents
+match the in-memory exports, JSON stays valid, portfolios hold every epic and
+an epic export only carries that epic's bugs.
+"""
+import asyncio
+import csv
+import io
+import json
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.dialects import postgresql
+
+from services.bug_service import epic_bug_ids
+from services.export_service import ExportService, ExportFormat, get_export_writer
+
+
+def make_story(n):
+    return {
+        "story_id": f"story_{n}", "title": f"Story {n}", "story_text": f"As a user I want {n}",
+        "persona": "a user", "action": f"do {n}", "benefit": "it helps", "current_stage": "draft",
+        "story_points": 3, "rice_total": None, "acceptance_criteria": ["Given, When, Then"],
+        "labels": ["api"], "story_priority": "must-have", "dependencies": [], "risks": ["Scope"],
+    }
+
+
+def make_feature(n):
+    return {
+        "feature_id": f"feat_{n}", "title": f"Feature {n}", "description": "Does things",
+        "current_stage": "approved", "moscow_score": "must_have", "rice_total": 12.5,
+        "acceptance_criteria": ["Works"], "user_stories": [make_story(f"{n}a"), make_story(f"{n}b")],
+    }
+
+
+def make_epic(n, features=2):
+    return {
+        "epic_id": f"epic_{n}", "title": f"Epic {n}", "current_stage": "epic_locked",
+        "moscow_score": "should_have", "problem_statement": "Slow", "desired_outcome": "Fast",
+        "acceptance_criteria": ["Faster"], "created_at": "2026-01-01T00:00:00+00:00",
+        "features": [make_feature(f"{n}.{i}") for i in range(features)],
+    }
+
+
+BUGS = [
+    {"bug_id": "bug_1", "epic_id": "epic_1", "title": "Crash", "description": "Boom", "severity": "high", "status": "draft",
+     "steps_to_reproduce": "Click", "expected_behavior": "Fine", "actual_behavior": "Crash", "rice_total": None},
+]
+
+
+class FakeExportService(ExportService):
+    """Serves epic trees from memory instead of the database"""
+
+    def __init__(self, epics, bugs):
+        super().__init__(session=None)
+        self.epics = epics
+        self.bugs = bugs
+
+    async def iter_epics(self, user_id, epic_id=None, page_size=None):
+        for epic in self.epics:
+            if epic_id is None or epic["epic_id"] == epic_id:
+                yield {key: value for key, value in epic.items() if key != "features"} | {"features": []}
+
+    async def iter_features(self, epic_id, page_size=None):
+        for epic in self.epics:
+            if epic["epic_id"] == epic_id:
+                for feature in epic["features"]:
+                    yield feature
+
+    async def iter_bugs(self, user_id, epic_id=None, page_size=None):
+        for bug in self.bugs:
+            if epic_id is None or bug.get("epic_id") == epic_id:
+                yield bug
+
+
+def stream(service, export_format, epic_id=None, include_bugs=True):
+    async def collect():
+        writer = get_export_writer(export_format, portfolio=epic_id is None)
+        return [chunk async for chunk in service.stream_export(writer, "user_1", epic_id, include_bugs)]
+    return asyncio.run(collect())
+
+
+class TestStreamExport:
+    """stream_export output"""
+
+    def test_streamed_csv_and_markdown_match_in_memory_export(self):
+        epic = make_epic(1)
+        service = FakeExportService([epic], BUGS)
+
+        assert "".join(stream(service, ExportFormat.JIRA_CSV, "epic_1")) == service.export_to_jira_csv(epic, BUGS)
+        assert "".join(stream(service, ExportFormat.AZURE_DEVOPS_CSV, "epic_1")) == service.export_to_azure_devops_csv(epic, BUGS)
+        assert "".join(stream(service, ExportFormat.MARKDOWN, "epic_1")) == service.export_to_markdown(epic, BUGS)
+
+    def test_single_epic_json(self):
+        service = FakeExportService([make_epic(1)], BUGS)
+        document = json.loads("".join(stream(service, ExportFormat.JSON, "epic_1")))
+
+        assert document["source"] == "JarlPM"
+        assert document["epic"]["title"] == "Epic 1"
+        assert [f["feature_id"] for f in document["epic"]["features"]] == ["feat_1.0", "feat_1.1"]
+        assert len(document["epic"]["features"][0]["user_stories"]) == 2
+        assert document["bugs"][0]["bug_id"] == "bug_1"
+        assert "jira" in document["field_mappings"]
+
+    def test_single_epic_json_when_epic_vanished(self):
+        service = FakeExportService([], BUGS)
+        document = json.loads("".join(stream(service, ExportFormat.JSON, "epic_1")))
+
+        assert document["epic"] is None
+        assert document["bugs"][0]["bug_id"] == "bug_1"
+
+    def test_portfolio_json_holds_every_epic(self):
+        service = FakeExportService([make_epic(1), make_epic(2, features=0), make_epic(3)], [])
+        document = json.loads("".join(stream(service, ExportFormat.JSON)))
+
+        assert [epic["epic_id"] for epic in document["epics"]] == ["epic_1", "epic_2", "epic_3"]
+        assert document["epics"][1]["features"] == []
+        assert document["bugs"] == []
+
+    def test_portfolio_csv_one_header_row(self):
+        service = FakeExportService([make_epic(1), make_epic(2)], BUGS)
+        rows = list(csv.reader(io.StringIO("".join(stream(service, ExportFormat.JIRA_CSV)))))
+
+        assert rows[0][0] == "Issue Type"
+        assert sum(1 for row in rows if row[0] == "Issue Type") == 1
+        assert [row[1] for row in rows if row[0] == "Epic"] == ["Epic 1", "Epic 2"]
+        assert rows[-1][0] == "Bug"
+
+    def test_markdown_numbers_features_per_epic(self):
+        service = FakeExportService([make_epic(1), make_epic(2)], [])
+        document = "".join(stream(service, ExportFormat.MARKDOWN, include_bugs=False))
+
+        assert document.count("## Features") == 2
+        assert document.count("### 1. Feature") == 2
+        assert "## Bugs" not in document
+
+    def test_chunks_streamed_per_item(self):
+        service = FakeExportService([make_epic(1, features=5)], BUGS)
+        chunks = stream(service, ExportFormat.JSON, "epic_1")
+
+        assert all(chunks)
+        assert len(chunks) >= 5
+
+    def test_epic_export_scopes_bugs_portfolio_does_not(self):
+        other_bug = dict(BUGS[0], bug_id="bug_2", title="Elsewhere", epic_id="epic_9")
+        service = FakeExportService([make_epic(1)], BUGS + [other_bug])
+
+        epic_doc = json.loads("".join(stream(service, ExportFormat.JSON, "epic_1")))
+        portfolio_doc = json.loads("".join(stream(service, ExportFormat.JSON)))
+
+        assert [bug["bug_id"] for bug in epic_doc["bugs"]] == ["bug_1"]
+        assert [bug["bug_id"] for bug in portfolio_doc["bugs"]] == ["bug_1", "bug_2"]
+
+
+class TestEpicBugIds:
+    """epic_bug_ids subquery"""
+
+    def test_links_to_epic_features_and_stories_in_one_statement(self):
+        sql = str(epic_bug_ids("epic_1").compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+
+        assert sql.startswith("SELECT bug_links.bug_id")
+        for entity_type in ("'epic'", "'feature'", "'story'"):
+            assert f"bug_links.entity_type = {entity_type}" in sql
+        assert "features.epic_id = 'epic_1'" in sql
+        assert "user_stories.feature_id IN (SELECT features.feature_id" in sql
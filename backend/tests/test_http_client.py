@@ -0,0 +1,50 @@
+"""
+HTTP Client Tests for JarlPM
+
+Tests that shared clients never keep cookies and that user-supplied origins
+get short-lived clients instead of growing the pooled registry.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from services import http_client
+from services.http_client import HTTPClientRegistry, OPENAI_BASE_URL, open_http_client
+
+
+class TestHTTPClients:
+    """Registry clients and open_http_client"""
+
+    def test_pooled_client_drops_cookies(self):
+        client = HTTPClientRegistry().get(OPENAI_BASE_URL)
+        request = httpx.Request("GET", f"{OPENAI_BASE_URL}/v1/models")
+        response = httpx.Response(200, headers={"set-cookie": "session=user_1; Path=/"}, request=request)
+
+        client.cookies.extract_cookies(response)
+
+        assert len(client.cookies.jar) == 0
+        asyncio.run(client.aclose())
+
+    def test_user_supplied_origin_gets_short_lived_client(self, monkeypatch):
+        registry = HTTPClientRegistry()
+        monkeypatch.setattr(http_client, "_http_client_registry", registry)
+
+        async def scenario():
+            async with open_http_client("http://localhost:11434/v1") as client:
+                local = client
+                assert not client.is_closed
+            async with open_http_client(f"{OPENAI_BASE_URL}/v1") as client:
+                pooled = client
+            return local, pooled
+
+        local, pooled = asyncio.run(scenario())
+
+        assert local.is_closed
+        assert not pooled.is_closed
+        assert list(registry._clients) == [OPENAI_BASE_URL]
+        asyncio.run(registry.close())
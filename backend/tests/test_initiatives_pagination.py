@@ -0,0 +1,46 @@
+"""
+Initiative Library Pagination Tests
+
+Tests the keyset (cursor) helpers used by GET /api/initiatives.
+"""
+import pytest
+import os
+import sys
+from datetime import datetime, timezone
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import HTTPException
+from routes.initiatives import encode_cursor, decode_cursor, KEYSET_SORT_FIELDS
+
+
+class TestKeysetCursor:
+    """Cursor encoding/decoding for keyset pagination"""
+    
+    def test_cursor_round_trip(self):
+        """A cursor decodes back to the same sort value and row id"""
+        updated_at = datetime(2026, 2, 8, 9, 30, 15, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor("updated_at", updated_at, 42)
+        
+        value, row_id = decode_cursor(cursor, "updated_at")
+        assert value == updated_at
+        assert row_id == 42
+    
+    def test_cursor_rejects_other_sort_field(self):
+        """A cursor issued for one sort field can't be reused for another"""
+        cursor = encode_cursor("created_at", datetime.now(timezone.utc), 1)
+        
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor(cursor, "updated_at")
+        assert exc.value.status_code == 400
+    
+    def test_cursor_rejects_garbage(self):
+        """Malformed cursors return 400 instead of 500"""
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor("not-a-cursor", "updated_at")
+        assert exc.value.status_code == 400
+    
+    def test_keyset_sort_fields(self):
+        """Only timestamp sorts support keyset pagination"""
+        assert set(KEYSET_SORT_FIELDS) == {"updated_at", "created_at"}
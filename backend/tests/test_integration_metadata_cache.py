@@ -0,0 +1,121 @@
+"""
+Integration Metadata Cache Tests for JarlPM
+
+Tests per-integration caching, background refresh of stale entries and
+invalidation.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import integration_metadata_cache
+from services.cache_service import Cache, MemoryCacheBackend
+from services.integration_metadata_cache import IntegrationMetadataCache, integration_metadata
+
+
+def make_cache(refresh_after: float = 600) -> IntegrationMetadataCache:
+    return IntegrationMetadataCache(
+        Cache("integration_metadata", MemoryCacheBackend(), default_ttl=60),
+        refresh_after=refresh_after,
+    )
+
+
+class FakeService:
+    """Counts fetches through a decorated metadata method"""
+
+    def __init__(self, integration_id):
+        self.integration_id = integration_id
+        self.calls = 0
+
+    @integration_metadata("projects")
+    async def get_projects(self, team_id=None):
+        self.calls += 1
+        return [{"id": f"p{self.calls}", "team": team_id}]
+
+
+class TestIntegrationMetadataCache:
+    """get_or_fetch, refresh and invalidation"""
+
+    def test_decorated_method_fetches_once_per_integration_and_args(self, monkeypatch):
+        cache = make_cache()
+        monkeypatch.setattr(integration_metadata_cache, "_integration_metadata_cache", cache)
+
+        async def scenario():
+            service = FakeService("int_1")
+            first = await service.get_projects("t1")
+            again = await service.get_projects("t1")
+            other_team = await service.get_projects("t2")
+            other_integration = FakeService("int_2")
+            await other_integration.get_projects("t1")
+            return service, first, again, other_team, other_integration
+
+        service, first, again, other_team, other_integration = asyncio.run(scenario())
+        assert first == again
+        assert other_team[0]["team"] == "t2"
+        assert service.calls == 2
+        assert other_integration.calls == 1
+
+    def test_without_integration_id_not_cached(self, monkeypatch):
+        monkeypatch.setattr(integration_metadata_cache, "_integration_metadata_cache", make_cache())
+        service = FakeService(None)
+        asyncio.run(service.get_projects())
+        asyncio.run(service.get_projects())
+        assert service.calls == 2
+
+    def test_stale_entry_served_then_refreshed_in_background(self):
+        cache = make_cache(refresh_after=0)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return len(calls)
+
+        async def scenario():
+            first = await cache.get_or_fetch("int_1", "teams", fetch)
+            stale = await cache.get_or_fetch("int_1", "teams", fetch)
+            await asyncio.sleep(0.01)  # Let the background refresh finish
+            refreshed = await cache.get_or_fetch("int_1", "teams", fetch)
+            return first, stale, refreshed
+
+        first, stale, refreshed = asyncio.run(scenario())
+        assert (first, stale) == (1, 1)
+        assert refreshed == 2
+
+    def test_refresh_task_referenced_and_cleared_when_cancelled(self):
+        cache = make_cache(refresh_after=0)
+
+        async def fetch():
+            await asyncio.sleep(10)
+            return "value"
+
+        async def scenario():
+            await cache._store("int_1", "teams", "stale")
+            await cache.get_or_fetch("int_1", "teams", fetch)
+            (task,) = cache._tasks
+            assert cache._refreshing == {"int_1:teams"}
+            task.cancel()
+            await asyncio.sleep(0)
+            return cache._tasks, cache._refreshing
+
+        assert asyncio.run(scenario()) == (set(), set())
+
+    def test_invalidate_drops_only_that_integration(self):
+        cache = make_cache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return "value"
+
+        async def scenario():
+            await cache.get_or_fetch("int_1", "fields", fetch)
+            await cache.get_or_fetch("int_2", "fields", fetch)
+            await cache.invalidate("int_1")
+            await cache.get_or_fetch("int_1", "fields", fetch)
+            await cache.get_or_fetch("int_2", "fields", fetch)
+
+        asyncio.run(scenario())
+        assert len(calls) == 3
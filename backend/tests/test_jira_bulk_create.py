@@ -0,0 +1,104 @@
+"""
+Jira Bulk Create Tests for JarlPM
+
+Tests mapping /issue/bulk responses (including partial failures) back onto
+the requested items.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.jira_service import (
+    JiraPushService, JiraAPIError, parse_bulk_create_response, chunked
+)
+
+
+class FakeJiraREST:
+    """Fails any issue whose summary starts with "bad", like a 400 partial response"""
+
+    cloud_id = "example"
+
+    def __init__(self):
+        self.requests = []
+
+    async def create_issues_bulk(self, fields_list):
+        self.requests.append(fields_list)
+        body = {"issues": [], "errors": []}
+        for index, fields in enumerate(fields_list):
+            if fields["summary"].startswith("bad"):
+                body["errors"].append({
+                    "status": 400,
+                    "failedElementNumber": index,
+                    "elementErrors": {"errorMessages": [], "errors": {"summary": "invalid"}}
+                })
+            else:
+                body["issues"].append({"id": str(10000 + index), "key": f"PROJ-{index + 1}"})
+        return parse_bulk_create_response(len(fields_list), body)
+
+
+def item(entity_id, title):
+    return {
+        "issue_type": "Story",
+        "title": title,
+        "description": "As a shopper...",
+        "entity_type": "story",
+        "entity_id": entity_id,
+        "epic_link_key": "PROJ-0",
+        "story_points": 3,
+    }
+
+
+class TestParseBulkCreateResponse:
+    """failedElementNumber mapping"""
+
+    def test_failures_keep_positions(self):
+        body = {
+            "issues": [{"id": "1", "key": "P-1"}, {"id": "3", "key": "P-3"}],
+            "errors": [{"status": 400, "failedElementNumber": 1,
+                        "elementErrors": {"errorMessages": ["Issue type is required"], "errors": {}}}],
+        }
+        assert parse_bulk_create_response(3, body) == [
+            {"id": "1", "key": "P-1"},
+            {"error": "Issue type is required"},
+            {"id": "3", "key": "P-3"},
+        ]
+
+    def test_chunked_respects_limit(self):
+        assert [len(c) for c in chunked(list(range(120)))] == [50, 50, 20]
+
+
+class TestCreateItemsBulk:
+    """JiraPushService.create_items_bulk"""
+
+    def test_one_request_with_per_item_results(self):
+        rest = FakeJiraREST()
+        service = JiraPushService(rest)
+        results = asyncio.run(service.create_items_bulk(
+            "PROJ", [item("s1", "Checkout"), item("s2", "bad title"), item("s3", "Refunds")]
+        ))
+
+        assert len(rest.requests) == 1
+        assert results["s1"]["action"] == "created"
+        assert results["s1"]["key"] == "PROJ-1"
+        assert results["s1"]["payload_hash"]
+        assert results["s3"]["key"] == "PROJ-3"
+        assert isinstance(results["s2"], JiraAPIError)
+        assert "summary: invalid" in str(results["s2"])
+
+    def test_hash_matches_single_push(self):
+        """A bulk-created item is skipped by the next individual re-push"""
+        rest = FakeJiraREST()
+        service = JiraPushService(rest)
+        created = asyncio.run(service.create_items_bulk("PROJ", [item("s1", "Checkout")]))["s1"]
+
+        single = dict(item("s1", "Checkout"))
+        repush = asyncio.run(service.push_item(
+            project_key="PROJ",
+            existing_issue_key=created["key"],
+            last_push_hash=created["payload_hash"],
+            **single
+        ))
+        assert repush["action"] == "skipped"
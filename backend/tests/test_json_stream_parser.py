@@ -0,0 +1,94 @@
+"""
+JSON Stream Parser Tests for JarlPM
+
+Tests extracting array elements from streamed LLM output as they complete,
+and per-item schema validation of generated features and stories.
+"""
+import json
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.json_stream_parser import JSONArrayStreamParser, validate_item
+from routes.feature import GeneratedFeature
+from routes.user_story import GeneratedStory
+
+
+FEATURES = [
+    {"title": "Login", "description": "Sign in with {email} and [password]", "acceptance_criteria": ["Works"]},
+    {"title": "Quote \"escaped\" \\ and }", "description": "Nested {\"a\": [1, {\"b\": 2}]}", "acceptance_criteria": []},
+    {"title": "Export", "description": "CSV", "acceptance_criteria": ["A", "B"], "extra": {"k": [1, 2]}},
+]
+
+
+def values(elements):
+    return [element.value for element in elements]
+
+
+def feed_in_chunks(parser, text, size):
+    """Feed text in fixed-size chunks, recording element values completed per chunk"""
+    completed = []
+    for start in range(0, len(text), size):
+        completed.append(values(parser.feed(text[start:start + size])))
+    return completed
+
+
+class TestJSONArrayStreamParser:
+    """JSONArrayStreamParser.feed"""
+
+    def test_elements_emitted_as_each_closes(self):
+        text = json.dumps(FEATURES, indent=2)
+        for size in (1, 3, 7, 64, len(text)):
+            parser = JSONArrayStreamParser()
+            emitted = [item for chunk in feed_in_chunks(parser, text, size) for item in chunk]
+            assert emitted == FEATURES
+            assert parser.finished
+
+    def test_first_element_available_before_response_ends(self):
+        text = json.dumps(FEATURES)
+        first_end = text.index("}, {") + 1
+        parser = JSONArrayStreamParser()
+
+        assert values(parser.feed(text[:first_end])) == [FEATURES[0]]
+        assert values(parser.feed(text[first_end:])) == FEATURES[1:]
+
+    def test_skips_prose_fences_and_wrapping_object(self):
+        parser = JSONArrayStreamParser()
+        text = 'Here you go:\n```json\n{"features": ' + json.dumps(FEATURES[:2]) + '}\n```\nAnything [else] {}'
+        assert values(parser.feed(text)) == FEATURES[:2]
+        assert parser.finished
+
+    def test_malformed_element_reported_with_its_index(self):
+        parser = JSONArrayStreamParser()
+        elements = parser.feed('[{"title": "A"}, {"title": oops}, {"title": "C"}]')
+
+        assert [(e.index, e.value) for e in elements] == [(0, {"title": "A"}), (1, None), (2, {"title": "C"})]
+        assert elements[1].error and elements[0].error is None
+        assert parser.count == 3
+        assert parser.errors == [elements[1].error]
+
+    def test_indexes_when_one_chunk_completes_several(self):
+        parser = JSONArrayStreamParser()
+        elements = parser.feed('[{"a":1}, {"b": }, {"title":2}]')
+        assert [e.index for e in elements] == [0, 1, 2]
+
+    def test_no_array(self):
+        parser = JSONArrayStreamParser()
+        assert parser.feed("I can't help with that.") == []
+        assert not parser.started
+
+
+class TestValidateItem:
+    """validate_item against the generation schemas"""
+
+    def test_valid_feature_keeps_extra_fields(self):
+        feature, problem = validate_item(GeneratedFeature, FEATURES[2])
+        assert problem is None
+        assert feature["extra"] == {"k": [1, 2]}
+
+    def test_story_missing_fields_rejected(self):
+        story, problem = validate_item(GeneratedStory, {"persona": "admin", "acceptance_criteria": "not a list"})
+        assert story is None
+        assert "action" in problem and "benefit" in problem and "acceptance_criteria" in problem
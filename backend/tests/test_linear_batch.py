@@ -0,0 +1,122 @@
+"""
+Linear Batched Mutation Tests for JarlPM
+
+Tests aliased mutation documents, per-alias error mapping and batched
+label creation.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.linear_service import (
+    LinearGraphQLService, LinearMutationBatcher, LinearPushService, LinearAPIError
+)
+
+
+class FakeLinearGraphQL(LinearGraphQLService):
+    """Answers aliased mutations locally; titles/names starting with "bad" fail"""
+
+    def __init__(self, labels=()):
+        super().__init__("token")
+        self.documents = []
+        self.labels = list(labels)
+
+    async def get_team_labels(self, team_id):
+        return self.labels
+
+    async def _post(self, query, variables=None):
+        self.documents.append((query, variables))
+        data, errors = {}, []
+        aliases = sorted({name.split("_")[0] for name in variables})
+        for alias in aliases:
+            value = variables.get(f"{alias}_input", {})
+            name = value.get("title") or value.get("name")
+            if name.startswith("bad"):
+                data[alias] = None
+                errors.append({"message": f"Invalid value for {name}", "path": [alias]})
+            elif "issueLabelCreate" in query.split(f"{alias}:")[1].split("\n")[0]:
+                data[alias] = {"success": True, "issueLabel": {"id": f"label-{name}", "name": name}}
+            else:
+                issue_id = variables.get(f"{alias}_id") or f"issue-{name}"
+                data[alias] = {"success": True, "issue": {
+                    "id": issue_id, "identifier": f"ENG-{len(data)}", "title": name,
+                    "url": f"https://linear.app/example/{issue_id}",
+                }}
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+
+def item(entity_id, title, **extra):
+    return {
+        "title": title,
+        "description": "Synced from JarlPM",
+        "entity_type": "story",
+        "entity_id": entity_id,
+        "parent_external_id": "issue-feature",
+        **extra,
+    }
+
+
+class TestMutationBatcher:
+    """Aliased documents"""
+
+    def test_document_aliases_each_mutation(self):
+        batcher = LinearMutationBatcher(FakeLinearGraphQL())
+        query, variables = batcher.build_document([
+            ("a", "issueCreate", {"input": {"title": "One"}}),
+            ("b", "issueUpdate", {"id": "x", "input": {"title": "Two"}}),
+        ])
+        assert "$m0_input: IssueCreateInput!" in query
+        assert "m1: issueUpdate(id: $m1_id, input: $m1_input)" in query
+        assert variables == {"m0_input": {"title": "One"}, "m1_id": "x", "m1_input": {"title": "Two"}}
+
+    def test_chunks_by_batch_size(self):
+        graphql = FakeLinearGraphQL()
+        batcher = LinearMutationBatcher(graphql, batch_size=2)
+        for i in range(5):
+            batcher.add(str(i), "issueCreate", {"input": {"title": f"Issue {i}", "teamId": "t"}})
+        results = asyncio.run(batcher.execute())
+        assert len(graphql.documents) == 3
+        assert results["4"]["title"] == "Issue 4"
+
+
+class TestPushItemsBatch:
+    """LinearPushService.push_items_batch"""
+
+    def test_per_alias_errors_and_skips(self):
+        graphql = FakeLinearGraphQL()
+        service = LinearPushService(graphql)
+        first = asyncio.run(service.push_items_batch("team", [item("s1", "Pay by card")]))["s1"]
+
+        results = asyncio.run(service.push_items_batch("team", [
+            item("s1", "Pay by card", existing_external_id=first["external_id"], last_push_hash=first["payload_hash"]),
+            item("s2", "bad story"),
+            item("s3", "Refunds", existing_external_id="issue-old"),
+        ]))
+
+        assert len(graphql.documents) == 2
+        assert results["s1"]["action"] == "skipped"
+        assert isinstance(results["s2"], LinearAPIError)
+        assert "Invalid value for bad story" in str(results["s2"])
+        assert results["s3"]["action"] == "updated"
+        assert results["s3"]["external_id"] == "issue-old"
+
+    def test_parent_id_sent_on_create(self):
+        graphql = FakeLinearGraphQL()
+        asyncio.run(LinearPushService(graphql).push_items_batch("team", [item("s1", "Pay by card")]))
+        _, variables = graphql.documents[0]
+        assert variables["m0_input"]["parentId"] == "issue-feature"
+
+
+class TestEnsureLabels:
+    """Missing labels are created in one request"""
+
+    def test_missing_labels_created_together(self):
+        graphql = FakeLinearGraphQL(labels=[{"id": "label-epic", "name": "Epic"}])
+        service = LinearPushService(graphql)
+        ids = asyncio.run(service.ensure_labels("team", ["epic", "feature", "story", "bad"]))
+
+        assert len(graphql.documents) == 1
+        assert ids == ["label-epic", "label-feature", "label-story"]
@@ -0,0 +1,68 @@
+"""
+LLM Response Cache Tests for JarlPM
+
+Tests content-addressed keys and the regenerate bypass.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import Cache, MemoryCacheBackend
+from services.llm_response_cache import LLMResponseCache, llm_response_cache_key
+
+CONFIG = {"config_id": "llm_user_1", "provider": "openai", "model_name": "gpt-4o", "api_key": "sk-one", "base_url": None}
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def make_cache(enabled: bool = True) -> LLMResponseCache:
+    return LLMResponseCache(Cache("llm_responses", MemoryCacheBackend(), default_ttl=60), enabled=enabled)
+
+
+class TestCacheKey:
+    """Key covers everything that determines the output, and nothing else"""
+
+    def test_same_inputs_same_key(self):
+        assert llm_response_cache_key(CONFIG, "sys", "user") == llm_response_cache_key(dict(CONFIG), "sys", "user")
+
+    def test_prompt_model_and_temperature_change_key(self):
+        base = llm_response_cache_key(CONFIG, "sys", "user")
+        assert llm_response_cache_key(CONFIG, "sys", "user 2") != base
+        assert llm_response_cache_key(CONFIG, "sys 2", "user") != base
+        assert llm_response_cache_key({**CONFIG, "model_name": "gpt-4o-mini"}, "sys", "user") != base
+        assert llm_response_cache_key(CONFIG, "sys", "user", temperature=0.2) != base
+
+    def test_other_users_config_changes_key(self):
+        other_user = {**CONFIG, "config_id": "llm_user_2"}
+        assert llm_response_cache_key(other_user, "sys", "user") != llm_response_cache_key(CONFIG, "sys", "user")
+
+    def test_api_key_not_part_of_key(self):
+        other_key = {**CONFIG, "api_key": "sk-two"}
+        assert llm_response_cache_key(other_key, "sys", "user") == llm_response_cache_key(CONFIG, "sys", "user")
+
+
+class TestLLMResponseCache:
+    """Lookup, regenerate bypass and disabled mode"""
+
+    def test_hit_after_set(self):
+        cache = make_cache()
+        assert run(cache.get(CONFIG, "sys", "user")) is None
+        run(cache.set(CONFIG, "sys", "user", "answer"))
+        assert run(cache.get(CONFIG, "sys", "user")) == "answer"
+
+    def test_regenerate_skips_lookup_and_replaces(self):
+        cache = make_cache()
+        run(cache.set(CONFIG, "sys", "user", "old"))
+        assert run(cache.get(CONFIG, "sys", "user", regenerate=True)) is None
+        run(cache.set(CONFIG, "sys", "user", "new"))
+        assert run(cache.get(CONFIG, "sys", "user")) == "new"
+
+    def test_disabled_cache_never_hits(self):
+        cache = make_cache(enabled=False)
+        run(cache.set(CONFIG, "sys", "user", "answer"))
+        assert run(cache.get(CONFIG, "sys", "user")) is None
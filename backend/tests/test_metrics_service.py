@@ -0,0 +1,101 @@
+"""
+Metrics Service Tests for JarlPM
+
+Tests quantile estimation from histogram buckets and LLM stream
+instrumentation (chunks must pass through unchanged).
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.metrics_service import histogram_quantile, instrument_llm_stream
+
+INF = float("inf")
+
+
+class TestHistogramQuantile:
+    """Matches PromQL histogram_quantile() semantics"""
+
+    def test_interpolates_within_bucket(self):
+        buckets = [(1.0, 0), (2.0, 10), (INF, 10)]
+        assert histogram_quantile(0.5, buckets) == 1.5
+
+    def test_picks_correct_bucket(self):
+        buckets = [(0.1, 50), (0.5, 90), (1.0, 100), (INF, 100)]
+        assert histogram_quantile(0.5, buckets) == 0.1
+        assert abs(histogram_quantile(0.95, buckets) - 0.75) < 1e-9
+
+    def test_overflow_bucket_returns_last_finite_bound(self):
+        buckets = [(1.0, 1), (INF, 10)]
+        assert histogram_quantile(0.99, buckets) == 1.0
+
+    def test_empty_histogram(self):
+        assert histogram_quantile(0.5, []) is None
+        assert histogram_quantile(0.5, [(1.0, 0), (INF, 0)]) is None
+
+
+class TestInstrumentLLMStream:
+    """Instrumentation must not alter the stream"""
+
+    def test_chunks_pass_through(self):
+        async def source():
+            for chunk in ["Hel", "lo", " world"]:
+                yield chunk
+
+        async def collect():
+            return [c async for c in instrument_llm_stream(source(), "openai", "gpt-4o")]
+
+        assert asyncio.run(collect()) == ["Hel", "lo", " world"]
+
+    def test_errors_propagate(self):
+        async def source():
+            yield "partial"
+            raise RuntimeError("upstream failed")
+
+        async def collect():
+            return [c async for c in instrument_llm_stream(source(), "anthropic", None)]
+
+        try:
+            asyncio.run(collect())
+            assert False, "expected RuntimeError"
+        except RuntimeError as e:
+            assert "upstream failed" in str(e)
+
+    def test_cancelled_task_labelled_cancelled(self, monkeypatch):
+        from services import metrics_service
+
+        outcomes = []
+
+        class Recorder:
+            def labels(self, **labels):
+                outcomes.append(labels.get("outcome"))
+                return self
+
+            def observe(self, value):
+                pass
+
+        monkeypatch.setattr(metrics_service, "LLM_STREAM_DURATION", Recorder())
+
+        async def source():
+            yield "first"
+            await asyncio.sleep(10)
+            yield "never"
+
+        async def scenario():
+            async def consume():
+                return [c async for c in instrument_llm_stream(source(), "openai", "gpt-4o")]
+
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                return True
+            return False
+
+        assert asyncio.run(scenario())
+        assert outcomes == ["cancelled"]
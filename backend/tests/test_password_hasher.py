@@ -0,0 +1,82 @@
+"""
+Password Hasher Tests for JarlPM
+
+Tests hashing off the event loop, the bounded queue and cost-based rehash
+detection.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import password_hasher
+from services.password_hasher import PasswordHasher, PasswordHasherBusy, hash_rounds
+
+
+class TestPasswordHasher:
+    """PasswordHasher hash/verify/needs_rehash"""
+
+    def test_hash_and_verify_with_configured_rounds(self):
+        hasher = PasswordHasher(rounds=4)
+
+        async def scenario():
+            hashed = await hasher.hash("s3cret")
+            return hashed, await hasher.verify("s3cret", hashed), await hasher.verify("wrong", hashed)
+
+        hashed, good, bad = asyncio.run(scenario())
+        assert hash_rounds(hashed) == 4
+        assert good and not bad
+        assert not hasher.needs_rehash(hashed)
+        assert PasswordHasher(rounds=5).needs_rehash(hashed)
+
+    def test_invalid_stored_hash_does_not_verify(self):
+        hasher = PasswordHasher(rounds=4)
+        assert asyncio.run(hasher.verify("s3cret", "not-a-bcrypt-hash")) is False
+        assert hasher.needs_rehash("not-a-bcrypt-hash")
+
+    def test_runs_off_the_event_loop(self, monkeypatch):
+        loop_thread = []
+
+        def slow_hash(password, rounds):
+            loop_thread.append(threading.current_thread().name)
+            time.sleep(0.2)
+            return "$2b$04$hash"
+
+        monkeypatch.setattr(password_hasher, "hash_password_sync", slow_hash)
+        hasher = PasswordHasher(rounds=4, workers=2)
+
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            await asyncio.gather(hasher.hash("a"), hasher.hash("b"))
+            task.cancel()
+            return ticks
+
+        started = time.monotonic()
+        ticks = asyncio.run(scenario())
+        # Both ran in parallel on pool threads while the loop kept ticking
+        assert time.monotonic() - started < 0.35
+        assert ticks >= 10
+        assert all(name.startswith("bcrypt") for name in loop_thread)
+
+    def test_full_queue_rejects_after_timeout(self, monkeypatch):
+        monkeypatch.setattr(password_hasher, "hash_password_sync", lambda password, rounds: time.sleep(0.3) or "h")
+        hasher = PasswordHasher(rounds=4, workers=1, queue_limit=1, queue_timeout=0.05)
+
+        async def scenario():
+            return await asyncio.gather(hasher.hash("a"), hasher.hash("b"), return_exceptions=True)
+
+        first, second = asyncio.run(scenario())
+        assert first == "h"
+        assert isinstance(second, PasswordHasherBusy)
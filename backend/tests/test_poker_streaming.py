@@ -0,0 +1,47 @@
+"""
+Poker Streaming Tests for JarlPM
+
+Tests that the concurrent persona fan-out reports every persona, including
+ones whose prompts fail to build, so the SSE stream always ends.
+"""
+import asyncio
+import json
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from routes import poker
+from routes.poker import AI_PERSONAS, stream_persona_estimates
+
+
+class TestStreamPersonaEstimates:
+    """stream_persona_estimates"""
+
+    def test_prompt_failure_reported_and_stream_ends(self, monkeypatch):
+        async def fake_estimate(config_data, persona, system_prompt, user_prompt):
+            return {'type': 'persona_estimate', 'estimate': {"persona_id": persona["id"], "estimate": 3}}
+
+        monkeypatch.setattr(poker, "estimate_with_persona", fake_estimate)
+        failing = AI_PERSONAS[0]["id"]
+
+        def build_prompts(persona):
+            if persona["id"] == failing:
+                raise ValueError("no story text")
+            return "system", "user"
+
+        async def collect():
+            estimates = []
+            events = [
+                json.loads(event[len("data: "):])
+                async for event in stream_persona_estimates("user_poker", {}, build_prompts, estimates)
+            ]
+            return events, estimates
+
+        events, estimates = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+
+        errors = [event for event in events if event["type"] == "persona_error"]
+        assert [event["persona_id"] for event in errors] == [failing]
+        assert "no story text" in errors[0]["error"]
+        assert len(estimates) == len(AI_PERSONAS) - 1
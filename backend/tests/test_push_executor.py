@@ -0,0 +1,280 @@
+"""
+Push Executor Tests for JarlPM
+
+Tests dependency ordering, concurrency, failure propagation, Retry-After
+handling and resuming of the integration push executor.
+"""
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.push_executor import (
+    PushExecutor, ProviderLimiter, TokenBucket, PARENT_FAILED, finalize_push_run
+)
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, retry_after):
+        super().__init__("rate limit exceeded")
+        self.retry_after = retry_after
+
+
+def make_push(log, entity_id, delay=0.05, fail=False):
+    async def push(parent):
+        log.append(("start", entity_id, parent["external_id"] if parent else None))
+        await asyncio.sleep(delay)
+        if fail:
+            raise ValueError("invalid field")
+        log.append(("end", entity_id))
+        return {"action": "created", "external_id": f"ext-{entity_id}", "external_key": None,
+                "url": f"https://example.test/{entity_id}"}
+    return push
+
+
+def build_tree(executor, log, stories_per_feature=5, fail=()):
+    executor.add("epic", "e1", make_push(log, "e1", fail="e1" in fail))
+    for f in range(3):
+        fid = f"f{f}"
+        executor.add("feature", fid, make_push(log, fid, fail=fid in fail), depends_on="e1")
+        for s in range(stories_per_feature):
+            sid = f"{fid}s{s}"
+            executor.add("story", sid, make_push(log, sid, fail=sid in fail), depends_on=fid)
+
+
+class TestPushExecutor:
+    """DAG execution"""
+
+    def test_children_start_after_parent_with_parent_outcome(self):
+        log = []
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000))
+        build_tree(executor, log)
+        result = asyncio.run(executor.run())
+
+        assert len(result.created) == 1 + 3 + 15
+        ended = set()
+        for event in log:
+            if event[0] == "end":
+                ended.add(event[1])
+            elif event[1].startswith("f"):
+                parent = event[1].split("s")[0] if "s" in event[1] else "e1"
+                assert parent in ended
+                assert event[2] == f"ext-{parent}"
+
+    def test_runs_by_depth_not_item_count(self):
+        executor = PushExecutor(ProviderLimiter(concurrency=20, rate_per_second=1000))
+        build_tree(executor, [])
+        started = time.monotonic()
+        asyncio.run(executor.run())
+        # 19 items x 50ms sequentially would be ~0.95s; three levels is ~0.15s
+        assert time.monotonic() - started < 0.5
+
+    def test_concurrency_cap(self):
+        in_flight = 0
+        peak = 0
+
+        async def push(parent):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return {"action": "updated", "external_id": "x"}
+
+        executor = PushExecutor(ProviderLimiter(concurrency=2, rate_per_second=1000))
+        for i in range(8):
+            executor.add("story", f"s{i}", push)
+        asyncio.run(executor.run())
+        assert peak == 2
+
+    def test_failed_parent_skips_children(self):
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000), max_retries=0)
+        build_tree(executor, [], stories_per_feature=2, fail={"f1"})
+        result = asyncio.run(executor.run())
+
+        assert [f["entity_id"] for f in result.failed] == ["f1"]
+        skipped = {s["entity_id"]: s["reason"] for s in result.skipped}
+        assert skipped == {"f1s0": PARENT_FAILED, "f1s1": PARENT_FAILED}
+        assert len(result.created) == 1 + 2 + 4
+
+    def test_retry_after_pauses_and_retries(self):
+        calls = []
+
+        async def push(parent):
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                raise FakeRateLimitError(retry_after=0.2)
+            return {"action": "created", "external_id": "x"}
+
+        executor = PushExecutor(ProviderLimiter(concurrency=1, rate_per_second=1000))
+        executor.add("epic", "e1", push)
+        result = asyncio.run(executor.run())
+
+        assert len(result.created) == 1
+        assert calls[1] - calls[0] >= 0.2
+
+    def test_retry_after_beyond_limit_fails(self):
+        async def push(parent):
+            raise FakeRateLimitError(retry_after=600)
+
+        executor = PushExecutor(ProviderLimiter(concurrency=1, rate_per_second=1000), max_retry_wait=30)
+        executor.add("epic", "e1", push)
+        result = asyncio.run(executor.run())
+        assert len(result.failed) == 1
+        assert executor.rate_limited_for == 600
+
+
+class TestFinalizePushRun:
+    """Run status from the push result"""
+
+    def test_failed_epic_with_skipped_children_is_failed(self):
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000), max_retries=0)
+        build_tree(executor, [], stories_per_feature=0, fail={"e1"})
+        result = asyncio.run(executor.run())
+        assert len(result.skipped) == 3
+
+        push_run = SimpleNamespace()
+        finalize_push_run(push_run, result, executor.links)
+        assert push_run.status == "failed"
+        assert push_run.summary_json["skipped"] == 3
+
+    def test_failure_with_unchanged_items_is_partial(self):
+        async def unchanged(parent):
+            return {"action": "skipped", "external_id": "ext-e1"}
+
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000), max_retries=0)
+        executor.add("epic", "e1", unchanged)
+        executor.add("feature", "f0", make_push([], "f0", delay=0, fail=True), depends_on="e1")
+        result = asyncio.run(executor.run())
+
+        push_run = SimpleNamespace()
+        finalize_push_run(push_run, result, executor.links)
+        assert push_run.status == "partial"
+
+
+class TestResume:
+    """Restoring items finished by an earlier attempt"""
+
+    def test_restored_items_not_pushed_and_still_parents(self):
+        log = []
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000))
+        executor.restore({
+            "e1": {"entity_type": "epic", "action": "created", "external_id": "ext-e1", "url": "https://example.test/e1"},
+            "f0": {"entity_type": "feature", "action": "created", "external_id": "ext-f0"},
+        })
+        build_tree(executor, log, stories_per_feature=1)
+        result = asyncio.run(executor.run())
+
+        started = {event[1] for event in log if event[0] == "start"}
+        assert started == {"f1", "f2", "f0s0", "f1s0", "f2s0"}
+        assert ("start", "f0s0", "ext-f0") in log
+        assert len(result.created) == 1 + 3 + 3
+        assert "https://example.test/e1" in executor.links
+        assert executor.completed["e1"]["entity_type"] == "epic"
+
+    def test_restored_batch_members_dropped(self):
+        pushed = []
+
+        async def push_features(parent):
+            pushed.append(parent["external_id"])
+            return {"f1": {"action": "created", "external_id": "ext-f1"}}
+
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000))
+        executor.restore({"f0": {"entity_type": "feature", "action": "updated", "external_id": "ext-f0"}})
+        executor.add("epic", "e1", make_push([], "e1", delay=0))
+        executor.add_batch([("feature", "f0"), ("feature", "f1")], push_features, depends_on="e1")
+        result = asyncio.run(executor.run())
+
+        assert executor.units[-1].members == [("feature", "f1")]
+        assert pushed == ["ext-e1"]
+        assert [u["entity_id"] for u in result.updated] == ["f0"]
+        assert len(executor.entity_ids) == 3
+
+    def test_progress_callback_after_each_unit(self):
+        seen = []
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000))
+
+        async def on_progress():
+            seen.append(len(executor.completed))
+
+        executor.on_progress = on_progress
+        build_tree(executor, [], stories_per_feature=1, fail=("f2",))
+        asyncio.run(executor.run())
+
+        assert len(seen) == 1 + 3 + 2
+        assert max(seen) == 1 + 2 + 2
+
+
+class TestPushBatch:
+    """Sibling items pushed with one request"""
+
+    def test_batch_records_per_item_errors_and_children_follow_members(self):
+        calls = []
+
+        async def push_features(parent):
+            calls.append(parent["external_id"])
+            return {
+                "f0": {"action": "created", "external_id": "ext-f0"},
+                "f1": ValueError("Summary is required"),
+            }
+
+        log = []
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000))
+        executor.add("epic", "e1", make_push(log, "e1", delay=0))
+        executor.add_batch([("feature", "f0"), ("feature", "f1")], push_features, depends_on="e1")
+        executor.add("story", "f0s0", make_push(log, "f0s0", delay=0), depends_on="f0")
+        executor.add("story", "f1s0", make_push(log, "f1s0", delay=0), depends_on="f1")
+        result = asyncio.run(executor.run())
+
+        assert calls == ["ext-e1"]
+        assert [(f["entity_id"], f["error"]) for f in result.failed] == [("f1", "Summary is required")]
+        assert {c["entity_id"] for c in result.created} == {"e1", "f0", "f0s0"}
+        assert ("start", "f0s0", "ext-f0") in log
+        assert [s["entity_id"] for s in result.skipped] == ["f1s0"]
+
+    def test_batch_across_parents_skips_members_of_failed_parent(self):
+        received = []
+
+        async def push_stories(parents):
+            received.append({parent_id: outcome["external_id"] for parent_id, outcome in parents.items()})
+            return {"f0s0": {"action": "created", "external_id": "ext-f0s0"}}
+
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000), max_retries=0)
+        executor.add("feature", "f0", make_push([], "f0", delay=0))
+        executor.add("feature", "f1", make_push([], "f1", delay=0, fail=True))
+        executor.add_batch(
+            [("story", "f0s0"), ("story", "f1s0")], push_stories, parents={"f0s0": "f0", "f1s0": "f1"}
+        )
+        result = asyncio.run(executor.run())
+
+        assert received == [{"f0": "ext-f0"}]
+        assert [c["entity_id"] for c in result.created] == ["f0", "f0s0"]
+        assert result.skipped == [{"type": "story", "entity_id": "f1s0", "reason": PARENT_FAILED}]
+
+    def test_batch_request_failure_fails_every_member(self):
+        async def push_features(parent):
+            raise ValueError("invalid request")
+
+        executor = PushExecutor(ProviderLimiter(concurrency=10, rate_per_second=1000), max_retries=0)
+        executor.add_batch([("feature", "f0"), ("feature", "f1")], push_features)
+        result = asyncio.run(executor.run())
+        assert [f["entity_id"] for f in result.failed] == ["f0", "f1"]
+
+
+class TestTokenBucket:
+    """Rate limiting"""
+
+    def test_rate_limits_acquires(self):
+        async def acquire_all():
+            bucket = TokenBucket(rate=20, capacity=1)
+            started = time.monotonic()
+            for _ in range(5):
+                await bucket.acquire()
+            return time.monotonic() - started
+
+        # First token is free, the next four take 1/20s each
+        assert asyncio.run(acquire_all()) >= 0.18
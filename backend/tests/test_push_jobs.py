@@ -0,0 +1,165 @@
+"""
+Push Job Tests for JarlPM
+
+Tests executing queued push runs: checkpointed progress, requeueing after a
+long Retry-After and resuming without re-pushing finished items.
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.push_jobs import PushJobQueue, PushJobError, register_push_handler
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, retry_after):
+        super().__init__("rate limit exceeded")
+        self.retry_after = retry_after
+
+
+class FakeResult:
+    def __init__(self, run):
+        self.run = run
+
+    def scalar_one(self):
+        return self.run
+
+
+class FakeSession:
+    """Hands out one push run and records what each commit saw"""
+
+    def __init__(self, run):
+        self.run = run
+        self.commits = []
+        self.rollbacks = 0
+
+    async def execute(self, statement):
+        return FakeResult(self.run)
+
+    async def commit(self):
+        self.commits.append((self.run.status, dict((self.run.progress_json or {}).get("completed", {}))))
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_run(provider):
+    return SimpleNamespace(
+        run_id="run_1", provider=provider, integration_id="int_1", user_id="user_1",
+        status="running", attempts=1, progress_json=None, result_json=None, error_json=None,
+        summary_json=None, ended_at=None, next_attempt_at=None, heartbeat_at=None, request_json={},
+    )
+
+
+class TestExecute:
+    """PushJobQueue.execute"""
+
+    def test_rate_limited_run_requeued_then_resumed(self):
+        calls = []
+        limited = {"f1"}
+
+        async def handler(session, push_run, executor, checkpoint):
+            def push(entity_id):
+                async def run(parent):
+                    calls.append(entity_id)
+                    if entity_id in limited:
+                        limited.discard(entity_id)
+                        raise FakeRateLimitError(retry_after=600)
+                    return {"action": "created", "external_id": f"ext-{entity_id}"}
+                return run
+
+            executor.add("epic", "e1", push("e1"))
+            executor.add("feature", "f0", push("f0"), depends_on="e1")
+            executor.add("feature", "f1", push("f1"), depends_on="e1")
+
+        register_push_handler("test_resume", handler)
+        run = make_run("test_resume")
+        session = FakeSession(run)
+        queue = PushJobQueue(session_factory=lambda: session)
+
+        asyncio.run(queue.execute(run.run_id))
+        assert run.status == "pending"
+        assert run.next_attempt_at is not None
+        assert set(run.progress_json["completed"]) == {"e1", "f0"}
+        # Progress was committed as items finished, not only at the end
+        assert any(set(completed) == {"e1"} for _, completed in session.commits)
+
+        run.status, run.attempts = "running", 2
+        asyncio.run(queue.execute(run.run_id))
+        assert calls == ["e1", "f0", "f1", "f1"]
+        assert run.status == "success"
+        assert {item["entity_id"] for item in run.result_json["created"]} == {"e1", "f0", "f1"}
+
+    def test_handler_error_fails_run(self):
+        async def handler(session, push_run, executor, checkpoint):
+            raise PushJobError("Jira not connected")
+
+        register_push_handler("test_error", handler)
+        run = make_run("test_error")
+        asyncio.run(PushJobQueue(session_factory=lambda: FakeSession(run)).execute(run.run_id))
+
+        assert run.status == "failed"
+        assert run.error_json == {"error": "Jira not connected"}
+
+    def test_failed_run_rolled_back_before_saving_failure(self):
+        session = FakeSession(make_run("test_rollback"))
+
+        async def handler(session, push_run, executor, checkpoint):
+            raise PushJobError("duplicate key value violates unique constraint")
+
+        register_push_handler("test_rollback", handler)
+        asyncio.run(PushJobQueue(session_factory=lambda: session).execute("run_1"))
+
+        assert session.rollbacks == 1
+        assert session.commits == [("failed", {})]
+
+    def test_gives_up_after_max_attempts(self):
+        async def handler(session, push_run, executor, checkpoint):
+            raise AssertionError("handler should not run")
+
+        register_push_handler("test_attempts", handler)
+        run = make_run("test_attempts")
+        run.attempts = 4
+        asyncio.run(PushJobQueue(max_attempts=3, session_factory=lambda: FakeSession(run)).execute(run.run_id))
+
+        assert run.status == "failed"
+        assert "Gave up" in run.error_json["error"]
+
+
+class TestWorker:
+    """PushJobQueue._worker"""
+
+    def test_execute_error_does_not_stop_worker(self):
+        queue = PushJobQueue(workers=1)
+        claims = ["run_1", "run_2"]
+        executed = []
+
+        async def claim():
+            if claims:
+                return claims.pop(0)
+            queue._stopping = True
+
+        async def execute(run_id):
+            executed.append(run_id)
+            if run_id == "run_1":
+                raise RuntimeError("connection reset")
+
+        queue.claim, queue.execute = claim, execute
+        queue.poll_interval = 0
+
+        async def scenario():
+            queue._wakeup = asyncio.Event()
+            await asyncio.wait_for(queue._worker(0), timeout=1)
+
+        asyncio.run(scenario())
+        assert executed == ["run_1", "run_2"]
@@ -0,0 +1,90 @@
+"""
+Skip-Unchanged Push Tests for JarlPM
+
+Tests that integration pushes skip items whose payload hash matches the
+last push, and that force overrides the skip.
+"""
+import asyncio
+import os
+import sys
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.jira_service import JiraPushService
+
+
+class FakeJiraREST:
+    """Records calls instead of talking to Jira"""
+    
+    cloud_id = "example"
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def update_issue(self, key, fields):
+        self.calls.append(("update", key))
+    
+    async def get_issue(self, key):
+        self.calls.append(("get", key))
+        return {"id": "10001"}
+    
+    async def create_issue(self, fields):
+        self.calls.append(("create", fields["summary"]))
+        return {"key": "PROJ-1", "id": "10001"}
+
+
+def push(service, **overrides):
+    kwargs = dict(
+        project_key="PROJ",
+        issue_type="Story",
+        title="Checkout",
+        description="As a shopper...",
+        entity_type="story",
+        entity_id="story_1",
+        existing_issue_key="PROJ-1",
+        story_points=3,
+    )
+    kwargs.update(overrides)
+    return asyncio.run(service.push_item(**kwargs))
+
+
+class TestSkipUnchanged:
+    """Hash comparison against ExternalPushMapping.last_push_hash"""
+    
+    def test_unchanged_item_is_skipped(self):
+        rest = FakeJiraREST()
+        service = JiraPushService(rest)
+        first = push(service)
+        rest.calls.clear()
+        
+        result = push(service, last_push_hash=first["payload_hash"])
+        assert result["action"] == "skipped"
+        assert result["key"] == "PROJ-1"
+        assert rest.calls == []
+    
+    def test_changed_item_is_updated(self):
+        rest = FakeJiraREST()
+        service = JiraPushService(rest)
+        first = push(service)
+        rest.calls.clear()
+        
+        result = push(service, title="Checkout v2", last_push_hash=first["payload_hash"])
+        assert result["action"] == "updated"
+        assert ("update", "PROJ-1") in rest.calls
+    
+    def test_story_points_change_is_not_skipped(self):
+        service = JiraPushService(FakeJiraREST())
+        first = push(service)
+        assert push(service, story_points=5, last_push_hash=first["payload_hash"])["action"] == "updated"
+    
+    def test_force_pushes_unchanged_item(self):
+        service = JiraPushService(FakeJiraREST())
+        first = push(service)
+        assert push(service, last_push_hash=first["payload_hash"], force=True)["action"] == "updated"
+    
+    def test_new_item_is_never_skipped(self):
+        service = JiraPushService(FakeJiraREST())
+        first = push(service)
+        result = push(service, existing_issue_key=None, last_push_hash=first["payload_hash"])
+        assert result["action"] == "created"
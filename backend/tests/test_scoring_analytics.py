@@ -0,0 +1,165 @@
+"""
+Scoring Analytics Tests for JarlPM
+
+Tests the columnar score table and the vectorized ranking, percentile,
+distribution and RICE-per-effort computations.
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from sqlalchemy.dialects import postgresql
+
+from services.scoring_analytics import ScoreTable, ScoringAnalyticsService, rice_totals
+from services.scoring_service import ScoringService
+
+
+def feature(item_id, total=None, effort=None, moscow=None, rice=(None, None, None)):
+    return ("feature", item_id, item_id.title(), "epic_1", moscow, *rice, effort, total)
+
+
+def story(item_id, total, effort):
+    return ("story", item_id, item_id.title(), "feat_a", None, None, None, None, effort, total)
+
+
+def bug(item_id, total, effort):
+    return ("bug", item_id, item_id.title(), None, None, None, None, None, effort, total)
+
+
+ROWS = [
+    feature("feat_a", 8.0, 1.0, "must_have"),
+    feature("feat_b", 2.0, 4.0, "could_have"),
+    feature("feat_c", moscow="should_have"),  # MoSCoW only
+    story("story_a", 8.0, 0.5),
+    story("story_b", 0.5, 2.0),
+    bug("bug_a", 30.0, 1.0),
+]
+
+
+class TestScoreTable:
+    """ScoreTable.from_rows / rice_totals"""
+
+    def test_missing_scores_are_nan(self):
+        table = ScoreTable.from_rows(ROWS)
+        assert len(table) == 6
+        assert np.isnan(table.total[2])
+        assert table.moscow[3] is None
+
+    def test_missing_total_computed_from_components(self):
+        table = ScoreTable.from_rows([feature("feat_x", effort=2.0, rice=(5, 2.0, 0.8))])
+        assert table.total[0] == 4.0
+
+    def test_rice_totals_match_scalar_calculation(self):
+        rng = np.random.default_rng(7)
+        reach = rng.integers(1, 11, 500).astype(float)
+        impact = rng.choice([0.25, 0.5, 1.0, 2.0, 3.0], 500)
+        confidence = rng.choice([0.5, 0.8, 1.0], 500)
+        effort = rng.choice([0.5, 1.0, 2.5, 7.0, 10.0], 500)
+
+        expected = [ScoringService.calculate_rice_total(*values) for values in zip(reach, impact, confidence, effort)]
+        assert np.allclose(rice_totals(reach, impact, confidence, effort), expected)
+
+    def test_empty(self):
+        result = ScoringAnalyticsService.compute(ScoreTable.from_rows([]))
+        assert result["ranking"] == [] and result["rice"] is None
+        assert result["counts"]["features"] == 0
+
+
+class TestCompute:
+    """ScoringAnalyticsService.compute"""
+
+    def test_ranks_ties_and_percentiles(self):
+        result = ScoringAnalyticsService.compute(ScoreTable.from_rows(ROWS))
+        ranking = [(item["item_id"], item["rank"], item["percentile"]) for item in result["ranking"]]
+
+        assert ranking == [
+            ("bug_a", 1, 100.0),
+            ("feat_a", 2, 80.0),
+            ("story_a", 2, 80.0),
+            ("feat_b", 4, 40.0),
+            ("story_b", 5, 20.0),
+        ]
+
+    def test_top_by_rice_per_effort(self):
+        result = ScoringAnalyticsService.compute(ScoreTable.from_rows(ROWS), top_n=3)
+        top = [(item["item_id"], item["rice_per_effort"]) for item in result["top_by_rice_per_effort"]]
+        # RICE is already per effort; equal totals prefer the smaller effort
+        assert top == [("bug_a", 30.0), ("story_a", 8.0), ("feat_a", 8.0)]
+
+    def test_rice_per_effort_uses_unrounded_components(self):
+        # Both totals round to 0.33; 1 * 1 * 1 / 3.01 < 2 * 0.5 * 1 / 3
+        table = ScoreTable.from_rows([
+            feature("feat_y", 0.33, 3.01, rice=(1, 1.0, 1.0)),
+            feature("feat_x", 0.33, 3.0, rice=(2, 0.5, 1.0)),
+        ])
+        result = ScoringAnalyticsService.compute(table, top_n=1)
+        assert [item["item_id"] for item in result["top_by_rice_per_effort"]] == ["feat_x"]
+        assert result["top_by_rice_per_effort"][0]["rice_per_effort"] == 0.33
+
+    def test_distributions(self):
+        result = ScoringAnalyticsService.compute(ScoreTable.from_rows(ROWS))
+
+        assert result["counts"] == {
+            "features": 3, "stories": 2, "bugs": 1, "rice_scored": 5, "moscow_scored": 3,
+        }
+        assert result["distribution"]["moscow"] == {
+            "must_have": 1, "should_have": 1, "could_have": 1, "wont_have": 0, "unscored": 0,
+        }
+        histogram = {(b["from"], b["to"]): b["count"] for b in result["distribution"]["rice_histogram"]}
+        assert histogram[(0.0, 1.0)] == 1 and histogram[(5.0, 10.0)] == 2 and histogram[(30.0, 60.0)] == 1
+        assert result["rice"]["max"] == 30.0 and result["rice"]["p50"] == 8.0
+        assert result["distribution"]["by_type"]["bug"]["count"] == 1
+
+    def test_thousands_of_items_are_fast(self):
+        rng = np.random.default_rng(1)
+        rows = [
+            story(f"story_{i}", float(total), float(effort))
+            for i, (total, effort) in enumerate(zip(rng.uniform(0, 60, 5000).round(2), rng.uniform(0.5, 10, 5000)))
+        ]
+        table = ScoreTable.from_rows(rows)
+
+        started = time.perf_counter()
+        result = ScoringAnalyticsService.compute(table)
+        assert time.perf_counter() - started < 0.25
+        assert len(result["ranking"]) == 5000
+        totals = [item["rice_total"] for item in result["ranking"]]
+        assert totals == sorted(totals, reverse=True)
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+
+        class Result:
+            def all(self):
+                return []
+
+        return Result()
+
+
+class TestLoadScores:
+    """ScoringAnalyticsService.load_scores"""
+
+    def test_one_query_per_item_type(self):
+        session = RecordingSession()
+        table = asyncio.run(ScoringAnalyticsService(session).load_scores("user_1"))
+
+        assert len(table) == 0
+        assert len(session.statements) == 3
+        features, stories, bugs = session.statements
+        assert "FROM features" in features and "epics.is_archived" in features
+        assert "user_stories.is_standalone" in stories
+        assert "bugs.is_deleted" in bugs
+
+    def test_epic_scope_uses_bug_links(self):
+        session = RecordingSession()
+        asyncio.run(ScoringAnalyticsService(session).load_scores("user_1", "epic_1"))
+        assert "bug_links" in session.statements[2]
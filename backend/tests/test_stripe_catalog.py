@@ -0,0 +1,113 @@
+"""
+Stripe Price Catalog Tests for JarlPM
+
+Tests that checkout prices are resolved once per billing cycle, shared by
+concurrent first lookups, and looked up again after invalidation.
+"""
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add backend to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stripe
+
+from services.cache_service import Cache, MemoryCacheBackend
+from services.stripe_catalog import StripePriceCatalog
+
+
+class FakeStripe:
+    """Records Stripe product/price calls"""
+
+    def __init__(self, prices=()):
+        self.calls = []
+        self.prices = list(prices)
+
+    def install(self, monkeypatch):
+        monkeypatch.setattr(stripe.Product, "list_async", self.product_list)
+        monkeypatch.setattr(stripe.Product, "create_async", self.product_create)
+        monkeypatch.setattr(stripe.Price, "list_async", self.price_list)
+        monkeypatch.setattr(stripe.Price, "create_async", self.price_create)
+
+    async def product_list(self, **params):
+        self.calls.append("Product.list")
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(data=[SimpleNamespace(id="prod_1", metadata={"app": "jarlpm"})])
+
+    async def product_create(self, **params):
+        self.calls.append("Product.create")
+        return SimpleNamespace(id="prod_new")
+
+    async def price_list(self, **params):
+        self.calls.append("Price.list")
+        return SimpleNamespace(data=self.prices)
+
+    async def price_create(self, **params):
+        self.calls.append("Price.create")
+        price_id = f"price_{params['recurring']['interval']}_{len(self.calls)}"
+        self.prices.append(SimpleNamespace(
+            id=price_id, unit_amount=params["unit_amount"],
+            recurring=SimpleNamespace(interval=params["recurring"]["interval"]),
+        ))
+        return SimpleNamespace(id=price_id)
+
+
+def make_catalog(configured=None):
+    return StripePriceCatalog(Cache("stripe_catalog", MemoryCacheBackend(), default_ttl=60), configured=configured)
+
+
+class TestStripePriceCatalog:
+    """get_price_id / warm / invalidate"""
+
+    def test_price_resolved_once_per_cycle(self, monkeypatch):
+        existing = SimpleNamespace(id="price_month", unit_amount=4500, recurring=SimpleNamespace(interval="month"))
+        fake = FakeStripe([existing])
+        fake.install(monkeypatch)
+        catalog = make_catalog()
+
+        async def scenario():
+            first = await asyncio.gather(*(catalog.get_price_id("monthly") for _ in range(5)))
+            again = await catalog.get_price_id("monthly")
+            return first, again
+
+        first, again = asyncio.run(scenario())
+        assert set(first) == {"price_month"} and again == "price_month"
+        assert fake.calls == ["Product.list", "Price.list"]
+
+    def test_warm_creates_missing_prices_and_shares_product(self, monkeypatch):
+        fake = FakeStripe()
+        fake.install(monkeypatch)
+        catalog = make_catalog()
+
+        async def scenario():
+            await catalog.warm()
+            return await catalog.get_price_id("annual")
+
+        annual = asyncio.run(scenario())
+        assert annual.startswith("price_year")
+        assert fake.calls.count("Product.list") == 1
+        assert fake.calls.count("Price.create") == 2
+
+    def test_configured_price_ids_skip_stripe(self, monkeypatch):
+        fake = FakeStripe()
+        fake.install(monkeypatch)
+        catalog = make_catalog({"monthly": "price_env", "annual": None})
+
+        assert asyncio.run(catalog.get_price_id("monthly")) == "price_env"
+        assert fake.calls == []
+
+    def test_invalidate_looks_price_up_again(self, monkeypatch):
+        existing = SimpleNamespace(id="price_month", unit_amount=4500, recurring=SimpleNamespace(interval="month"))
+        fake = FakeStripe([existing])
+        fake.install(monkeypatch)
+        catalog = make_catalog()
+
+        async def scenario():
+            await catalog.get_price_id("monthly")
+            await catalog.invalidate("monthly")
+            return await catalog.get_price_id("monthly")
+
+        assert asyncio.run(scenario()) == "price_month"
+        assert fake.calls == ["Product.list", "Price.list", "Product.list", "Price.list"]
@@ -264,8 +264,8 @@ export const scoringAPI = {
   // Epic MoSCoW scoring
   getEpicMoSCoW: (epicId) => api.get(`/scoring/epic/${epicId}/moscow`),
   updateEpicMoSCoW: (epicId, score) => api.put(`/scoring/epic/${epicId}/moscow`, { score }),
-  suggestEpicMoSCoW: (epicId) => {
-    return fetch(`${API}/scoring/epic/${epicId}/moscow/suggest`, {
+  suggestEpicMoSCoW: (epicId, regenerate = false) => {
+    return fetch(`${API}/scoring/epic/${epicId}/moscow/suggest${regenerate ? '?regenerate=true' : ''}`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       credentials: 'include',
@@ -276,8 +276,8 @@ export const scoringAPI = {
   getFeatureScores: (featureId) => api.get(`/scoring/feature/${featureId}`),
   updateFeatureMoSCoW: (featureId, score) => api.put(`/scoring/feature/${featureId}/moscow`, { score }),
   updateFeatureRICE: (featureId, data) => api.put(`/scoring/feature/${featureId}/rice`, data),
-  suggestFeatureScores: (featureId) => {
-    return fetch(`${API}/scoring/feature/${featureId}/suggest`, {
+  suggestFeatureScores: (featureId, regenerate = false) => {
+    return fetch(`${API}/scoring/feature/${featureId}/suggest${regenerate ? '?regenerate=true' : ''}`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       credentials: 'include',
@@ -287,8 +287,8 @@ export const scoringAPI = {
   // User Story RICE scoring
   getStoryRICE: (storyId) => api.get(`/scoring/story/${storyId}`),
   updateStoryRICE: (storyId, data) => api.put(`/scoring/story/${storyId}/rice`, data),
-  suggestStoryRICE: (storyId) => {
-    return fetch(`${API}/scoring/story/${storyId}/suggest`, {
+  suggestStoryRICE: (storyId, regenerate = false) => {
+    return fetch(`${API}/scoring/story/${storyId}/suggest${regenerate ? '?regenerate=true' : ''}`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       credentials: 'include',
@@ -298,8 +298,8 @@ export const scoringAPI = {
   // Bug RICE scoring
   getBugRICE: (bugId) => api.get(`/scoring/bug/${bugId}`),
   updateBugRICE: (bugId, data) => api.put(`/scoring/bug/${bugId}/rice`, data),
-  suggestBugRICE: (bugId) => {
-    return fetch(`${API}/scoring/bug/${bugId}/suggest`, {
+  suggestBugRICE: (bugId, regenerate = false) => {
+    return fetch(`${API}/scoring/bug/${bugId}/suggest${regenerate ? '?regenerate=true' : ''}`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       credentials: 'include',
@@ -307,11 +307,11 @@ export const scoringAPI = {
   },
   
   // Bulk scoring for Epic features
-  bulkScoreEpic: (epicId) => api.post(`/scoring/epic/${epicId}/bulk-score`),
+  bulkScoreEpic: (epicId, regenerate = false) => api.post(`/scoring/epic/${epicId}/bulk-score`, null, { params: regenerate ? { regenerate: true } : undefined }),
   applyBulkScores: (epicId, suggestions) => api.post(`/scoring/epic/${epicId}/apply-scores`, suggestions),
   
   // Comprehensive bulk scoring (Features, Stories, Bugs)
-  bulkScoreAll: (epicId) => api.post(`/scoring/epic/${epicId}/bulk-score-all`),
+  bulkScoreAll: (epicId, regenerate = false) => api.post(`/scoring/epic/${epicId}/bulk-score-all`, null, { params: regenerate ? { regenerate: true } : undefined }),
   applyAllScores: (epicId, data) => api.post(`/scoring/epic/${epicId}/apply-all-scores`, data),
   
   // List-first scoring endpoints
@@ -425,9 +425,9 @@ export const deliveryRealityAPI = {
   getScopeSummary: (epicId) => api.get(`/delivery-reality/initiative/${epicId}/scope-summary`),
   
   // AI-powered features
-  generateCutRationale: (epicId) => api.post(`/delivery-reality/initiative/${epicId}/ai/cut-rationale`),
-  generateAlternativeCuts: (epicId) => api.post(`/delivery-reality/initiative/${epicId}/ai/alternative-cuts`),
-  generateRiskReview: (epicId) => api.post(`/delivery-reality/initiative/${epicId}/ai/risk-review`),
+  generateCutRationale: (epicId, regenerate = false) => api.post(`/delivery-reality/initiative/${epicId}/ai/cut-rationale`, null, { params: regenerate ? { regenerate: true } : undefined }),
+  generateAlternativeCuts: (epicId, regenerate = false) => api.post(`/delivery-reality/initiative/${epicId}/ai/alternative-cuts`, null, { params: regenerate ? { regenerate: true } : undefined }),
+  generateRiskReview: (epicId, regenerate = false) => api.post(`/delivery-reality/initiative/${epicId}/ai/risk-review`, null, { params: regenerate ? { regenerate: true } : undefined }),
 };
 
 // Sprint API
@@ -454,9 +454,9 @@ export const sprintAPI = {
   getInsightsBySprint: (sprintNumber) => api.get(`/sprints/insights/${sprintNumber}`),
   
   // AI Features (generate and save)
-  generateKickoffPlan: () => api.post('/sprints/ai/kickoff-plan'),
-  generateStandupSummary: () => api.post('/sprints/ai/standup-summary'),
-  generateWipSuggestions: () => api.post('/sprints/ai/wip-suggestions'),
+  generateKickoffPlan: (regenerate = false) => api.post('/sprints/ai/kickoff-plan', null, { params: regenerate ? { regenerate: true } : undefined }),
+  generateStandupSummary: (regenerate = false) => api.post('/sprints/ai/standup-summary', null, { params: regenerate ? { regenerate: true } : undefined }),
+  generateWipSuggestions: (regenerate = false) => api.post('/sprints/ai/wip-suggestions', null, { params: regenerate ? { regenerate: true } : undefined }),
 };
 
 // Dashboard API
@@ -521,6 +521,10 @@ export const prdAPI = {
 };
 
 // Integrations API
+const PUSH_POLL_INTERVAL_MS = 1500;
+// Stop waiting after this; the run carries on in the background and shows up in push history
+const PUSH_MAX_WAIT_MS = 5 * 60 * 1000;
+
 export const integrationsAPI = {
   // Status
   getStatus: () => api.get('/integrations/status'),
@@ -564,6 +568,29 @@ export const integrationsAPI = {
   // Push operations
   previewPush: (provider, data) => api.post(`/integrations/${provider}/preview`, data),
   push: (provider, data) => api.post(`/integrations/${provider}/push`, data),
+  getPushRun: (runId) => api.get(`/integrations/push-runs/${runId}`),
+  resumePushRun: (runId) => api.post(`/integrations/push-runs/${runId}/resume`),
+  // Pushes run in the background: queue one, poll until it finishes, resolve like push() did.
+  // Gives up after maxWaitMs or when signal aborts, resolving { pending: true, runId } instead.
+  pushAndWait: async (provider, data, onProgress = null, { signal = null, maxWaitMs = PUSH_MAX_WAIT_MS } = {}) => {
+    const queued = await api.post(`/integrations/${provider}/push`, data);
+    if (queued.data.status !== 'pending') return queued;
+    
+    const runId = queued.data.run_id;
+    const deadline = Date.now() + maxWaitMs;
+    while (!signal?.aborted && Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, PUSH_POLL_INTERVAL_MS));
+      if (signal?.aborted) break;
+      const { data: run } = await api.get(`/integrations/push-runs/${runId}`);
+      if (onProgress) onProgress(run.progress);
+      if (run.result) return { data: run.result };
+      if (run.status === 'failed') {
+        const detail = run.errors?.error || 'Push failed';
+        throw Object.assign(new Error(detail), { response: { data: { detail } } });
+      }
+    }
+    return { pending: true, runId };
+  },
   getPushHistory: (provider = null, limit = 20) => {
     const params = new URLSearchParams({ limit: limit.toString() });
     if (provider) params.append('provider', provider);
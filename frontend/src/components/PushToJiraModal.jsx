@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
   Dialog,
   DialogContent,
@@ -36,6 +36,7 @@ const PushToJiraModal = ({ isOpen, onClose, epicId, epicTitle }) => {
   const [preview, setPreview] = useState(null);
   const [loadingPreview, setLoadingPreview] = useState(false);
   const [pushing, setPushing] = useState(false);
+  const [pushProgress, setPushProgress] = useState(null);
   const [pushResults, setPushResults] = useState(null);
 
   // Load integration status and projects on mount
@@ -97,6 +98,8 @@ const PushToJiraModal = ({ isOpen, onClose, epicId, epicTitle }) => {
     }
   };
 
+  const pushAbortRef = useRef(null);
+
   const handlePush = async () => {
     if (!selectedProject) {
       toast.error('Please select a project');
@@ -104,23 +107,33 @@ const PushToJiraModal = ({ isOpen, onClose, epicId, epicTitle }) => {
     }
 
     setPushing(true);
+    setPushProgress(null);
+    const controller = new AbortController();
+    pushAbortRef.current = controller;
     try {
-      const res = await integrationsAPI.push('jira', {
+      const res = await integrationsAPI.pushAndWait('jira', {
         epic_id: epicId,
         project_key: selectedProject,
         push_scope: pushScope,
         include_bugs: includeBugs,
         dry_run: false
-      });
+      }, setPushProgress, { signal: controller.signal });
       
+      // Closed while waiting: the run finishes in the background
+      if (controller.signal.aborted) return;
+      if (res.pending) {
+        toast.info('Push is still running. Check push history for the result.');
+        return;
+      }
       setPushResults(res.data);
       
       const created = res.data.created?.length || 0;
       const updated = res.data.updated?.length || 0;
+      const skipped = res.data.skipped?.length || 0;
       const errors = res.data.errors?.length || 0;
       
       if (errors === 0) {
-        toast.success(`Successfully pushed ${created + updated} items to Jira`);
+        toast.success(`Successfully pushed ${created + updated} items to Jira${skipped ? ` (${skipped} unchanged, skipped)` : ''}`);
       } else {
         toast.warning(`Pushed with ${errors} errors. ${created} created, ${updated} updated.`);
       }
@@ -128,11 +141,13 @@ const PushToJiraModal = ({ isOpen, onClose, epicId, epicTitle }) => {
       console.error('Push failed:', error);
       toast.error(error.response?.data?.detail || 'Failed to push to Jira');
     } finally {
+      pushAbortRef.current = null;
       setPushing(false);
     }
   };
 
   const handleClose = () => {
+    pushAbortRef.current?.abort();
     setPreview(null);
     setPushResults(null);
     onClose();
@@ -400,7 +415,7 @@ const PushToJiraModal = ({ isOpen, onClose, epicId, epicTitle }) => {
               {pushing ? (
                 <>
                   <Loader2 className="w-4 h-4 mr-2 animate-spin" />
-                  Pushing...
+                  Pushing{pushProgress?.total ? ` ${pushProgress.done}/${pushProgress.total}` : ''}...
                 </>
               ) : (
                 <>
@@ -256,6 +256,8 @@ export const RICEEditor = ({
 export const FeatureScoringDialog = ({ open, onOpenChange, featureId, featureTitle, onUpdate }) => {
   const [loading, setLoading] = useState(false);
   const [aiLoading, setAiLoading] = useState(false);
+  // Asking again means the user wants a fresh answer, not the cached one
+  const [hasSuggested, setHasSuggested] = useState(false);
   const [scores, setScores] = useState({
     moscow_score: null,
     rice_reach: null,
@@ -330,7 +332,8 @@ export const FeatureScoringDialog = ({ open, onOpenChange, featureId, featureTit
   const handleAISuggest = async () => {
     setAiLoading(true);
     try {
-      const response = await scoringAPI.suggestFeatureScores(featureId);
+      const response = await scoringAPI.suggestFeatureScores(featureId, hasSuggested);
+      setHasSuggested(true);
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       
@@ -463,6 +466,8 @@ export const RICEScoringDialog = ({
 }) => {
   const [loading, setLoading] = useState(false);
   const [aiLoading, setAiLoading] = useState(false);
+  // Asking again means the user wants a fresh answer, not the cached one
+  const [hasSuggested, setHasSuggested] = useState(false);
   const [scores, setScores] = useState({
     rice_reach: null,
     rice_impact: null,
@@ -523,7 +528,8 @@ export const RICEScoringDialog = ({
     setAiLoading(true);
     try {
       const suggestApi = entityType === 'story' ? scoringAPI.suggestStoryRICE : scoringAPI.suggestBugRICE;
-      const response = await suggestApi(entityId);
+      const response = await suggestApi(entityId, hasSuggested);
+      setHasSuggested(true);
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       
@@ -610,6 +616,8 @@ export const RICEScoringDialog = ({
 export const EpicMoSCoWDialog = ({ open, onOpenChange, epicId, epicTitle, onUpdate }) => {
   const [loading, setLoading] = useState(false);
   const [aiLoading, setAiLoading] = useState(false);
+  // Asking again means the user wants a fresh answer, not the cached one
+  const [hasSuggested, setHasSuggested] = useState(false);
   const [score, setScore] = useState(null);
 
   const loadScore = useCallback(async () => {
@@ -644,7 +652,8 @@ export const EpicMoSCoWDialog = ({ open, onOpenChange, epicId, epicTitle, onUpda
   const handleAISuggest = async () => {
     setAiLoading(true);
     try {
-      const response = await scoringAPI.suggestEpicMoSCoW(epicId);
+      const response = await scoringAPI.suggestEpicMoSCoW(epicId, hasSuggested);
+      setHasSuggested(true);
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
       
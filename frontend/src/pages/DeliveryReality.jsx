@@ -269,12 +269,13 @@ const DeliveryReality = () => {
   };
 
   // AI Feature handlers
-  const generateCutRationale = async () => {
+  // regenerate skips the server's cached answer
+  const generateCutRationale = async (regenerate = false) => {
     if (!initiativeDetail) return;
     
     try {
       setAiLoading(prev => ({ ...prev, rationale: true }));
-      const response = await deliveryRealityAPI.generateCutRationale(initiativeDetail.epic_id);
+      const response = await deliveryRealityAPI.generateCutRationale(initiativeDetail.epic_id, regenerate);
       setCutRationale(response.data);
       toast.success('Rationale generated');
     } catch (error) {
@@ -286,12 +287,12 @@ const DeliveryReality = () => {
     }
   };
 
-  const generateAlternatives = async () => {
+  const generateAlternatives = async (regenerate = false) => {
     if (!initiativeDetail) return;
     
     try {
       setAiLoading(prev => ({ ...prev, alternatives: true }));
-      const response = await deliveryRealityAPI.generateAlternativeCuts(initiativeDetail.epic_id);
+      const response = await deliveryRealityAPI.generateAlternativeCuts(initiativeDetail.epic_id, regenerate);
       setAlternativeCuts(response.data.alternatives);
       toast.success('Alternative cut strategies generated');
     } catch (error) {
@@ -303,12 +304,12 @@ const DeliveryReality = () => {
     }
   };
 
-  const generateRisks = async () => {
+  const generateRisks = async (regenerate = false) => {
     if (!initiativeDetail) return;
     
     try {
       setAiLoading(prev => ({ ...prev, risks: true }));
-      const response = await deliveryRealityAPI.generateRiskReview(initiativeDetail.epic_id);
+      const response = await deliveryRealityAPI.generateRiskReview(initiativeDetail.epic_id, regenerate);
       setRiskReview(response.data);
       toast.success('Risk review generated');
     } catch (error) {
@@ -883,15 +884,27 @@ const DeliveryReality = () => {
                           <p className="text-xs font-medium text-blue-600 mb-1">Validate First</p>
                           <p className="text-sm">{cutRationale.what_to_validate_first}</p>
                         </div>
-                        <Button 
-                          variant="outline" 
-                          size="sm"
-                          onClick={() => copyToClipboard(`Rationale: ${cutRationale.rationale}\n\nUser Impact: ${cutRationale.user_impact_tradeoff}\n\nValidate First: ${cutRationale.what_to_validate_first}`)}
-                          className="gap-1"
-                        >
-                          <Copy className="h-3 w-3" />
-                          Copy
-                        </Button>
+                        <div className="flex gap-2">
+                          <Button 
+                            variant="outline" 
+                            size="sm"
+                            onClick={() => copyToClipboard(`Rationale: ${cutRationale.rationale}\n\nUser Impact: ${cutRationale.user_impact_tradeoff}\n\nValidate First: ${cutRationale.what_to_validate_first}`)}
+                            className="gap-1"
+                          >
+                            <Copy className="h-3 w-3" />
+                            Copy
+                          </Button>
+                          <Button
+                            variant="outline"
+                            size="sm"
+                            onClick={() => generateCutRationale(true)}
+                            disabled={aiLoading.rationale}
+                            className="gap-1"
+                          >
+                            <RefreshCw className={`h-3 w-3 ${aiLoading.rationale ? 'animate-spin' : ''}`} />
+                            Regenerate
+                          </Button>
+                        </div>
                       </div>
                     ) : (
                       <div className="text-center py-6">
@@ -900,7 +913,7 @@ const DeliveryReality = () => {
                           Generate PM-quality explanation for your scope decisions
                         </p>
                         <Button 
-                          onClick={generateCutRationale}
+                          onClick={() => generateCutRationale()}
                           disabled={aiLoading.rationale}
                           className="gap-2"
                         >
@@ -941,6 +954,16 @@ const DeliveryReality = () => {
                             </CardContent>
                           </Card>
                         ))}
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => generateAlternatives(true)}
+                          disabled={aiLoading.alternatives}
+                          className="gap-1"
+                        >
+                          <RefreshCw className={`h-3 w-3 ${aiLoading.alternatives ? 'animate-spin' : ''}`} />
+                          Regenerate
+                        </Button>
                       </div>
                     ) : (
                       <div className="text-center py-6">
@@ -949,7 +972,7 @@ const DeliveryReality = () => {
                           Get 2-3 alternative ways to cut scope
                         </p>
                         <Button 
-                          onClick={generateAlternatives}
+                          onClick={() => generateAlternatives()}
                           disabled={aiLoading.alternatives || initiativeDetail.delta >= 0}
                           className="gap-2"
                         >
@@ -1007,6 +1030,16 @@ const DeliveryReality = () => {
                             </CardContent>
                           </Card>
                         )}
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => generateRisks(true)}
+                          disabled={aiLoading.risks}
+                          className="gap-1"
+                        >
+                          <RefreshCw className={`h-3 w-3 ${aiLoading.risks ? 'animate-spin' : ''}`} />
+                          Regenerate
+                        </Button>
                       </div>
                     ) : (
                       <div className="text-center py-6">
@@ -1015,7 +1048,7 @@ const DeliveryReality = () => {
                           Identify risks and assumptions for your plan
                         </p>
                         <Button 
-                          onClick={generateRisks}
+                          onClick={() => generateRisks()}
                           disabled={aiLoading.risks}
                           className="gap-2"
                         >
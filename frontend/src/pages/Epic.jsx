@@ -277,17 +277,29 @@ const Epic = () => {
       const response = await featureAPI.generate(epicId, 5);
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
+      let streamedDrafts = 0;
+      let buffer = '';
 
       while (true) {
         const { done, value } = await reader.read();
         if (done) break;
-        const chunk = decoder.decode(value);
-        const lines = chunk.split('\n');
+        buffer += decoder.decode(value, { stream: true });
+        // An event can be split across reads; keep the unfinished last line
+        const lines = buffer.split('\n');
+        buffer = lines.pop() || '';
         for (const line of lines) {
           if (line.startsWith('data: ')) {
             try {
               const data = JSON.parse(line.slice(6));
-              if (data.type === 'features') {
+              if (data.type === 'feature') {
+                // Show each feature as a draft as soon as it has streamed
+                streamedDrafts += 1;
+                setGeneratedDrafts(prev => [...prev, {
+                  tempId: `draft_${Date.now()}_${data.index}`,
+                  ...data.feature
+                }]);
+              }
+              else if (data.type === 'features' && streamedDrafts === 0) {
                 // Store generated features as drafts
                 setGeneratedDrafts(data.features.map((f, i) => ({
                   tempId: `draft_${Date.now()}_${i}`,
@@ -108,7 +108,8 @@ const Scoring = () => {
     }
   };
 
-  const handleAIGenerateForEpic = async (epicId) => {
+  // regenerate skips the server's cached suggestions
+  const handleAIGenerateForEpic = async (epicId, regenerate = false) => {
     setGenerating(true);
     setAllSuggestions(null);
     
@@ -116,7 +117,7 @@ const Scoring = () => {
     await handleViewEpicScores(epicId);
     
     try {
-      const response = await scoringAPI.bulkScoreAll(epicId);
+      const response = await scoringAPI.bulkScoreAll(epicId, regenerate);
       setAllSuggestions(response.data);
       const total = (response.data.feature_suggestions?.length || 0) + 
                     (response.data.story_suggestions?.length || 0) + 
@@ -205,7 +206,7 @@ const Scoring = () => {
               </Button>
             )}
             <Button
-              onClick={() => handleAIGenerateForEpic(selectedEpicDetail.epic_id)}
+              onClick={() => handleAIGenerateForEpic(selectedEpicDetail.epic_id, true)}
               disabled={generating}
               className="bg-gradient-to-r from-violet-500 to-purple-500 hover:from-violet-600 hover:to-purple-600 text-white"
               data-testid="ai-score-btn"
@@ -194,10 +194,11 @@ const Sprints = () => {
   };
 
   // AI handlers
-  const generateKickoff = async () => {
+  // regenerate skips the server's cached answer
+  const generateKickoff = async (regenerate = false) => {
     try {
       setAiLoading(prev => ({ ...prev, kickoff: true }));
-      const response = await sprintAPI.generateKickoffPlan();
+      const response = await sprintAPI.generateKickoffPlan(regenerate);
       setKickoffPlan(response.data);
       toast.success('Kickoff plan generated');
     } catch (error) {
@@ -209,10 +210,10 @@ const Sprints = () => {
     }
   };
 
-  const generateStandup = async () => {
+  const generateStandup = async (regenerate = false) => {
     try {
       setAiLoading(prev => ({ ...prev, standup: true }));
-      const response = await sprintAPI.generateStandupSummary();
+      const response = await sprintAPI.generateStandupSummary(regenerate);
       setStandupSummary(response.data);
       toast.success('Standup summary generated');
     } catch (error) {
@@ -224,10 +225,10 @@ const Sprints = () => {
     }
   };
 
-  const generateWip = async () => {
+  const generateWip = async (regenerate = false) => {
     try {
       setAiLoading(prev => ({ ...prev, wip: true }));
-      const response = await sprintAPI.generateWipSuggestions();
+      const response = await sprintAPI.generateWipSuggestions(regenerate);
       setWipSuggestions(response.data);
       toast.success('WIP suggestions generated');
     } catch (error) {
@@ -630,19 +631,31 @@ const Sprints = () => {
                         </ul>
                       </div>
                       
-                      <Button
-                        variant="outline"
-                        size="sm"
-                        onClick={() => copyToClipboard(
-                          `Sprint Goal: ${kickoffPlan.sprint_goal}\n\n` +
-                          `Top Stories:\n${kickoffPlan.top_stories?.map((s, i) => `${i+1}. ${s.title}`).join('\n')}\n\n` +
-                          `Sequencing:\n${kickoffPlan.sequencing?.map(s => `- ${s}`).join('\n')}`
-                        )}
-                        className="gap-1"
-                      >
-                        <Copy className="h-3 w-3" />
-                        Copy
-                      </Button>
+                      <div className="flex gap-2">
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => copyToClipboard(
+                            `Sprint Goal: ${kickoffPlan.sprint_goal}\n\n` +
+                            `Top Stories:\n${kickoffPlan.top_stories?.map((s, i) => `${i+1}. ${s.title}`).join('\n')}\n\n` +
+                            `Sequencing:\n${kickoffPlan.sequencing?.map(s => `- ${s}`).join('\n')}`
+                          )}
+                          className="gap-1"
+                        >
+                          <Copy className="h-3 w-3" />
+                          Copy
+                        </Button>
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => generateKickoff(true)}
+                          disabled={aiLoading.kickoff}
+                          className="gap-1"
+                        >
+                          <RefreshCw className={`h-3 w-3 ${aiLoading.kickoff ? 'animate-spin' : ''}`} />
+                          Regenerate
+                        </Button>
+                      </div>
                     </div>
                   ) : (
                     <div className="text-center py-8">
@@ -651,7 +664,7 @@ const Sprints = () => {
                         Generate a sprint kickoff plan with goal, priorities, and sequencing
                       </p>
                       <Button 
-                        onClick={generateKickoff}
+                        onClick={() => generateKickoff()}
                         disabled={aiLoading.kickoff || totalStories === 0}
                         className="gap-2"
                       >
@@ -717,20 +730,32 @@ const Sprints = () => {
                         </ul>
                       </div>
                       
-                      <Button
-                        variant="outline"
-                        size="sm"
-                        onClick={() => copyToClipboard(
-                          `${standupSummary.summary}\n\n` +
-                          `✓ What Changed:\n${standupSummary.what_changed?.map(s => `- ${s}`).join('\n')}\n\n` +
-                          `🚫 Blocked:\n${standupSummary.whats_blocked?.map(s => `- ${s}`).join('\n') || 'None'}\n\n` +
-                          `→ Next:\n${standupSummary.what_to_do_next?.map(s => `- ${s}`).join('\n')}`
-                        )}
-                        className="gap-1"
-                      >
-                        <Copy className="h-3 w-3" />
-                        Copy for Slack
-                      </Button>
+                      <div className="flex gap-2">
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => copyToClipboard(
+                            `${standupSummary.summary}\n\n` +
+                            `✓ What Changed:\n${standupSummary.what_changed?.map(s => `- ${s}`).join('\n')}\n\n` +
+                            `🚫 Blocked:\n${standupSummary.whats_blocked?.map(s => `- ${s}`).join('\n') || 'None'}\n\n` +
+                            `→ Next:\n${standupSummary.what_to_do_next?.map(s => `- ${s}`).join('\n')}`
+                          )}
+                          className="gap-1"
+                        >
+                          <Copy className="h-3 w-3" />
+                          Copy for Slack
+                        </Button>
+                        <Button
+                          variant="outline"
+                          size="sm"
+                          onClick={() => generateStandup(true)}
+                          disabled={aiLoading.standup}
+                          className="gap-1"
+                        >
+                          <RefreshCw className={`h-3 w-3 ${aiLoading.standup ? 'animate-spin' : ''}`} />
+                          Regenerate
+                        </Button>
+                      </div>
                     </div>
                   ) : (
                     <div className="text-center py-8">
@@ -739,7 +764,7 @@ const Sprints = () => {
                         Generate a quick standup summary: what changed, blocked, next steps
                       </p>
                       <Button 
-                        onClick={generateStandup}
+                        onClick={() => generateStandup()}
                         disabled={aiLoading.standup || totalStories === 0}
                         className="gap-2"
                       >
@@ -785,6 +810,17 @@ const Sprints = () => {
                           ))}
                         </div>
                       )}
+                      
+                      <Button
+                        variant="outline"
+                        size="sm"
+                        onClick={() => generateWip(true)}
+                        disabled={aiLoading.wip}
+                        className="gap-1"
+                      >
+                        <RefreshCw className={`h-3 w-3 ${aiLoading.wip ? 'animate-spin' : ''}`} />
+                        Regenerate
+                      </Button>
                     </div>
                   ) : (
                     <div className="text-center py-8">
@@ -793,7 +829,7 @@ const Sprints = () => {
                         Get suggestions on what to focus on when WIP is high
                       </p>
                       <Button 
-                        onClick={generateWip}
+                        onClick={() => generateWip()}
                         disabled={aiLoading.wip || inProgressCount < 2}
                         className="gap-2"
                       >
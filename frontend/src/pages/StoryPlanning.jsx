@@ -124,17 +124,29 @@ const StoryPlanning = () => {
       const response = await userStoryAPI.generate(featureId, 5);
       const reader = response.body.getReader();
       const decoder = new TextDecoder();
+      let streamedDrafts = 0;
+      let buffer = '';
 
       while (true) {
         const { done, value } = await reader.read();
         if (done) break;
-        const chunk = decoder.decode(value);
-        const lines = chunk.split('\n');
+        buffer += decoder.decode(value, { stream: true });
+        // An event can be split across reads; keep the unfinished last line
+        const lines = buffer.split('\n');
+        buffer = lines.pop() || '';
         for (const line of lines) {
           if (line.startsWith('data: ')) {
             try {
               const data = JSON.parse(line.slice(6));
-              if (data.type === 'stories') {
+              if (data.type === 'story') {
+                // Show each story as a draft as soon as it has streamed
+                streamedDrafts += 1;
+                setGeneratedDrafts(prev => [...prev, {
+                  tempId: `draft_${Date.now()}_${data.index}`,
+                  ...data.story
+                }]);
+              }
+              else if (data.type === 'stories' && streamedDrafts === 0) {
                 setGeneratedDrafts(data.stories.map((s, i) => ({
                   tempId: `draft_${Date.now()}_${i}`,
                   ...s